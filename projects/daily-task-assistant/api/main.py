@@ -7,18 +7,22 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+import json
 import logging
 import os
+from contextlib import asynccontextmanager
 
 logger = logging.getLogger(__name__)
 from dataclasses import asdict
 from functools import lru_cache
-from typing import Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Literal, Optional, Tuple
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from daily_task_assistant.api.auth import get_current_user
@@ -33,16 +37,46 @@ from daily_task_assistant.conversations import (
     strike_message,
     unstrike_message,
 )
-from daily_task_assistant.dataset import fetch_tasks as fetch_task_dataset
+from daily_task_assistant.dataset import fetch_task_by_id
+from daily_task_assistant.dataset import fetch_tasks_async as fetch_task_dataset_async
 from daily_task_assistant.logs import fetch_activity_entries
 from daily_task_assistant.services import execute_assist
 from daily_task_assistant.tasks import AttachmentDetail, TaskDetail
 
+if TYPE_CHECKING:
+    from daily_task_assistant.email import AttentionState
+    from daily_task_assistant.mailer import HydrationResult
+
+
+def _threadpool_size() -> int:
+    """Worker threads for sync endpoints and blocking helpers (anyio default: 40)."""
+    try:
+        return max(1, int(os.getenv("DTA_THREADPOOL_SIZE", "40")))
+    except ValueError:
+        return 40
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Sync endpoints (Smartsheet/Gmail writes, Firestore) each hold a thread
+    # for their whole request, so this bounds how many run at once. The
+    # listing routes are async and only borrow threads for storage calls.
+    import anyio.to_thread
+
+    from daily_task_assistant.http_transport import close_async_http_client
+    from daily_task_assistant.llm import close_async_anthropic_client
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = _threadpool_size()
+    yield
+    await close_async_anthropic_client()
+    await close_async_http_client()
+
 
 app = FastAPI(
     title="Daily Task Assistant API",
     version="0.1.0",
     description="REST interface powering the upcoming web dashboard.",
+    lifespan=_lifespan,
 )
 
 ALLOWED_ORIGINS = [
@@ -214,13 +248,13 @@ def health_check() -> dict:
 
 
 @app.get("/tasks")
-def list_tasks(
+async def list_tasks(
     source: Literal["auto", "live", "stub"] = Query("auto"),
     limit: Optional[int] = Query(None, ge=1, le=500),
     include_work: bool = Query(False, alias="includeWork"),
     user: str = Depends(get_current_user),
 ) -> dict:
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
+    tasks, live_tasks, settings, warning = await fetch_task_dataset_async(
         limit=limit, source=source, include_work_in_all=include_work
     )
     return {
@@ -287,6 +321,60 @@ def get_work_badge(
     }
 
 
+# --- Chat Streaming (Server-Sent Events) ---
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _sse_chat_response(
+    start: Callable[[], AsyncIterator[Any]],
+    finish: Callable[[Any], dict],
+) -> StreamingResponse:
+    """Relay a streamed chat turn to the client as Server-Sent Events.
+
+    The model stream is consumed asynchronously, so an open stream does not
+    hold a worker thread; only finish (persistence) runs on the threadpool.
+
+    Events:
+        delta: {"text": ...} for each chunk of assistant text.
+        tool: {"name": ..., "input": ...} once a tool call is fully assembled.
+        done: the same body the non-streaming endpoint returns.
+        error: {"detail": ...} if the model call or persistence fails.
+
+    Args:
+        start: Opens the async model stream (called lazily inside the generator).
+        finish: Persists the finished turn and builds the "done" payload.
+    """
+    from daily_task_assistant.llm.anthropic_client import AnthropicError
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event in start():
+                if event.type == "text":
+                    yield _sse_event("delta", {"text": event.text})
+                elif event.type == "tool_use":
+                    yield _sse_event(
+                        "tool", {"name": event.tool_name, "input": event.tool_input}
+                    )
+                elif event.type == "final":
+                    yield _sse_event("done", await run_in_threadpool(finish, event.response))
+        except AnthropicError as exc:
+            yield _sse_event("error", {"detail": f"AI service error: {exc}"})
+        except HTTPException as exc:
+            yield _sse_event("error", {"detail": exc.detail})
+        except Exception as exc:
+            logger.exception("Chat stream failed")
+            yield _sse_event("error", {"detail": str(exc)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # --- Global Portfolio Mode Endpoints ---
 # NOTE: These routes MUST be defined BEFORE /assist/{task_id} routes
 # to prevent FastAPI from matching "global" as a task_id
@@ -308,7 +396,7 @@ class GlobalChatRequest(BaseModel):
 
 
 @app.post("/assist/global/chat")
-def global_chat(
+async def global_chat(
     request: GlobalChatRequest,
     user: str = Depends(get_current_user),
 ) -> dict:
@@ -327,13 +415,58 @@ def global_chat(
     Returns pending_actions when DATA wants to update tasks - frontend
     should display these for user confirmation before executing.
     """
-    from daily_task_assistant.smartsheet_client import SmartsheetClient
-    from daily_task_assistant.portfolio_context import build_portfolio_context
-    from daily_task_assistant.llm.prompts import _format_portfolio_summary
     from daily_task_assistant.llm.anthropic_client import (
-        portfolio_chat_with_tools,
+        portfolio_chat_with_tools_async,
         AnthropicError,
     )
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_global_chat, request, user)
+
+    # Execute LLM call with tools
+    try:
+        chat_response = await portfolio_chat_with_tools_async(**llm_kwargs)
+    except AnthropicError as exc:
+        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
+    except Exception as exc:
+        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
+
+    return await run_in_threadpool(finish, chat_response)
+
+
+@app.post("/assist/global/chat/stream")
+async def global_chat_stream(
+    request: GlobalChatRequest,
+    user: str = Depends(get_current_user),
+) -> StreamingResponse:
+    """Streaming variant of /assist/global/chat over Server-Sent Events.
+
+    Emits "delta" events with text as DATA writes it, a "tool" event per
+    completed update_task call, and a final "done" event carrying the same
+    body /assist/global/chat returns (pending actions, portfolio, history).
+    """
+    from daily_task_assistant.llm.anthropic_client import (
+        stream_portfolio_chat_with_tools_async,
+    )
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_global_chat, request, user)
+    return _sse_chat_response(
+        lambda: stream_portfolio_chat_with_tools_async(**llm_kwargs), finish
+    )
+
+
+def _prepare_global_chat(
+    request: GlobalChatRequest,
+    user: str,
+) -> Tuple[Dict[str, Any], Callable[[Any], dict]]:
+    """Load portfolio context and history for a global chat turn.
+
+    Returns:
+        Tuple of (LLM call kwargs, finish) where finish(chat_response)
+        persists the reply and builds the endpoint response body.
+    """
+    from daily_task_assistant.smartsheet_client import SmartsheetClient
+    from daily_task_assistant.portfolio_context import build_portfolio_context
+    from daily_task_assistant.llm.prompts import _format_portfolio_summary
     from daily_task_assistant.trust import log_trust_event
     
     settings = _get_settings()
@@ -344,6 +477,7 @@ def global_chat(
         portfolio = build_portfolio_context(client, request.perspective)
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"Failed to load portfolio: {exc}")
+    logger.info(f"[global_chat] Sheet timings ({request.perspective}): {portfolio.source_timings}")
     
     # Use global conversation ID scoped by perspective
     conversation_id = f"global:{request.perspective}"
@@ -365,110 +499,109 @@ def global_chat(
     
     # Format portfolio context for LLM
     portfolio_context_text = _format_portfolio_summary(portfolio)
-    
-    # Execute LLM call with tools
-    try:
-        chat_response = portfolio_chat_with_tools(
-            portfolio_context=portfolio_context_text,
-            task_summaries=portfolio.task_summaries,
-            user_message=request.message,
-            history=llm_history,
-            perspective=request.perspective,
-        )
+
+    def finish(chat_response: Any) -> dict:
         response_text = chat_response.message
         pending_actions = chat_response.pending_actions
-        
-    except AnthropicError as exc:
-        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
-    except Exception as exc:
-        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
-    
-    # Log assistant response
-    log_assistant_message(
-        conversation_id,
-        content=response_text,
-        plan=None,
-        metadata={
-            "source": "global_chat",
-            "perspective": request.perspective,
-            "has_pending_actions": len(pending_actions) > 0,
-        },
-    )
-    
-    # Log trust event if feedback provided
-    if request.feedback:
-        log_trust_event(
-            scope="portfolio",
-            perspective=request.perspective,
-            suggestion_type="insight",
-            suggestion=response_text[:200],
-            response="accepted" if request.feedback == "helpful" else "rejected",
-            user=user,
+        usage = chat_response.usage
+
+        # Log assistant response
+        log_assistant_message(
+            conversation_id,
+            content=response_text,
+            plan=None,
+            metadata={
+                "source": "global_chat",
+                "perspective": request.perspective,
+                "has_pending_actions": len(pending_actions) > 0,
+            },
         )
     
-    # Fetch updated history
-    updated_history = fetch_conversation(conversation_id, limit=50)
-    
-    # Format pending actions for frontend - enrich with task details from portfolio
-    task_lookup = {t["row_id"]: t for t in portfolio.task_summaries}
-    formatted_actions = []
-    
-    # Debug: log available row_ids vs requested row_ids
-    available_ids = list(task_lookup.keys())[:5]
-    logger.info(f"[DEBUG] Available task row_ids (first 5): {available_ids}")
-    requested_ids = [a.row_id for a in pending_actions[:5]]
-    logger.info(f"[DEBUG] LLM requested row_ids (first 5): {requested_ids}")
-    
-    for action in pending_actions:
-        # Look up task details to include title and domain
-        task_info = task_lookup.get(action.row_id, {})
-        if not task_info:
-            logger.warning(f"[DEBUG] No task found for row_id: {action.row_id}")
-        formatted_actions.append({
-            "rowId": action.row_id,
-            "source": task_info.get("source", "personal"),  # Which Smartsheet to update
-            "action": action.action,
-            "status": action.status,
-            "priority": action.priority,
-            "dueDate": action.due_date,
-            "comment": action.comment,
-            "number": action.number,
-            "contactFlag": action.contact_flag,
-            "recurring": action.recurring,
-            "project": action.project,
-            "taskTitle": task_info.get("title") or action.task_title,
-            "assignedTo": action.assigned_to,
-            "notes": action.notes,
-            "estimatedHours": action.estimated_hours,
-            "reason": action.reason,
-            # Add enriched data from portfolio
-            "domain": task_info.get("domain", "Unknown"),
-            "currentDue": task_info.get("due", "")[:10] if task_info.get("due") else None,
-            "currentNumber": task_info.get("number"),
-            "currentPriority": task_info.get("priority"),
-            "currentStatus": task_info.get("status"),
-        })
+        # Log trust event if feedback provided
+        if request.feedback:
+            log_trust_event(
+                scope="portfolio",
+                perspective=request.perspective,
+                suggestion_type="insight",
+                suggestion=response_text[:200],
+                response="accepted" if request.feedback == "helpful" else "rejected",
+                user=user,
+            )
     
-    return {
-        "response": response_text,
+        # Fetch updated history
+        updated_history = fetch_conversation(conversation_id, limit=50)
+    
+        # Format pending actions for frontend - enrich with task details from portfolio
+        task_lookup = {t["row_id"]: t for t in portfolio.task_summaries}
+        formatted_actions = []
+    
+        # Debug: log available row_ids vs requested row_ids
+        available_ids = list(task_lookup.keys())[:5]
+        logger.info(f"[DEBUG] Available task row_ids (first 5): {available_ids}")
+        requested_ids = [a.row_id for a in pending_actions[:5]]
+        logger.info(f"[DEBUG] LLM requested row_ids (first 5): {requested_ids}")
+    
+        for action in pending_actions:
+            # Look up task details to include title and domain
+            task_info = task_lookup.get(action.row_id, {})
+            if not task_info:
+                logger.warning(f"[DEBUG] No task found for row_id: {action.row_id}")
+            formatted_actions.append({
+                "rowId": action.row_id,
+                "source": task_info.get("source", "personal"),  # Which Smartsheet to update
+                "action": action.action,
+                "status": action.status,
+                "priority": action.priority,
+                "dueDate": action.due_date,
+                "comment": action.comment,
+                "number": action.number,
+                "contactFlag": action.contact_flag,
+                "recurring": action.recurring,
+                "project": action.project,
+                "taskTitle": task_info.get("title") or action.task_title,
+                "assignedTo": action.assigned_to,
+                "notes": action.notes,
+                "estimatedHours": action.estimated_hours,
+                "reason": action.reason,
+                # Add enriched data from portfolio
+                "domain": task_info.get("domain", "Unknown"),
+                "currentDue": task_info.get("due", "")[:10] if task_info.get("due") else None,
+                "currentNumber": task_info.get("number"),
+                "currentPriority": task_info.get("priority"),
+                "currentStatus": task_info.get("status"),
+            })
+    
+        return {
+            "response": response_text,
+            "perspective": request.perspective,
+            "pendingActions": formatted_actions,  # NEW: Task updates for confirmation
+            "portfolio": {
+                "totalOpen": portfolio.total_open,
+                "overdue": portfolio.overdue,
+                "dueToday": portfolio.due_today,
+                "dueThisWeek": portfolio.due_this_week,
+                "byPriority": portfolio.by_priority,
+                "byProject": portfolio.by_project,
+                "byDueDate": portfolio.by_due_date,
+                "conflicts": portfolio.conflicts,
+                "domainBreakdown": portfolio.domain_breakdown,
+                "sourceTimings": portfolio.source_timings,
+            },
+            "usage": usage.to_dict() if usage else None,
+            "history": [
+                ConversationMessageModel(**asdict(msg)).model_dump()
+                for msg in updated_history
+            ],
+        }
+
+    llm_kwargs = {
+        "portfolio_context": portfolio_context_text,
+        "task_summaries": portfolio.task_summaries,
+        "user_message": request.message,
+        "history": llm_history,
         "perspective": request.perspective,
-        "pendingActions": formatted_actions,  # NEW: Task updates for confirmation
-        "portfolio": {
-            "totalOpen": portfolio.total_open,
-            "overdue": portfolio.overdue,
-            "dueToday": portfolio.due_today,
-            "dueThisWeek": portfolio.due_this_week,
-            "byPriority": portfolio.by_priority,
-            "byProject": portfolio.by_project,
-            "byDueDate": portfolio.by_due_date,
-            "conflicts": portfolio.conflicts,
-            "domainBreakdown": portfolio.domain_breakdown,
-        },
-        "history": [
-            ConversationMessageModel(**asdict(msg)).model_dump()
-            for msg in updated_history
-        ],
     }
+    return llm_kwargs, finish
 
 
 @app.get("/assist/global/context")
@@ -611,8 +744,9 @@ def bulk_update_tasks(
     - Reordering tasks for the day (# field)
     - Bulk status changes
     
-    Each update is executed independently - failures don't stop subsequent updates.
-    Returns results for each update with success/failure status.
+    Updates are grouped per sheet and written in a single batched request
+    (per 200 rows), with partial success - a failing row doesn't stop the
+    others. Returns results for each update with success/failure status.
     """
     import logging
     logging.warning(f"[BULK-UPDATE] Received {len(request.updates)} updates")
@@ -628,76 +762,51 @@ def bulk_update_tasks(
     except Exception as exc:
         raise HTTPException(status_code=502, detail=f"Failed to connect to Smartsheet: {exc}")
     
-    results: List[BulkUpdateResult] = []
-    success_count = 0
+    # Warm the sheet snapshots so recurring checks for mark_complete need no per-row GETs
+    complete_sources = sorted({u.source for u in request.updates if u.action == "mark_complete"})
+    if complete_sources:
+        try:
+            client.list_tasks(sources=complete_sources, fallback_to_stub=False)
+        except Exception as exc:
+            logging.warning(f"[BULK-UPDATE] Snapshot warm-up failed: {exc}")
+    
+    # Build each update's field changes, then write them in one batch per sheet
+    errors: Dict[int, str] = {}
+    batches: Dict[str, List[Tuple[int, str, Dict[str, Any]]]] = {}
     
-    for update in request.updates:
+    for index, update in enumerate(request.updates):
         try:
-            # Handle mark_complete specially - uses dedicated method with recurring logic
-            if update.action == "mark_complete":
-                logging.warning(f"[BULK-UPDATE] Executing mark_complete: row_id={update.row_id}, source={update.source}")
-                client.mark_complete(update.row_id, source=update.source)
-                logging.warning(f"[BULK-UPDATE] Success: row_id={update.row_id}")
-                results.append(BulkUpdateResult(row_id=update.row_id, success=True))
-                success_count += 1
-                continue
-            
-            # Build the update payload based on action
-            update_data = {}
-            
-            if update.action == "update_status":
-                update_data["status"] = update.status
-                # Terminal statuses also mark done
-                if update.status in ("Completed", "Cancelled", "Delegated", "Ticket Created"):
-                    update_data["done"] = True
-                    
-            elif update.action == "update_priority":
-                update_data["priority"] = update.priority
-                
-            elif update.action == "update_due_date":
-                update_data["due_date"] = update.due_date
-                
-            elif update.action == "add_comment":
-                update_data["notes"] = update.comment
-                
-            elif update.action == "update_number":
-                update_data["number"] = update.number
-                
-            elif update.action == "update_contact_flag":
-                update_data["contact_flag"] = update.contact_flag
-                
-            elif update.action == "update_recurring":
-                update_data["recurring_pattern"] = update.recurring
-                
-            elif update.action == "update_project":
-                update_data["project"] = update.project
-                
-            elif update.action == "update_task":
-                update_data["task"] = update.task_title
-                
-            elif update.action == "update_assigned_to":
-                update_data["assigned_to"] = update.assigned_to
-                
-            elif update.action == "update_notes":
-                update_data["notes"] = update.notes
-                
-            elif update.action == "update_estimated_hours":
-                update_data["estimated_hours"] = update.estimated_hours
-            
-            # Execute the update
-            logging.warning(f"[BULK-UPDATE] Executing: row_id={update.row_id}, source={update.source}, update_data={update_data}")
-            client.update_row(update.row_id, update_data, source=update.source)
-            logging.warning(f"[BULK-UPDATE] Success: row_id={update.row_id}")
-            
-            results.append(BulkUpdateResult(row_id=update.row_id, success=True))
-            success_count += 1
-            
+            update_data = _bulk_update_fields(client, update)
+        except Exception as exc:
+            errors[index] = str(exc)[:200]
+            continue
+        batches.setdefault(update.source, []).append((index, update.row_id, update_data))
+    
+    for source, entries in batches.items():
+        logging.warning(f"[BULK-UPDATE] Writing {len(entries)} updates to {source} sheet")
+        try:
+            outcomes = client.update_rows(
+                [(row_id, update_data) for _, row_id, update_data in entries],
+                source=source,
+            )
         except Exception as exc:
+            outcomes = {row_id: str(exc) for _, row_id, _ in entries}
+        for index, row_id, _ in entries:
+            if outcomes.get(str(row_id)):
+                errors[index] = outcomes[str(row_id)][:200]
+    
+    results: List[BulkUpdateResult] = []
+    for index, update in enumerate(request.updates):
+        if index in errors:
             results.append(BulkUpdateResult(
                 row_id=update.row_id,
                 success=False,
-                error=str(exc)[:200]
+                error=errors[index],
             ))
+        else:
+            results.append(BulkUpdateResult(row_id=update.row_id, success=True))
+    success_count = sum(1 for r in results if r.success)
+    logging.warning(f"[BULK-UPDATE] {success_count}/{len(results)} updates succeeded")
     
     # Log summary to conversation history for audit trail and DATA context
     if success_count > 0:
@@ -724,6 +833,58 @@ def bulk_update_tasks(
     }
 
 
+def _bulk_update_fields(client: Any, update: BulkTaskUpdate) -> Dict[str, Any]:
+    """Translate one bulk update action into Smartsheet field changes."""
+    # mark_complete keeps the recurring-task logic (Done only for recurring rows)
+    if update.action == "mark_complete":
+        return client.completion_updates(update.row_id, source=update.source)
+    
+    update_data: Dict[str, Any] = {}
+    
+    if update.action == "update_status":
+        update_data["status"] = update.status
+        # Terminal statuses also mark done
+        if update.status in ("Completed", "Cancelled", "Delegated", "Ticket Created"):
+            update_data["done"] = True
+            
+    elif update.action == "update_priority":
+        update_data["priority"] = update.priority
+        
+    elif update.action == "update_due_date":
+        update_data["due_date"] = update.due_date
+        
+    elif update.action == "add_comment":
+        update_data["notes"] = update.comment
+        
+    elif update.action == "update_number":
+        update_data["number"] = update.number
+        
+    elif update.action == "update_contact_flag":
+        update_data["contact_flag"] = update.contact_flag
+        
+    elif update.action == "update_recurring":
+        update_data["recurring_pattern"] = update.recurring
+        
+    elif update.action == "update_project":
+        update_data["project"] = update.project
+        
+    elif update.action == "update_task":
+        update_data["task"] = update.task_title
+        
+    elif update.action == "update_assigned_to":
+        update_data["assigned_to"] = update.assigned_to
+        
+    elif update.action == "update_notes":
+        update_data["notes"] = update.notes
+        
+    elif update.action == "update_estimated_hours":
+        update_data["estimated_hours"] = update.estimated_hours
+    
+    if not update_data:
+        raise ValueError("No updates provided")
+    return update_data
+
+
 def _build_bulk_update_summary(
     updates: List[BulkTaskUpdate],
     results: List[BulkUpdateResult],
@@ -1076,10 +1237,9 @@ def assist_task(
     """
     from daily_task_assistant.conversations.history import get_latest_plan
     
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1148,10 +1308,9 @@ def generate_plan(
     This is triggered explicitly by the user clicking the 'Plan' action button.
     The plan is stored in conversation history for persistence across sessions.
     """
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1377,7 +1536,7 @@ class ChatRequest(BaseModel):
 
 
 @app.post("/assist/{task_id}/chat")
-def chat_with_task(
+async def chat_with_task(
     task_id: str,
     request: ChatRequest,
     user: str = Depends(get_current_user),
@@ -1387,12 +1546,54 @@ def chat_with_task(
     If DATA detects a task update intent, returns a pending_action that the
     frontend can use to show a confirmation dialog.
     """
-    from daily_task_assistant.llm.anthropic_client import chat_with_tools, AnthropicError
+    from daily_task_assistant.llm.anthropic_client import (
+        chat_with_tools_async,
+        AnthropicError,
+    )
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_task_chat, task_id, request, user)
+
+    # Call Anthropic with tool support for task updates
+    try:
+        chat_response = await chat_with_tools_async(**llm_kwargs)
+    except AnthropicError as exc:
+        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
+
+    return await run_in_threadpool(finish, chat_response)
+
+
+@app.post("/assist/{task_id}/chat/stream")
+async def chat_with_task_stream(
+    task_id: str,
+    request: ChatRequest,
+    user: str = Depends(get_current_user),
+) -> StreamingResponse:
+    """Streaming variant of /assist/{task_id}/chat over Server-Sent Events.
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    The final "done" event carries the same body as the non-streaming
+    endpoint, including pendingAction and the persisted history.
+    """
+    from daily_task_assistant.llm.anthropic_client import stream_chat_with_tools_async
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_task_chat, task_id, request, user)
+    return _sse_chat_response(lambda: stream_chat_with_tools_async(**llm_kwargs), finish)
+
+
+def _prepare_task_chat(
+    task_id: str,
+    request: ChatRequest,
+    user: str,
+) -> Tuple[Dict[str, Any], Callable[[Any], dict]]:
+    """Load the task, history and attachments for a task chat turn.
+
+    Returns:
+        Tuple of (LLM call kwargs, finish) where finish(chat_response)
+        persists the reply and builds the endpoint response body.
+    """
+
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1413,75 +1614,73 @@ def chat_with_task(
         {"role": msg.role, "content": msg.content} for msg in llm_history_messages
     ]
 
-    # Fetch selected attachments with full details
+    # Fetch selected attachments with full details (looked up concurrently)
     attachments: List[AttachmentDetail] = []
     if request.selected_attachments:
         from daily_task_assistant.smartsheet_client import SmartsheetClient
         settings = load_settings()
         ss_client = SmartsheetClient(settings)
         source_key = "personal" if target.source != "work" else "work"
-        for att_id in request.selected_attachments:
-            detail = ss_client.get_attachment_detail(att_id, source=source_key)
-            if detail:
-                attachments.append(detail)
-
-    # Call Anthropic with tool support for task updates
-    try:
-        chat_response = chat_with_tools(
-            task=target,
-            user_message=request.message,
-            history=llm_history,
-            workspace_context=request.workspace_context,
-            attachments=attachments if attachments else None,
+        attachments = ss_client.get_attachment_details(
+            request.selected_attachments, source=source_key
         )
-    except AnthropicError as exc:
-        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
 
-    # Log the assistant response
-    assistant_turn = log_assistant_message(
-        task_id,
-        content=chat_response.message,
-        plan=None,  # No structured plan for chat responses
-        metadata={
-            "source": "chat",
-            "has_pending_action": chat_response.pending_action is not None,
-        },
-    )
+    def finish(chat_response: Any) -> dict:
+        # Log the assistant response
+        assistant_turn = log_assistant_message(
+            task_id,
+            content=chat_response.message,
+            plan=None,  # No structured plan for chat responses
+            metadata={
+                "source": "chat",
+                "has_pending_action": chat_response.pending_action is not None,
+            },
+        )
 
-    # Fetch updated history
-    updated_history = fetch_conversation(task_id, limit=100)
+        # Fetch updated history
+        updated_history = fetch_conversation(task_id, limit=100)
 
-    # Build response
-    response_data = {
-        "response": chat_response.message,
-        "history": [
-            ConversationMessageModel(**asdict(msg)).model_dump()
-            for msg in updated_history
-        ],
-    }
-    
-    # Include pending action if DATA detected an update intent
-    if chat_response.pending_action:
-        action = chat_response.pending_action
-        response_data["pendingAction"] = {
-            "action": action.action,
-            "status": action.status,
-            "priority": action.priority,
-            "dueDate": action.due_date,
-            "comment": action.comment,
-            "reason": action.reason,
+        # Build response
+        response_data = {
+            "response": chat_response.message,
+            "usage": chat_response.usage.to_dict() if chat_response.usage else None,
+            "history": [
+                ConversationMessageModel(**asdict(msg)).model_dump()
+                for msg in updated_history
+            ],
         }
     
-    # Include email draft update if DATA suggested changes
-    if chat_response.email_draft_update:
-        update = chat_response.email_draft_update
-        response_data["emailDraftUpdate"] = {
-            "subject": update.subject,
-            "body": update.body,
-            "reason": update.reason,
-        }
+        # Include pending action if DATA detected an update intent
+        if chat_response.pending_action:
+            action = chat_response.pending_action
+            response_data["pendingAction"] = {
+                "action": action.action,
+                "status": action.status,
+                "priority": action.priority,
+                "dueDate": action.due_date,
+                "comment": action.comment,
+                "reason": action.reason,
+            }
+    
+        # Include email draft update if DATA suggested changes
+        if chat_response.email_draft_update:
+            update = chat_response.email_draft_update
+            response_data["emailDraftUpdate"] = {
+                "subject": update.subject,
+                "body": update.body,
+                "reason": update.reason,
+            }
+
+        return response_data
 
-    return response_data
+    llm_kwargs = {
+        "task": target,
+        "user_message": request.message,
+        "history": llm_history,
+        "workspace_context": request.workspace_context,
+        "attachments": attachments if attachments else None,
+    }
+    return llm_kwargs, finish
 
 
 class ResearchRequest(BaseModel):
@@ -1570,10 +1769,9 @@ def research_task_endpoint(
     """
     from daily_task_assistant.llm.anthropic_client import research_task, AnthropicError
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1652,10 +1850,9 @@ def contact_search_endpoint(
     """
     from daily_task_assistant.contacts import search_contacts, ContactCard
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1757,10 +1954,9 @@ def summarize_task_endpoint(
     """
     from daily_task_assistant.llm.anthropic_client import summarize_task, AnthropicError
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1837,10 +2033,9 @@ def draft_email_endpoint(
     """
     from daily_task_assistant.llm.anthropic_client import generate_email_draft, AnthropicError
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -1891,10 +2086,9 @@ def send_email_endpoint(
     """
     from daily_task_assistant.mailer import GmailError, load_account_from_env, send_email
 
-    tasks, live_tasks, settings, warning = fetch_task_dataset(
-        limit=None, source=request.source, include_work_in_all=True
+    target, live_tasks, settings, warning = fetch_task_by_id(
+        task_id, source=request.source
     )
-    target = next((task for task in tasks if task.row_id == task_id), None)
     if not target:
         raise HTTPException(status_code=404, detail="Task not found.")
 
@@ -2148,7 +2342,7 @@ def _email_to_model(msg, include_body: bool = False) -> dict:
 
 
 @app.get("/inbox/{account}")
-def get_inbox(
+async def get_inbox(
     account: Literal["church", "personal"],
     max_results: int = Query(20, ge=1, le=100),
     page_token: Optional[str] = Query(None, description="Gmail pagination token for next page"),
@@ -2162,7 +2356,7 @@ def get_inbox(
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        get_inbox_summary,
+        get_inbox_summary_async,
     )
 
     try:
@@ -2171,7 +2365,9 @@ def get_inbox(
         raise HTTPException(status_code=400, detail=f"Gmail config error: {exc}")
 
     try:
-        summary = get_inbox_summary(gmail_config, max_recent=max_results, page_token=page_token)
+        summary = await get_inbox_summary_async(
+            gmail_config, max_recent=max_results, page_token=page_token, use_cache=True
+        )
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
 
@@ -2188,7 +2384,7 @@ def get_inbox(
 
 
 @app.get("/inbox/{account}/unread")
-def get_unread(
+async def get_unread(
     account: Literal["church", "personal"],
     max_results: int = Query(20, ge=1, le=100),
     from_filter: Optional[str] = Query(None, description="Filter by sender"),
@@ -2201,7 +2397,7 @@ def get_unread(
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        get_unread_messages,
+        get_unread_messages_async,
     )
     
     try:
@@ -2210,10 +2406,11 @@ def get_unread(
         raise HTTPException(status_code=400, detail=f"Gmail config error: {exc}")
     
     try:
-        messages = get_unread_messages(
+        messages = await get_unread_messages_async(
             gmail_config,
             max_results=max_results,
             from_filter=from_filter,
+            use_cache=True,
         )
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
@@ -2227,7 +2424,7 @@ def get_unread(
 
 
 @app.get("/inbox/{account}/search")
-def search_inbox(
+async def search_inbox(
     account: Literal["church", "personal"],
     q: str = Query(..., description="Gmail search query"),
     max_results: int = Query(20, ge=1, le=100),
@@ -2245,7 +2442,7 @@ def search_inbox(
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        search_messages,
+        search_messages_async,
     )
     
     try:
@@ -2254,7 +2451,9 @@ def search_inbox(
         raise HTTPException(status_code=400, detail=f"Gmail config error: {exc}")
     
     try:
-        messages = search_messages(gmail_config, query=q, max_results=max_results)
+        messages = await search_messages_async(
+            gmail_config, query=q, max_results=max_results, use_cache=True
+        )
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
     
@@ -2333,7 +2532,8 @@ def get_thread_context(
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        get_message,
+        get_thread_cached,
+        save_thread_summary,
     )
     
     try:
@@ -2341,39 +2541,14 @@ def get_thread_context(
     except GmailError as exc:
         raise HTTPException(status_code=400, detail=f"Gmail config error: {exc}")
     
-    # Get thread messages via Gmail API
-    access_token = None
+    # Get thread messages (only messages not seen before are downloaded)
     try:
-        from daily_task_assistant.mailer.gmail import _fetch_access_token
-        import json
-        from urllib import request as urlrequest
-        from urllib import error as urlerror
-        
-        access_token = _fetch_access_token(gmail_config)
-        
-        # Fetch the thread
-        thread_url = f"https://gmail.googleapis.com/gmail/v1/users/me/threads/{thread_id}?format=full"
-        headers = {"Authorization": f"Bearer {access_token}"}
-        
-        req = urlrequest.Request(thread_url, headers=headers, method="GET")
-        with urlrequest.urlopen(req, timeout=30) as resp:
-            thread_data = json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise HTTPException(status_code=502, detail=f"Gmail API error ({exc.code}): {detail}")
-    except urlerror.URLError as exc:
-        raise HTTPException(status_code=502, detail=f"Gmail network error: {exc}")
-    
-    # Parse messages from thread
-    from daily_task_assistant.mailer.inbox import _parse_message
-    
-    thread_messages = []
-    for msg_data in thread_data.get("messages", []):
-        msg = _parse_message(msg_data, include_body=True)
-        thread_messages.append(msg)
+        snapshot = get_thread_cached(gmail_config, thread_id)
+    except GmailError as exc:
+        raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
     
     # Sort by date (oldest first for reading context)
-    thread_messages.sort(key=lambda m: m.date)
+    thread_messages = sorted(snapshot.messages, key=lambda m: m.date)
     
     # Build condensed context for older messages, full body for most recent
     messages_for_response = []
@@ -2384,7 +2559,26 @@ def get_thread_context(
     # Generate AI summary for long threads (>3 messages)
     thread_summary = None
     if len(thread_messages) > 3:
-        thread_summary = _summarize_thread(thread_messages)
+        # The summary covers every message except the latest (shown in full)
+        earlier_ids = [msg.id for msg in thread_messages[:-1]]
+        covered = snapshot.summary_message_ids
+        if snapshot.summary and covered == earlier_ids:
+            thread_summary = snapshot.summary
+        else:
+            # Extend the cached summary when the thread only grew
+            extends = bool(snapshot.summary and covered) and earlier_ids[:len(covered)] == covered
+            thread_summary = _summarize_thread(
+                thread_messages,
+                previous_summary=snapshot.summary if extends else None,
+                summarized_count=len(covered) if extends else 0,
+            )
+            if thread_summary:
+                save_thread_summary(gmail_config, thread_id, thread_summary, earlier_ids)
+            else:
+                thread_summary = (
+                    f"Thread with {len(thread_messages)} messages discussing: "
+                    f"{thread_messages[0].subject}"
+                )
     
     return {
         "account": account,
@@ -2395,46 +2589,71 @@ def get_thread_context(
     }
 
 
-def _summarize_thread(messages: list) -> str:
+def _summarize_thread(
+    messages: list,
+    *,
+    previous_summary: Optional[str] = None,
+    summarized_count: int = 0,
+) -> Optional[str]:
     """Generate a brief summary of an email thread.
     
     Uses a lightweight summarization to provide context without
     overwhelming the reply generation prompt.
+    
+    Args:
+        messages: Thread messages, oldest first. The last one is excluded
+            (it is shown in full).
+        previous_summary: Summary of the first summarized_count messages;
+            when given, only the newer messages are sent to the model.
+        summarized_count: Number of leading messages previous_summary covers.
+    
+    Returns:
+        The summary, or None if AI summarization failed.
     """
-    # Build a simple text representation of the thread
-    thread_text_parts = []
-    for msg in messages[:-1]:  # Exclude the last message (which will be shown in full)
+    def describe(msg) -> str:
         sender = msg.from_name or msg.from_address
         date_str = msg.date.strftime("%b %d")
         body_preview = (msg.body or msg.snippet or "")[:200]
         if len(msg.body or msg.snippet or "") > 200:
             body_preview += "..."
-        thread_text_parts.append(f"[{date_str}] {sender}: {body_preview}")
-    
-    thread_text = "\n\n".join(thread_text_parts)
+        return f"[{date_str}] {sender}: {body_preview}"
+
+    # Build a simple text representation of the thread
+    earlier = messages[:-1]  # Exclude the last message (which will be shown in full)
     
     # For now, return a structured summary without AI
     # This can be upgraded to use Gemini Flash for longer threads
-    if len(thread_text_parts) <= 5:
+    if len(earlier) <= 5:
+        thread_text = "\n\n".join(describe(msg) for msg in earlier)
         return f"Thread with {len(messages)} messages. Earlier exchanges:\n" + thread_text
     
+    if previous_summary:
+        new_text = "\n\n".join(describe(msg) for msg in earlier[summarized_count:])
+        prompt = (
+            f"Here is a summary of the earlier part of an email thread:\n\n{previous_summary}"
+            f"\n\nUpdate the summary to include these newer messages:\n\n{new_text}"
+        )
+    else:
+        thread_text = "\n\n".join(describe(msg) for msg in earlier)
+        prompt = f"Summarize this email thread:\n\n{thread_text}"
+
     # For very long threads, try AI summarization
     try:
-        from daily_task_assistant.llm.anthropic_client import get_client
+        from daily_task_assistant.llm.anthropic_client import build_anthropic_client
         
-        client = get_client()
+        client = build_anthropic_client()
         response = client.messages.create(
             model="claude-3-haiku-20240307",  # Fast, cheap model for summarization
             max_tokens=300,
             system="You are summarizing an email thread to help someone write a reply. Be concise and focus on: (1) Main topic, (2) Key points discussed, (3) Any action items or questions raised. Keep it under 100 words.",
             messages=[
-                {"role": "user", "content": f"Summarize this email thread:\n\n{thread_text}"}
+                {"role": "user", "content": prompt}
             ],
         )
         return response.content[0].text
     except Exception:
-        # Fall back to simple summary if AI fails
-        return f"Thread with {len(messages)} messages discussing: {messages[0].subject}"
+        # Caller falls back to a simple summary if AI fails
+        return None
 
 
 # --- Email Management endpoints ---
@@ -2633,7 +2852,7 @@ def _confidence_level_to_float(confidence_value: str) -> float:
 
 
 @app.get("/email/analyze/{account}")
-def analyze_inbox(
+async def analyze_inbox(
     account: Literal["church", "personal"],
     max_messages: int = Query(50, ge=10, le=100),
     user: str = Depends(get_current_user),
@@ -2651,57 +2870,71 @@ def analyze_inbox(
     - Save new attention items for future sessions
 
     Returns suggestions that can be approved to add as rules.
+
+    Gmail listing and hydration run on the event loop; storage reads/writes
+    and the Haiku analysis run in the threadpool.
     """
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        get_unread_messages,
-        search_messages,
-    )
-    from daily_task_assistant.sheets import FilterRulesManager, SheetsError
-    from daily_task_assistant.email import (
-        EmailAnalyzer,
-        AttentionRecord,
-        save_attention,
-        list_active_attention,
-        get_dismissed_email_ids,
-        purge_expired_records,
-        detect_attention_with_haiku,
-        get_haiku_usage_summary,
-        generate_rule_suggestions_with_haiku,
-        generate_action_suggestions_with_haiku,
-        create_suggestion,
-        has_pending_suggestion_for_email,
-        create_rule_suggestion,
-        has_pending_rule_for_pattern,
-        list_pending_rules,
-        LastAnalysisRecord,
-        save_last_analysis,
+        hydrate_cached_async,
+        list_messages_async,
     )
-    from daily_task_assistant.memory.profile import get_or_create_profile
+    from daily_task_assistant.email import load_attention_state
 
     # Load Gmail config
     try:
         gmail_config = load_account_from_env(account)
-        email_address = gmail_config.from_address
     except GmailError as exc:
         raise HTTPException(status_code=400, detail=f"Gmail config error: {exc}")
 
-    # Purge expired records (opportunistic cleanup)
+    # One read of the attention collection: purges expired records,
+    # reactivates due snoozes, and yields the dismissed and active items
+    attention_state = await run_in_threadpool(load_attention_state, account)
+    dismissed_ids = attention_state.dismissed_ids
+    persisted_email_ids = {r.email_id for r in attention_state.active}
+
+    action_labels_query = _attention_scan_query(account)
+    logger.info(f"[analyze_inbox] Query for {account}: {action_labels_query}")
+
+    # Get recent messages for analysis
+    # Use format="full" to fetch email bodies for Haiku analysis of short-snippet emails
     try:
-        purge_expired_records(account)
-    except Exception as e:
-        logger.warning(f"[analyze_inbox] Failed to purge expired records: {e}")
+        message_refs, _ = await list_messages_async(
+            gmail_config,
+            query=action_labels_query,
+            max_results=max_messages,
+        )
+    except GmailError as exc:
+        raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
 
-    # Get set of dismissed email IDs to filter out
-    dismissed_ids = get_dismissed_email_ids(account)
+    # Filter out dismissed and already-persisted emails before hydrating them
+    new_ids = [
+        ref["id"] for ref in message_refs
+        if ref["id"] not in dismissed_ids and ref["id"] not in persisted_email_ids
+    ]
+    hydration = await hydrate_cached_async(gmail_config, new_ids, format="full")
+    if hydration.failures:
+        logger.warning(
+            f"[analyze_inbox] Failed to fetch {len(hydration.failures)} messages: "
+            f"{list(hydration.failures)[:5]}"
+        )
 
-    # Get already-active attention items from persistence
-    persisted_attention = list_active_attention(account)
-    persisted_email_ids = {r.email_id for r in persisted_attention}
+    return await run_in_threadpool(
+        _analyze_messages,
+        account,
+        user,
+        gmail_config.from_address,
+        attention_state,
+        len(message_refs),
+        hydration,
+    )
 
-    # Build account-specific query to scan beyond just inbox
-    # This catches action items that automations have filed to labels
+
+def _attention_scan_query(account: str) -> str:
+    """Gmail query for recent mail in the inbox and action-oriented labels."""
+    # Scan beyond just inbox: this catches action items that automations
+    # have filed to labels
     config = ATTENTION_SCAN_CONFIG.get(account, {"include": [], "exclude": []})
 
     # Build label inclusion part (inbox + action-oriented labels)
@@ -2719,32 +2952,43 @@ def analyze_inbox(
         exclude_parts.append(f"-label:{label}")
 
     # Combine into query: recent emails in action-oriented locations
-    action_labels_query = (
-        f"newer_than:7d {' '.join(exclude_parts)} ({' OR '.join(label_parts)})"
-    )
+    return f"newer_than:7d {' '.join(exclude_parts)} ({' OR '.join(label_parts)})"
 
-    logger.info(f"[analyze_inbox] Query for {account}: {action_labels_query}")
 
-    # Get recent messages for analysis
-    # Use format="full" to fetch email bodies for Haiku analysis of short-snippet emails
-    try:
-        messages = search_messages(
-            gmail_config,
-            query=action_labels_query,
-            max_results=max_messages,
-            format="full",
-        )
-    except GmailError as exc:
-        raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
+def _analyze_messages(
+    account: str,
+    user: str,
+    email_address: str,
+    attention_state: AttentionState,
+    listed_count: int,
+    hydration: HydrationResult,
+) -> dict:
+    """Blocking half of analyze_inbox: rules, profile, Haiku and storage."""
+    from daily_task_assistant.sheets import FilterRulesManager, SheetsError
+    from daily_task_assistant.email import (
+        AttentionRecord,
+        save_attentions,
+        detect_attention_with_haiku,
+        get_haiku_usage_summary,
+        generate_rule_suggestions_with_haiku,
+        generate_action_suggestions_with_haiku,
+        create_suggestions,
+        pending_email_ids,
+        create_rule_suggestions,
+        pending_rule_patterns,
+        list_pending_rules,
+        LastAnalysisRecord,
+        save_last_analysis,
+    )
+    from daily_task_assistant.memory.profile import get_or_create_profile
 
-    # Filter out dismissed and already-persisted emails before analysis
-    messages_to_analyze = [
-        m for m in messages
-        if m.id not in dismissed_ids and m.id not in persisted_email_ids
-    ]
+    dismissed_ids = attention_state.dismissed_ids
+    persisted_attention = attention_state.active
+    persisted_email_ids = {r.email_id for r in persisted_attention}
+    messages_to_analyze = hydration.messages
 
     logger.info(
-        f"[analyze_inbox] {len(messages)} fetched, "
+        f"[analyze_inbox] {listed_count} listed, "
         f"{len(dismissed_ids)} dismissed, "
         f"{len(persisted_email_ids)} already tracked, "
         f"{len(messages_to_analyze)} to analyze"
@@ -2798,21 +3042,24 @@ def analyze_inbox(
     )
 
     # Persist rule suggestions (for Trust Gradient tracking)
-    # Skip duplicates (already pending or matches existing rule in Sheets)
-    persisted_rule_suggestions = []
+    # Skip duplicates (already pending or repeated within this run);
+    # pending patterns are loaded once rather than per suggestion
+    known_patterns = pending_rule_patterns(account)
+    new_rule_suggestions = []
     for s in suggestions:
-        # Check for duplicate pending suggestions
-        if has_pending_rule_for_pattern(
-            account,
-            field=s.suggested_rule.field,
-            value=s.suggested_rule.value,
-        ):
+        pattern = (s.suggested_rule.field, s.suggested_rule.value)
+        if pattern in known_patterns:
             logger.debug(f"[analyze_inbox] Skipping duplicate rule: {s.suggested_rule.value}")
             continue
+        known_patterns.add(pattern)
+        new_rule_suggestions.append(s)
 
-        try:
-            # Convert FilterRule to dict for storage
-            rule_dict = {
+    rule_fields = [
+        {
+            "user_id": user,
+            "suggestion_type": s.type.value,  # SuggestionType enum value
+            # FilterRule as dict for storage
+            "suggested_rule": {
                 "field": s.suggested_rule.field,
                 "operator": s.suggested_rule.operator,
                 "value": s.suggested_rule.value,
@@ -2820,31 +3067,39 @@ def analyze_inbox(
                 "category": s.suggested_rule.category,
                 "email_account": s.suggested_rule.email_account,
                 "order": s.suggested_rule.order,
-            }
+            },
+            "reason": s.reason,
+            "examples": s.examples[:5],
+            "email_count": s.email_count,
+            "confidence": _confidence_level_to_float(s.confidence.value),
+            "analysis_method": "haiku" if any(
+                haiku_results.get(ex, None) and haiku_results[ex].analysis_method == "haiku"
+                for ex in s.examples[:5] if ex in haiku_results
+            ) else "regex",
+            "category": s.suggested_rule.category,
+        }
+        for s in new_rule_suggestions
+    ]
+    try:
+        rule_records = create_rule_suggestions(account, rule_fields)
+    except Exception as e:
+        logger.warning(f"[analyze_inbox] Failed to persist rule suggestions: {e}")
+        rule_records = []
+    # Records that failed to save are left out, so match them by pattern
+    rule_ids = {
+        (r.suggested_rule.get("field"), r.suggested_rule.get("value")): r.rule_id
+        for r in rule_records
+    }
 
-            record = create_rule_suggestion(
-                account=account,
-                user_id=user,
-                suggestion_type=s.type.value,  # SuggestionType enum value
-                suggested_rule=rule_dict,
-                reason=s.reason,
-                examples=s.examples[:5],
-                email_count=s.email_count,
-                confidence=_confidence_level_to_float(s.confidence.value),
-                analysis_method="haiku" if any(
-                    haiku_results.get(ex, None) and haiku_results[ex].analysis_method == "haiku"
-                    for ex in s.examples[:5] if ex in haiku_results
-                ) else "regex",
-                category=s.suggested_rule.category,
-            )
-            # Build suggestion dict with ruleId for frontend
-            suggestion_dict = s.to_dict()
-            suggestion_dict["ruleId"] = record.rule_id
-            persisted_rule_suggestions.append(suggestion_dict)
-        except Exception as e:
-            logger.warning(f"[analyze_inbox] Failed to persist rule suggestion: {e}")
-            # Still include in response even if persistence fails
-            persisted_rule_suggestions.append(s.to_dict())
+    persisted_rule_suggestions = []
+    for s in new_rule_suggestions:
+        # Build suggestion dict with ruleId for frontend
+        # (still included without one if persistence failed)
+        suggestion_dict = s.to_dict()
+        rule_id = rule_ids.get((s.suggested_rule.field, s.suggested_rule.value))
+        if rule_id:
+            suggestion_dict["ruleId"] = rule_id
+        persisted_rule_suggestions.append(suggestion_dict)
 
     logger.info(
         f"[analyze_inbox] Persisted {len(persisted_rule_suggestions)} rule suggestions "
@@ -2852,8 +3107,8 @@ def analyze_inbox(
     )
 
     # Save new attention items to persistence
-    for item in new_attention_items:
-        record = AttentionRecord(
+    attention_records = [
+        AttentionRecord(
             email_id=item.email.id,
             email_account=account,
             user_id=user,
@@ -2871,10 +3126,14 @@ def analyze_inbox(
             matched_role=item.matched_role,
             analysis_method=item.analysis_method,
         )
-        try:
-            save_attention(account, record)
-        except Exception as e:
-            logger.warning(f"[analyze_inbox] Failed to save attention record: {e}")
+        for item in new_attention_items
+    ]
+    try:
+        failed = save_attentions(account, attention_records)
+        if failed:
+            logger.warning(f"[analyze_inbox] Failed to save {len(failed)} attention records")
+    except Exception as e:
+        logger.warning(f"[analyze_inbox] Failed to save attention records: {e}")
 
     # Combine persisted attention items with new ones for response
     # Convert persisted records to API format
@@ -2904,48 +3163,58 @@ def analyze_inbox(
         if result.analysis_method == "haiku"
     }
 
-    persisted_action_suggestions = []
+    # Pending email IDs are loaded once rather than queried per suggestion
+    known_email_ids = pending_email_ids(account)
+    new_action_suggestions = []
     skipped_duplicates = 0
     for s in action_suggestions:
         # Skip if a pending suggestion already exists for this email
-        if has_pending_suggestion_for_email(account, s.email.id):
+        if s.email.id in known_email_ids:
             skipped_duplicates += 1
             continue
+        known_email_ids.add(s.email.id)
+        new_action_suggestions.append(s)
 
-        # Determine analysis method
-        analysis_method = "haiku" if s.email.id in haiku_analyzed_ids else "regex"
+    action_fields = [
+        {
+            "email_id": s.email.id,
+            "user_id": user,
+            "action": s.action.value,  # EmailActionType enum value
+            "rationale": s.rationale,
+            "confidence": _confidence_level_to_float(s.confidence.value),
+            "label_name": s.label_name,
+            "label_id": s.label_id,
+            "task_title": s.task_title,
+            "analysis_method": "haiku" if s.email.id in haiku_analyzed_ids else "regex",
+            # Email metadata for UI display after refresh
+            "email_subject": s.email.subject,
+            "email_from": s.email.from_address,
+            "email_from_name": s.email.from_name,
+            "email_to": s.email.to_address,
+            "email_snippet": s.email.snippet,
+            "email_date": s.email.date.isoformat() if s.email.date else None,
+            "email_is_unread": s.email.is_unread,
+            "email_is_important": s.email.is_important,
+            "email_is_starred": s.email.is_starred,
+        }
+        for s in new_action_suggestions
+    ]
+    try:
+        action_records = create_suggestions(account, action_fields)
+    except Exception as e:
+        logger.warning(f"[analyze_inbox] Failed to persist action suggestions: {e}")
+        action_records = []
+    # Records that failed to save are left out, so match them by email
+    suggestion_ids = {r.email_id: r.suggestion_id for r in action_records}
 
-        try:
-            record = create_suggestion(
-                account=account,
-                email_id=s.email.id,
-                user_id=user,
-                action=s.action.value,  # EmailActionType enum value
-                rationale=s.rationale,
-                confidence=_confidence_level_to_float(s.confidence.value),
-                label_name=s.label_name,
-                label_id=s.label_id,
-                task_title=s.task_title,
-                analysis_method=analysis_method,
-                # Email metadata for UI display after refresh
-                email_subject=s.email.subject,
-                email_from=s.email.from_address,
-                email_from_name=s.email.from_name,
-                email_to=s.email.to_address,
-                email_snippet=s.email.snippet,
-                email_date=s.email.date.isoformat() if s.email.date else None,
-                email_is_unread=s.email.is_unread,
-                email_is_important=s.email.is_important,
-                email_is_starred=s.email.is_starred,
-            )
-            # Build suggestion dict with suggestionId for frontend
-            suggestion_dict = s.to_dict()
-            suggestion_dict["suggestionId"] = record.suggestion_id
-            persisted_action_suggestions.append(suggestion_dict)
-        except Exception as e:
-            logger.warning(f"[analyze_inbox] Failed to persist action suggestion: {e}")
-            # Still include in response even if persistence fails
-            persisted_action_suggestions.append(s.to_dict())
+    persisted_action_suggestions = []
+    for s in new_action_suggestions:
+        # Build suggestion dict with suggestionId for frontend
+        # (still included without one if persistence failed)
+        suggestion_dict = s.to_dict()
+        if s.email.id in suggestion_ids:
+            suggestion_dict["suggestionId"] = suggestion_ids[s.email.id]
+        persisted_action_suggestions.append(suggestion_dict)
 
     logger.info(
         f"[analyze_inbox] Persisted {len(persisted_action_suggestions)} action suggestions "
@@ -2956,7 +3225,7 @@ def analyze_inbox(
     last_analysis = LastAnalysisRecord(
         account=account,
         timestamp=datetime.now(timezone.utc).isoformat(),
-        emails_fetched=len(messages),
+        emails_fetched=listed_count,
         emails_analyzed=len(messages_to_analyze),
         already_tracked=len(persisted_email_ids),
         dismissed=len(dismissed_ids),
@@ -2974,7 +3243,8 @@ def analyze_inbox(
         "account": account,
         "email": email_address,
         # Analysis breakdown for auditing
-        "emailsFetched": len(messages),
+        "emailsFetched": listed_count,
+        "emailsFailed": len(hydration.failures),
         "emailsDismissed": len(dismissed_ids),
         "emailsAlreadyTracked": len(persisted_email_ids),
         "messagesAnalyzed": len(messages_to_analyze),
@@ -3907,7 +4177,7 @@ def check_email_privacy_status(
     Also returns overrideGranted if user previously shared this email thread.
     Use this to show privacy indicators before loading full body.
     """
-    from daily_task_assistant.mailer import GmailError, load_account_from_env, get_message, list_labels
+    from daily_task_assistant.mailer import GmailError, load_account_from_env, get_message, get_label_catalog
     from daily_task_assistant.email import get_privacy_summary_for_email
     from daily_task_assistant.conversations import get_conversation_metadata
 
@@ -3915,16 +4185,12 @@ def check_email_privacy_status(
         gmail_config = load_account_from_env(account)
         # Use metadata format - enough for labels, avoids loading body
         email = get_message(gmail_config, email_id, format="metadata")
-        # Get all labels to resolve IDs to names (Gmail returns labelIds, not names)
-        all_labels = list_labels(gmail_config)
+        # Resolve label IDs to names (Gmail returns labelIds, not names)
+        label_catalog = get_label_catalog(gmail_config)
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
 
-    # Build label ID -> name mapping and resolve email's label IDs to names
-    label_id_to_name = {label.id: label.name for label in all_labels}
-    resolved_label_names = [
-        label_id_to_name.get(label_id, label_id) for label_id in email.labels
-    ]
+    resolved_label_names = label_catalog.names_for(email.labels)
 
     # Get privacy summary (quick check without body scan)
     summary = get_privacy_summary_for_email(
@@ -4353,20 +4619,11 @@ def generate_reply_draft(
     if original_msg.thread_id:
         # Fetch thread to check if there are multiple messages
         try:
-            import json
-            from urllib import request as urlrequest
-            from urllib import error as urlerror
-            from daily_task_assistant.mailer.gmail import _fetch_access_token
+            from daily_task_assistant.mailer import get_thread_messages
             
-            access_token = _fetch_access_token(gmail_config)
-            thread_url = f"https://gmail.googleapis.com/gmail/v1/users/me/threads/{original_msg.thread_id}?format=metadata"
-            headers = {"Authorization": f"Bearer {access_token}"}
-            
-            req = urlrequest.Request(thread_url, headers=headers, method="GET")
-            with urlrequest.urlopen(req, timeout=15) as resp:
-                thread_data = json.loads(resp.read().decode("utf-8"))
-                
-            message_count = len(thread_data.get("messages", []))
+            message_count = len(
+                get_thread_messages(gmail_config, original_msg.thread_id, format="minimal")
+            )
             if message_count > 1:
                 # Fetch full thread context
                 thread_response = get_thread_context(account, original_msg.thread_id, user)
@@ -4500,7 +4757,7 @@ def get_email_action_suggestions(
         GmailError,
         load_account_from_env,
         search_messages,
-        list_labels,
+        get_label_catalog,
     )
     from daily_task_assistant.email.analyzer import generate_action_suggestions
     
@@ -4523,7 +4780,7 @@ def get_email_action_suggestions(
     # Get available labels for matching
     available_labels = []
     try:
-        labels = list_labels(gmail_config)
+        labels = get_label_catalog(gmail_config).labels
         available_labels = [
             {"id": l.id, "name": l.name, "color": l.color}
             for l in labels
@@ -4595,12 +4852,12 @@ def get_email_labels(
     from daily_task_assistant.mailer import (
         GmailError,
         load_account_from_env,
-        list_labels,
+        get_label_catalog,
     )
     
     try:
         gmail_config = load_account_from_env(account)
-        labels = list_labels(gmail_config)
+        labels = get_label_catalog(gmail_config).labels
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
     
@@ -4692,7 +4949,7 @@ class EmailChatRequest(BaseModel):
 
 
 @app.post("/email/{account}/chat")
-def chat_about_email(
+async def chat_about_email(
     account: Literal["church", "personal"],
     request: EmailChatRequest,
     user: str = Depends(get_current_user),
@@ -4705,8 +4962,51 @@ def chat_about_email(
     Conversation is persisted by thread_id (90-day TTL).
     Privacy controls determine if DATA can see the email body.
     """
-    from daily_task_assistant.llm.anthropic_client import chat_with_email, AnthropicError
-    from daily_task_assistant.mailer import GmailError, load_account_from_env, get_message, list_labels
+    from daily_task_assistant.llm.anthropic_client import (
+        chat_with_email_async,
+        AnthropicError,
+    )
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_email_chat, account, request, user)
+
+    # Chat with DATA
+    try:
+        chat_response = await chat_with_email_async(**llm_kwargs)
+    except AnthropicError as exc:
+        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
+
+    return await run_in_threadpool(finish, chat_response)
+
+
+@app.post("/email/{account}/chat/stream")
+async def chat_about_email_stream(
+    account: Literal["church", "personal"],
+    request: EmailChatRequest,
+    user: str = Depends(get_current_user),
+) -> StreamingResponse:
+    """Streaming variant of /email/{account}/chat over Server-Sent Events.
+
+    The final "done" event carries the same body as the non-streaming
+    endpoint, including pendingAction and privacyStatus.
+    """
+    from daily_task_assistant.llm.anthropic_client import stream_chat_with_email_async
+
+    llm_kwargs, finish = await run_in_threadpool(_prepare_email_chat, account, request, user)
+    return _sse_chat_response(lambda: stream_chat_with_email_async(**llm_kwargs), finish)
+
+
+def _prepare_email_chat(
+    account: str,
+    request: EmailChatRequest,
+    user: str,
+) -> Tuple[Dict[str, Any], Callable[[Any], dict]]:
+    """Load the email, apply privacy controls and build context for a chat turn.
+
+    Returns:
+        Tuple of (LLM call kwargs, finish) where finish(chat_response)
+        persists the conversation and builds the endpoint response body.
+    """
+    from daily_task_assistant.mailer import GmailError, load_account_from_env, get_message, get_label_catalog
     from daily_task_assistant.conversations import (
         fetch_email_conversation,
         log_email_message,
@@ -4721,16 +5021,12 @@ def chat_about_email(
     try:
         gmail_config = load_account_from_env(account)
         email = get_message(gmail_config, request.email_id, format="full")
-        # Get all labels to resolve IDs to names (Gmail returns labelIds, not names)
-        all_labels = list_labels(gmail_config)
+        # Resolve label IDs to names (Gmail returns labelIds, not names)
+        label_catalog = get_label_catalog(gmail_config)
     except GmailError as exc:
         raise HTTPException(status_code=502, detail=f"Gmail API error: {exc}")
 
-    # Build label ID -> name mapping and resolve email's label IDs to names
-    label_id_to_name = {label.id: label.name for label in all_labels}
-    resolved_label_names = [
-        label_id_to_name.get(label_id, label_id) for label_id in email.labels
-    ]
+    resolved_label_names = label_catalog.names_for(email.labels)
 
     # Use thread_id for conversation persistence (falls back to email_id)
     thread_id = request.thread_id or email.thread_id
@@ -4836,75 +5132,74 @@ Email Body:
         if persisted_msgs:
             history = [{"role": m.role, "content": m.content} for m in persisted_msgs]
 
-    # Chat with DATA
-    try:
-        chat_response = chat_with_email(
-            email_context=email_context,
-            user_message=request.message,
-            history=history,
+    def finish(chat_response: Any) -> dict:
+        # Persist conversation messages
+        log_email_message(
+            account=account,
+            thread_id=thread_id,
+            role="user",
+            content=request.message,
+            email_context=request.email_id,
+            user_email=user,
+        )
+        log_email_message(
+            account=account,
+            thread_id=thread_id,
+            role="assistant",
+            content=chat_response.message,
+            email_context=request.email_id,
         )
-    except AnthropicError as exc:
-        raise HTTPException(status_code=502, detail=f"AI service error: {exc}")
-
-    # Persist conversation messages
-    log_email_message(
-        account=account,
-        thread_id=thread_id,
-        role="user",
-        content=request.message,
-        email_context=request.email_id,
-        user_email=user,
-    )
-    log_email_message(
-        account=account,
-        thread_id=thread_id,
-        role="assistant",
-        content=chat_response.message,
-        email_context=request.email_id,
-    )
-
-    # Update conversation metadata
-    update_conversation_metadata(
-        account=account,
-        thread_id=thread_id,
-        subject=email.subject,
-        from_email=email.from_address,
-        from_name=email.from_name,
-        last_email_date=email.date.isoformat() if email.date else None,
-    )
 
-    # Build response
-    response_data = {
-        "response": chat_response.message,
-        "account": account,
-        "emailId": request.email_id,
-        "threadId": thread_id,
-        "privacyStatus": {
-            "canSeeBody": privacy_result.can_see_body,
-            "blockedReason": privacy_result.blocked_reason,
-            "blockedReasonDisplay": privacy_result.blocked_reason_display,
-            "overrideGranted": privacy_result.override_granted,
-        },
-    }
+        # Update conversation metadata
+        update_conversation_metadata(
+            account=account,
+            thread_id=thread_id,
+            subject=email.subject,
+            from_email=email.from_address,
+            from_name=email.from_name,
+            last_email_date=email.date.isoformat() if email.date else None,
+        )
 
-    # Include pending action if DATA detected one
-    if chat_response.pending_action:
-        action = chat_response.pending_action
-        pending_action_data = {
-            "action": action.action,
-            "reason": action.reason,
+        # Build response
+        response_data = {
+            "response": chat_response.message,
+            "account": account,
+            "emailId": request.email_id,
+            "threadId": thread_id,
+            "usage": chat_response.usage.to_dict() if chat_response.usage else None,
+            "privacyStatus": {
+                "canSeeBody": privacy_result.can_see_body,
+                "blockedReason": privacy_result.blocked_reason,
+                "blockedReasonDisplay": privacy_result.blocked_reason_display,
+                "overrideGranted": privacy_result.override_granted,
+            },
         }
-        if action.task_title:
-            pending_action_data["taskTitle"] = action.task_title
-        if action.draft_body:
-            pending_action_data["draftBody"] = action.draft_body
-        if action.draft_subject:
-            pending_action_data["draftSubject"] = action.draft_subject
-        if action.label_name:
-            pending_action_data["labelName"] = action.label_name
-        response_data["pendingAction"] = pending_action_data
 
-    return response_data
+        # Include pending action if DATA detected one
+        if chat_response.pending_action:
+            action = chat_response.pending_action
+            pending_action_data = {
+                "action": action.action,
+                "reason": action.reason,
+            }
+            if action.task_title:
+                pending_action_data["taskTitle"] = action.task_title
+            if action.draft_body:
+                pending_action_data["draftBody"] = action.draft_body
+            if action.draft_subject:
+                pending_action_data["draftSubject"] = action.draft_subject
+            if action.label_name:
+                pending_action_data["labelName"] = action.label_name
+            response_data["pendingAction"] = pending_action_data
+
+        return response_data
+
+    llm_kwargs = {
+        "email_context": email_context,
+        "user_message": request.message,
+        "history": history,
+    }
+    return llm_kwargs, finish
 
 
 @app.get("/email/{account}/conversation/{thread_id}")
@@ -6358,7 +6653,7 @@ def list_calendars_endpoint(
 
 
 @app.get("/calendar/{account}/events")
-def list_events_endpoint(
+async def list_events_endpoint(
     account: Literal["church", "personal"],
     calendar_id: str = Query("primary", alias="calendarId"),
     time_min: Optional[str] = Query(None, alias="timeMin", description="Start time (ISO format)"),
@@ -6385,7 +6680,7 @@ def list_events_endpoint(
     from daily_task_assistant.calendar import (
         CalendarError,
         load_account_from_env,
-        list_events,
+        list_events_cached_async,
     )
 
     try:
@@ -6395,7 +6690,7 @@ def list_events_endpoint(
         time_min_dt = datetime.fromisoformat(time_min) if time_min else None
         time_max_dt = datetime.fromisoformat(time_max) if time_max else None
 
-        response = list_events(
+        response = await list_events_cached_async(
             config,
             calendar_id=calendar_id,
             time_min=time_min_dt,
@@ -6419,7 +6714,7 @@ def list_events_endpoint(
 
 
 @app.get("/calendar/{account}/events/{event_id}")
-def get_event_endpoint(
+async def get_event_endpoint(
     account: Literal["church", "personal"],
     event_id: str,
     calendar_id: str = Query("primary", alias="calendarId"),
@@ -6440,12 +6735,12 @@ def get_event_endpoint(
     from daily_task_assistant.calendar import (
         CalendarError,
         load_account_from_env,
-        get_event,
+        get_event_async,
     )
 
     try:
         config = load_account_from_env(account)
-        event = get_event(config, calendar_id, event_id, source_domain=source_domain)
+        event = await get_event_async(config, calendar_id, event_id, source_domain=source_domain)
     except CalendarError as exc:
         raise HTTPException(status_code=502, detail=f"Calendar API error: {exc}")
 
@@ -6474,6 +6769,7 @@ def create_event_endpoint(
         CalendarError,
         load_account_from_env,
         create_event,
+        mark_calendar_stale,
     )
 
     try:
@@ -6496,6 +6792,7 @@ def create_event_endpoint(
             send_notifications=request.send_notifications,
             source_domain=account,  # Use account as source domain for new events
         )
+        mark_calendar_stale(config, request.calendar_id)
     except CalendarError as exc:
         raise HTTPException(status_code=502, detail=f"Calendar API error: {exc}")
     except ValueError as exc:
@@ -6529,6 +6826,7 @@ def update_event_endpoint(
         CalendarError,
         load_account_from_env,
         update_event,
+        mark_calendar_stale,
     )
 
     try:
@@ -6551,6 +6849,7 @@ def update_event_endpoint(
             send_notifications=request.send_notifications,
             source_domain=account,
         )
+        mark_calendar_stale(config, request.calendar_id)
     except CalendarError as exc:
         raise HTTPException(status_code=502, detail=f"Calendar API error: {exc}")
     except ValueError as exc:
@@ -6586,11 +6885,13 @@ def delete_event_endpoint(
         CalendarError,
         load_account_from_env,
         delete_event,
+        mark_calendar_stale,
     )
 
     try:
         config = load_account_from_env(account)
         delete_event(config, calendar_id, event_id, send_notifications=send_notifications)
+        mark_calendar_stale(config, calendar_id)
     except CalendarError as exc:
         raise HTTPException(status_code=502, detail=f"Calendar API error: {exc}")
 
@@ -6624,6 +6925,7 @@ def quick_add_event_endpoint(
         CalendarError,
         load_account_from_env,
         quick_add_event,
+        mark_calendar_stale,
     )
 
     try:
@@ -6635,6 +6937,7 @@ def quick_add_event_endpoint(
             send_notifications=request.send_notifications,
             source_domain=account,
         )
+        mark_calendar_stale(config, request.calendar_id)
     except CalendarError as exc:
         raise HTTPException(status_code=502, detail=f"Calendar API error: {exc}")
 
@@ -6836,7 +7139,7 @@ def analyze_calendar_events(
     from datetime import datetime, timezone, timedelta
     from daily_task_assistant.calendar import (
         load_account_from_env,
-        list_events,
+        list_events_cached,
         analyze_events,
         get_calendar_settings,
     )
@@ -6853,7 +7156,7 @@ def analyze_calendar_events(
     time_max = now + timedelta(days=days_ahead)
 
     try:
-        response = list_events(
+        response = list_events_cached(
             cal_account,
             calendar_id="primary",
             time_min=now,
@@ -6916,7 +7219,7 @@ class CalendarChatRequestModel(BaseModel):
 
 
 @app.post("/calendar/{domain}/chat")
-def chat_about_calendar(
+async def chat_about_calendar(
     domain: Literal["personal", "church", "work", "combined"],
     request: CalendarChatRequestModel,
     user: str = Depends(get_current_user),
@@ -6928,12 +7231,49 @@ def chat_about_calendar(
 
     Conversation is persisted by domain (7-day TTL).
     """
-    from datetime import datetime, timezone
     from daily_task_assistant.calendar.chat import (
-        handle_calendar_chat,
-        CalendarChatRequest,
+        handle_calendar_chat_async,
         CalendarChatError,
     )
+
+    chat_request = _build_calendar_chat_request(domain, request)
+
+    # Handle chat
+    try:
+        response = await handle_calendar_chat_async(chat_request, user_email=user)
+    except CalendarChatError as exc:
+        raise HTTPException(status_code=502, detail=str(exc))
+
+    return _calendar_chat_result(response)
+
+
+@app.post("/calendar/{domain}/chat/stream")
+async def chat_about_calendar_stream(
+    domain: Literal["personal", "church", "work", "combined"],
+    request: CalendarChatRequestModel,
+    user: str = Depends(get_current_user),
+) -> StreamingResponse:
+    """Streaming variant of /calendar/{domain}/chat over Server-Sent Events.
+
+    The final "done" event carries the same body as the non-streaming
+    endpoint, including any pending calendar/task actions.
+    """
+    from daily_task_assistant.calendar.chat import stream_calendar_chat_async
+
+    chat_request = _build_calendar_chat_request(domain, request)
+    return _sse_chat_response(
+        lambda: stream_calendar_chat_async(chat_request, user_email=user),
+        _calendar_chat_result,
+    )
+
+
+def _build_calendar_chat_request(
+    domain: str,
+    request: CalendarChatRequestModel,
+) -> Any:
+    """Convert the frontend chat payload into a CalendarChatRequest."""
+    from datetime import datetime, timezone
+    from daily_task_assistant.calendar.chat import CalendarChatRequest
     from daily_task_assistant.calendar.types import (
         CalendarEvent,
         CalendarAttentionRecord,
@@ -7063,7 +7403,7 @@ def chat_about_calendar(
         filtered_tasks = request.tasks
 
     # Build chat request
-    chat_request = CalendarChatRequest(
+    return CalendarChatRequest(
         message=request.message,
         domain=domain,  # type: ignore
         selected_event_id=request.selectedEventId,
@@ -7076,25 +7416,25 @@ def chat_about_calendar(
         history=request.history,
     )
 
-    # Handle chat
-    try:
-        response = handle_calendar_chat(chat_request, user_email=user)
-    except CalendarChatError as exc:
-        raise HTTPException(status_code=502, detail=str(exc))
 
+
+def _calendar_chat_result(chat_response: Any) -> dict:
+    """Build the API response body from a CalendarChatResponse."""
     # Build API response
     result = {
-        "response": response.response,
-        "domain": response.domain,
+        "response": chat_response.response,
+        "domain": chat_response.domain,
     }
 
     # Pass through pending action dicts (already formatted by chat.py)
-    if response.pending_calendar_action:
-        result["pendingCalendarAction"] = response.pending_calendar_action
-    if response.pending_task_creation:
-        result["pendingTaskCreation"] = response.pending_task_creation
-    if response.pending_task_update:
-        result["pendingTaskUpdate"] = response.pending_task_update
+    if chat_response.pending_calendar_action:
+        result["pendingCalendarAction"] = chat_response.pending_calendar_action
+    if chat_response.pending_task_creation:
+        result["pendingTaskCreation"] = chat_response.pending_task_creation
+    if chat_response.pending_task_update:
+        result["pendingTaskUpdate"] = chat_response.pending_task_update
+    if chat_response.usage:
+        result["usage"] = chat_response.usage
 
     return result
 
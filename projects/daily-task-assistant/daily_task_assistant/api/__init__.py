@@ -1,6 +1,6 @@
 """API utilities for Daily Task Assistant."""
 
-from .auth import get_current_user
+from .auth import clear_auth_caches, get_current_user, verify_token
 
-__all__ = ["get_current_user"]
+__all__ = ["clear_auth_caches", "get_current_user", "verify_token"]
 
@@ -1,8 +1,25 @@
-"""Google ID token verification helpers."""
+"""Google ID token verification helpers.
+
+A dashboard load makes dozens of API calls with the same bearer token.
+Verified tokens are cached (keyed by a hash of the token) until their
+``exp`` claim, and Google's signing certificates are fetched over a shared
+session and reused for as long as their Cache-Control max-age allows, so
+a repeat call costs a dictionary lookup instead of a network round trip.
+
+Environment Variables:
+    DTA_AUTH_TOKEN_CACHE_SIZE: Verified tokens kept in memory (default 256, 0 disables)
+"""
 from __future__ import annotations
 
+import hashlib
 import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from fastapi import Header, HTTPException, status
 from google.auth.transport import requests as google_requests
@@ -42,6 +59,154 @@ def _allowed_emails() -> set[str]:
     return {email.lower() for email in DEFAULT_ALLOWED_EMAILS}
 
 
+# =============================================================================
+# Verification Caches
+# =============================================================================
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _token_cache_size() -> int:
+    try:
+        return max(0, int(os.getenv("DTA_AUTH_TOKEN_CACHE_SIZE", "256")))
+    except ValueError:
+        return 256
+
+
+def _max_age_seconds(headers: Any) -> int:
+    """Return how long a response may be reused per its Cache-Control header."""
+    headers = headers or {}
+    cache_control = headers.get("cache-control") or headers.get("Cache-Control") or ""
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    response: Any
+    expires_at: float  # time.monotonic() deadline
+
+
+class _CachingCertRequest:
+    """google.auth transport that caches GET responses per Cache-Control.
+
+    Only used for the public signing-certificate endpoints, which Google
+    serves with a max-age of several hours. Requests share one pooled
+    ``requests`` session.
+    """
+
+    def __init__(self, request: Optional[Any] = None) -> None:
+        self._request = request or google_requests.Request()
+        self._responses: Dict[str, _CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, method: str = "GET", **kwargs: Any) -> Any:
+        if method.upper() != "GET" or kwargs.get("body") is not None:
+            return self._request(url, method=method, **kwargs)
+
+        cached = self._responses.get(url)
+        if cached is not None and time.monotonic() < cached.expires_at:
+            return cached.response
+
+        with self._lock:
+            # Another thread may have refreshed while we waited
+            cached = self._responses.get(url)
+            if cached is not None and time.monotonic() < cached.expires_at:
+                return cached.response
+
+            response = self._request(url, method=method, **kwargs)
+            max_age = _max_age_seconds(response.headers)
+            if response.status == 200 and max_age > 0:
+                self._responses[url] = _CachedResponse(
+                    response=response, expires_at=time.monotonic() + max_age
+                )
+            return response
+
+    def clear(self) -> None:
+        self._responses.clear()
+
+
+@dataclass(slots=True)
+class _VerifiedToken:
+    idinfo: Dict[str, Any]
+    expires_at: float  # the token's exp claim (Unix time)
+
+
+_cert_request = _CachingCertRequest()
+_verified_tokens: "OrderedDict[str, _VerifiedToken]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _token_key(token: str) -> str:
+    # Hash the token so bearer credentials are not held as dict keys
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _cached_idinfo(key: str) -> Optional[Dict[str, Any]]:
+    with _verified_lock:
+        entry = _verified_tokens.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry.expires_at:
+            del _verified_tokens[key]
+            return None
+        _verified_tokens.move_to_end(key)
+        return entry.idinfo
+
+
+def _remember_idinfo(key: str, idinfo: Dict[str, Any]) -> None:
+    max_entries = _token_cache_size()
+    exp = idinfo.get("exp")
+    if not max_entries or not isinstance(exp, (int, float)):
+        return
+    with _verified_lock:
+        _verified_tokens[key] = _VerifiedToken(idinfo=idinfo, expires_at=float(exp))
+        _verified_tokens.move_to_end(key)
+        while len(_verified_tokens) > max_entries:
+            _verified_tokens.popitem(last=False)
+
+
+def verify_token(token: str) -> Dict[str, Any]:
+    """Verify a Google ID token against the configured audiences.
+
+    Returns the token's claims. Tokens that verified before are served from
+    memory until they expire.
+
+    Raises:
+        AuthError: If no audience is configured or the token is invalid.
+    """
+    key = _token_key(token)
+    idinfo = _cached_idinfo(key)
+    if idinfo is not None:
+        return idinfo
+
+    audiences = _audiences()
+    if not audiences:
+        raise AuthError("Server missing GOOGLE_OAUTH_CLIENT_ID or audience config.")
+
+    validation_error: ValueError | None = None
+    for audience in audiences:
+        try:
+            idinfo = id_token.verify_oauth2_token(token, _cert_request, audience)
+            break
+        except ValueError as exc:
+            validation_error = exc
+    else:
+        raise AuthError(f"Invalid token: {validation_error}")
+
+    _remember_idinfo(key, idinfo)
+    return idinfo
+
+
+def clear_auth_caches() -> None:
+    """Drop cached verified tokens and signing certificates."""
+    with _verified_lock:
+        _verified_tokens.clear()
+    _cert_request.clear()
+
+
 def get_current_user(
     authorization: str | None = Header(default=None, alias="Authorization"),
     dev_user: str | None = Header(default=None, alias="X-User-Email"),
@@ -69,20 +234,7 @@ def get_current_user(
         raise AuthError("Missing Bearer token.")
 
     token = authorization.split(" ", 1)[1].strip()
-    request = google_requests.Request()
-    audiences = _audiences()
-    if not audiences:
-        raise AuthError("Server missing GOOGLE_OAUTH_CLIENT_ID or audience config.")
-
-    validation_error: ValueError | None = None
-    for audience in audiences:
-        try:
-            idinfo = id_token.verify_oauth2_token(token, request, audience)
-            break
-        except ValueError as exc:
-            validation_error = exc
-    else:
-        raise AuthError(f"Invalid token: {validation_error}")
+    idinfo = verify_token(token)
 
     email = idinfo.get("email")
     if not email:
@@ -17,6 +17,7 @@ from .types import (
     CalendarSettings,
     CalendarListResponse,
     EventListResponse,
+    EventSyncPage,
     # Phase CA-1: Calendar Attention
     CalendarAttentionRecord,
     CalendarAttentionType,
@@ -26,18 +27,31 @@ from .types import (
 
 from .google_calendar import (
     CalendarError,
+    SyncTokenExpiredError,
     CalendarAccountConfig,
     load_account_from_env,
     list_calendars,
     get_calendar,
     list_events,
+    list_events_async,
+    sync_events,
     get_event,
+    get_event_async,
     create_event,
     update_event,
     delete_event,
     quick_add_event,
 )
 
+from .event_cache import (
+    EventCache,
+    get_event_cache,
+    list_events_cached,
+    list_events_cached_async,
+    mark_calendar_stale,
+    sync_calendar,
+)
+
 from .calendar_store import (
     get_calendar_settings,
     save_calendar_settings,
@@ -69,6 +83,7 @@ __all__ = [
     "CalendarSettings",
     "CalendarListResponse",
     "EventListResponse",
+    "EventSyncPage",
     # Phase CA-1: Attention Types
     "CalendarAttentionRecord",
     "CalendarAttentionType",
@@ -76,16 +91,27 @@ __all__ = [
     "CalendarActionType",
     # API Client
     "CalendarError",
+    "SyncTokenExpiredError",
     "CalendarAccountConfig",
     "load_account_from_env",
     "list_calendars",
     "get_calendar",
     "list_events",
+    "list_events_async",
+    "sync_events",
     "get_event",
+    "get_event_async",
     "create_event",
     "update_event",
     "delete_event",
     "quick_add_event",
+    # Event Cache (incremental sync)
+    "EventCache",
+    "get_event_cache",
+    "list_events_cached",
+    "list_events_cached_async",
+    "mark_calendar_stale",
+    "sync_calendar",
     # Settings Store
     "get_calendar_settings",
     "save_calendar_settings",
@@ -8,9 +8,10 @@ same data is accessible regardless of which user identity is used to log in.
 
 Firestore Structure:
     email_accounts/{account}/calendar_attention/{event_id} -> CalendarAttentionRecord
+    email_accounts/{account}/metric_rollups/calendar_attention_{day} -> per-day quality counters
 
 File Storage Structure:
-    calendar_attention_store/{account}/{event_id}.json
+    calendar_attention_store/store.sqlite3 -> (account, event_id) documents (see local_store)
 
 Environment Variables:
     DTA_CALENDAR_ATTENTION_FORCE_FILE: Set to "1" to use local file storage (dev mode)
@@ -18,13 +19,14 @@ Environment Variables:
 """
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..firestore import get_firestore_client
+from ..firestore import delete_documents, get_firestore_client
+from ..local_store import LocalStore, get_local_store
+from ..metric_rollups import read_rollups_firestore, save_with_rollups, window_start
 from .types import CalendarAttentionRecord, _now
 
 
@@ -44,6 +46,23 @@ def _attention_dir() -> Path:
     )
 
 
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode."""
+    return get_local_store(_attention_dir(), rollup_keys=_rollup_keys)
+
+
+def _rollup_keys(data: Dict[str, Any]) -> List[str]:
+    """Metric counter keys for a calendar attention record (see metric_rollups)."""
+    keys = [
+        "total",
+        f"status:{data.get('status', 'active')}",
+        f"type:{data.get('attention_type', 'prep_needed')}",
+    ]
+    if data.get("action_type"):
+        keys.append(f"action:{data['action_type']}")
+    return keys
+
+
 # =============================================================================
 # CRUD Operations
 # =============================================================================
@@ -63,12 +82,7 @@ def save_attention(account: str, record: CalendarAttentionRecord) -> None:
 
 def _save_attention_file(account: str, record: CalendarAttentionRecord) -> None:
     """Save attention record to file storage."""
-    store_dir = _attention_dir() / account
-    store_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = store_dir / f"{record.event_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(record.to_dict(), f, indent=2)
+    _local_store().put(account, record.event_id, record.to_dict())
 
 
 def _save_attention_firestore(account: str, record: CalendarAttentionRecord) -> None:
@@ -84,7 +98,10 @@ def _save_attention_firestore(account: str, record: CalendarAttentionRecord) ->
         .collection("calendar_attention")
         .document(record.event_id)
     )
-    doc_ref.set(record.to_dict())
+    save_with_rollups(
+        db, doc_ref, record.to_dict(),
+        account=account, store="calendar_attention", keys=_rollup_keys,
+    )
 
 
 def get_attention(account: str, event_id: str) -> Optional[CalendarAttentionRecord]:
@@ -104,18 +121,16 @@ def get_attention(account: str, event_id: str) -> Optional[CalendarAttentionReco
 
 def _get_attention_file(account: str, event_id: str) -> Optional[CalendarAttentionRecord]:
     """Get attention record from file storage."""
-    file_path = _attention_dir() / account / f"{event_id}.json"
-    if not file_path.exists():
+    store = _local_store()
+    data = store.get(account, event_id)
+    if data is None:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     record = CalendarAttentionRecord.from_dict(data)
 
     # Check expiration
     if record.is_expired():
-        file_path.unlink()
+        store.delete(account, event_id)
         return None
 
     return record
@@ -164,27 +179,15 @@ def list_active_attention(account: str) -> List[CalendarAttentionRecord]:
 
 def _list_active_attention_file(account: str) -> List[CalendarAttentionRecord]:
     """List active attention records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return []
+    store = _local_store()
 
-    records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    # Drop expired records before reading
+    store.delete_where(account, expires_before=_now())
 
-        record = CalendarAttentionRecord.from_dict(data)
-
-        # Skip expired records (and delete them)
-        if record.is_expired():
-            file_path.unlink()
-            continue
-
-        # Skip non-active records
-        if record.status != "active":
-            continue
-
-        records.append(record)
+    records = [
+        CalendarAttentionRecord.from_dict(data)
+        for data in store.query(account, status="active")
+    ]
 
     # Sort by start time (upcoming first)
     records.sort(key=lambda r: r.start)
@@ -314,6 +317,9 @@ def mark_viewed(account: str, event_id: str) -> bool:
 def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     """Get quality metrics for calendar attention items.
 
+    Metrics are summed from per-day counters kept up to date as items are
+    created and acted on (see metric_rollups).
+
     Args:
         account: Calendar account ("church", "personal", or "work")
         days: Number of days to look back
@@ -321,30 +327,22 @@ def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     Returns:
         Dictionary with quality metrics including acceptance rates
     """
-    from datetime import timedelta
-
-    cutoff = _now() - timedelta(days=days)
-
-    # Get all attention records
     if _force_file_fallback():
-        records = _get_all_records_file(account)
+        counts = _get_metric_counts_file(account, days)
     else:
-        records = _get_all_records_firestore(account)
-
-    # Filter by date
-    filtered = [r for r in records if r.created_at >= cutoff]
+        counts = _get_metric_counts_firestore(account, days)
 
     # Aggregate metrics
-    total = len(filtered)
+    total = counts.get("total", 0)
     by_status = {"active": 0, "dismissed": 0, "acted": 0, "expired": 0}
     by_type = {"vip_meeting": 0, "prep_needed": 0, "task_conflict": 0, "overcommitment": 0}
     by_action = {"viewed": 0, "dismissed": 0, "task_linked": 0, "prep_started": 0}
 
-    for record in filtered:
-        by_status[record.status] = by_status.get(record.status, 0) + 1
-        by_type[record.attention_type] = by_type.get(record.attention_type, 0) + 1
-        if record.action_type:
-            by_action[record.action_type] = by_action.get(record.action_type, 0) + 1
+    groups = {"status": by_status, "type": by_type, "action": by_action}
+    for key, count in counts.items():
+        dimension, _, value = key.partition(":")
+        if dimension in groups:
+            groups[dimension][value] = count
 
     # Calculate acceptance rate (acted / total shown)
     accepted = by_status.get("acted", 0)
@@ -360,38 +358,26 @@ def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     }
 
 
-def _get_all_records_file(account: str) -> List[CalendarAttentionRecord]:
-    """Get all attention records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return []
+def _get_metric_counts_file(account: str, days: int) -> Dict[str, int]:
+    """Sum the quality counters for the window from file storage."""
+    return _local_store().read_rollups(account, window_start(days))
 
-    records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        records.append(CalendarAttentionRecord.from_dict(data))
-
-    return records
 
-
-def _get_all_records_firestore(account: str) -> List[CalendarAttentionRecord]:
-    """Get all attention records from Firestore."""
+def _get_metric_counts_firestore(account: str, days: int) -> Dict[str, int]:
+    """Sum the quality counters for the window from Firestore."""
     db = get_firestore_client()
     if db is None:
-        return _get_all_records_file(account)
+        return _get_metric_counts_file(account, days)
 
     collection_ref = (
         db.collection("email_accounts")
         .document(account)
         .collection("calendar_attention")
     )
-
-    records = []
-    for doc in collection_ref.stream():
-        records.append(CalendarAttentionRecord.from_dict(doc.to_dict()))
-
-    return records
+    return read_rollups_firestore(
+        db, collection_ref,
+        account=account, store="calendar_attention", keys=_rollup_keys, days=days,
+    )
 
 
 def purge_expired_records(account: str) -> int:
@@ -410,21 +396,7 @@ def purge_expired_records(account: str) -> int:
 
 def _purge_expired_file(account: str) -> int:
     """Purge expired records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return 0
-
-    count = 0
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        record = CalendarAttentionRecord.from_dict(data)
-        if record.is_expired():
-            file_path.unlink()
-            count += 1
-
-    return count
+    return _local_store().delete_where(account, expires_before=_now())
 
 
 def _purge_expired_firestore(account: str) -> int:
@@ -443,9 +415,4 @@ def _purge_expired_firestore(account: str) -> int:
     # Query for expired items
     query = collection_ref.where("expires_at", "<", now_str)
 
-    count = 0
-    for doc in query.stream():
-        doc.reference.delete()
-        count += 1
-
-    return count
+    return delete_documents(db, query.stream()).written
@@ -10,10 +10,11 @@ No privacy tiers like email - calendar is fully visible to DATA.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Literal, Optional
 
 from .types import CalendarEvent, CalendarAttentionRecord
 from .context import build_calendar_context, DomainType
@@ -24,6 +25,9 @@ from ..conversations.calendar_history import (
 )
 from ..smartsheet_client import SmartsheetClient, SmartsheetAPIError
 
+if TYPE_CHECKING:
+    from ..llm.anthropic_client import ChatStreamEvent
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,15 +68,17 @@ class CalendarChatResponse:
         pending_calendar_action: Event creation/update/delete action
         pending_task_creation: New task to create
         pending_task_update: Task update action
+        usage: Token counts for the LLM call (including prompt cache hits)
     """
     response: str
     domain: DomainType
     pending_calendar_action: Optional[Dict[str, Any]] = None
     pending_task_creation: Optional[Dict[str, Any]] = None
     pending_task_update: Optional[Dict[str, Any]] = None
+    usage: Optional[Dict[str, int]] = None
 
 
-def handle_calendar_chat(
+async def handle_calendar_chat_async(
     request: CalendarChatRequest,
     user_email: Optional[str] = None,
 ) -> CalendarChatResponse:
@@ -86,6 +92,9 @@ def handle_calendar_chat(
     5. Persists messages
     6. Returns response with any pending actions
 
+    History loading and persistence run on worker threads; the LLM call
+    is awaited.
+
     Args:
         request: CalendarChatRequest with all context
         user_email: User's email for logging
@@ -94,10 +103,56 @@ def handle_calendar_chat(
         CalendarChatResponse with DATA's message and pending actions
     """
     from ..llm.anthropic_client import (
-        chat_with_calendar,
+        chat_with_calendar_async,
+        AnthropicError,
+    )
+
+    llm_kwargs = await asyncio.to_thread(_prepare_calendar_chat, request)
+
+    try:
+        llm_response = await chat_with_calendar_async(**llm_kwargs)
+    except AnthropicError as exc:
+        raise CalendarChatError(f"AI service error: {exc}") from exc
+
+    return await asyncio.to_thread(_finish_calendar_chat, request, llm_response, user_email)
+
+
+async def stream_calendar_chat_async(
+    request: CalendarChatRequest,
+    user_email: Optional[str] = None,
+) -> AsyncIterator["ChatStreamEvent"]:
+    """Streaming variant of handle_calendar_chat_async.
+
+    Forwards text and tool events from the LLM as they arrive. The final
+    event's response is the CalendarChatResponse handle_calendar_chat_async
+    would return, produced after the messages are persisted.
+
+    Raises:
+        CalendarChatError: If the LLM call fails (while iterating)
+    """
+    from ..llm.anthropic_client import (
+        stream_chat_with_calendar_async,
         AnthropicError,
+        ChatStreamEvent,
     )
 
+    llm_kwargs = await asyncio.to_thread(_prepare_calendar_chat, request)
+
+    try:
+        async for event in stream_chat_with_calendar_async(**llm_kwargs):
+            if event.type == "final":
+                response = await asyncio.to_thread(
+                    _finish_calendar_chat, request, event.response, user_email
+                )
+                yield ChatStreamEvent(type="final", response=response)
+            else:
+                yield event
+    except AnthropicError as exc:
+        raise CalendarChatError(f"AI service error: {exc}") from exc
+
+
+def _prepare_calendar_chat(request: CalendarChatRequest) -> Dict[str, Any]:
+    """Build the LLM call arguments (context and history) for a chat request."""
     # Find selected event if specified
     selected_event = None
     if request.selected_event_id:
@@ -135,16 +190,19 @@ def handle_calendar_chat(
         if persisted_msgs:
             history = [{"role": m.role, "content": m.content} for m in persisted_msgs]
 
-    # Call DATA
-    try:
-        llm_response = chat_with_calendar(
-            calendar_context=context,
-            user_message=request.message,
-            history=history,
-        )
-    except AnthropicError as exc:
-        raise CalendarChatError(f"AI service error: {exc}") from exc
+    return {
+        "calendar_context": context,
+        "user_message": request.message,
+        "history": history,
+    }
 
+
+def _finish_calendar_chat(
+    request: CalendarChatRequest,
+    llm_response: Any,
+    user_email: Optional[str],
+) -> CalendarChatResponse:
+    """Persist the exchange and convert the LLM response for the API."""
     # Persist messages
     log_calendar_message(
         domain=request.domain,
@@ -164,6 +222,7 @@ def handle_calendar_chat(
     response = CalendarChatResponse(
         response=llm_response.message,
         domain=request.domain,
+        usage=llm_response.usage.to_dict() if llm_response.usage else None,
     )
 
     # Convert pending actions to API-friendly dicts
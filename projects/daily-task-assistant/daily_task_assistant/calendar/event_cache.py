@@ -0,0 +1,557 @@
+"""Incremental Calendar sync with a cached event store.
+
+Event views and attention analysis used to re-list the whole time window
+from Google on every request. This module keeps each calendar's events in a
+local SQLite store and keeps it current with Google's sync tokens:
+
+    1. The first read for a calendar does a full sync of a bounded window
+       (DTA_CALENDAR_SYNC_PAST_DAYS back, DTA_CALENDAR_SYNC_FUTURE_DAYS ahead)
+       and stores the returned nextSyncToken.
+    2. Later reads send only the sync token and apply the delta (changed and
+       cancelled events). Deltas are skipped entirely when the calendar was
+       synced within DTA_CALENDAR_SYNC_INTERVAL seconds.
+    3. A 410 Gone on the sync token drops the calendar's events and does a
+       fresh full sync.
+
+Window queries inside the synced range are answered locally. Queries that
+reach past it re-anchor the window once, then fall back to a live listing.
+Cached listings are paged with offset tokens ("cache:<offset>"); any other
+page token is a Google token and is passed through to a live listing.
+
+Cache Structure (SQLite):
+    events(owner, calendar_id, event_id, start_ts, end_ts, data)
+    sync_state(owner, calendar_id, sync_token, window_start, window_end, synced_at)
+
+Environment Variables:
+    DTA_CALENDAR_CACHE: Set to "0" to always list events live
+    DTA_CALENDAR_CACHE_PATH: SQLite file path (default: calendar_cache/events.sqlite3)
+    DTA_CALENDAR_SYNC_PAST_DAYS: Days before now covered by a full sync (default: 30)
+    DTA_CALENDAR_SYNC_FUTURE_DAYS: Days after now covered by a full sync (default: 180)
+    DTA_CALENDAR_SYNC_INTERVAL: Seconds between delta syncs (default: 30)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .google_calendar import (
+    CalendarAccountConfig,
+    SyncTokenExpiredError,
+    _parse_event,
+    list_events,
+    list_events_async,
+    sync_events,
+)
+from .types import EventListResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("DTA_CALENDAR_CACHE", "1") != "0"
+
+
+def _cache_path() -> Path:
+    """Return the SQLite file used for the event cache."""
+    return Path(
+        os.getenv(
+            "DTA_CALENDAR_CACHE_PATH",
+            Path(__file__).resolve().parents[2] / "calendar_cache" / "events.sqlite3",
+        )
+    )
+
+
+def _past_days() -> int:
+    return int(os.getenv("DTA_CALENDAR_SYNC_PAST_DAYS", "30"))
+
+
+def _future_days() -> int:
+    return int(os.getenv("DTA_CALENDAR_SYNC_FUTURE_DAYS", "180"))
+
+
+def _sync_interval_seconds() -> float:
+    return float(os.getenv("DTA_CALENDAR_SYNC_INTERVAL", "30"))
+
+
+def _now() -> datetime:
+    """Return current UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _timestamp(value: datetime) -> float:
+    # All-day events parse as naive dates; treat naive values as UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass(slots=True)
+class SyncState:
+    """Stored sync position for one calendar."""
+
+    sync_token: str
+    window_start: float
+    window_end: float
+    synced_at: float  # time.time() of the last full or delta sync
+
+
+# =============================================================================
+# Event Store
+# =============================================================================
+
+class EventCache:
+    """SQLite-backed store of raw Calendar event resources per calendar."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else _cache_path()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS events (
+                    owner TEXT NOT NULL,
+                    calendar_id TEXT NOT NULL,
+                    event_id TEXT NOT NULL,
+                    start_ts REAL NOT NULL,
+                    end_ts REAL NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (owner, calendar_id, event_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_window
+                    ON events (owner, calendar_id, start_ts);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    owner TEXT NOT NULL,
+                    calendar_id TEXT NOT NULL,
+                    sync_token TEXT NOT NULL,
+                    window_start REAL NOT NULL,
+                    window_end REAL NOT NULL,
+                    synced_at REAL NOT NULL,
+                    PRIMARY KEY (owner, calendar_id)
+                );
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get_state(self, owner: str, calendar_id: str) -> Optional[SyncState]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sync_token, window_start, window_end, synced_at FROM sync_state "
+                "WHERE owner = ? AND calendar_id = ?",
+                (owner, calendar_id),
+            ).fetchone()
+        return SyncState(*row) if row else None
+
+    def set_state(self, owner: str, calendar_id: str, state: SyncState) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state "
+                "(owner, calendar_id, sync_token, window_start, window_end, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (owner, calendar_id, state.sync_token, state.window_start,
+                 state.window_end, state.synced_at),
+            )
+
+    def mark_stale(self, owner: str, calendar_id: str) -> None:
+        """Force the next read to run a delta sync."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE sync_state SET synced_at = 0 WHERE owner = ? AND calendar_id = ?",
+                (owner, calendar_id),
+            )
+
+    def apply(
+        self,
+        owner: str,
+        calendar_id: str,
+        items: List[dict],
+        cancelled_ids: List[str],
+        *,
+        replace: bool = False,
+    ) -> None:
+        """Upsert changed events and drop cancelled ones.
+
+        Args:
+            replace: Drop every stored event for the calendar first (full sync).
+        """
+        rows = []
+        for item in items:
+            # Parsing once here validates the resource and yields its window bounds
+            event = _parse_event(item, calendar_id, "")
+            rows.append((
+                owner, calendar_id, item["id"],
+                _timestamp(event.start), _timestamp(event.end), json.dumps(item),
+            ))
+        with self._connect() as conn:
+            if replace:
+                conn.execute(
+                    "DELETE FROM events WHERE owner = ? AND calendar_id = ?",
+                    (owner, calendar_id),
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO events "
+                "(owner, calendar_id, event_id, start_ts, end_ts, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "DELETE FROM events WHERE owner = ? AND calendar_id = ? AND event_id = ?",
+                [(owner, calendar_id, event_id) for event_id in cancelled_ids],
+            )
+
+    def query(
+        self,
+        owner: str,
+        calendar_id: str,
+        time_min: float,
+        time_max: float,
+        limit: int,
+        offset: int = 0,
+    ) -> List[dict]:
+        """Return raw events overlapping [time_min, time_max), by start time."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM events WHERE owner = ? AND calendar_id = ? "
+                "AND end_ts > ? AND start_ts < ? ORDER BY start_ts, event_id "
+                "LIMIT ? OFFSET ?",
+                (owner, calendar_id, time_min, time_max, limit, offset),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self, owner: str, calendar_id: str) -> None:
+        """Drop all events and sync state for a calendar."""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM events WHERE owner = ? AND calendar_id = ?",
+                (owner, calendar_id),
+            )
+            conn.execute(
+                "DELETE FROM sync_state WHERE owner = ? AND calendar_id = ?",
+                (owner, calendar_id),
+            )
+
+
+_default_cache: Optional[EventCache] = None
+_default_cache_lock = threading.Lock()
+_sync_locks: Dict[str, threading.Lock] = {}
+
+
+def get_event_cache() -> EventCache:
+    """Return the process-wide event cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EventCache()
+        return _default_cache
+
+
+def _sync_lock(owner: str, calendar_id: str) -> threading.Lock:
+    with _default_cache_lock:
+        return _sync_locks.setdefault(f"{owner}|{calendar_id}", threading.Lock())
+
+
+def _owner_key(account: CalendarAccountConfig) -> str:
+    return account.user_email.lower()
+
+
+# =============================================================================
+# Sync Engine
+# =============================================================================
+
+def _full_sync(
+    account: CalendarAccountConfig,
+    calendar_id: str,
+    cache: EventCache,
+    *,
+    window_end: Optional[datetime] = None,
+) -> SyncState:
+    owner = _owner_key(account)
+    now = _now()
+    start = now - timedelta(days=_past_days())
+    end = max(window_end or now, now + timedelta(days=_future_days()))
+
+    items: List[dict] = []
+    page_token: Optional[str] = None
+    while True:
+        page = sync_events(
+            account, calendar_id, time_min=start, time_max=end, page_token=page_token
+        )
+        items.extend(page.items)
+        page_token = page.next_page_token
+        if not page_token:
+            break
+
+    cache.apply(owner, calendar_id, items, [], replace=True)
+    state = SyncState(
+        sync_token=page.next_sync_token or "",
+        window_start=start.timestamp(),
+        window_end=end.timestamp(),
+        synced_at=time.time(),
+    )
+    cache.set_state(owner, calendar_id, state)
+    logger.info(f"[event_cache] Full sync of {calendar_id} for {owner}: {len(items)} events")
+    return state
+
+
+def _delta_sync(
+    account: CalendarAccountConfig,
+    calendar_id: str,
+    cache: EventCache,
+    state: SyncState,
+) -> SyncState:
+    owner = _owner_key(account)
+    sync_token = state.sync_token
+    page_token: Optional[str] = None
+    while True:
+        page = sync_events(
+            account, calendar_id, sync_token=sync_token, page_token=page_token
+        )
+        cache.apply(owner, calendar_id, page.items, page.cancelled_ids)
+        page_token = page.next_page_token
+        if not page_token:
+            break
+
+    state = SyncState(
+        sync_token=page.next_sync_token or sync_token,
+        window_start=state.window_start,
+        window_end=state.window_end,
+        synced_at=time.time(),
+    )
+    cache.set_state(owner, calendar_id, state)
+    return state
+
+
+def sync_calendar(
+    account: CalendarAccountConfig,
+    calendar_id: str = "primary",
+    *,
+    cache: Optional[EventCache] = None,
+    window_end: Optional[datetime] = None,
+    force: bool = False,
+) -> SyncState:
+    """Bring a calendar's cached events up to date.
+
+    Args:
+        account: Calendar account configuration
+        calendar_id: Calendar ID (or "primary")
+        cache: Cache to update (defaults to the process-wide cache)
+        window_end: Re-anchor with a full sync if the window ends before this
+        force: Run a delta sync even if the last one was recent
+
+    Returns:
+        The calendar's SyncState after syncing
+    """
+    cache = cache or get_event_cache()
+    owner = _owner_key(account)
+
+    with _sync_lock(owner, calendar_id):
+        state = cache.get_state(owner, calendar_id)
+        if state is None or not state.sync_token:
+            return _full_sync(account, calendar_id, cache, window_end=window_end)
+        if window_end is not None and _timestamp(window_end) > state.window_end:
+            return _full_sync(account, calendar_id, cache, window_end=window_end)
+        if not force and time.time() - state.synced_at < _sync_interval_seconds():
+            return state
+        try:
+            return _delta_sync(account, calendar_id, cache, state)
+        except SyncTokenExpiredError:
+            logger.info(f"[event_cache] Sync token expired for {calendar_id} ({owner}), resyncing")
+            cache.clear(owner, calendar_id)
+            return _full_sync(account, calendar_id, cache, window_end=window_end)
+
+
+_CACHE_TOKEN_PREFIX = "cache:"
+
+# Google caps events.list pages at 2500 results
+_MAX_LIVE_RESULTS = 2500
+
+
+def _cache_offset(page_token: Optional[str]) -> Optional[int]:
+    """Return the offset in a cache page token, or None for other tokens."""
+    if not page_token or not page_token.startswith(_CACHE_TOKEN_PREFIX):
+        return None
+    try:
+        return max(0, int(page_token[len(_CACHE_TOKEN_PREFIX):]))
+    except ValueError:
+        return None
+
+
+def list_events_cached(
+    account: CalendarAccountConfig,
+    calendar_id: str = "primary",
+    *,
+    time_min: Optional[datetime] = None,
+    time_max: Optional[datetime] = None,
+    max_results: int = 100,
+    page_token: Optional[str] = None,
+    source_domain: str = "personal",
+    cache: Optional[EventCache] = None,
+) -> EventListResponse:
+    """List events in a window, served from the synced cache when possible.
+
+    Takes the same arguments as list_events. Without time_max, results run
+    to the end of the synced window. Pages served from the cache carry a
+    "cache:<offset>" next_page_token; Google page tokens from a live listing
+    are passed through to list_events.
+
+    Args:
+        account: Calendar account configuration
+        calendar_id: Calendar ID (or "primary")
+        time_min: Lower bound for event end time (defaults to now)
+        time_max: Upper bound for event start time
+        max_results: Maximum events to return
+        page_token: next_page_token from a previous call
+        source_domain: Domain label for events ("personal", "work", "church")
+        cache: Cache to use (defaults to the process-wide cache)
+
+    Returns:
+        EventListResponse ordered by start time (no sync token)
+    """
+    if time_min is None:
+        time_min = _now()
+    offset = _cache_offset(page_token)
+
+    if _cache_enabled() and not (page_token and offset is None):
+        cached = _cached_page(
+            account, calendar_id, time_min, time_max, max_results, offset,
+            source_domain, cache,
+        )
+        if cached is not None:
+            return cached
+
+    live_max, live_token = _live_request(offset, max_results, page_token)
+    response = list_events(
+        account,
+        calendar_id=calendar_id,
+        time_min=time_min,
+        time_max=time_max,
+        max_results=live_max,
+        page_token=live_token,
+        source_domain=source_domain,
+    )
+    return _live_page(response, offset)
+
+
+async def list_events_cached_async(
+    account: CalendarAccountConfig,
+    calendar_id: str = "primary",
+    *,
+    time_min: Optional[datetime] = None,
+    time_max: Optional[datetime] = None,
+    max_results: int = 100,
+    page_token: Optional[str] = None,
+    source_domain: str = "personal",
+    cache: Optional[EventCache] = None,
+) -> EventListResponse:
+    """Async variant of list_events_cached.
+
+    The sync and cache read run in a worker thread; live listings go
+    through list_events_async on the event loop.
+    """
+    if time_min is None:
+        time_min = _now()
+    offset = _cache_offset(page_token)
+
+    if _cache_enabled() and not (page_token and offset is None):
+        cached = await asyncio.to_thread(
+            _cached_page,
+            account, calendar_id, time_min, time_max, max_results, offset,
+            source_domain, cache,
+        )
+        if cached is not None:
+            return cached
+
+    live_max, live_token = _live_request(offset, max_results, page_token)
+    response = await list_events_async(
+        account,
+        calendar_id=calendar_id,
+        time_min=time_min,
+        time_max=time_max,
+        max_results=live_max,
+        page_token=live_token,
+        source_domain=source_domain,
+    )
+    return _live_page(response, offset)
+
+
+def _cached_page(
+    account: CalendarAccountConfig,
+    calendar_id: str,
+    time_min: datetime,
+    time_max: Optional[datetime],
+    max_results: int,
+    offset: Optional[int],
+    source_domain: str,
+    cache: Optional[EventCache],
+) -> Optional[EventListResponse]:
+    """Serve a page from the synced cache, or None if the window isn't covered."""
+    cache = cache or get_event_cache()
+    state = sync_calendar(account, calendar_id, cache=cache, window_end=time_max)
+
+    lower = _timestamp(time_min)
+    upper = _timestamp(time_max) if time_max else state.window_end
+    if lower < state.window_start or upper > state.window_end:
+        return None
+
+    start = offset or 0
+    # Fetch one extra row to learn whether another page exists
+    items = cache.query(
+        _owner_key(account), calendar_id, lower, upper, max_results + 1, offset=start
+    )
+    next_page_token = None
+    if len(items) > max_results:
+        items = items[:max_results]
+        next_page_token = f"{_CACHE_TOKEN_PREFIX}{start + max_results}"
+    return EventListResponse(
+        events=[
+            _parse_event(item, calendar_id, account.user_email, source_domain)
+            for item in items
+        ],
+        next_page_token=next_page_token,
+    )
+
+
+def _live_request(
+    offset: Optional[int], max_results: int, page_token: Optional[str]
+) -> Tuple[int, Optional[str]]:
+    """Return the (max_results, page_token) to list live for a request."""
+    if offset is None:
+        return max_results, page_token
+    # A cache token the cache can no longer serve: list up to the end of
+    # the requested page live; Google's token then continues after it.
+    return min(offset + max_results, _MAX_LIVE_RESULTS), None
+
+
+def _live_page(response: EventListResponse, offset: Optional[int]) -> EventListResponse:
+    if offset is None:
+        return response
+    return EventListResponse(
+        events=response.events[offset:],
+        next_page_token=response.next_page_token,
+    )
+
+
+def mark_calendar_stale(account: CalendarAccountConfig, calendar_id: str = "primary") -> None:
+    """Make the next cached read pick up a change we just wrote."""
+    if _cache_enabled():
+        get_event_cache().mark_stale(_owner_key(account), calendar_id)
@@ -1,21 +1,25 @@
 """Google Calendar API client."""
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, List, Literal
-from urllib import error as urlerror
+from typing import Optional, List, Literal, Tuple
 from urllib import parse as urlparse
-from urllib import request as urlrequest
 
+from ..google_oauth import (
+    get_cached_access_token,
+    get_cached_access_token_async,
+    invalidate_access_token,
+)
+from ..http_transport import HTTPStatusError, TransportError, request_json, request_json_async
 from .types import (
     CalendarInfo,
     CalendarEvent,
     EventAttendee,
     CalendarListResponse,
     EventListResponse,
+    EventSyncPage,
 )
 
 
@@ -24,7 +28,19 @@ CALENDAR_API_BASE = "https://www.googleapis.com/calendar/v3"
 
 
 class CalendarError(RuntimeError):
-    """Raised when Calendar API operations fail."""
+    """Raised when Calendar API operations fail.
+
+    Attributes:
+        status_code: HTTP status of the failed Calendar API call, if any
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SyncTokenExpiredError(CalendarError):
+    """Raised when Google rejects a sync token (410 Gone); do a full sync."""
 
 
 @dataclass(slots=True)
@@ -98,38 +114,46 @@ def load_account_from_env(name: str) -> CalendarAccountConfig:
 
 
 def _fetch_access_token(account: CalendarAccountConfig) -> str:
-    """Get a fresh access token using the refresh token."""
-    payload = urlparse.urlencode(
-        {
-            "client_id": account.client_id,
-            "client_secret": account.client_secret,
-            "refresh_token": account.refresh_token,
-            "grant_type": "refresh_token",
-        }
-    ).encode("utf-8")
-
-    req = urlrequest.Request(
-        TOKEN_URL,
-        data=payload,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        method="POST",
+    """Return a process-wide cached access token for the account."""
+    return get_cached_access_token(
+        account.client_id,
+        account.refresh_token,
+        lambda: _request_access_token(account),
+    )
+
+
+async def _fetch_access_token_async(account: CalendarAccountConfig) -> str:
+    """Async variant of _fetch_access_token."""
+    return await get_cached_access_token_async(
+        account.client_id,
+        account.refresh_token,
+        lambda: _request_access_token(account),
     )
 
+
+def _request_access_token(account: CalendarAccountConfig) -> Tuple[str, int]:
+    """Get a fresh access token using the refresh token."""
+    payload = {
+        "client_id": account.client_id,
+        "client_secret": account.client_secret,
+        "refresh_token": account.refresh_token,
+        "grant_type": "refresh_token",
+    }
+
     try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
+        data = request_json("POST", TOKEN_URL, data=payload, timeout=15)
+    except HTTPStatusError as exc:
         raise CalendarError(
-            f"Calendar token request failed ({exc.code}): {detail}"
+            f"Calendar token request failed ({exc.status_code}): {exc.detail}",
+            status_code=exc.status_code,
         ) from exc
-    except urlerror.URLError as exc:
+    except TransportError as exc:
         raise CalendarError(f"Calendar token network error: {exc}") from exc
 
     token = data.get("access_token")
     if not token:
         raise CalendarError("Calendar token response missing access_token.")
-    return str(token)
+    return str(token), int(data.get("expires_in") or 0)
 
 
 def _make_request(
@@ -143,29 +167,57 @@ def _make_request(
     access_token = _fetch_access_token(account)
 
     url = f"{CALENDAR_API_BASE}{endpoint}"
-    if params:
-        url = f"{url}?{urlparse.urlencode(params)}"
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    try:
+        return request_json(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json_body=body or None,
+            timeout=30,
+        )
+    except TransportError as exc:
+        raise _calendar_error(account, exc) from exc
 
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
 
-    data = json.dumps(body).encode("utf-8") if body else None
-    req = urlrequest.Request(url, data=data, headers=headers, method=method)
+async def _make_request_async(
+    account: CalendarAccountConfig,
+    endpoint: str,
+    method: str = "GET",
+    params: Optional[dict] = None,
+    body: Optional[dict] = None,
+) -> dict:
+    """Async variant of _make_request."""
+    access_token = await _fetch_access_token_async(account)
+
+    url = f"{CALENDAR_API_BASE}{endpoint}"
+    headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        with urlrequest.urlopen(req, timeout=30) as resp:
-            if resp.status == 204:  # No content
-                return {}
-            return json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise CalendarError(
-            f"Calendar API request failed ({exc.code}): {detail}"
-        ) from exc
-    except urlerror.URLError as exc:
-        raise CalendarError(f"Calendar API network error: {exc}") from exc
+        return await request_json_async(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            json_body=body or None,
+            timeout=30,
+        )
+    except TransportError as exc:
+        raise _calendar_error(account, exc) from exc
+
+
+def _calendar_error(account: CalendarAccountConfig, exc: TransportError) -> CalendarError:
+    """Translate a transport failure into a CalendarError."""
+    if isinstance(exc, HTTPStatusError):
+        if exc.status_code == 401:
+            invalidate_access_token(account.client_id, account.refresh_token)
+        return CalendarError(
+            f"Calendar API request failed ({exc.status_code}): {exc.detail}",
+            status_code=exc.status_code,
+        )
+    return CalendarError(f"Calendar API network error: {exc}")
 
 
 # ============================================================================
@@ -353,6 +405,42 @@ def list_events(
     Returns:
         EventListResponse with events and pagination token
     """
+    endpoint, params = _list_events_request(
+        calendar_id, time_min, time_max, max_results, single_events, order_by, page_token
+    )
+    response = _make_request(account, endpoint, params=params)
+    return _event_list(response, account, calendar_id, source_domain)
+
+
+async def list_events_async(
+    account: CalendarAccountConfig,
+    calendar_id: str = "primary",
+    *,
+    time_min: Optional[datetime] = None,
+    time_max: Optional[datetime] = None,
+    max_results: int = 100,
+    single_events: bool = True,
+    order_by: Literal["startTime", "updated"] = "startTime",
+    page_token: Optional[str] = None,
+    source_domain: str = "personal",
+) -> EventListResponse:
+    """Async variant of list_events."""
+    endpoint, params = _list_events_request(
+        calendar_id, time_min, time_max, max_results, single_events, order_by, page_token
+    )
+    response = await _make_request_async(account, endpoint, params=params)
+    return _event_list(response, account, calendar_id, source_domain)
+
+
+def _list_events_request(
+    calendar_id: str,
+    time_min: Optional[datetime],
+    time_max: Optional[datetime],
+    max_results: int,
+    single_events: bool,
+    order_by: str,
+    page_token: Optional[str],
+) -> Tuple[str, dict]:
     if time_min is None:
         time_min = datetime.now(timezone.utc)
 
@@ -372,8 +460,15 @@ def list_events(
         params["pageToken"] = page_token
 
     encoded_id = urlparse.quote(calendar_id, safe="")
-    response = _make_request(account, f"/calendars/{encoded_id}/events", params=params)
+    return f"/calendars/{encoded_id}/events", params
 
+
+def _event_list(
+    response: dict,
+    account: CalendarAccountConfig,
+    calendar_id: str,
+    source_domain: str,
+) -> EventListResponse:
     events = []
     for item in response.get("items", []):
         # Skip cancelled events
@@ -390,6 +485,72 @@ def list_events(
     )
 
 
+def sync_events(
+    account: CalendarAccountConfig,
+    calendar_id: str = "primary",
+    *,
+    sync_token: Optional[str] = None,
+    time_min: Optional[datetime] = None,
+    time_max: Optional[datetime] = None,
+    page_token: Optional[str] = None,
+) -> EventSyncPage:
+    """Fetch one page of a full or incremental event sync.
+
+    Without a sync token this lists recurring-event instances in the given
+    window; with one, it returns only changes since that token (including
+    cancellations). Google does not allow timeMin/timeMax together with a
+    sync token, so the window only applies to the initial full sync.
+
+    Args:
+        account: Calendar account configuration
+        calendar_id: Calendar ID (or "primary")
+        sync_token: nextSyncToken from a previous sync
+        time_min: Lower bound for the initial full sync
+        time_max: Upper bound for the initial full sync
+        page_token: Token for pagination
+
+    Returns:
+        EventSyncPage with raw event items, cancelled IDs and tokens
+
+    Raises:
+        SyncTokenExpiredError: The sync token is no longer valid (410 Gone).
+    """
+    params = {"maxResults": "2500", "singleEvents": "true"}
+    if sync_token:
+        params["syncToken"] = sync_token
+    else:
+        if time_min:
+            params["timeMin"] = time_min.isoformat()
+        if time_max:
+            params["timeMax"] = time_max.isoformat()
+    if page_token:
+        params["pageToken"] = page_token
+
+    encoded_id = urlparse.quote(calendar_id, safe="")
+    try:
+        response = _make_request(account, f"/calendars/{encoded_id}/events", params=params)
+    except CalendarError as exc:
+        if sync_token and exc.status_code == 410:
+            raise SyncTokenExpiredError(str(exc), status_code=410) from exc
+        raise
+
+    items: List[dict] = []
+    cancelled_ids: List[str] = []
+    for item in response.get("items", []):
+        # Cancelled items in a delta may carry only id and status
+        if item.get("status") == "cancelled":
+            cancelled_ids.append(item["id"])
+        else:
+            items.append(item)
+
+    return EventSyncPage(
+        items=items,
+        cancelled_ids=cancelled_ids,
+        next_page_token=response.get("nextPageToken"),
+        next_sync_token=response.get("nextSyncToken"),
+    )
+
+
 def get_event(
     account: CalendarAccountConfig,
     calendar_id: str,
@@ -407,16 +568,27 @@ def get_event(
     Returns:
         CalendarEvent for the specified event
     """
-    encoded_cal_id = urlparse.quote(calendar_id, safe="")
-    encoded_event_id = urlparse.quote(event_id, safe="")
+    response = _make_request(account, _event_endpoint(calendar_id, event_id))
+    return _parse_event(response, calendar_id, account.user_email, source_domain)
 
-    response = _make_request(
-        account, f"/calendars/{encoded_cal_id}/events/{encoded_event_id}"
-    )
 
+async def get_event_async(
+    account: CalendarAccountConfig,
+    calendar_id: str,
+    event_id: str,
+    source_domain: str = "personal",
+) -> CalendarEvent:
+    """Async variant of get_event."""
+    response = await _make_request_async(account, _event_endpoint(calendar_id, event_id))
     return _parse_event(response, calendar_id, account.user_email, source_domain)
 
 
+def _event_endpoint(calendar_id: str, event_id: str) -> str:
+    encoded_cal_id = urlparse.quote(calendar_id, safe="")
+    encoded_event_id = urlparse.quote(event_id, safe="")
+    return f"/calendars/{encoded_cal_id}/events/{encoded_event_id}"
+
+
 # ============================================================================
 # Event Write Operations
 # ============================================================================
@@ -197,6 +197,16 @@ class EventListResponse:
     next_sync_token: Optional[str] = None
 
 
+@dataclass(slots=True)
+class EventSyncPage:
+    """One page of a full or incremental (sync token) event listing."""
+
+    items: List[Dict[str, Any]]  # Raw API event resources (not cancelled)
+    cancelled_ids: List[str] = field(default_factory=list)
+    next_page_token: Optional[str] = None
+    next_sync_token: Optional[str] = None
+
+
 # =============================================================================
 # Phase CA-1: Calendar Attention Record
 # =============================================================================
@@ -1,7 +1,6 @@
 """Persistent contact storage for saved contacts (Phase 2 foundation)."""
 from __future__ import annotations
 
-import json
 import os
 import uuid
 from dataclasses import dataclass, field, asdict
@@ -10,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..firestore import get_firestore_client
+from ..local_store import LocalStore, get_local_store
 
 
 def _contacts_collection() -> str:
@@ -307,68 +307,41 @@ def _delete_from_firestore(db: Any, contact_id: str) -> bool:
 
 # --- File helpers ---
 
-def _contacts_file(contact_id: str) -> Path:
-    """Get the file path for a contact."""
-    directory = _contacts_dir()
-    directory.mkdir(parents=True, exist_ok=True)
-    safe_id = contact_id.replace("/", "_").replace("\\", "_")
-    return directory / f"{safe_id}.json"
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode.
+
+    Contacts are not partitioned by account; the owner's address fills the
+    indexed email column and updated_at the created_at column, so listing a
+    user's most recently updated contacts is an index lookup.
+    """
+    return get_local_store(
+        _contacts_dir(),
+        fields={"email_id": "user_email", "created_at": "updated_at"},
+    )
 
 
 def _save_to_file(contact: SavedContact) -> None:
-    """Save contact to local JSON file."""
-    filepath = _contacts_file(contact.id)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(contact.to_dict(), f, indent=2)
+    """Save contact to local storage."""
+    _local_store().put("", contact.id, contact.to_dict())
 
 
 def _load_from_file(contact_id: str) -> Optional[SavedContact]:
-    """Load contact from local JSON file."""
-    filepath = _contacts_file(contact_id)
-    
-    if not filepath.exists():
-        return None
-    
-    try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return SavedContact.from_dict(data)
-    except (json.JSONDecodeError, IOError):
+    """Load contact from local storage."""
+    data = _local_store().get("", contact_id)
+    if data is None:
         return None
+    return SavedContact.from_dict(data)
 
 
 def _list_from_files(
     user_email: Optional[str],
     limit: int,
 ) -> List[SavedContact]:
-    """List contacts from local files."""
-    directory = _contacts_dir()
-    if not directory.exists():
-        return []
-    
-    contacts = []
-    for filepath in directory.glob("*.json"):
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                contact = SavedContact.from_dict(data)
-                if user_email is None or contact.user_email == user_email:
-                    contacts.append(contact)
-                    if len(contacts) >= limit:
-                        break
-        except (json.JSONDecodeError, IOError):
-            continue
-    
-    # Sort by updated_at descending
-    contacts.sort(key=lambda c: c.updated_at, reverse=True)
-    return contacts[:limit]
+    """List contacts from local storage, most recently updated first."""
+    docs = _local_store().query("", email_id=user_email, newest_first=True, limit=limit)
+    return [SavedContact.from_dict(data) for data in docs]
 
 
 def _delete_from_file(contact_id: str) -> bool:
-    """Delete contact file."""
-    filepath = _contacts_file(contact_id)
-    if filepath.exists():
-        filepath.unlink()
-        return True
-    return False
-
+    """Delete contact from local storage."""
+    return _local_store().delete("", contact_id)
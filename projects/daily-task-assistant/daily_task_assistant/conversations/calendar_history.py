@@ -28,7 +28,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
-from ..firestore import get_firestore_client
+from ..firestore import delete_documents, get_firestore_client
 
 
 # Type aliases
@@ -447,14 +447,9 @@ def _clear_conversation_firestore(domain: str) -> bool:
     if conv_ref is None:
         return _clear_conversation_file(domain)
 
-    # Delete all messages in subcollection
-    messages_ref = conv_ref.collection("messages")
-    for doc in messages_ref.stream():
-        doc.reference.delete()
-
-    # Delete metadata document
-    conv_ref.delete()
-    return True
+    # Delete all messages in subcollection, then the metadata document
+    messages = list(conv_ref.collection("messages").stream())
+    return delete_documents(db, [*messages, conv_ref]).ok
 
 
 # =============================================================================
@@ -29,7 +29,7 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
-from ..firestore import get_firestore_client
+from ..firestore import BatchWriter, delete_documents, get_firestore_client
 
 
 # Type aliases
@@ -582,14 +582,9 @@ def _clear_conversation_firestore(account: str, thread_id: str) -> bool:
     if thread_ref is None:
         return _clear_conversation_file(account, thread_id)
 
-    # Delete all messages in subcollection
-    messages_ref = thread_ref.collection("messages")
-    for doc in messages_ref.stream():
-        doc.reference.delete()
-
-    # Delete metadata document
-    thread_ref.delete()
-    return True
+    # Delete all messages in subcollection, then the metadata document
+    messages = list(thread_ref.collection("messages").stream())
+    return delete_documents(db, [*messages, thread_ref]).ok
 
 
 def _purge_expired_firestore(account: str) -> int:
@@ -607,12 +602,16 @@ def _purge_expired_firestore(account: str) -> int:
     now_str = _now().isoformat()
     query = collection_ref.where("expires_at", "<", now_str)
 
+    # Messages and metadata for every expired thread go out in shared batches
+    writer = BatchWriter(db)
     count = 0
     for doc in query.stream():
-        thread_id = doc.id
-        _clear_conversation_firestore(account, thread_id)
+        for message in doc.reference.collection("messages").stream():
+            writer.delete(message.reference)
+        writer.delete(doc.reference)
         count += 1
 
+    writer.commit()
     return count
 
 
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
 from ..actions import AssistPlan
-from ..firestore import get_firestore_client
+from ..firestore import delete_documents, get_firestore_client
 
 def _conversation_collection() -> str:
     return os.getenv("DTA_CONVERSATION_COLLECTION", "conversations")
@@ -118,9 +118,7 @@ def clear_conversation(task_id: str) -> None:
             .document(task_id)
             .collection("messages")
         )
-        docs = collection.stream()
-        for doc in docs:
-            doc.reference.delete()
+        delete_documents(client, collection.stream())
     except Exception:
         path = _conversation_file(task_id)
         if path.exists():
@@ -1,6 +1,7 @@
 """Shared dataset helpers."""
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 import re
 from typing import List, Optional, Tuple
@@ -26,23 +27,9 @@ def fetch_tasks(
                  If None, fetches from sources included in 'ALL' filter (excludes work by default).
         include_work_in_all: If True, include work tasks even when sources is None.
     """
-    settings = load_settings()
-    live_tasks = False
-    warning: str | None = None
-    client: SmartsheetClient | None = None
-
-    if source != "stub":
-        try:
-            client = SmartsheetClient(settings=settings)
-        except SchemaError as exc:
-            if source == "live":
-                raise RuntimeError(f"Schema error: {exc}") from exc
-            warning = _merge_warning(
-                warning, f"Schema not ready; falling back to stub data: {exc}"
-            )
-
-    if source == "stub" or client is None:
-        return fetch_stubbed_tasks(limit=limit), live_tasks, settings, warning
+    settings, client, warning = _create_client(source)
+    if client is None:
+        return fetch_stubbed_tasks(limit=limit), False, settings, warning
 
     try:
         tasks = client.list_tasks(
@@ -51,24 +38,127 @@ def fetch_tasks(
             sources=sources,
             include_work_in_all=include_work_in_all,
         )
-        live_tasks = client.last_fetch_used_live
-        if not live_tasks and source == "auto":
-            warning = _merge_warning(
-                warning, "Live data unavailable, showing stubbed tasks."
-            )
-        if client.row_errors:
-            row_warning = _summarize_row_errors(client.row_errors)
-            warning = _merge_warning(warning, row_warning)
     except (SchemaError, SmartsheetAPIError) as exc:
+        return _list_failed(exc, source, limit, settings, warning)
+    return _listed(tasks, client, source, settings, warning)
+
+
+async def fetch_tasks_async(
+    *,
+    limit: Optional[int],
+    source: str,
+    sources: Optional[List[str]] = None,
+    include_work_in_all: bool = False,
+) -> Tuple[list[TaskDetail], bool, Settings, str | None]:
+    """Async variant of fetch_tasks for async routes.
+
+    Loading settings and the sheet config reads files, so it runs in a
+    worker thread; the sheets are fetched on the event loop.
+    """
+    settings, client, warning = await asyncio.to_thread(_create_client, source)
+    if client is None:
+        return fetch_stubbed_tasks(limit=limit), False, settings, warning
+
+    try:
+        tasks = await client.list_tasks_async(
+            limit=limit,
+            fallback_to_stub=(source == "auto"),
+            sources=sources,
+            include_work_in_all=include_work_in_all,
+        )
+    except (SchemaError, SmartsheetAPIError) as exc:
+        return _list_failed(exc, source, limit, settings, warning)
+    return _listed(tasks, client, source, settings, warning)
+
+
+def _create_client(source: str) -> Tuple[Settings, SmartsheetClient | None, str | None]:
+    """Load settings and a client; the client is None when stub data should be served."""
+    settings = load_settings()
+    if source == "stub":
+        return settings, None, None
+    try:
+        return settings, SmartsheetClient(settings=settings), None
+    except SchemaError as exc:
         if source == "live":
-            raise RuntimeError(f"Live list failed: {exc}") from exc
+            raise RuntimeError(f"Schema error: {exc}") from exc
+        return settings, None, f"Schema not ready; falling back to stub data: {exc}"
+
+
+def _listed(
+    tasks: list[TaskDetail],
+    client: SmartsheetClient,
+    source: str,
+    settings: Settings,
+    warning: str | None,
+) -> Tuple[list[TaskDetail], bool, Settings, str | None]:
+    live_tasks = client.last_fetch_used_live
+    if not live_tasks and source == "auto":
+        warning = _merge_warning(
+            warning, "Live data unavailable, showing stubbed tasks."
+        )
+    if client.row_errors:
+        row_warning = _summarize_row_errors(client.row_errors)
+        warning = _merge_warning(warning, row_warning)
+    return tasks, live_tasks, settings, warning
+
+
+def _list_failed(
+    exc: Exception,
+    source: str,
+    limit: Optional[int],
+    settings: Settings,
+    warning: str | None,
+) -> Tuple[list[TaskDetail], bool, Settings, str | None]:
+    if source == "live":
+        raise RuntimeError(f"Live list failed: {exc}") from exc
+    warning = _merge_warning(
+        warning, f"Live data unavailable, showing stubbed tasks: {exc}"
+    )
+    return fetch_stubbed_tasks(limit=limit), False, settings, warning
+
+
+def fetch_task_by_id(
+    task_id: str,
+    *,
+    source: str,
+) -> Tuple[Optional[TaskDetail], bool, Settings, str | None]:
+    """Fetch a single task by row ID from Smartsheet or fallback stub.
+
+    Unlike fetch_tasks, this never downloads whole sheets: cached sheet
+    snapshots are consulted first and a miss costs one row request per sheet.
+
+    Args:
+        task_id: Smartsheet row ID of the task.
+        source: Data source mode - "auto", "live", or "stub".
+    """
+    settings, client, warning = _create_client(source)
+    if client is None:
+        task = next(
+            (task for task in fetch_stubbed_tasks() if task.row_id == task_id), None
+        )
+        return task, False, settings, warning
+
+    try:
+        task = client.get_task(task_id, fallback_to_stub=(source == "auto"))
+    except (SchemaError, SmartsheetAPIError) as exc:
+        if source == "live":
+            raise RuntimeError(f"Live lookup failed: {exc}") from exc
         warning = _merge_warning(
             warning, f"Live data unavailable, showing stubbed tasks: {exc}"
         )
-        tasks = fetch_stubbed_tasks(limit=limit)
-        live_tasks = False
+        task = next(
+            (task for task in fetch_stubbed_tasks() if task.row_id == task_id), None
+        )
+        return task, False, settings, warning
 
-    return tasks, live_tasks, settings, warning
+    live_tasks = client.last_fetch_used_live
+    if not live_tasks and source == "auto":
+        warning = _merge_warning(
+            warning, "Live data unavailable, showing stubbed tasks."
+        )
+    if client.row_errors:
+        warning = _merge_warning(warning, _summarize_row_errors(client.row_errors))
+    return task, live_tasks, settings, warning
 
 
 def _merge_warning(existing: str | None, new_warning: str | None) -> str | None:
@@ -18,6 +18,7 @@ from .analyzer import (
     # Haiku-enhanced analysis
     detect_attention_with_haiku,
     analyze_email_with_haiku_safe,
+    analyze_emails_with_haiku_batch_safe,
     get_haiku_usage_for_user,
     generate_action_suggestions_with_haiku,
     generate_rule_suggestions_with_haiku,
@@ -26,6 +27,7 @@ from .analyzer import (
 from .attention_store import (
     AttentionRecord,
     save_attention,
+    save_attentions,
     get_attention,
     list_active_attention,
     dismiss_attention,
@@ -34,16 +36,21 @@ from .attention_store import (
     is_already_analyzed,
     purge_expired_records,
     get_dismissed_email_ids,
+    AttentionState,
+    load_attention_state,
 )
 
 from .suggestion_store import (
     SuggestionRecord,
     save_suggestion,
+    save_suggestions,
     get_suggestion,
     list_pending_suggestions,
     has_pending_suggestion_for_email,
+    pending_email_ids,
     record_suggestion_decision,
     create_suggestion,
+    create_suggestions,
     get_approval_stats,
     purge_old_suggestions,
     cleanup_duplicate_suggestions,
@@ -83,6 +90,7 @@ from .haiku_analyzer import (
     HaikuAttentionResult,
     HaikuActionResult,
     HaikuRuleResult,
+    HaikuBatchEmail,
     PrivacySanitizeResult,
     # Privacy functions
     is_sensitive_domain,
@@ -90,18 +98,22 @@ from .haiku_analyzer import (
     prepare_email_for_haiku,
     # Main analysis
     analyze_email_with_haiku,
+    analyze_emails_with_haiku_batch,
 )
 
 from .rule_store import (
     RuleSuggestionRecord,
     save_rule_suggestion,
+    save_rule_suggestions,
     get_rule_suggestion,
     list_pending_rules,
     decide_rule_suggestion,
     create_rule_suggestion,
+    create_rule_suggestions,
     get_rule_approval_stats,
     purge_expired_rules,
     has_pending_rule_for_pattern,
+    pending_rule_patterns,
 )
 
 from .haiku_usage import (
@@ -115,6 +127,8 @@ from .haiku_usage import (
     get_usage as get_haiku_usage,
     save_usage as save_haiku_usage,
     increment_usage as increment_haiku_usage,
+    reserve_usage as reserve_haiku_usage,
+    release_usage as release_haiku_usage,
     # Combined operations
     can_use_haiku,
     get_usage_summary as get_haiku_usage_summary,
@@ -165,12 +179,14 @@ __all__ = [
     # Haiku-enhanced analysis
     "detect_attention_with_haiku",
     "analyze_email_with_haiku_safe",
+    "analyze_emails_with_haiku_batch_safe",
     "get_haiku_usage_for_user",
     "generate_action_suggestions_with_haiku",
     "generate_rule_suggestions_with_haiku",
     # Attention Store
     "AttentionRecord",
     "save_attention",
+    "save_attentions",
     "get_attention",
     "list_active_attention",
     "dismiss_attention",
@@ -179,13 +195,18 @@ __all__ = [
     "is_already_analyzed",
     "purge_expired_records",
     "get_dismissed_email_ids",
+    "AttentionState",
+    "load_attention_state",
     # Suggestion Store
     "SuggestionRecord",
     "save_suggestion",
+    "save_suggestions",
     "get_suggestion",
     "list_pending_suggestions",
+    "pending_email_ids",
     "record_suggestion_decision",
     "create_suggestion",
+    "create_suggestions",
     "get_approval_stats",
     "purge_old_suggestions",
     # Memory - data classes
@@ -219,11 +240,13 @@ __all__ = [
     "HaikuAttentionResult",
     "HaikuActionResult",
     "HaikuRuleResult",
+    "HaikuBatchEmail",
     "PrivacySanitizeResult",
     "is_sensitive_domain",
     "sanitize_content",
     "prepare_email_for_haiku",
     "analyze_email_with_haiku",
+    "analyze_emails_with_haiku_batch",
     # Haiku Usage
     "HaikuSettings",
     "HaikuUsage",
@@ -232,18 +255,23 @@ __all__ = [
     "get_haiku_usage",
     "save_haiku_usage",
     "increment_haiku_usage",
+    "reserve_haiku_usage",
+    "release_haiku_usage",
     "can_use_haiku",
     "get_haiku_usage_summary",
     # Rule Store
     "RuleSuggestionRecord",
     "save_rule_suggestion",
+    "save_rule_suggestions",
     "get_rule_suggestion",
     "list_pending_rules",
     "decide_rule_suggestion",
     "create_rule_suggestion",
+    "create_rule_suggestions",
     "get_rule_approval_stats",
     "purge_expired_rules",
     "has_pending_rule_for_pattern",
+    "pending_rule_patterns",
     # Analysis Store
     "LastAnalysisRecord",
     "save_last_analysis",
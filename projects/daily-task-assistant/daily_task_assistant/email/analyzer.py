@@ -20,8 +20,10 @@ Haiku Intelligence Layer (v1.0):
 from __future__ import annotations
 
 import logging
+import os
 import re
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -36,7 +38,10 @@ from ..sheets.filter_rules import (
 )
 from .haiku_analyzer import (
     HaikuAnalysisResult,
+    HaikuBatchEmail,
     analyze_email_with_haiku,
+    analyze_emails_with_haiku_batch,
+    haiku_batch_size,
     _create_fallback_result,
 )
 from .privacy import (
@@ -46,6 +51,8 @@ from ..memory.profile import is_sender_blocked
 from .haiku_usage import (
     can_use_haiku,
     increment_usage as increment_haiku_usage,
+    reserve_usage as reserve_haiku_usage,
+    release_usage as release_haiku_usage,
     get_usage_summary as get_haiku_usage_summary,
 )
 from ..llm.anthropic_client import AnthropicError
@@ -1210,6 +1217,25 @@ def detect_attention_with_profile(
 # Haiku Intelligence Layer Integration
 # =============================================================================
 
+def _haiku_max_concurrency() -> int:
+    """Return the maximum number of concurrent Haiku calls per batch."""
+    try:
+        return max(1, int(os.getenv("DTA_HAIKU_MAX_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+def _unique_messages(messages: List[EmailMessage]) -> List[EmailMessage]:
+    """Return messages with duplicate IDs removed, keeping first occurrence."""
+    seen: Set[str] = set()
+    unique: List[EmailMessage] = []
+    for msg in messages:
+        if msg.id not in seen:
+            seen.add(msg.id)
+            unique.append(msg)
+    return unique
+
+
 def _haiku_result_to_attention_item(
     email: EmailMessage,
     result: HaikuAnalysisResult,
@@ -1241,11 +1267,43 @@ def _haiku_result_to_attention_item(
     )
 
 
+def _haiku_privacy_skip_reason(email: EmailMessage) -> Optional[str]:
+    """Return why an email must not be sent to Haiku, or None if it may be.
+
+    Tier 1: Sender blocklist (user-managed via Profile)
+    Tier 2: Gmail "Sensitive" label (user-applied or via Gmail filters)
+    """
+    if is_sender_blocked(email.from_address):
+        logger.debug(f"Haiku skipped {email.id}: sender blocked by user")
+        return f"Sender blocked: {email.from_address}"
+
+    if email.labels:
+        for label in email.labels:
+            if label in SENSITIVE_LABEL_VARIANTS or "sensitive" in label.lower():
+                logger.debug(f"Haiku skipped {email.id}: Sensitive label")
+                return "Email has Sensitive label"
+
+    return None
+
+
+def _haiku_body(email: EmailMessage) -> Optional[str]:
+    """Return the body to send alongside a short snippet, if any.
+
+    For short snippets (< 250 chars) the body is included because the
+    preview is often just a signature.
+    """
+    snippet_len = len(email.snippet) if email.snippet else 0
+    if snippet_len < 250 and email.body:
+        return email.body
+    return None
+
+
 def analyze_email_with_haiku_safe(
     email: EmailMessage,
     user_id: str,
     roles_context: Optional[str] = None,
     available_labels: Optional[str] = None,
+    count_usage: bool = True,
 ) -> Optional[HaikuAnalysisResult]:
     """Safely analyze an email with Haiku, handling errors gracefully.
 
@@ -1258,31 +1316,17 @@ def analyze_email_with_haiku_safe(
         user_id: User identifier for usage tracking.
         roles_context: Optional custom roles context.
         available_labels: Optional custom labels list.
+        count_usage: Increment the usage counters on success. Batch callers
+            that already reserved quota with reserve_usage() pass False.
 
     Returns:
         HaikuAnalysisResult if successful, None if error or skipped.
     """
     try:
         # Privacy Check: Skip Haiku for blocked/sensitive emails
-        # Tier 1: Check user-managed sender blocklist
-        if is_sender_blocked(email.from_address):
-            logger.debug(f"Haiku skipped {email.id}: sender blocked by user")
-            return _create_fallback_result(f"Sender blocked: {email.from_address}")
-
-        # Tier 2: Check Gmail "Sensitive" label
-        if email.labels:
-            for label in email.labels:
-                if label in SENSITIVE_LABEL_VARIANTS or "sensitive" in label.lower():
-                    logger.debug(f"Haiku skipped {email.id}: Sensitive label")
-                    return _create_fallback_result("Email has Sensitive label")
-
-        # For short snippets (< 250 chars), include body if available
-        # This handles emails where snippet is just a signature
-        body_to_send = None
-        snippet_len = len(email.snippet) if email.snippet else 0
-        if snippet_len < 250 and email.body:
-            # Use body for short snippets (likely signature-only previews)
-            body_to_send = email.body
+        skip_reason = _haiku_privacy_skip_reason(email)
+        if skip_reason:
+            return _create_fallback_result(skip_reason)
 
         result = analyze_email_with_haiku(
             sender_email=email.from_address,
@@ -1290,13 +1334,13 @@ def analyze_email_with_haiku_safe(
             subject=email.subject,
             snippet=email.snippet,
             date=email.date.isoformat() if email.date else "",
-            body=body_to_send,
+            body=_haiku_body(email),
             roles_context=roles_context,
             available_labels=available_labels,
         )
 
         # Increment usage only on successful analysis (GLOBAL - no user param)
-        if result.analysis_method == "haiku":
+        if count_usage and result.analysis_method == "haiku":
             increment_haiku_usage()
 
         return result
@@ -1309,6 +1353,71 @@ def analyze_email_with_haiku_safe(
         return None
 
 
+def analyze_emails_with_haiku_batch_safe(
+    emails: List[EmailMessage],
+    user_id: str,
+    roles_context: Optional[str] = None,
+    available_labels: Optional[str] = None,
+    count_usage: bool = True,
+) -> Dict[str, Optional[HaikuAnalysisResult]]:
+    """Batch counterpart of analyze_email_with_haiku_safe.
+
+    Privacy checks run per email; the remaining emails share one Haiku
+    request (see analyze_emails_with_haiku_batch).
+
+    Args:
+        emails: The emails to analyze.
+        user_id: User identifier for usage tracking.
+        roles_context: Optional custom roles context.
+        available_labels: Optional custom labels list.
+        count_usage: Increment the usage counters once per analyzed email.
+
+    Returns:
+        Dict mapping every email ID to its HaikuAnalysisResult, a skipped
+        fallback result (privacy), or None if analysis failed.
+    """
+    results: Dict[str, Optional[HaikuAnalysisResult]] = {
+        email.id: None for email in emails
+    }
+    batch: List[HaikuBatchEmail] = []
+
+    try:
+        for email in emails:
+            skip_reason = _haiku_privacy_skip_reason(email)
+            if skip_reason:
+                results[email.id] = _create_fallback_result(skip_reason)
+                continue
+            batch.append(HaikuBatchEmail(
+                email_id=email.id,
+                sender_email=email.from_address,
+                sender_name=email.from_name or "",
+                subject=email.subject,
+                snippet=email.snippet,
+                date=email.date.isoformat() if email.date else "",
+                body=_haiku_body(email),
+            ))
+
+        if not batch:
+            return results
+
+        analyzed = analyze_emails_with_haiku_batch(
+            batch,
+            roles_context=roles_context,
+            available_labels=available_labels,
+        )
+    except AnthropicError as exc:
+        logger.warning(f"Haiku batch analysis failed for {len(batch)} emails: {exc}")
+        return results
+    except Exception as exc:
+        logger.error(f"Unexpected error in Haiku batch analysis: {exc}")
+        return results
+
+    results.update(analyzed)
+    if count_usage and analyzed:
+        increment_haiku_usage(len(analyzed))
+    return results
+
+
 def detect_attention_with_haiku(
     messages: List[EmailMessage],
     email_account: str,
@@ -1331,7 +1440,9 @@ def detect_attention_with_haiku(
     1. Check not-actionable patterns (skip these entirely)
     2. Check VIP senders (always high priority, no Haiku needed)
     3. Check if already analyzed by Haiku (skip to avoid duplicates)
-    4. If Haiku enabled and under limits: run Haiku analysis
+    4. If Haiku enabled and under limits: reserve quota for the batch and
+       run Haiku analysis concurrently (DTA_HAIKU_MAX_CONCURRENCY requests
+       of up to DTA_HAIKU_BATCH_SIZE emails each)
     5. Fall back to profile/regex for remaining emails
 
     Args:
@@ -1367,6 +1478,10 @@ def detect_attention_with_haiku(
     if not haiku_available:
         logger.info("Haiku not available, using profile/regex only")
 
+    # Items keyed by message ID so VIP and Haiku results keep inbox order
+    first_pass_items: Dict[str, AttentionItem] = {}
+    haiku_candidates: List[EmailMessage] = []
+
     for msg in messages:
         # Skip already processed in this batch
         if msg.id in processed_ids:
@@ -1388,7 +1503,7 @@ def detect_attention_with_haiku(
                     matched_vip = pattern
                     break
 
-            attention_items.append(AttentionItem(
+            first_pass_items[msg.id] = AttentionItem(
                 email=msg,
                 reason=f"VIP: {matched_vip}",
                 urgency="high",
@@ -1397,7 +1512,7 @@ def detect_attention_with_haiku(
                 matched_role="VIP",
                 confidence=0.95,
                 analysis_method="vip",
-            ))
+            )
             processed_ids.add(msg.id)
             continue
 
@@ -1406,31 +1521,79 @@ def detect_attention_with_haiku(
             processed_ids.add(msg.id)
             continue
 
-        # 4. Try Haiku analysis if available
+        # 4. Queue for Haiku analysis if available
         if haiku_available:
-            # Re-check availability (may have hit limit during batch)
-            if can_use_haiku():
-                haiku_result = analyze_email_with_haiku_safe(
-                    email=msg,
-                    user_id=user_id,
-                    roles_context=roles_context,
-                    available_labels=available_labels,
-                )
+            haiku_candidates.append(msg)
+            processed_ids.add(msg.id)
 
-                if haiku_result and haiku_result.analysis_method == "haiku":
-                    # Store result for later use (action/rule suggestions)
-                    haiku_results[msg.id] = haiku_result
+    # 4a. Reserve quota for the whole batch once; candidates beyond the
+    # grant (limit reached) go to profile/regex like before.
+    granted = reserve_haiku_usage(len(haiku_candidates)) if haiku_candidates else 0
+    if granted < len(haiku_candidates):
+        logger.info(
+            f"Haiku quota covers {granted} of {len(haiku_candidates)} emails; "
+            "using profile/regex for the rest"
+        )
+        for msg in haiku_candidates[granted:]:
+            processed_ids.discard(msg.id)
+    haiku_batch = haiku_candidates[:granted]
+
+    # 4b. Pack candidates into multi-email requests and run them
+    # concurrently; map() keeps chunk order
+    def _analyze(chunk: List[EmailMessage]) -> List[Optional[HaikuAnalysisResult]]:
+        if len(chunk) == 1:
+            return [analyze_email_with_haiku_safe(
+                email=chunk[0],
+                user_id=user_id,
+                roles_context=roles_context,
+                available_labels=available_labels,
+                count_usage=False,
+            )]
+        chunk_results = analyze_emails_with_haiku_batch_safe(
+            chunk,
+            user_id=user_id,
+            roles_context=roles_context,
+            available_labels=available_labels,
+            count_usage=False,
+        )
+        return [chunk_results.get(msg.id) for msg in chunk]
+
+    size = haiku_batch_size()
+    chunks = [haiku_batch[i:i + size] for i in range(0, len(haiku_batch), size)]
+    workers = min(_haiku_max_concurrency(), len(chunks))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(_analyze, chunks))
+    else:
+        chunk_results = [_analyze(chunk) for chunk in chunks]
+    batch_results = [result for chunk in chunk_results for result in chunk]
+
+    unused = 0
+    for msg, haiku_result in zip(haiku_batch, batch_results):
+        if haiku_result and haiku_result.analysis_method == "haiku":
+            # Store result for later use (action/rule suggestions)
+            haiku_results[msg.id] = haiku_result
+
+            # Convert to attention item if needed
+            item = _haiku_result_to_attention_item(msg, haiku_result)
+            if item:
+                first_pass_items[msg.id] = item
+            continue
 
-                    # Convert to attention item if needed
-                    item = _haiku_result_to_attention_item(msg, haiku_result)
-                    if item:
-                        attention_items.append(item)
-                    processed_ids.add(msg.id)
-                    continue
-                elif haiku_result and haiku_result.skipped_reason:
-                    # Haiku skipped due to privacy (sensitive domain)
-                    logger.debug(f"Haiku skipped {msg.id}: {haiku_result.skipped_reason}")
-                    # Fall through to profile/regex
+        if haiku_result and haiku_result.skipped_reason:
+            # Haiku skipped due to privacy (sensitive domain)
+            logger.debug(f"Haiku skipped {msg.id}: {haiku_result.skipped_reason}")
+        # Fall through to profile/regex and hand the reserved call back
+        unused += 1
+        processed_ids.discard(msg.id)
+
+    if unused:
+        release_haiku_usage(unused)
+
+    attention_items.extend(
+        first_pass_items[msg.id] for msg in _unique_messages(messages)
+        if msg.id in first_pass_items
+    )
 
     # 5. Fallback to profile/regex for remaining emails
     analyzer = EmailAnalyzer(email_account)
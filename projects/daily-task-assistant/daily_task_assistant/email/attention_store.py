@@ -9,9 +9,10 @@ data is accessible regardless of which user identity is used to log in.
 
 Firestore Structure:
     email_accounts/{account}/attention/{email_id} -> AttentionRecord document
+    email_accounts/{account}/metric_rollups/attention_{day} -> per-day quality counters
 
 File Storage Structure:
-    attention_store/{account}/{email_id}.json
+    attention_store/store.sqlite3 -> (account, email_id) documents (see local_store)
 
 Environment Variables:
     DTA_ATTENTION_FORCE_FILE: Set to "1" to use local file storage (dev mode)
@@ -21,14 +22,25 @@ Environment Variables:
 """
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
-
-from ..firestore import get_firestore_client
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set
+
+from ..firestore import BatchWriter, delete_documents, get_firestore_client
+from ..local_store import LocalStore, get_local_store
+from ..metric_rollups import (
+    RollupDeltas,
+    commit_with_rollups,
+    merge_deltas,
+    queue_rollups,
+    read_rollups_firestore,
+    rollup_deltas,
+    save_many_with_rollups,
+    save_with_rollups,
+    window_start,
+)
 
 
 # Type aliases
@@ -56,6 +68,23 @@ def _attention_dir() -> Path:
     )
 
 
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode."""
+    return get_local_store(_attention_dir(), rollup_keys=_rollup_keys)
+
+
+def _rollup_keys(data: Dict[str, Any]) -> List[str]:
+    """Metric counter keys for an attention record (see metric_rollups)."""
+    keys = [
+        "total",
+        f"status:{data.get('status', 'active')}",
+        f"method:{data.get('analysis_method', 'regex')}",
+    ]
+    if data.get("action_type"):
+        keys.append(f"action:{data['action_type']}")
+    return keys
+
+
 def _ttl_active_days() -> int:
     """Return TTL for active attention items in days."""
     return int(os.getenv("DTA_ATTENTION_TTL_ACTIVE", "30"))
@@ -313,12 +342,7 @@ def save_attention(account: str, record: AttentionRecord) -> None:
 
 def _save_attention_file(account: str, record: AttentionRecord) -> None:
     """Save attention record to file storage."""
-    store_dir = _attention_dir() / account
-    store_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = store_dir / f"{record.email_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(record.to_dict(), f, indent=2)
+    _local_store().put(account, record.email_id, record.to_dict())
 
 
 def _save_attention_firestore(account: str, record: AttentionRecord) -> None:
@@ -330,7 +354,50 @@ def _save_attention_firestore(account: str, record: AttentionRecord) -> None:
         return
 
     doc_ref = db.collection("email_accounts").document(account).collection("attention").document(record.email_id)
-    doc_ref.set(record.to_dict())
+    save_with_rollups(
+        db, doc_ref, record.to_dict(),
+        account=account, store="attention", keys=_rollup_keys,
+    )
+
+
+def save_attentions(account: str, records: Iterable[AttentionRecord]) -> Set[str]:
+    """Save many attention records in one pass.
+
+    In Firestore mode the writes are committed in batches (see BatchWriter).
+
+    Args:
+        account: Email account ("church" or "personal")
+        records: AttentionRecords to save
+
+    Returns:
+        Email IDs of the records that could not be saved
+    """
+    records = list(records)
+    if not records:
+        return set()
+    if _force_file_fallback():
+        _save_attentions_file(account, records)
+        return set()
+    return _save_attentions_firestore(account, records)
+
+
+def _save_attentions_file(account: str, records: List[AttentionRecord]) -> None:
+    """Save attention records to file storage."""
+    _local_store().put_many(account, {r.email_id: r.to_dict() for r in records})
+
+
+def _save_attentions_firestore(account: str, records: List[AttentionRecord]) -> Set[str]:
+    """Save attention records to Firestore in batches."""
+    db = get_firestore_client()
+    if db is None:
+        _save_attentions_file(account, records)
+        return set()
+
+    collection_ref = db.collection("email_accounts").document(account).collection("attention")
+    return save_many_with_rollups(
+        db, collection_ref, {r.email_id: r.to_dict() for r in records},
+        account=account, store="attention", keys=_rollup_keys,
+    )
 
 
 def get_attention(account: str, email_id: str) -> Optional[AttentionRecord]:
@@ -350,18 +417,16 @@ def get_attention(account: str, email_id: str) -> Optional[AttentionRecord]:
 
 def _get_attention_file(account: str, email_id: str) -> Optional[AttentionRecord]:
     """Get attention record from file storage."""
-    file_path = _attention_dir() / account / f"{email_id}.json"
-    if not file_path.exists():
+    store = _local_store()
+    data = store.get(account, email_id)
+    if data is None:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     record = AttentionRecord.from_dict(data)
 
     # Check expiration
     if record.is_expired():
-        file_path.unlink()
+        store.delete(account, email_id)
         return None
 
     return record
@@ -409,37 +474,29 @@ def _list_active_attention_file(
     account: str,
 ) -> List[AttentionRecord]:
     """List active attention records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return []
+    store = _local_store()
 
-    records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    # Drop expired records before reading
+    store.delete_where(account, expires_before=_now())
 
+    records = []
+    reactivated = []
+    for data in store.query(account, status=("active", "snoozed")):
         record = AttentionRecord.from_dict(data)
 
-        # Skip expired records (and delete them)
-        if record.is_expired():
-            file_path.unlink()
-            continue
-
-        # Skip non-active records
-        if record.status != "active":
-            # Check if snoozed item should be reactivated
-            if record.status == "snoozed" and record.snoozed_until:
-                if _now() >= record.snoozed_until:
-                    record.status = "active"
-                    record.snoozed_until = None
-                    save_attention(account, record)
-                else:
-                    continue
-            else:
+        # Check if snoozed item should be reactivated
+        if record.status == "snoozed":
+            if record.snoozed_until is None or _now() < record.snoozed_until:
                 continue
+            record.status = "active"
+            record.snoozed_until = None
+            reactivated.append(record)
 
         records.append(record)
 
+    if reactivated:
+        _save_attentions_file(account, reactivated)
+
     # Sort by date descending (newest first)
     records.sort(key=lambda r: r.date, reverse=True)
     return records
@@ -605,21 +662,7 @@ def purge_expired_records(account: str) -> int:
 
 def _purge_expired_file(account: str) -> int:
     """Purge expired records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return 0
-
-    count = 0
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        record = AttentionRecord.from_dict(data)
-        if record.is_expired():
-            file_path.unlink()
-            count += 1
-
-    return count
+    return _local_store().delete_where(account, expires_before=_now())
 
 
 def _purge_expired_firestore(account: str) -> int:
@@ -634,12 +677,7 @@ def _purge_expired_firestore(account: str) -> int:
     # Query for expired items
     query = collection_ref.where("expires_at", "<", now_str)
 
-    count = 0
-    for doc in query.stream():
-        doc.reference.delete()
-        count += 1
-
-    return count
+    return delete_documents(db, query.stream()).written
 
 
 def get_dismissed_email_ids(account: str) -> set:
@@ -658,19 +696,7 @@ def get_dismissed_email_ids(account: str) -> set:
 
 def _get_dismissed_email_ids_file(account: str) -> set:
     """Get dismissed email IDs from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return set()
-
-    dismissed_ids = set()
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if data.get("status") == "dismissed":
-            dismissed_ids.add(data["email_id"])
-
-    return dismissed_ids
+    return {data["email_id"] for data in _local_store().query(account, status="dismissed")}
 
 
 def _get_dismissed_email_ids_firestore(account: str) -> set:
@@ -690,6 +716,105 @@ def _get_dismissed_email_ids_firestore(account: str) -> set:
     return dismissed_ids
 
 
+# =============================================================================
+# Single-Pass State Loading
+# =============================================================================
+
+@dataclass(slots=True)
+class AttentionState:
+    """An account's attention collection, read once and partitioned.
+
+    Attributes:
+        active: Active items, including reactivated snoozes, newest first
+        dismissed: Dismissed items
+        snoozed_due: Snoozed items whose snooze has passed (now active)
+        expired: Expired records (deleted by the load)
+    """
+    active: List[AttentionRecord] = field(default_factory=list)
+    dismissed: List[AttentionRecord] = field(default_factory=list)
+    snoozed_due: List[AttentionRecord] = field(default_factory=list)
+    expired: List[AttentionRecord] = field(default_factory=list)
+
+    @property
+    def dismissed_ids(self) -> Set[str]:
+        return {record.email_id for record in self.dismissed}
+
+
+def load_attention_state(account: str) -> AttentionState:
+    """Load and partition every attention record for an account in one read.
+
+    Replaces calling purge_expired_records, get_dismissed_email_ids and
+    list_active_attention back to back. Expired records are deleted and due
+    snoozes reactivated, with all of those writes committed together.
+
+    Args:
+        account: Email account ("church" or "personal")
+
+    Returns:
+        AttentionState with active, dismissed, snoozed-due and expired partitions
+    """
+    if _force_file_fallback():
+        return _load_attention_state_file(account)
+    return _load_attention_state_firestore(account)
+
+
+def _partition_attention(records: Iterable[AttentionRecord]) -> AttentionState:
+    """Sort records into state partitions, reactivating due snoozes in place."""
+    state = AttentionState()
+    now = _now()
+    for record in records:
+        if record.is_expired():
+            state.expired.append(record)
+        elif record.status == "dismissed":
+            state.dismissed.append(record)
+        elif record.status == "active":
+            state.active.append(record)
+        elif record.status == "snoozed" and record.snoozed_until and now >= record.snoozed_until:
+            record.status = "active"
+            record.snoozed_until = None
+            state.snoozed_due.append(record)
+            state.active.append(record)
+
+    # Sort by date descending (newest first)
+    state.active.sort(key=lambda r: r.date, reverse=True)
+    return state
+
+
+def _load_attention_state_file(account: str) -> AttentionState:
+    """Load attention state from file storage."""
+    store = _local_store()
+    state = _partition_attention(
+        AttentionRecord.from_dict(data) for data in store.query(account)
+    )
+    store.delete_many(account, [r.email_id for r in state.expired])
+    _save_attentions_file(account, state.snoozed_due)
+    return state
+
+
+def _load_attention_state_firestore(account: str) -> AttentionState:
+    """Load attention state from Firestore."""
+    db = get_firestore_client()
+    if db is None:
+        return _load_attention_state_file(account)
+
+    collection_ref = db.collection("email_accounts").document(account).collection("attention")
+    state = _partition_attention(
+        AttentionRecord.from_dict(doc.to_dict()) for doc in collection_ref.stream()
+    )
+
+    writer = BatchWriter(db)
+    deltas: RollupDeltas = {}
+    for record in state.expired:
+        writer.delete(collection_ref.document(record.email_id))
+    for record in state.snoozed_due:
+        data = record.to_dict()
+        writer.set(collection_ref.document(record.email_id), data)
+        merge_deltas(deltas, rollup_deltas(_rollup_keys, {**data, "status": "snoozed"}, data))
+    queue_rollups(writer, db, account, "attention", deltas)
+    commit_with_rollups(writer, db, account, "attention")
+    return state
+
+
 # =============================================================================
 # Phase 1A: Quality Tracking Functions
 # =============================================================================
@@ -742,6 +867,9 @@ def mark_email_replied(account: str, email_id: str) -> bool:
 def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     """Get quality metrics for attention items.
 
+    Metrics are summed from per-day counters kept up to date as items are
+    created and acted on (see metric_rollups).
+
     Args:
         account: Email account ("church" or "personal")
         days: Number of days to look back
@@ -749,30 +877,22 @@ def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     Returns:
         Dictionary with quality metrics including acceptance rates
     """
-    from datetime import timedelta
-
-    cutoff = _now() - timedelta(days=days)
-
-    # Get all attention records
     if _force_file_fallback():
-        records = _get_all_records_file(account)
+        counts = _get_metric_counts_file(account, days)
     else:
-        records = _get_all_records_firestore(account)
-
-    # Filter by date
-    filtered = [r for r in records if r.created_at >= cutoff]
+        counts = _get_metric_counts_firestore(account, days)
 
     # Aggregate metrics
-    total = len(filtered)
+    total = counts.get("total", 0)
     by_status = {"active": 0, "dismissed": 0, "snoozed": 0, "task_created": 0}
     by_method = {"regex": 0, "haiku": 0, "profile_match": 0, "vip": 0}
     by_action = {"viewed": 0, "dismissed": 0, "task_created": 0, "email_replied": 0, "ignored": 0}
 
-    for record in filtered:
-        by_status[record.status] = by_status.get(record.status, 0) + 1
-        by_method[record.analysis_method] = by_method.get(record.analysis_method, 0) + 1
-        if record.action_type:
-            by_action[record.action_type] = by_action.get(record.action_type, 0) + 1
+    groups = {"status": by_status, "method": by_method, "action": by_action}
+    for key, count in counts.items():
+        dimension, _, value = key.partition(":")
+        if dimension in groups:
+            groups[dimension][value] = count
 
     # Calculate acceptance rate (task_created + email_replied) / total
     accepted = by_action.get("task_created", 0) + by_action.get("email_replied", 0)
@@ -788,31 +908,19 @@ def get_quality_metrics(account: str, days: int = 30) -> Dict[str, Any]:
     }
 
 
-def _get_all_records_file(account: str) -> List[AttentionRecord]:
-    """Get all attention records from file storage."""
-    store_dir = _attention_dir() / account
-    if not store_dir.exists():
-        return []
-
-    records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        records.append(AttentionRecord.from_dict(data))
-
-    return records
+def _get_metric_counts_file(account: str, days: int) -> Dict[str, int]:
+    """Sum the quality counters for the window from file storage."""
+    return _local_store().read_rollups(account, window_start(days))
 
 
-def _get_all_records_firestore(account: str) -> List[AttentionRecord]:
-    """Get all attention records from Firestore."""
+def _get_metric_counts_firestore(account: str, days: int) -> Dict[str, int]:
+    """Sum the quality counters for the window from Firestore."""
     db = get_firestore_client()
     if db is None:
-        return _get_all_records_file(account)
+        return _get_metric_counts_file(account, days)
 
     collection_ref = db.collection("email_accounts").document(account).collection("attention")
-
-    records = []
-    for doc in collection_ref.stream():
-        records.append(AttentionRecord.from_dict(doc.to_dict()))
-
-    return records
+    return read_rollups_firestore(
+        db, collection_ref,
+        account=account, store="attention", keys=_rollup_keys, days=days,
+    )
@@ -9,6 +9,8 @@ Includes privacy safeguards: domain blocklist and content masking.
 """
 from __future__ import annotations
 
+import logging
+import os
 import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
@@ -21,6 +23,8 @@ except ModuleNotFoundError:
 
 from ..llm.anthropic_client import build_anthropic_client, AnthropicError
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Constants
@@ -28,6 +32,11 @@ from ..llm.anthropic_client import build_anthropic_client, AnthropicError
 
 HAIKU_MODEL = "claude-3-5-haiku-20241022"
 
+HAIKU_SYSTEM_PROMPT = "You are an email triage assistant. Respond with JSON only, no markdown fences."
+
+# Output budget per email in a batch request (single requests use 500)
+HAIKU_BATCH_TOKENS_PER_EMAIL = 450
+
 # DEPRECATED: Hardcoded domain blocklist removed (Jan 2026)
 # User now manages sensitive senders via Profile blocklist and Gmail "Sensitive" label.
 # The domains below are preserved for reference if user wants to add them to blocklist:
@@ -117,6 +126,18 @@ class HaikuAnalysisResult:
     skipped_reason: Optional[str] = None  # Set if analysis was skipped
 
 
+@dataclass(slots=True)
+class HaikuBatchEmail:
+    """One email in a batch analysis request."""
+    email_id: str
+    sender_email: str
+    sender_name: str
+    subject: str
+    snippet: str
+    date: str
+    body: Optional[str] = None
+
+
 @dataclass(slots=True)
 class PrivacySanitizeResult:
     """Result from privacy sanitization."""
@@ -223,21 +244,9 @@ def prepare_email_for_haiku(
 # Haiku Prompt Templates
 # =============================================================================
 
-HAIKU_UNIFIED_PROMPT = """Analyze this email for David Royes and return a JSON object with your analysis.
-
-DAVID'S ROLES AND RESPONSIBILITIES:
-{roles_context}
-
-AVAILABLE LABELS FOR ORGANIZATION:
-{available_labels}
-
-EMAIL TO ANALYZE:
-From: {sender_name} <{sender_email}>
-Date: {date}
-{email_content}
-
-Return ONLY a JSON object (no markdown, no explanation) with this exact structure:
-{{
+# Per-email JSON structure shared by the single and batch prompts
+# (braces are doubled because the prompts are str.format templates)
+_HAIKU_ANALYSIS_SCHEMA = """{{
     "attention": {{
         "needs_attention": true or false,
         "urgency": "high" or "medium" or "low",
@@ -258,9 +267,9 @@ Return ONLY a JSON object (no markdown, no explanation) with this exact structur
         "reason": "why this rule would help" or null
     }},
     "confidence": 0.0 to 1.0
-}}
+}}"""
 
-GUIDELINES:
+_HAIKU_GUIDELINES = """GUIDELINES:
 - needs_attention=true ONLY if David must personally act on this email
 - High urgency: deadlines within 48h, urgent requests from VIPs, time-sensitive items
 - Medium urgency: questions requiring response, action items with flexibility
@@ -294,6 +303,38 @@ IMPORTANT - SHORT EMAIL HANDLING:
 - Email signatures don't indicate actionable content - look at subject and sender instead
 """
 
+HAIKU_UNIFIED_PROMPT = """Analyze this email for David Royes and return a JSON object with your analysis.
+
+DAVID'S ROLES AND RESPONSIBILITIES:
+{roles_context}
+
+AVAILABLE LABELS FOR ORGANIZATION:
+{available_labels}
+
+EMAIL TO ANALYZE:
+From: {sender_name} <{sender_email}>
+Date: {date}
+{email_content}
+
+Return ONLY a JSON object (no markdown, no explanation) with this exact structure:
+""" + _HAIKU_ANALYSIS_SCHEMA + "\n\n" + _HAIKU_GUIDELINES
+
+HAIKU_BATCH_PROMPT = """Analyze each of the {email_count} emails below for David Royes and return a JSON array with one analysis object per email.
+
+DAVID'S ROLES AND RESPONSIBILITIES:
+{roles_context}
+
+AVAILABLE LABELS FOR ORGANIZATION:
+{available_labels}
+
+EMAILS TO ANALYZE:
+{email_blocks}
+
+Return ONLY a JSON array (no markdown, no explanation) with exactly one object per email.
+Each object MUST include "email_id" copied from the email header, plus this exact structure:
+""" + _HAIKU_ANALYSIS_SCHEMA + "\n\n" + _HAIKU_GUIDELINES
+
+
 DEFAULT_ROLES_CONTEXT = """
 WORK (PGA TOUR):
 - Business Solutions Team lead for Custom Dev, SaaS, CRM, BI projects
@@ -390,7 +431,7 @@ def analyze_email_with_haiku(
             model=HAIKU_MODEL,
             max_tokens=500,
             temperature=0.2,  # Low temperature for consistent analysis
-            system="You are an email triage assistant. Respond with JSON only, no markdown fences.",
+            system=HAIKU_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": prompt}],
         )
     except APIStatusError as exc:
@@ -405,6 +446,137 @@ def analyze_email_with_haiku(
     return _build_analysis_result(data)
 
 
+def haiku_batch_size() -> int:
+    """Return the maximum number of emails packed into one Haiku request."""
+    try:
+        return max(1, int(os.getenv("DTA_HAIKU_BATCH_SIZE", "10")))
+    except ValueError:
+        return 10
+
+
+def analyze_emails_with_haiku_batch(
+    emails: List[HaikuBatchEmail],
+    roles_context: Optional[str] = None,
+    available_labels: Optional[str] = None,
+    *,
+    client: Optional[Anthropic] = None,
+    max_retries: int = 1,
+) -> Dict[str, HaikuAnalysisResult]:
+    """Analyze several emails in one Claude 3.5 Haiku request.
+
+    The roles context, label list and guidelines are sent once for the whole
+    batch and Haiku returns a JSON array keyed by email_id. Entries that are
+    missing or malformed are re-requested (only those emails) up to
+    ``max_retries`` times.
+
+    Args:
+        emails: Emails to analyze (privacy checks already applied).
+        roles_context: Optional custom roles context (defaults to David's roles)
+        available_labels: Optional custom labels list
+        client: Optional pre-built Anthropic client
+        max_retries: Extra requests for emails without a valid entry.
+
+    Returns:
+        Dict mapping email_id to HaikuAnalysisResult. Emails that never got
+        a valid entry are absent so callers can fall back per email.
+
+    Raises:
+        AnthropicError: If the first API call fails
+    """
+    if not emails:
+        return {}
+
+    if client is None:
+        client = build_anthropic_client()
+
+    results: Dict[str, HaikuAnalysisResult] = {}
+    pending = list(emails)
+
+    for attempt in range(max_retries + 1):
+        try:
+            entries = _request_haiku_batch(
+                pending, roles_context, available_labels, client=client
+            )
+        except AnthropicError as exc:
+            if not results and attempt == 0:
+                raise
+            logger.warning(f"Haiku batch retry failed for {len(pending)} emails: {exc}")
+            break
+
+        expected = {email.email_id for email in pending}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            email_id = str(entry.get("email_id", ""))
+            if email_id not in expected or email_id in results:
+                continue
+            if not isinstance(entry.get("attention"), dict):
+                continue
+            try:
+                results[email_id] = _build_analysis_result(entry)
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+        pending = [email for email in pending if email.email_id not in results]
+        if not pending:
+            break
+        logger.debug(f"Haiku batch missing {len(pending)} of {len(emails)} entries")
+
+    return results
+
+
+def _request_haiku_batch(
+    emails: List[HaikuBatchEmail],
+    roles_context: Optional[str],
+    available_labels: Optional[str],
+    *,
+    client: Anthropic,
+) -> List[Any]:
+    """Send one batch prompt and return the parsed JSON array.
+
+    A response that is not a JSON array yields an empty list so every email
+    in the batch is treated as failed and retried.
+    """
+    blocks = []
+    for email in emails:
+        sanitized_content, _ = prepare_email_for_haiku(
+            email.sender_email, email.subject, email.snippet, email.body
+        )
+        blocks.append(
+            f"[email_id: {email.email_id}]\n"
+            f"From: {email.sender_name or 'Unknown'} <{email.sender_email}>\n"
+            f"Date: {email.date or 'Unknown'}\n"
+            f"{sanitized_content}"
+        )
+
+    prompt = HAIKU_BATCH_PROMPT.format(
+        email_count=len(emails),
+        roles_context=roles_context or DEFAULT_ROLES_CONTEXT,
+        available_labels=available_labels or DEFAULT_LABELS,
+        email_blocks="\n\n".join(blocks),
+    )
+
+    try:
+        response = client.messages.create(
+            model=HAIKU_MODEL,
+            max_tokens=HAIKU_BATCH_TOKENS_PER_EMAIL * len(emails) + 100,
+            temperature=0.2,  # Low temperature for consistent analysis
+            system=HAIKU_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}],
+        )
+    except APIStatusError as exc:
+        raise AnthropicError(f"Haiku API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Haiku request failed: {exc}") from exc
+
+    text = _extract_response_text(response)
+    try:
+        data = _parse_haiku_response(text)
+    except AnthropicError:
+        return []
+    return data if isinstance(data, list) else []
+
+
 def _extract_response_text(response) -> str:
     """Extract text content from Anthropic response."""
     for block in getattr(response, "content", []):
@@ -436,9 +608,11 @@ def _parse_haiku_response(text: str) -> Dict[str, Any]:
 
 def _build_analysis_result(data: Dict[str, Any]) -> HaikuAnalysisResult:
     """Build HaikuAnalysisResult from parsed response data."""
-    attention_data = data.get("attention", {})
-    action_data = data.get("action", {})
-    rule_data = data.get("rule", {})
+    # Sections may come back null or malformed; fall back to the defaults
+    attention_data, action_data, rule_data = (
+        section if isinstance(section, dict) else {}
+        for section in (data.get("attention"), data.get("action"), data.get("rule"))
+    )
 
     return HaikuAnalysisResult(
         attention=HaikuAttentionResult(
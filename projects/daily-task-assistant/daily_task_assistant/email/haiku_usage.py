@@ -19,11 +19,16 @@ File Storage (dev mode):
 Environment Variables:
     DTA_HAIKU_FORCE_FILE: Set to "1" to use local file storage (dev mode)
     DTA_HAIKU_STORAGE_DIR: Directory for file-based storage (default: haiku_usage/)
+
+Batch analysis reserves its calls up front with reserve_usage() and hands
+back whatever it did not spend with release_usage(), so a batch costs two
+storage round trips instead of a settings/usage read per email.
 """
 from __future__ import annotations
 
 import json
 import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -42,6 +47,9 @@ GLOBAL_USER_ID = "david"
 DEFAULT_DAILY_LIMIT = 50
 DEFAULT_WEEKLY_LIMIT = 200
 
+# Serializes read-modify-write cycles on the usage counters within this process
+_usage_lock = threading.Lock()
+
 
 def _force_file_fallback() -> bool:
     """Check if file-based storage should be used (dev mode)."""
@@ -191,10 +199,15 @@ class HaikuUsage:
             self.weekly_count < settings.weekly_limit
         )
 
-    def increment(self) -> None:
+    def increment(self, count: int = 1) -> None:
         """Increment both daily and weekly counters."""
-        self.daily_count += 1
-        self.weekly_count += 1
+        self.daily_count += count
+        self.weekly_count += count
+
+    def decrement(self, count: int = 1) -> None:
+        """Decrement both counters, never going below zero."""
+        self.daily_count = max(0, self.daily_count - count)
+        self.weekly_count = max(0, self.weekly_count - count)
 
     def remaining_daily(self, settings: HaikuSettings) -> int:
         """Get remaining daily quota."""
@@ -442,15 +455,71 @@ def _save_usage_firestore(usage: HaikuUsage) -> None:
     doc_ref.set(usage.to_dict())
 
 
-def increment_usage() -> HaikuUsage:
+def increment_usage(count: int = 1) -> HaikuUsage:
     """Increment GLOBAL usage counters and save.
 
+    Args:
+        count: Number of analyzed emails to record.
+
     Returns:
         Updated HaikuUsage
     """
-    usage = get_usage()
-    usage.increment()
-    save_usage(usage)
+    with _usage_lock:
+        usage = get_usage()
+        usage.increment(count)
+        save_usage(usage)
+    return usage
+
+
+def reserve_usage(count: int) -> int:
+    """Reserve up to ``count`` Haiku calls against the GLOBAL limits.
+
+    Settings and usage are read once and the granted calls are counted
+    immediately, so concurrent batches cannot overshoot the limits.
+    Reserved calls that end up unused should be returned via release_usage().
+
+    Args:
+        count: Number of calls the caller would like to make.
+
+    Returns:
+        Number of calls granted (0 if disabled or out of quota).
+    """
+    if count <= 0:
+        return 0
+
+    with _usage_lock:
+        settings = get_settings()
+        if not settings.enabled:
+            return 0
+
+        usage = get_usage()
+        granted = min(
+            count,
+            usage.remaining_daily(settings),
+            usage.remaining_weekly(settings),
+        )
+        if granted > 0:
+            usage.increment(granted)
+            save_usage(usage)
+        return granted
+
+
+def release_usage(count: int) -> HaikuUsage | None:
+    """Return unused calls from a reserve_usage() grant.
+
+    Args:
+        count: Number of reserved calls that were not spent.
+
+    Returns:
+        Updated HaikuUsage, or None if there was nothing to release.
+    """
+    if count <= 0:
+        return None
+
+    with _usage_lock:
+        usage = get_usage()
+        usage.decrement(count)
+        save_usage(usage)
     return usage
 
 
@@ -11,7 +11,7 @@ Firestore Structure:
     email_accounts/{account}/pinned/{email_id} -> PinnedRecord document
 
 File Storage (dev mode):
-    pinned_store/{account}/{email_id}.json
+    pinned_store/store.sqlite3 -> (account, email_id) documents (see local_store)
 
 Environment Variables:
     DTA_PINNED_FORCE_FILE: Set to "1" to use local file storage (dev mode)
@@ -20,14 +20,14 @@ Environment Variables:
 """
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from ..firestore import get_firestore_client
+from ..firestore import delete_documents, get_firestore_client
+from ..local_store import LocalStore, get_local_store
 
 
 # Configuration helpers
@@ -46,6 +46,19 @@ def _pinned_dir() -> Path:
     )
 
 
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode.
+
+    Pins have no status or expiry of their own: pinned_at fills the
+    created_at column and unpinned_at the expires_at column, so expired
+    unpins are found through the index (see cleanup_expired).
+    """
+    return get_local_store(
+        _pinned_dir(),
+        fields={"created_at": "pinned_at", "expires_at": "unpinned_at"},
+    )
+
+
 def _ttl_days() -> int:
     """Return TTL for unpinned emails in days (from unpin date)."""
     return int(os.getenv("DTA_PINNED_TTL_DAYS", "30"))
@@ -161,12 +174,7 @@ def _save_pinned(account: str, record: PinnedRecord) -> None:
 
 def _save_pinned_file(account: str, record: PinnedRecord) -> None:
     """Save pinned record to file storage."""
-    store_dir = _pinned_dir() / account
-    store_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = store_dir / f"{record.email_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(record.to_dict(), f, indent=2)
+    _local_store().put(account, record.email_id, record.to_dict())
 
 
 def _save_pinned_firestore(account: str, record: PinnedRecord) -> None:
@@ -202,13 +210,10 @@ def _get_pinned(account: str, email_id: str) -> Optional[PinnedRecord]:
 
 def _get_pinned_file(account: str, email_id: str) -> Optional[PinnedRecord]:
     """Get pinned record from file storage."""
-    file_path = _pinned_dir() / account / f"{email_id}.json"
-    if not file_path.exists():
+    data = _local_store().get(account, email_id)
+    if data is None:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     return PinnedRecord.from_dict(data)
 
 
@@ -247,9 +252,7 @@ def _delete_pinned(account: str, email_id: str) -> None:
 
 def _delete_pinned_file(account: str, email_id: str) -> None:
     """Delete pinned record from file storage."""
-    file_path = _pinned_dir() / account / f"{email_id}.json"
-    if file_path.exists():
-        file_path.unlink()
+    _local_store().delete(account, email_id)
 
 
 def _delete_pinned_firestore(account: str, email_id: str) -> None:
@@ -362,15 +365,8 @@ def get_pinned_emails(account: str, include_unpinned: bool = False) -> List[Pinn
 
 def _get_pinned_emails_file(account: str, include_unpinned: bool) -> List[PinnedRecord]:
     """Get pinned emails from file storage."""
-    store_dir = _pinned_dir() / account
-    if not store_dir.exists():
-        return []
-
     records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
+    for data in _local_store().query(account):
         record = PinnedRecord.from_dict(data)
 
         # Skip expired records (cleanup happens separately)
@@ -451,22 +447,10 @@ def cleanup_expired(account: str) -> int:
 
 def _cleanup_expired_file(account: str) -> int:
     """Cleanup expired records from file storage."""
-    store_dir = _pinned_dir() / account
-    if not store_dir.exists():
-        return 0
-
-    count = 0
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    cutoff = _now() - timedelta(days=_ttl_days())
 
-        record = PinnedRecord.from_dict(data)
-
-        if record.is_expired:
-            file_path.unlink()
-            count += 1
-
-    return count
+    # expires_at holds unpinned_at for pins (see _local_store)
+    return _local_store().delete_where(account, expires_before=cutoff)
 
 
 def _cleanup_expired_firestore(account: str) -> int:
@@ -481,14 +465,9 @@ def _cleanup_expired_firestore(account: str) -> int:
         .collection("pinned")
     )
 
-    count = 0
     cutoff = (_now() - timedelta(days=_ttl_days())).isoformat()
 
     # Query for unpinned records older than TTL
     query = collection_ref.where("unpinned_at", "<=", cutoff)
 
-    for doc in query.stream():
-        doc.reference.delete()
-        count += 1
-
-    return count
+    return delete_documents(db, query.stream()).written
@@ -9,9 +9,10 @@ David has multiple login emails but data is keyed by "church" or "personal".
 
 Firestore Structure:
     email_accounts/{account}/rule_suggestions/{rule_id} -> RuleSuggestionRecord document
+    email_accounts/{account}/metric_rollups/rule_suggestions_{day} -> per-day stats counters
 
 File Storage (dev mode):
-    rule_store/{account}/{rule_id}.json
+    rule_store/store.sqlite3 -> (account, rule_id) documents (see local_store)
 
 Environment Variables:
     DTA_RULE_FORCE_FILE: Set to "1" to use local file storage (dev mode)
@@ -22,15 +23,21 @@ Environment Variables:
 """
 from __future__ import annotations
 
-import json
 import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple
 
-from ..firestore import get_firestore_client
+from ..firestore import delete_documents, get_firestore_client
+from ..local_store import LocalStore, get_local_store
+from ..metric_rollups import (
+    read_rollups_firestore,
+    save_many_with_rollups,
+    save_with_rollups,
+    window_start,
+)
 
 
 # Type aliases
@@ -55,6 +62,22 @@ def _rule_dir() -> Path:
     )
 
 
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode."""
+    return get_local_store(_rule_dir(), rollup_keys=_rollup_keys)
+
+
+def _rollup_keys(data: Dict[str, Any]) -> List[str]:
+    """Metric counter keys for a rule suggestion (see metric_rollups)."""
+    status = data.get("status", "pending")
+    method = data.get("analysis_method", "regex")
+    category = data.get("category") or "Uncategorized"
+    keys = ["total", f"status:{status}", f"method:{method}", f"category:{category}"]
+    if status in ("approved", "rejected"):
+        keys += [f"method_{status}:{method}", f"category_{status}:{category}"]
+    return keys
+
+
 def _ttl_pending_days() -> int:
     """Return TTL for pending rule suggestions in days."""
     return int(os.getenv("DTA_RULE_TTL_PENDING", "30"))
@@ -256,12 +279,7 @@ def save_rule_suggestion(account: str, record: RuleSuggestionRecord) -> None:
 
 def _save_rule_file(account: str, record: RuleSuggestionRecord) -> None:
     """Save rule suggestion to file storage."""
-    store_dir = _rule_dir() / account
-    store_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = store_dir / f"{record.rule_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(record.to_dict(), f, indent=2)
+    _local_store().put(account, record.rule_id, record.to_dict())
 
 
 def _save_rule_firestore(account: str, record: RuleSuggestionRecord) -> None:
@@ -277,7 +295,54 @@ def _save_rule_firestore(account: str, record: RuleSuggestionRecord) -> None:
         .collection("rule_suggestions")
         .document(record.rule_id)
     )
-    doc_ref.set(record.to_dict())
+    save_with_rollups(
+        db, doc_ref, record.to_dict(),
+        account=account, store="rule_suggestions", keys=_rollup_keys,
+    )
+
+
+def save_rule_suggestions(account: str, records: Iterable[RuleSuggestionRecord]) -> Set[str]:
+    """Save many rule suggestion records in one pass.
+
+    In Firestore mode the writes are committed in batches (see BatchWriter).
+
+    Args:
+        account: Email account ("church" or "personal")
+        records: RuleSuggestionRecords to save
+
+    Returns:
+        IDs of the rule suggestions that could not be saved
+    """
+    records = list(records)
+    if not records:
+        return set()
+    if _force_file_fallback():
+        _save_rules_file(account, records)
+        return set()
+    return _save_rules_firestore(account, records)
+
+
+def _save_rules_file(account: str, records: List[RuleSuggestionRecord]) -> None:
+    """Save rule suggestions to file storage."""
+    _local_store().put_many(account, {r.rule_id: r.to_dict() for r in records})
+
+
+def _save_rules_firestore(account: str, records: List[RuleSuggestionRecord]) -> Set[str]:
+    """Save rule suggestions to Firestore in batches."""
+    db = get_firestore_client()
+    if db is None:
+        _save_rules_file(account, records)
+        return set()
+
+    collection_ref = (
+        db.collection("email_accounts")
+        .document(account)
+        .collection("rule_suggestions")
+    )
+    return save_many_with_rollups(
+        db, collection_ref, {r.rule_id: r.to_dict() for r in records},
+        account=account, store="rule_suggestions", keys=_rollup_keys,
+    )
 
 
 def get_rule_suggestion(account: str, rule_id: str) -> Optional[RuleSuggestionRecord]:
@@ -297,17 +362,15 @@ def get_rule_suggestion(account: str, rule_id: str) -> Optional[RuleSuggestionRe
 
 def _get_rule_file(account: str, rule_id: str) -> Optional[RuleSuggestionRecord]:
     """Get rule suggestion from file storage."""
-    file_path = _rule_dir() / account / f"{rule_id}.json"
-    if not file_path.exists():
+    store = _local_store()
+    data = store.get(account, rule_id)
+    if data is None:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     record = RuleSuggestionRecord.from_dict(data)
 
     if record.is_expired():
-        file_path.unlink()
+        store.delete(account, rule_id)
         return None
 
     return record
@@ -355,23 +418,15 @@ def list_pending_rules(account: str) -> List[RuleSuggestionRecord]:
 
 def _list_pending_rules_file(account: str) -> List[RuleSuggestionRecord]:
     """List pending rule suggestions from file storage."""
-    store_dir = _rule_dir() / account
-    if not store_dir.exists():
-        return []
+    store = _local_store()
 
-    records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    # Drop expired rules before reading
+    store.delete_where(account, expires_before=_now())
 
-        record = RuleSuggestionRecord.from_dict(data)
-
-        if record.is_expired():
-            file_path.unlink()
-            continue
-
-        if record.status == "pending":
-            records.append(record)
+    records = [
+        RuleSuggestionRecord.from_dict(data)
+        for data in store.query(account, status="pending")
+    ]
 
     # Sort by confidence descending (highest confidence first)
     records.sort(key=lambda r: r.confidence, reverse=True)
@@ -392,15 +447,18 @@ def _list_pending_rules_firestore(account: str) -> List[RuleSuggestionRecord]:
     query = collection_ref.where("status", "==", "pending")
 
     records = []
+    expired = []
     for doc in query.stream():
         record = RuleSuggestionRecord.from_dict(doc.to_dict())
 
         if record.is_expired():
-            doc.reference.delete()
+            expired.append(doc)
             continue
 
         records.append(record)
 
+    delete_documents(db, expired)
+
     records.sort(key=lambda r: r.confidence, reverse=True)
     return records
 
@@ -483,9 +541,38 @@ def create_rule_suggestion(
     return record
 
 
+def create_rule_suggestions(
+    account: str,
+    suggestions: Iterable[Dict[str, Any]],
+) -> List[RuleSuggestionRecord]:
+    """Create and save many rule suggestions in one pass.
+
+    Args:
+        account: Email account ("church" or "personal")
+        suggestions: Keyword arguments for each rule suggestion, as accepted
+            by create_rule_suggestion (without account)
+
+    Returns:
+        The created RuleSuggestionRecords, in input order. Records that
+        could not be saved are left out.
+    """
+    records = []
+    for fields in suggestions:
+        fields = dict(fields)
+        fields["examples"] = fields.get("examples") or []
+        records.append(
+            RuleSuggestionRecord(rule_id=_generate_id(), email_account=account, **fields)
+        )
+    failed = save_rule_suggestions(account, records)
+    return [record for record in records if record.rule_id not in failed]
+
+
 def get_rule_approval_stats(account: str, days: int = 30) -> Dict[str, Any]:
     """Get rule approval statistics for Trust Gradient.
 
+    Stats are summed from per-day counters kept up to date as rules are
+    suggested and decided (see metric_rollups).
+
     Args:
         account: Email account ("church" or "personal")
         days: How many days to look back
@@ -513,68 +600,7 @@ def _empty_rule_stats() -> Dict[str, Any]:
 
 def _get_rule_stats_file(account: str, days: int = 30) -> Dict[str, Any]:
     """Get rule approval stats from file storage."""
-    store_dir = _rule_dir() / account
-    if not store_dir.exists():
-        return _empty_rule_stats()
-
-    cutoff = _now() - timedelta(days=days)
-    stats = {
-        "total": 0,
-        "approved": 0,
-        "rejected": 0,
-        "pending": 0,
-        "byMethod": {},
-        "byCategory": {},
-    }
-
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        record = RuleSuggestionRecord.from_dict(data)
-
-        # Skip old records
-        if record.created_at < cutoff:
-            continue
-
-        stats["total"] += 1
-        status = record.status
-        if status in ("approved", "rejected", "pending"):
-            stats[status] += 1
-
-        # Group by analysis method
-        method = record.analysis_method
-        if method not in stats["byMethod"]:
-            stats["byMethod"][method] = {"approved": 0, "rejected": 0, "total": 0}
-        stats["byMethod"][method]["total"] += 1
-        if status in ("approved", "rejected"):
-            stats["byMethod"][method][status] += 1
-
-        # Group by category
-        cat = record.category or "Uncategorized"
-        if cat not in stats["byCategory"]:
-            stats["byCategory"][cat] = {"approved": 0, "rejected": 0, "total": 0}
-        stats["byCategory"][cat]["total"] += 1
-        if status in ("approved", "rejected"):
-            stats["byCategory"][cat][status] += 1
-
-    # Calculate approval rates
-    decided = stats["approved"] + stats["rejected"]
-    stats["approvalRate"] = stats["approved"] / decided if decided > 0 else 0.0
-
-    for method_stats in stats["byMethod"].values():
-        method_decided = method_stats["approved"] + method_stats["rejected"]
-        method_stats["rate"] = (
-            method_stats["approved"] / method_decided if method_decided > 0 else 0.0
-        )
-
-    for cat_stats in stats["byCategory"].values():
-        cat_decided = cat_stats["approved"] + cat_stats["rejected"]
-        cat_stats["rate"] = (
-            cat_stats["approved"] / cat_decided if cat_decided > 0 else 0.0
-        )
-
-    return stats
+    return _rule_stats_from_rollups(_local_store().read_rollups(account, window_start(days)))
 
 
 def _get_rule_stats_firestore(account: str, days: int = 30) -> Dict[str, Any]:
@@ -588,58 +614,39 @@ def _get_rule_stats_firestore(account: str, days: int = 30) -> Dict[str, Any]:
         .document(account)
         .collection("rule_suggestions")
     )
-
-    cutoff = (_now() - timedelta(days=days)).isoformat()
-    query = collection_ref.where("created_at", ">=", cutoff)
-
-    stats = {
-        "total": 0,
-        "approved": 0,
-        "rejected": 0,
-        "pending": 0,
-        "byMethod": {},
-        "byCategory": {},
-    }
-
-    for doc in query.stream():
-        data = doc.to_dict()
-        record = RuleSuggestionRecord.from_dict(data)
-
-        stats["total"] += 1
-        status = record.status
-        if status in ("approved", "rejected", "pending"):
-            stats[status] += 1
-
-        method = record.analysis_method
-        if method not in stats["byMethod"]:
-            stats["byMethod"][method] = {"approved": 0, "rejected": 0, "total": 0}
-        stats["byMethod"][method]["total"] += 1
-        if status in ("approved", "rejected"):
-            stats["byMethod"][method][status] += 1
-
-        cat = record.category or "Uncategorized"
-        if cat not in stats["byCategory"]:
-            stats["byCategory"][cat] = {"approved": 0, "rejected": 0, "total": 0}
-        stats["byCategory"][cat]["total"] += 1
-        if status in ("approved", "rejected"):
-            stats["byCategory"][cat][status] += 1
-
-    # Calculate approval rates
+    counts = read_rollups_firestore(
+        db, collection_ref,
+        account=account, store="rule_suggestions", keys=_rollup_keys, days=days,
+    )
+    return _rule_stats_from_rollups(counts)
+
+
+def _rule_stats_from_rollups(counts: Dict[str, int]) -> Dict[str, Any]:
+    """Build the rule approval stats dict from summed rollup counters."""
+    stats = _empty_rule_stats()
+    stats["total"] = counts.get("total", 0)
+    for status in ("approved", "rejected", "pending"):
+        stats[status] = counts.get(f"status:{status}", 0)
+
+    # Group by analysis method and category
+    groups = {"method": stats["byMethod"], "category": stats["byCategory"]}
+    for key, total in counts.items():
+        dimension, _, value = key.partition(":")
+        if dimension in groups and total > 0:
+            approved = counts.get(f"{dimension}_approved:{value}", 0)
+            rejected = counts.get(f"{dimension}_rejected:{value}", 0)
+            decided = approved + rejected
+            groups[dimension][value] = {
+                "approved": approved,
+                "rejected": rejected,
+                "total": total,
+                "rate": approved / decided if decided > 0 else 0.0,
+            }
+
+    # Calculate approval rate
     decided = stats["approved"] + stats["rejected"]
     stats["approvalRate"] = stats["approved"] / decided if decided > 0 else 0.0
 
-    for method_stats in stats["byMethod"].values():
-        method_decided = method_stats["approved"] + method_stats["rejected"]
-        method_stats["rate"] = (
-            method_stats["approved"] / method_decided if method_decided > 0 else 0.0
-        )
-
-    for cat_stats in stats["byCategory"].values():
-        cat_decided = cat_stats["approved"] + cat_stats["rejected"]
-        cat_stats["rate"] = (
-            cat_stats["approved"] / cat_decided if cat_decided > 0 else 0.0
-        )
-
     return stats
 
 
@@ -659,21 +666,7 @@ def purge_expired_rules(account: str) -> int:
 
 def _purge_expired_rules_file(account: str) -> int:
     """Purge expired rules from file storage."""
-    store_dir = _rule_dir() / account
-    if not store_dir.exists():
-        return 0
-
-    count = 0
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        record = RuleSuggestionRecord.from_dict(data)
-        if record.is_expired():
-            file_path.unlink()
-            count += 1
-
-    return count
+    return _local_store().delete_where(account, expires_before=_now())
 
 
 def _purge_expired_rules_firestore(account: str) -> int:
@@ -691,12 +684,25 @@ def _purge_expired_rules_firestore(account: str) -> int:
 
     query = collection_ref.where("expires_at", "<", now_str)
 
-    count = 0
-    for doc in query.stream():
-        doc.reference.delete()
-        count += 1
+    return delete_documents(db, query.stream()).written
+
+
+def pending_rule_patterns(account: str) -> Set[Tuple[str, str]]:
+    """Return the (field, value) patterns of all pending rule suggestions.
+
+    Loads pending rules once so callers checking many suggestions do a set
+    lookup per pattern instead of re-listing pending rules each time.
+
+    Args:
+        account: Email account ("church" or "personal")
 
-    return count
+    Returns:
+        Set of (field, value) tuples
+    """
+    return {
+        (record.suggested_rule.get("field"), record.suggested_rule.get("value"))
+        for record in list_pending_rules(account)
+    }
 
 
 def has_pending_rule_for_pattern(
@@ -716,11 +722,5 @@ def has_pending_rule_for_pattern(
     Returns:
         True if a pending rule already exists for this pattern
     """
-    pending = list_pending_rules(account)
-
-    for record in pending:
-        rule = record.suggested_rule
-        if rule.get("field") == field and rule.get("value") == value:
-            return True
+    return (field, value) in pending_rule_patterns(account)
 
-    return False
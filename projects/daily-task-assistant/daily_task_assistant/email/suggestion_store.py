@@ -10,8 +10,10 @@ David has multiple login emails but data is keyed by "church" or "personal".
 Firestore Structure:
     email_accounts/{account}/suggestions/{suggestion_id} -> SuggestionRecord document
 
+    email_accounts/{account}/metric_rollups/suggestions_{day} -> per-day stats counters
+
 File Storage (dev mode):
-    suggestion_store/{account}/{suggestion_id}.json
+    suggestion_store/store.sqlite3 -> (account, suggestion_id) documents (see local_store)
 
 Environment Variables:
     DTA_SUGGESTION_FORCE_FILE: Set to "1" to use local file storage (dev mode)
@@ -20,15 +22,21 @@ Environment Variables:
 """
 from __future__ import annotations
 
-import json
 import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set
 
-from ..firestore import get_firestore_client
+from ..firestore import BatchWriter, get_firestore_client
+from ..local_store import LocalStore, get_local_store
+from ..metric_rollups import (
+    read_rollups_firestore,
+    save_many_with_rollups,
+    save_with_rollups,
+    window_start,
+)
 
 
 # Type aliases
@@ -53,6 +61,22 @@ def _suggestion_dir() -> Path:
     )
 
 
+def _local_store() -> LocalStore:
+    """Return the embedded store used in file mode."""
+    return get_local_store(_suggestion_dir(), rollup_keys=_rollup_keys)
+
+
+def _rollup_keys(data: Dict[str, Any]) -> List[str]:
+    """Metric counter keys for a suggestion (see metric_rollups)."""
+    status = data.get("status", "pending")
+    action = data.get("action")
+    method = data.get("analysis_method", "regex")
+    keys = ["total", f"status:{status}", f"action:{action}", f"method:{method}"]
+    if status in ("approved", "rejected"):
+        keys += [f"action_{status}:{action}", f"method_{status}:{method}"]
+    return keys
+
+
 def _ttl_days() -> int:
     """Return TTL for suggestions in days."""
     return int(os.getenv("DTA_SUGGESTION_TTL_DAYS", "7"))
@@ -277,12 +301,7 @@ def save_suggestion(account: str, record: SuggestionRecord) -> None:
 
 def _save_suggestion_file(account: str, record: SuggestionRecord) -> None:
     """Save suggestion record to file storage."""
-    store_dir = _suggestion_dir() / account
-    store_dir.mkdir(parents=True, exist_ok=True)
-
-    file_path = store_dir / f"{record.suggestion_id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(record.to_dict(), f, indent=2)
+    _local_store().put(account, record.suggestion_id, record.to_dict())
 
 
 def _save_suggestion_firestore(account: str, record: SuggestionRecord) -> None:
@@ -298,7 +317,54 @@ def _save_suggestion_firestore(account: str, record: SuggestionRecord) -> None:
         .collection("suggestions")
         .document(record.suggestion_id)
     )
-    doc_ref.set(record.to_dict())
+    save_with_rollups(
+        db, doc_ref, record.to_dict(),
+        account=account, store="suggestions", keys=_rollup_keys,
+    )
+
+
+def save_suggestions(account: str, records: Iterable[SuggestionRecord]) -> Set[str]:
+    """Save many suggestion records in one pass.
+
+    In Firestore mode the writes are committed in batches (see BatchWriter).
+
+    Args:
+        account: Email account ("church" or "personal")
+        records: SuggestionRecords to save
+
+    Returns:
+        IDs of the suggestions that could not be saved
+    """
+    records = list(records)
+    if not records:
+        return set()
+    if _force_file_fallback():
+        _save_suggestions_file(account, records)
+        return set()
+    return _save_suggestions_firestore(account, records)
+
+
+def _save_suggestions_file(account: str, records: List[SuggestionRecord]) -> None:
+    """Save suggestion records to file storage."""
+    _local_store().put_many(account, {r.suggestion_id: r.to_dict() for r in records})
+
+
+def _save_suggestions_firestore(account: str, records: List[SuggestionRecord]) -> Set[str]:
+    """Save suggestion records to Firestore in batches."""
+    db = get_firestore_client()
+    if db is None:
+        _save_suggestions_file(account, records)
+        return set()
+
+    collection_ref = (
+        db.collection("email_accounts")
+        .document(account)
+        .collection("suggestions")
+    )
+    return save_many_with_rollups(
+        db, collection_ref, {r.suggestion_id: r.to_dict() for r in records},
+        account=account, store="suggestions", keys=_rollup_keys,
+    )
 
 
 def get_suggestion(account: str, suggestion_id: str) -> Optional[SuggestionRecord]:
@@ -318,13 +384,10 @@ def get_suggestion(account: str, suggestion_id: str) -> Optional[SuggestionRecor
 
 def _get_suggestion_file(account: str, suggestion_id: str) -> Optional[SuggestionRecord]:
     """Get suggestion record from file storage."""
-    file_path = _suggestion_dir() / account / f"{suggestion_id}.json"
-    if not file_path.exists():
+    data = _local_store().get(account, suggestion_id)
+    if data is None:
         return None
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     record = SuggestionRecord.from_dict(data)
 
     # Check expiration
@@ -378,29 +441,22 @@ def list_pending_suggestions(account: str) -> List[SuggestionRecord]:
 
 def _list_pending_suggestions_file(account: str) -> List[SuggestionRecord]:
     """List pending suggestions from file storage."""
-    store_dir = _suggestion_dir() / account
-    if not store_dir.exists():
-        return []
-
     records = []
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
+    expired = []
+    for data in _local_store().query(account, status="pending"):
         record = SuggestionRecord.from_dict(data)
 
-        # Skip non-pending
-        if record.status != "pending":
-            continue
-
         # Check expiration
         if record.is_expired():
             record.status = "expired"
-            save_suggestion(account, record)
+            expired.append(record)
             continue
 
         records.append(record)
 
+    if expired:
+        _save_suggestions_file(account, expired)
+
     # Sort by created_at descending
     records.sort(key=lambda r: r.created_at, reverse=True)
     return records
@@ -455,19 +511,9 @@ def has_pending_suggestion_for_email(account: str, email_id: str) -> bool:
 
 def _has_pending_suggestion_file(account: str, email_id: str) -> bool:
     """Check for pending suggestion in file storage."""
-    store_dir = _suggestion_dir() / account
-    if not store_dir.exists():
-        return False
-
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        if data.get("email_id") == email_id and data.get("status") == "pending":
-            # Check expiration
-            record = SuggestionRecord.from_dict(data)
-            if not record.is_expired():
-                return True
+    for data in _local_store().query(account, status="pending", email_id=email_id):
+        if not SuggestionRecord.from_dict(data).is_expired():
+            return True
 
     return False
 
@@ -500,6 +546,55 @@ def _has_pending_suggestion_firestore(account: str, email_id: str) -> bool:
     return False
 
 
+def pending_email_ids(account: str) -> Set[str]:
+    """Return the email IDs that already have a pending, unexpired suggestion.
+
+    Loads the pending set once so callers checking many emails (e.g.
+    analyze_inbox) do a set lookup per email instead of a scan or query.
+
+    Args:
+        account: Email account ("church" or "personal")
+
+    Returns:
+        Set of Gmail message IDs
+    """
+    if _force_file_fallback():
+        return _pending_email_ids_file(account)
+    return _pending_email_ids_firestore(account)
+
+
+def _pending_email_ids_file(account: str) -> Set[str]:
+    """Collect pending email IDs from file storage."""
+    email_ids: Set[str] = set()
+    for data in _local_store().query(account, status="pending"):
+        if data.get("email_id") and not SuggestionRecord.from_dict(data).is_expired():
+            email_ids.add(data["email_id"])
+
+    return email_ids
+
+
+def _pending_email_ids_firestore(account: str) -> Set[str]:
+    """Collect pending email IDs from Firestore."""
+    db = get_firestore_client()
+    if db is None:
+        return _pending_email_ids_file(account)
+
+    collection_ref = (
+        db.collection("email_accounts")
+        .document(account)
+        .collection("suggestions")
+    )
+    query = collection_ref.where("status", "==", "pending")
+
+    email_ids: Set[str] = set()
+    for doc in query.stream():
+        record = SuggestionRecord.from_dict(doc.to_dict())
+        if not record.is_expired():
+            email_ids.add(record.email_id)
+
+    return email_ids
+
+
 def record_suggestion_decision(
     account: str,
     suggestion_id: str,
@@ -604,9 +699,40 @@ def create_suggestion(
     return record
 
 
+def create_suggestions(
+    account: str,
+    suggestions: Iterable[Dict[str, Any]],
+) -> List[SuggestionRecord]:
+    """Create and save many suggestions in one pass.
+
+    Args:
+        account: Email account ("church" or "personal")
+        suggestions: Keyword arguments for each suggestion, as accepted by
+            create_suggestion (without account)
+
+    Returns:
+        The created SuggestionRecords, in input order. Records that could
+        not be saved are left out.
+    """
+    records = [
+        SuggestionRecord(
+            suggestion_id=_generate_id(),
+            email_account=account,
+            **fields,
+        )
+        for fields in suggestions
+    ]
+    failed = save_suggestions(account, records)
+    return [record for record in records if record.suggestion_id not in failed]
+
+
 def get_approval_stats(account: str, days: int = 30) -> Dict[str, Any]:
     """Get suggestion approval statistics for Trust Gradient.
 
+    Stats are summed from per-day counters kept up to date as suggestions
+    are created and decided, so the cost depends on ``days``, not on how
+    many suggestions exist.
+
     Args:
         account: Email account ("church" or "personal")
         days: How many days to look back
@@ -621,54 +747,7 @@ def get_approval_stats(account: str, days: int = 30) -> Dict[str, Any]:
 
 def _get_approval_stats_file(account: str, days: int = 30) -> Dict[str, Any]:
     """Get approval stats from file storage."""
-    store_dir = _suggestion_dir() / account
-    if not store_dir.exists():
-        return _empty_stats()
-
-    cutoff = _now() - timedelta(days=days)
-
-    stats = {
-        "total": 0,
-        "approved": 0,
-        "rejected": 0,
-        "expired": 0,
-        "pending": 0,
-        "by_action": {},
-        "by_method": {},
-    }
-
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        record = SuggestionRecord.from_dict(data)
-
-        # Only count recent records
-        if record.created_at < cutoff:
-            continue
-
-        stats["total"] += 1
-        stats[record.status] += 1
-
-        # Track by action type
-        action = record.action
-        if action not in stats["by_action"]:
-            stats["by_action"][action] = {"approved": 0, "rejected": 0}
-        if record.status in ("approved", "rejected"):
-            stats["by_action"][action][record.status] += 1
-
-        # Track by analysis method
-        method = record.analysis_method
-        if method not in stats["by_method"]:
-            stats["by_method"][method] = {"approved": 0, "rejected": 0}
-        if record.status in ("approved", "rejected"):
-            stats["by_method"][method][record.status] += 1
-
-    # Calculate approval rate
-    decided = stats["approved"] + stats["rejected"]
-    stats["approval_rate"] = stats["approved"] / decided if decided > 0 else 0.0
-
-    return stats
+    return _stats_from_rollups(_local_store().read_rollups(account, window_start(days)))
 
 
 def _get_approval_stats_firestore(account: str, days: int = 30) -> Dict[str, Any]:
@@ -682,39 +761,28 @@ def _get_approval_stats_firestore(account: str, days: int = 30) -> Dict[str, Any
         .document(account)
         .collection("suggestions")
     )
-    cutoff = (_now() - timedelta(days=days)).isoformat()
-
-    stats = {
-        "total": 0,
-        "approved": 0,
-        "rejected": 0,
-        "expired": 0,
-        "pending": 0,
-        "by_action": {},
-        "by_method": {},
-    }
-
-    query = collection_ref.where("created_at", ">=", cutoff)
-
-    for doc in query.stream():
-        record = SuggestionRecord.from_dict(doc.to_dict())
+    counts = read_rollups_firestore(
+        db, collection_ref,
+        account=account, store="suggestions", keys=_rollup_keys, days=days,
+    )
+    return _stats_from_rollups(counts)
 
-        stats["total"] += 1
-        stats[record.status] += 1
 
-        # Track by action type
-        action = record.action
-        if action not in stats["by_action"]:
-            stats["by_action"][action] = {"approved": 0, "rejected": 0}
-        if record.status in ("approved", "rejected"):
-            stats["by_action"][action][record.status] += 1
+def _stats_from_rollups(counts: Dict[str, int]) -> Dict[str, Any]:
+    """Build the approval stats dict from summed rollup counters."""
+    stats = _empty_stats()
+    stats["total"] = counts.get("total", 0)
+    for status in ("approved", "rejected", "expired", "pending"):
+        stats[status] = counts.get(f"status:{status}", 0)
 
-        # Track by analysis method
-        method = record.analysis_method
-        if method not in stats["by_method"]:
-            stats["by_method"][method] = {"approved": 0, "rejected": 0}
-        if record.status in ("approved", "rejected"):
-            stats["by_method"][method][record.status] += 1
+    # Track by action type and analysis method
+    for key, count in counts.items():
+        dimension, _, value = key.partition(":")
+        if dimension in ("action", "method") and count > 0:
+            stats[f"by_{dimension}"][value] = {
+                "approved": counts.get(f"{dimension}_approved:{value}", 0),
+                "rejected": counts.get(f"{dimension}_rejected:{value}", 0),
+            }
 
     # Calculate approval rate
     decided = stats["approved"] + stats["rejected"]
@@ -754,29 +822,14 @@ def purge_old_suggestions(account: str, days: int = 30) -> int:
 
 def _purge_old_suggestions_file(account: str, days: int = 30) -> int:
     """Purge old suggestions from file storage."""
-    store_dir = _suggestion_dir() / account
-    if not store_dir.exists():
-        return 0
-
     cutoff = _now() - timedelta(days=days)
-    count = 0
-
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
 
-        record = SuggestionRecord.from_dict(data)
-
-        # Keep pending suggestions regardless of age
-        if record.status == "pending":
-            continue
-
-        # Purge old decided suggestions
-        if record.created_at < cutoff:
-            file_path.unlink()
-            count += 1
-
-    return count
+    # Keep pending suggestions regardless of age
+    return _local_store().delete_where(
+        account,
+        status=("approved", "rejected", "expired"),
+        created_before=cutoff,
+    )
 
 
 def _purge_old_suggestions_firestore(account: str, days: int = 30) -> int:
@@ -792,17 +845,15 @@ def _purge_old_suggestions_firestore(account: str, days: int = 30) -> int:
     )
     cutoff = (_now() - timedelta(days=days)).isoformat()
 
-    count = 0
-
     # Query for old non-pending suggestions
+    writer = BatchWriter(db)
     for status in ["approved", "rejected", "expired"]:
         query = collection_ref.where("status", "==", status).where("created_at", "<", cutoff)
 
         for doc in query.stream():
-            doc.reference.delete()
-            count += 1
+            writer.delete(doc.reference)
 
-    return count
+    return writer.commit().written
 
 
 def cleanup_duplicate_suggestions(account: str) -> Dict[str, Any]:
@@ -823,28 +874,16 @@ def cleanup_duplicate_suggestions(account: str) -> Dict[str, Any]:
 
 def _cleanup_duplicates_file(account: str) -> Dict[str, Any]:
     """Cleanup duplicates from file storage."""
-    store_dir = _suggestion_dir() / account
-    if not store_dir.exists():
-        return {"removed": 0, "kept": 0, "email_ids_affected": 0}
+    store = _local_store()
 
     # Group pending suggestions by email_id
-    email_suggestions: Dict[str, List[tuple]] = {}  # email_id -> [(path, record), ...]
-
-    for file_path in store_dir.glob("*.json"):
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    email_suggestions: Dict[str, List[SuggestionRecord]] = {}
 
+    for data in store.query(account, status="pending"):
         record = SuggestionRecord.from_dict(data)
+        email_suggestions.setdefault(record.email_id, []).append(record)
 
-        if record.status != "pending":
-            continue
-
-        email_id = record.email_id
-        if email_id not in email_suggestions:
-            email_suggestions[email_id] = []
-        email_suggestions[email_id].append((file_path, record))
-
-    removed = 0
+    duplicate_ids = []
     kept = 0
     email_ids_affected = 0
 
@@ -856,14 +895,13 @@ def _cleanup_duplicates_file(account: str) -> Dict[str, Any]:
         email_ids_affected += 1
 
         # Sort by created_at descending (newest first)
-        suggestions.sort(key=lambda x: x[1].created_at, reverse=True)
+        suggestions.sort(key=lambda r: r.created_at, reverse=True)
 
         # Keep the newest, delete the rest
         kept += 1
-        for file_path, _ in suggestions[1:]:
-            file_path.unlink()
-            removed += 1
+        duplicate_ids.extend(r.suggestion_id for r in suggestions[1:])
 
+    removed = store.delete_many(account, duplicate_ids)
     return {"removed": removed, "kept": kept, "email_ids_affected": email_ids_affected}
 
 
@@ -893,9 +931,9 @@ def _cleanup_duplicates_firestore(account: str) -> Dict[str, Any]:
             email_suggestions[email_id] = []
         email_suggestions[email_id].append((doc.reference, record))
 
-    removed = 0
     kept = 0
     email_ids_affected = 0
+    writer = BatchWriter(db)
 
     for email_id, suggestions in email_suggestions.items():
         if len(suggestions) <= 1:
@@ -910,7 +948,7 @@ def _cleanup_duplicates_firestore(account: str) -> Dict[str, Any]:
         # Keep the newest, delete the rest
         kept += 1
         for doc_ref, _ in suggestions[1:]:
-            doc_ref.delete()
-            removed += 1
+            writer.delete(doc_ref)
 
+    removed = writer.commit().written
     return {"removed": removed, "kept": kept, "email_ids_affected": email_ids_affected}
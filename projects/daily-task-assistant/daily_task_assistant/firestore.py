@@ -1,6 +1,15 @@
-"""Shared Firestore client helper."""
+"""Shared Firestore client helper and batched write layer."""
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
 _firestore_client = None
 
 
@@ -25,3 +34,150 @@ def get_firestore_client():
     _firestore_client = firestore.client()
     return _firestore_client
 
+
+
+# =============================================================================
+# Batched Writes
+# =============================================================================
+
+# Firestore rejects WriteBatch commits with more than 500 mutations
+MAX_BATCH_WRITES = 500
+
+# (operation, document reference, data, merge)
+_Mutation = Tuple[str, Any, Optional[Dict[str, Any]], bool]
+
+
+def _batch_workers() -> int:
+    """Max WriteBatch commits in flight at once."""
+    try:
+        return max(1, int(os.getenv("DTA_FIRESTORE_BATCH_WORKERS", "4")))
+    except ValueError:
+        return 4
+
+
+@dataclass(slots=True)
+class BatchWriteResult:
+    """Outcome of BatchWriter.commit().
+
+    Attributes:
+        written: Number of mutations that were applied
+        failures: Document path -> error message for mutations that failed
+    """
+    written: int = 0
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+
+class BatchWriter:
+    """Groups Firestore set/delete mutations into WriteBatch commits.
+
+    Mutations are queued, then committed in batches of up to 500 with
+    independent batches committed concurrently. A batch is atomic, so when
+    one fails its mutations are retried individually to find out exactly
+    which documents failed.
+
+    Usage:
+        writer = BatchWriter(db)
+        for record in records:
+            writer.set(collection_ref.document(record.id), record.to_dict())
+        result = writer.commit()
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        *,
+        batch_size: int = MAX_BATCH_WRITES,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._db = db
+        self._batch_size = max(1, min(batch_size, MAX_BATCH_WRITES))
+        self._max_workers = max_workers or _batch_workers()
+        self._mutations: List[_Mutation] = []
+
+    def __len__(self) -> int:
+        return len(self._mutations)
+
+    def set(self, doc_ref: Any, data: Dict[str, Any], *, merge: bool = False) -> None:
+        """Queue a document write."""
+        self._mutations.append(("set", doc_ref, data, merge))
+
+    def delete(self, doc_ref: Any) -> None:
+        """Queue a document delete."""
+        self._mutations.append(("delete", doc_ref, None, False))
+
+    def commit(self) -> BatchWriteResult:
+        """Commit all queued mutations and clear the queue."""
+        mutations, self._mutations = self._mutations, []
+        result = BatchWriteResult()
+        if not mutations:
+            return result
+
+        chunks = [
+            mutations[start:start + self._batch_size]
+            for start in range(0, len(mutations), self._batch_size)
+        ]
+        workers = min(self._max_workers, len(chunks))
+        if workers == 1:
+            outcomes = [self._commit_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(self._commit_chunk, chunks))
+
+        for written, failures in outcomes:
+            result.written += written
+            result.failures.update(failures)
+        if result.failures:
+            logger.warning(
+                f"[firestore] {len(result.failures)} of {len(mutations)} batched writes failed"
+            )
+        return result
+
+    def _commit_chunk(self, chunk: List[_Mutation]) -> Tuple[int, Dict[str, str]]:
+        batch = self._db.batch()
+        for op, doc_ref, data, merge in chunk:
+            if op == "set":
+                batch.set(doc_ref, data, merge=merge)
+            else:
+                batch.delete(doc_ref)
+        try:
+            batch.commit()
+            return len(chunk), {}
+        except Exception as exc:
+            logger.warning(f"[firestore] Batch of {len(chunk)} failed ({exc}); retrying individually")
+
+        written = 0
+        failures: Dict[str, str] = {}
+        for op, doc_ref, data, merge in chunk:
+            try:
+                if op == "set":
+                    doc_ref.set(data, merge=merge)
+                else:
+                    doc_ref.delete()
+                written += 1
+            except Exception as exc:
+                failures[_doc_path(doc_ref)] = str(exc)
+        return written, failures
+
+
+def _doc_path(doc_ref: Any) -> str:
+    return str(getattr(doc_ref, "path", None) or getattr(doc_ref, "id", doc_ref))
+
+
+def delete_documents(db: Any, docs: Iterable[Any]) -> BatchWriteResult:
+    """Delete streamed documents (or document references) in batches.
+
+    Args:
+        db: Firestore client
+        docs: DocumentSnapshots (e.g. from query.stream()) or DocumentReferences
+
+    Returns:
+        BatchWriteResult; ``written`` is the number of documents deleted
+    """
+    writer = BatchWriter(db)
+    for doc in docs:
+        writer.delete(getattr(doc, "reference", doc))
+    return writer.commit()
@@ -0,0 +1,124 @@
+"""Shared Google OAuth access-token cache.
+
+Gmail, Calendar and the Sheets-backed filter rules all mint access tokens
+from the same refresh tokens. Access tokens are valid for about an hour, so
+minting one per API call is wasted work. This module keeps one token per
+(client_id, refresh_token) pair for the whole process and refreshes it
+shortly before it expires.
+
+Callers keep their own token request code (and error types) and pass it in
+as ``fetch``; the cache only decides when to call it.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+
+# Google access tokens default to one hour when expires_in is missing
+DEFAULT_EXPIRES_IN = 3600
+
+
+def _refresh_margin_seconds() -> int:
+    """Refresh tokens this many seconds before they expire."""
+    return int(os.getenv("DTA_OAUTH_REFRESH_MARGIN", "120"))
+
+
+@dataclass(slots=True)
+class _CachedToken:
+    access_token: str
+    expires_at: float  # time.monotonic() deadline
+
+
+_tokens: Dict[str, _CachedToken] = {}
+_key_locks: Dict[str, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def _cache_key(client_id: str, refresh_token: str) -> str:
+    # Hash the refresh token so secrets are not held as dict keys
+    digest = hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()[:32]
+    return f"{client_id}:{digest}"
+
+
+def _lock_for(key: str) -> threading.Lock:
+    with _registry_lock:
+        lock = _key_locks.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _key_locks[key] = lock
+        return lock
+
+
+def _is_fresh(entry: _CachedToken | None) -> bool:
+    return entry is not None and time.monotonic() < entry.expires_at - _refresh_margin_seconds()
+
+
+def get_cached_access_token(
+    client_id: str,
+    refresh_token: str,
+    fetch: Callable[[], Tuple[str, int]],
+) -> str:
+    """Return a cached access token, refreshing it when close to expiry.
+
+    Concurrent callers for the same credentials wait on a single refresh
+    instead of each POSTing to the token endpoint.
+
+    Args:
+        client_id: OAuth client ID.
+        refresh_token: OAuth refresh token.
+        fetch: Performs the token request and returns
+            ``(access_token, expires_in_seconds)``. Errors propagate unchanged.
+
+    Returns:
+        A valid access token.
+    """
+    key = _cache_key(client_id, refresh_token)
+    entry = _tokens.get(key)
+    if _is_fresh(entry):
+        return entry.access_token
+
+    with _lock_for(key):
+        # Another thread may have refreshed while we waited
+        entry = _tokens.get(key)
+        if _is_fresh(entry):
+            return entry.access_token
+
+        access_token, expires_in = fetch()
+        _tokens[key] = _CachedToken(
+            access_token=access_token,
+            expires_at=time.monotonic() + (expires_in or DEFAULT_EXPIRES_IN),
+        )
+        return access_token
+
+
+async def get_cached_access_token_async(
+    client_id: str,
+    refresh_token: str,
+    fetch: Callable[[], Tuple[str, int]],
+) -> str:
+    """Async variant of get_cached_access_token.
+
+    A cached token is returned without leaving the event loop. Refreshes
+    (about once an hour) go through get_cached_access_token on a worker
+    thread, so sync and async callers still share a single token request.
+    """
+    entry = _tokens.get(_cache_key(client_id, refresh_token))
+    if _is_fresh(entry):
+        return entry.access_token
+    return await asyncio.to_thread(get_cached_access_token, client_id, refresh_token, fetch)
+
+
+def invalidate_access_token(client_id: str, refresh_token: str) -> None:
+    """Drop the cached token for these credentials (e.g. after a 401)."""
+    _tokens.pop(_cache_key(client_id, refresh_token), None)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached tokens."""
+    _tokens.clear()
@@ -0,0 +1,296 @@
+"""Shared HTTP transport for Google and Smartsheet REST calls.
+
+Every API client used to open a fresh ``urllib`` connection (and TLS
+handshake) per call. This module keeps one pooled ``httpx.Client`` for the
+process so connections to each host are reused, negotiates HTTP/2 when the
+``h2`` package is installed, and retries rate-limited or transient failures
+with exponential backoff.
+
+Async endpoints use ``request_async`` / ``request_json_async``, which go
+through a pooled ``httpx.AsyncClient`` with the same limits and retry rules.
+
+Callers translate the two exception types below into their own error classes,
+mirroring the old ``HTTPError`` / ``URLError`` split.
+
+Configuration (environment variables):
+    DTA_HTTP_MAX_CONNECTIONS: Total pooled connections (default 20).
+    DTA_HTTP_MAX_KEEPALIVE: Idle keep-alive connections kept open (default 10).
+    DTA_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default 60).
+    DTA_HTTP_RETRIES: Retries on 429/5xx and connection errors (default 2).
+    DTA_HTTP_BACKOFF: Base backoff in seconds, doubled per retry (default 0.5).
+    DTA_HTTP2: Set to "0" to disable HTTP/2 negotiation.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Only these are retried after a 5xx; a 429 means the request was not processed
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class TransportError(RuntimeError):
+    """Raised when a request cannot be completed (network failure)."""
+
+
+class HTTPStatusError(TransportError):
+    """Raised when the server returns a non-success status code."""
+
+    def __init__(self, status_code: int, detail: str, url: str = "") -> None:
+        super().__init__(f"HTTP {status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+        self.url = url
+
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+# An AsyncClient's connections belong to the event loop that opened them
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _http2_available() -> bool:
+    if os.getenv("DTA_HTTP2", "1") == "0":
+        return False
+    try:
+        import h2  # noqa: F401
+    except ModuleNotFoundError:
+        return False
+    return True
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=_env_int("DTA_HTTP_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=_env_int("DTA_HTTP_MAX_KEEPALIVE", 10),
+        keepalive_expiry=_env_float("DTA_HTTP_KEEPALIVE_EXPIRY", 60.0),
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Return the shared pooled HTTP client, creating it on first use."""
+
+    global _client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                http2=_http2_available(),
+                limits=_limits(),
+                timeout=30.0,
+            )
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client for the running event loop.
+
+    The server runs a single loop, so this is one client per process; each
+    extra loop (e.g. a test client's) gets its own.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=_limits(),
+            timeout=30.0,
+        )
+    return client
+
+
+def close_http_client() -> None:
+    """Close the shared client and drop its pooled connections."""
+
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+async def close_async_http_client() -> None:
+    """Close the running loop's async client and drop its pooled connections."""
+
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+    return _env_float("DTA_HTTP_BACKOFF", 0.5) * (2 ** attempt)
+
+
+def _request_kwargs(
+    headers: Optional[Mapping[str, str]],
+    params: Optional[Mapping[str, Any]],
+    json_body: Any,
+    data: Optional[Any],
+    timeout: Optional[float],
+) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"headers": headers, "params": params}
+    if json_body is not None:
+        kwargs["json"] = json_body
+    if isinstance(data, (bytes, str)):
+        kwargs["content"] = data
+    elif data is not None:
+        kwargs["data"] = data
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return kwargs
+
+
+def _error_is_retryable(method: str, exc: httpx.HTTPError) -> bool:
+    # Connect failures never reached the server and are always safe to retry
+    return isinstance(exc, httpx.ConnectError) or method in IDEMPOTENT_METHODS
+
+
+def _status_is_retryable(method: str, status_code: int) -> bool:
+    return status_code == 429 or (
+        status_code in RETRY_STATUS_CODES and method in IDEMPOTENT_METHODS
+    )
+
+
+def _decode_json(response: httpx.Response, url: str) -> Dict[str, Any]:
+    if response.status_code == 204 or not response.content:
+        return {}
+    try:
+        return json.loads(response.content.decode("utf-8"))
+    except ValueError as exc:
+        raise TransportError(f"Invalid JSON response from {url}: {exc}") from exc
+
+
+def request(
+    method: str,
+    url: str,
+    *,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    json_body: Any = None,
+    data: Optional[Any] = None,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+) -> httpx.Response:
+    """Send a request over the shared pool, retrying transient failures.
+
+    Args:
+        method: HTTP method.
+        url: Absolute URL (may already include a query string).
+        headers: Request headers.
+        params: Extra query parameters.
+        json_body: Object to send as a JSON body.
+        data: Form fields (dict) or raw bytes to send as the body.
+        timeout: Per-request timeout in seconds.
+        retries: Override DTA_HTTP_RETRIES for this call.
+
+    Returns:
+        The successful (2xx/3xx) response.
+
+    Raises:
+        HTTPStatusError: The server returned an error status.
+        TransportError: The request failed at the network level.
+    """
+    method = method.upper()
+    max_retries = _env_int("DTA_HTTP_RETRIES", 2) if retries is None else retries
+    client = get_http_client()
+    kwargs = _request_kwargs(headers, params, json_body, data, timeout)
+
+    attempt = 0
+    while True:
+        try:
+            response = client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            if _error_is_retryable(method, exc) and attempt < max_retries:
+                time.sleep(_retry_delay(attempt, None))
+                attempt += 1
+                continue
+            raise TransportError(str(exc) or exc.__class__.__name__) from exc
+
+        if response.status_code < 400:
+            return response
+
+        if _status_is_retryable(method, response.status_code) and attempt < max_retries:
+            time.sleep(_retry_delay(attempt, response))
+            attempt += 1
+            continue
+
+        raise HTTPStatusError(response.status_code, response.text, url=url)
+
+
+def request_json(method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+    """Send a request and decode the JSON response (``{}`` for empty bodies)."""
+
+    return _decode_json(request(method, url, **kwargs), url)
+
+
+async def request_async(
+    method: str,
+    url: str,
+    *,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    json_body: Any = None,
+    data: Optional[Any] = None,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+) -> httpx.Response:
+    """Async variant of request(); backoff waits do not block the event loop."""
+    method = method.upper()
+    max_retries = _env_int("DTA_HTTP_RETRIES", 2) if retries is None else retries
+    client = get_async_http_client()
+    kwargs = _request_kwargs(headers, params, json_body, data, timeout)
+
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            if _error_is_retryable(method, exc) and attempt < max_retries:
+                await asyncio.sleep(_retry_delay(attempt, None))
+                attempt += 1
+                continue
+            raise TransportError(str(exc) or exc.__class__.__name__) from exc
+
+        if response.status_code < 400:
+            return response
+
+        if _status_is_retryable(method, response.status_code) and attempt < max_retries:
+            await asyncio.sleep(_retry_delay(attempt, response))
+            attempt += 1
+            continue
+
+        raise HTTPStatusError(response.status_code, response.text, url=url)
+
+
+async def request_json_async(method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+    """Async variant of request_json()."""
+
+    return _decode_json(await request_async(method, url, **kwargs), url)
@@ -6,10 +6,16 @@ from .anthropic_client import (
     AnthropicNotConfigured,
     AnthropicSuggestion,
     build_anthropic_client,
+    build_async_anthropic_client,
+    ChatStreamEvent,
+    close_async_anthropic_client,
     generate_assist_suggestion,
     portfolio_chat_with_tools,
+    portfolio_chat_with_tools_async,
     PortfolioChatResponse,
     PortfolioTaskUpdateAction,
+    stream_portfolio_chat_with_tools_async,
+    TokenUsage,
 )
 
 __all__ = [
@@ -18,9 +24,15 @@ __all__ = [
     "AnthropicNotConfigured",
     "AnthropicSuggestion",
     "build_anthropic_client",
+    "build_async_anthropic_client",
+    "ChatStreamEvent",
+    "close_async_anthropic_client",
     "generate_assist_suggestion",
     "portfolio_chat_with_tools",
+    "portfolio_chat_with_tools_async",
     "PortfolioChatResponse",
     "PortfolioTaskUpdateAction",
+    "stream_portfolio_chat_with_tools_async",
+    "TokenUsage",
 ]
 
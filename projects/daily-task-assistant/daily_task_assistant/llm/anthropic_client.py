@@ -1,19 +1,29 @@
 """Anthropic client wrappers for Daily Task Assistant."""
 from __future__ import annotations
 
+import asyncio
 import base64
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from dataclasses import dataclass
 import json
+import logging
+import multiprocessing
 import os
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
 from urllib import request as urlrequest
 from urllib import error as urlerror
 
 try:  # Optional dependency loaded via requirements.txt
-    from anthropic import Anthropic, APIStatusError  # type: ignore
+    from anthropic import Anthropic, APIStatusError, AsyncAnthropic  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime
     Anthropic = None  # type: ignore
+    AsyncAnthropic = None  # type: ignore
     APIStatusError = Exception  # type: ignore
 
 try:
@@ -22,34 +32,14 @@ except ModuleNotFoundError:  # pragma: no cover
     load_dotenv = None
 
 from ..tasks import AttachmentDetail, TaskDetail
+from .attachment_cache import attachment_cache_key, get_attachment_cache
 
+logger = logging.getLogger(__name__)
 
 # Supported image types for Claude Vision
 VISION_SUPPORTED_TYPES = {'image/jpeg', 'image/png', 'image/gif', 'image/webp'}
 
 
-def download_and_encode_image(url: str, max_size_bytes: int = 4_500_000) -> Optional[str]:
-    """Download an image from URL and return base64-encoded data.
-    
-    If the image exceeds max_size_bytes, it will be resized to fit.
-    Returns None if download fails or times out.
-    """
-    try:
-        with urlrequest.urlopen(url, timeout=15) as response:
-            data = response.read()
-            
-            # If image is too large, try to resize it
-            if len(data) > max_size_bytes:
-                data = _resize_image(data, max_size_bytes)
-                if data is None:
-                    return None
-            
-            return base64.standard_b64encode(data).decode('utf-8')
-    except Exception:
-        # Catch any error - network issues, expired URLs, etc.
-        return None
-
-
 def _resize_image(image_data: bytes, max_size_bytes: int) -> Optional[bytes]:
     """Resize image to fit within max_size_bytes.
     
@@ -109,59 +99,393 @@ def is_pdf(mime_type: str) -> bool:
     return mime_type.lower() == 'application/pdf'
 
 
-def download_and_extract_pdf_text(url: str, max_chars: int = 10000) -> Optional[str]:
-    """Download a PDF from URL and extract text content.
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+
+def _download_to_file(url: str, timeout: float) -> Optional[Path]:
+    """Stream a download to a temporary file. Returns its path, or None on failure."""
+    fd, name = tempfile.mkstemp(prefix="dta-attachment-", suffix=".download")
+    path = Path(name)
+    try:
+        with os.fdopen(fd, "wb") as out, urlrequest.urlopen(url, timeout=timeout) as response:
+            while chunk := response.read(DOWNLOAD_CHUNK_BYTES):
+                out.write(chunk)
+    except Exception:
+        path.unlink(missing_ok=True)
+        return None
+    return path
 
-    Uses pdfplumber for reliable text extraction.
-    Returns None if download fails or PDF cannot be parsed.
+
+def _page_may_have_text(page: Any) -> bool:
+    """Cheaply check whether a PDF page can contain text.
+
+    Text needs a font, either on the page itself or inside a form XObject.
+    Scanned pages only reference image XObjects, so they are skipped
+    without parsing their content streams.
+    """
+    try:
+        from pdfminer.pdftypes import resolve1
+
+        resources = resolve1(page.page_obj.resources) or {}
+        if resolve1(resources.get("Font")):
+            return True
+        xobjects = resolve1(resources.get("XObject")) or {}
+        for xobject in xobjects.values():
+            subtype = resolve1(xobject).get("Subtype")
+            if getattr(subtype, "name", subtype) != "Image":
+                return True
+        return False
+    except Exception:
+        # Unusual structure; let the full extractor decide
+        return True
+
+
+def _parse_pdf_text(source: bytes | str | Path, max_chars: int) -> str:
+    """Extract up to max_chars of text from a PDF.
 
     Args:
-        url: URL to download the PDF from
-        max_chars: Maximum characters to extract (default 10000)
+        source: PDF bytes, or the path of a PDF file (parsed without
+            reading the whole file into memory).
+        max_chars: Stop parsing pages once this many characters are extracted.
 
     Returns:
-        Extracted text content, or None if extraction fails
+        The text, or "" if the PDF parsed but has no extractable text.
+
+    Raises:
+        ImportError: pdfplumber is not installed.
+        Exception: Whatever the parser raised for an unreadable file.
     """
+    import pdfplumber
+    import io
+
+    # Extract text using pdfplumber
+    text_parts: List[str] = []
+    total_chars = 0
+
+    pdf_source = io.BytesIO(source) if isinstance(source, bytes) else source
+    with pdfplumber.open(pdf_source) as pdf:
+        for page in pdf.pages:
+            if not _page_may_have_text(page):
+                continue
+            page_text = page.extract_text() or ""
+            # Drop the parsed layout; large PDFs otherwise keep every page
+            page.close()
+            if page_text:
+                text_parts.append(page_text)
+                total_chars += len(page_text)
+
+                # Stop if we've extracted enough
+                if total_chars >= max_chars:
+                    break
+
+    full_text = "\n\n".join(text_parts)
+
+    # Truncate if necessary
+    if len(full_text) > max_chars:
+        full_text = full_text[:max_chars] + "\n\n[... PDF content truncated ...]"
+
+    return full_text
+
+
+def _attachment_bytes(attachment: AttachmentDetail, timeout: float) -> Optional[bytes]:
+    """Return an attachment's raw bytes from the cache, downloading on a miss."""
+    cache = get_attachment_cache()
+    key = attachment_cache_key(attachment)
+    data = cache.get(key, "raw") if cache else None
+    if data is None:
+        try:
+            with urlrequest.urlopen(attachment.download_url, timeout=timeout) as response:
+                data = response.read()
+        except Exception:
+            # Network issues, expired URLs, etc. are not cached
+            return None
+        if cache:
+            cache.put(key, "raw", data)
+    return data
+
+
+@contextmanager
+def _attachment_file(attachment: AttachmentDetail, timeout: float) -> Iterator[Optional[Path]]:
+    """Yield a local file holding the attachment's raw bytes (None if unavailable).
+
+    Served from the cache when possible; otherwise the download is streamed
+    to disk rather than buffered in memory, then moved into the cache.
+    """
+    cache = get_attachment_cache()
+    key = attachment_cache_key(attachment)
+    cached = cache.get_path(key, "raw") if cache else None
+    if cached is not None:
+        yield cached
+        return
+
+    downloaded = _download_to_file(attachment.download_url, timeout)
+    if downloaded is None:
+        yield None
+        return
     try:
-        import pdfplumber
-        import io
+        yield cache.put_file(key, "raw", downloaded) if cache else downloaded
+    finally:
+        downloaded.unlink(missing_ok=True)
+
+
+def _run_inline(fn: Callable[..., Any], *args: Any) -> Any:
+    return fn(*args)
+
+
+def _cached_image_bytes(
+    attachment: AttachmentDetail,
+    max_size_bytes: int,
+    run: Callable[..., Any] = _run_inline,
+) -> Optional[bytes]:
+    """Return image bytes that fit max_size_bytes, resizing (via run) on a cache miss."""
+    cache = get_attachment_cache()
+    key = attachment_cache_key(attachment)
+    variant = f"image:{max_size_bytes}"
+    data = cache.get(key, variant) if cache else None
+    if data is None:
+        data = _attachment_bytes(attachment, timeout=15)
+        if data is None:
+            return None
+        # If image is too large, try to resize it
+        if len(data) > max_size_bytes:
+            data = run(_resize_image, data, max_size_bytes)
+            if data is None:
+                return None
+        if cache:
+            cache.put(key, variant, data)
+    return data
+
+
+def _cached_pdf_text(
+    attachment: AttachmentDetail,
+    max_chars: int,
+    run: Callable[..., Any] = _run_inline,
+) -> Optional[str]:
+    """Return extracted PDF text, extracting (via run) on a cache miss."""
+    cache = get_attachment_cache()
+    key = attachment_cache_key(attachment)
+    variant = f"pdf_text:{max_chars}"
+    cached = cache.get(key, variant) if cache else None
+    if cached is not None:
+        return cached.decode("utf-8") or None
+
+    with _attachment_file(attachment, timeout=30) as pdf_path:
+        if pdf_path is None:
+            return None
+        try:
+            # Workers get the file path, not the PDF bytes
+            text = run(_parse_pdf_text, str(pdf_path), max_chars)
+        except Exception as exc:
+            # Missing pdfplumber, parser errors or a file evicted mid-parse
+            # may not recur, so failures are not cached
+            logger.warning(f"[attachments] PDF text extraction failed for {key}: {exc}")
+            return None
+    if cache:
+        # PDFs without extractable text are cached as empty
+        cache.put(key, variant, text.encode("utf-8"))
+    return text or None
+
+
+# =============================================================================
+# Attachment Preparation (concurrent, budgeted)
+# =============================================================================
+
+# Claude downsizes large images to about 1.15 megapixels (~1,600 tokens)
+IMAGE_TOKEN_ESTIMATE = 1600
+PDF_TRUNCATION_NOTE = "\n\n[... PDF content truncated ...]"
+
+
+def _attachment_workers() -> int:
+    """Max attachments downloaded concurrently."""
+    try:
+        return max(1, int(os.getenv("DTA_ATTACHMENT_WORKERS", "5")))
+    except ValueError:
+        return 5
+
+
+def _attachment_process_workers() -> int:
+    """Process pool size for image resizing and PDF parsing (0 = in-thread)."""
+    default = min(4, os.cpu_count() or 1)
+    try:
+        return max(0, int(os.getenv("DTA_ATTACHMENT_PROCESS_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+def _attachment_byte_budget() -> int:
+    """Total attachment payload (base64 images plus PDF text) per request."""
+    try:
+        return int(float(os.getenv("DTA_ATTACHMENT_MAX_TOTAL_MB", "20")) * 1024 * 1024)
+    except ValueError:
+        return 20 * 1024 * 1024
+
+
+def _attachment_token_budget() -> int:
+    """Estimated input tokens all attachments together may use."""
+    try:
+        return int(os.getenv("DTA_ATTACHMENT_MAX_TOKENS", "20000"))
+    except ValueError:
+        return 20000
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
 
-        # Download the PDF
-        with urlrequest.urlopen(url, timeout=30) as response:
-            pdf_data = response.read()
 
-        # Extract text using pdfplumber
-        text_parts: List[str] = []
-        total_chars = 0
+def _run_in_process_pool(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run CPU-bound preprocessing in the shared process pool.
+
+    Falls back to running in the calling thread when the pool is disabled
+    or cannot run the job (it fails to start or a worker died). Exceptions
+    raised by ``fn`` itself propagate unchanged.
+    """
+    global _process_pool
+    workers = _attachment_process_workers()
+    if workers:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # Forking a process that runs server threads can copy held
+                # locks into the child; forkserver/spawn workers start clean
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(method),
+                )
+            pool = _process_pool
+        try:
+            # BrokenProcessPool is a RuntimeError; errors raised by fn come
+            # from result() and are not caught here
+            future = pool.submit(fn, *args)
+        except (OSError, RuntimeError) as exc:
+            _discard_process_pool(pool, exc)
+        else:
+            try:
+                return future.result()
+            except BrokenProcessPool as exc:
+                _discard_process_pool(pool, exc)
+    return fn(*args)
+
 
-        with pdfplumber.open(io.BytesIO(pdf_data)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                if page_text:
-                    text_parts.append(page_text)
-                    total_chars += len(page_text)
+def _discard_process_pool(pool: ProcessPoolExecutor, exc: BaseException) -> None:
+    """Drop a pool that cannot run jobs; the next job starts a fresh one."""
+    global _process_pool
+    logger.warning(f"[attachments] Process pool unavailable, running in-thread: {exc}")
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
 
-                    # Stop if we've extracted enough
-                    if total_chars >= max_chars:
-                        break
 
-        if not text_parts:
+@dataclass(slots=True)
+class PreparedAttachment:
+    """An attachment converted to model input."""
+    attachment: AttachmentDetail
+    media_type: str
+    image_data: Optional[str] = None  # Base64 image, for vision attachments
+    text: Optional[str] = None  # Extracted text, for PDFs
+    tokens: int = 0  # Estimated input tokens
+
+    @property
+    def size(self) -> int:
+        """Bytes this attachment adds to the request."""
+        return len(self.image_data or "") + len((self.text or "").encode("utf-8"))
+
+
+def _prepare_attachment(
+    attachment: AttachmentDetail,
+    max_image_bytes: int,
+    max_pdf_chars: int,
+) -> Optional[PreparedAttachment]:
+    if is_vision_supported(attachment.mime_type):
+        data = _cached_image_bytes(attachment, max_image_bytes, run=_run_in_process_pool)
+        if data is None:
+            return None
+        # Resized images are re-encoded as JPEG whatever the original type
+        media_type = "image/jpeg" if data[:3] == b"\xff\xd8\xff" else attachment.mime_type
+        return PreparedAttachment(
+            attachment=attachment,
+            media_type=media_type,
+            image_data=base64.standard_b64encode(data).decode("utf-8"),
+            tokens=IMAGE_TOKEN_ESTIMATE,
+        )
+    if is_pdf(attachment.mime_type):
+        text = _cached_pdf_text(attachment, max_pdf_chars, run=_run_in_process_pool)
+        if not text:
             return None
+        return PreparedAttachment(
+            attachment=attachment,
+            media_type="text/plain",
+            text=text,
+            tokens=len(text) // 4 + 1,
+        )
+    return None
 
-        full_text = "\n\n".join(text_parts)
 
-        # Truncate if necessary
-        if len(full_text) > max_chars:
-            full_text = full_text[:max_chars] + "\n\n[... PDF content truncated ...]"
+def prepare_attachments(
+    attachments: List[AttachmentDetail],
+    *,
+    max_image_bytes: int = 4_500_000,
+    max_pdf_chars: int = 10000,
+    max_total_bytes: Optional[int] = None,
+    max_total_tokens: Optional[int] = None,
+) -> List[PreparedAttachment]:
+    """Download and convert attachments for a chat request concurrently.
 
-        return full_text
+    Downloads run on a thread pool and image resizing / PDF extraction on a
+    shared process pool, so several attachments cost about as much as the
+    slowest one. Results are cached (see attachment_cache).
 
-    except ImportError:
-        # pdfplumber not installed
-        return None
-    except Exception:
-        # Any error during download or parsing
-        return None
+    The combined result is held to a byte and token budget, applied in the
+    order the attachments were selected: images that do not fit are
+    dropped and PDF text is truncated to the remaining tokens.
+
+    Args:
+        attachments: Attachments in the order the user selected them.
+        max_image_bytes: Per-image size limit before base64 encoding.
+        max_pdf_chars: Per-PDF character limit.
+        max_total_bytes: Payload budget (default DTA_ATTACHMENT_MAX_TOTAL_MB).
+        max_total_tokens: Token budget (default DTA_ATTACHMENT_MAX_TOKENS).
+
+    Returns:
+        PreparedAttachment list in input order; unsupported, failed and
+        over-budget attachments are omitted.
+    """
+    if not attachments:
+        return []
+
+    def prepare(attachment: AttachmentDetail) -> Optional[PreparedAttachment]:
+        return _prepare_attachment(attachment, max_image_bytes, max_pdf_chars)
+
+    workers = min(_attachment_workers(), len(attachments))
+    if workers <= 1:
+        results = [prepare(attachment) for attachment in attachments]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields results in submission order
+            results = list(pool.map(prepare, attachments))
+
+    bytes_left = max_total_bytes if max_total_bytes is not None else _attachment_byte_budget()
+    tokens_left = max_total_tokens if max_total_tokens is not None else _attachment_token_budget()
+    prepared: List[PreparedAttachment] = []
+    for item in results:
+        if item is None:
+            continue
+        if item.text is not None and (item.tokens > tokens_left or item.size > bytes_left):
+            # Keep as much of the PDF as still fits
+            chars = (tokens_left - 1) * 4 - len(PDF_TRUNCATION_NOTE)
+            max_bytes = bytes_left - len(PDF_TRUNCATION_NOTE.encode("utf-8"))
+            if chars > 0 and max_bytes > 0:
+                # Cut on the encoded length; non-ASCII text takes several bytes a character
+                text = item.text[:chars].encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+                item.text = text + PDF_TRUNCATION_NOTE
+                item.tokens = len(item.text) // 4 + 1
+        if item.tokens > tokens_left or item.size > bytes_left:
+            logger.info(f"[attachments] Skipping {item.attachment.name}: over attachment budget")
+            continue
+        tokens_left -= item.tokens
+        bytes_left -= item.size
+        prepared.append(item)
+    return prepared
 
 
 # Load DATA preferences from markdown file
@@ -317,7 +641,39 @@ class EmailDraftResult:
 
 def build_anthropic_client() -> Anthropic:
     """Instantiate the Anthropics SDK client."""
+    return Anthropic(api_key=_anthropic_api_key())
+
+
+_async_client: Optional[AsyncAnthropic] = None
+_async_client_lock = threading.Lock()
 
+
+def build_async_anthropic_client() -> AsyncAnthropic:
+    """Return the shared asyncio Anthropic SDK client (for async endpoints).
+
+    The client is created on first use and reused, so requests share its
+    connection pool instead of each opening (and leaking) their own.
+    """
+    global _async_client
+    if _async_client is not None:
+        return _async_client
+
+    with _async_client_lock:
+        if _async_client is None:
+            _async_client = AsyncAnthropic(api_key=_anthropic_api_key())
+    return _async_client
+
+
+async def close_async_anthropic_client() -> None:
+    """Close the shared async client and drop its pooled connections."""
+    global _async_client
+    with _async_client_lock:
+        client, _async_client = _async_client, None
+    if client is not None:
+        await client.close()
+
+
+def _anthropic_api_key() -> str:
     if load_dotenv is not None:
         load_dotenv()
 
@@ -331,8 +687,7 @@ def build_anthropic_client() -> Anthropic:
         raise AnthropicNotConfigured(
             "ANTHROPIC_API_KEY is missing. Add it to your environment or .env file."
         )
-
-    return Anthropic(api_key=api_key)
+    return api_key
 
 
 def resolve_config(model_override: Optional[str] = None) -> AnthropicConfig:
@@ -341,6 +696,249 @@ def resolve_config(model_override: Optional[str] = None) -> AnthropicConfig:
     return AnthropicConfig(model=model)
 
 
+# =============================================================================
+# Prompt Caching
+# =============================================================================
+# System prompts, tool definitions and context priming turns repeat verbatim
+# across the turns of a chat. Marking the end of each stable prefix with
+# cache_control lets the API serve it from cache; any byte difference in the
+# prefix is a miss, so these helpers copy the module-level definitions in a
+# fixed order and never mutate them.
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _prompt_cache_enabled() -> bool:
+    """Return True unless prompt caching is disabled via DTA_PROMPT_CACHE=0."""
+    return os.getenv("DTA_PROMPT_CACHE", "1") != "0"
+
+
+def cached_system(prompt: str) -> Any:
+    """Return a system prompt with a cache breakpoint at its end."""
+    if not _prompt_cache_enabled():
+        return prompt
+    return [{"type": "text", "text": prompt, "cache_control": dict(CACHE_CONTROL)}]
+
+
+def cached_tools(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return copies of tool definitions with a cache breakpoint on the last one."""
+    copies = [dict(tool) for tool in tools]
+    if copies and _prompt_cache_enabled():
+        copies[-1]["cache_control"] = dict(CACHE_CONTROL)
+    return copies
+
+
+def _mark_cache_breakpoint(content: List[Dict[str, Any]]) -> None:
+    """Mark the last content block of a stable priming turn as cacheable."""
+    if content and _prompt_cache_enabled():
+        content[-1]["cache_control"] = dict(CACHE_CONTROL)
+
+
+@dataclass(slots=True)
+class TokenUsage:
+    """Token counts reported for one Messages API call."""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+
+    @classmethod
+    def from_response(cls, response: Any) -> Optional["TokenUsage"]:
+        """Read usage from an SDK response, or None if it has none."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+
+        def count(name: str) -> int:
+            value = getattr(usage, name, None)
+            return value if isinstance(value, int) else 0
+
+        return cls(
+            input_tokens=count("input_tokens"),
+            output_tokens=count("output_tokens"),
+            cache_read_input_tokens=count("cache_read_input_tokens"),
+            cache_creation_input_tokens=count("cache_creation_input_tokens"),
+        )
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to an API-friendly dict."""
+        return {
+            "inputTokens": self.input_tokens,
+            "outputTokens": self.output_tokens,
+            "cacheReadTokens": self.cache_read_input_tokens,
+            "cacheWriteTokens": self.cache_creation_input_tokens,
+        }
+
+
+def _record_usage(call: str, response: Any) -> Optional[TokenUsage]:
+    """Extract and log token usage (including cache hits) for a call."""
+    usage = TokenUsage.from_response(response)
+    if usage is not None:
+        logger.info(
+            f"[{call}] tokens in={usage.input_tokens} out={usage.output_tokens} "
+            f"cache_read={usage.cache_read_input_tokens} "
+            f"cache_write={usage.cache_creation_input_tokens}"
+        )
+    return usage
+
+
+# =============================================================================
+# Streaming
+# =============================================================================
+
+@dataclass(slots=True)
+class ChatStreamEvent:
+    """One event from a streaming chat call.
+
+    type is "text" (a text delta), "tool_use" (a tool call whose input has
+    been fully received) or "final" (the parsed response, always last).
+    """
+    type: str
+    text: str = ""
+    tool_name: Optional[str] = None
+    tool_input: Optional[Dict[str, Any]] = None
+    response: Any = None
+
+
+class _StreamAssembler:
+    """Re-assembles raw Messages API stream events into a message.
+
+    Text deltas are forwarded as they arrive; tool_use input JSON is
+    accumulated per content block and emitted once the block closes.
+    Shared by the sync and async streaming paths.
+    """
+
+    def __init__(self) -> None:
+        self.blocks: Dict[int, SimpleNamespace] = {}
+        self.tool_json: Dict[int, List[str]] = {}
+        self.usage: Dict[str, int] = {}
+        self.stop_reason = None
+
+    def feed(self, event: Any) -> Optional[ChatStreamEvent]:
+        """Apply one stream event; return the ChatStreamEvent to forward, if any."""
+        event_type = getattr(event, "type", None)
+        index = getattr(event, "index", None)
+
+        if event_type == "message_start":
+            message_usage = getattr(event.message, "usage", None)
+            for name in ("input_tokens", "cache_read_input_tokens",
+                         "cache_creation_input_tokens"):
+                value = getattr(message_usage, name, None)
+                if isinstance(value, int):
+                    self.usage[name] = value
+
+        elif event_type == "content_block_start":
+            block = event.content_block
+            if block.type == "text":
+                self.blocks[index] = SimpleNamespace(type="text", text=block.text or "")
+            elif block.type == "tool_use":
+                self.blocks[index] = SimpleNamespace(
+                    type="tool_use", id=block.id, name=block.name, input={}
+                )
+                self.tool_json[index] = []
+
+        elif event_type == "content_block_delta":
+            delta = event.delta
+            if delta.type == "text_delta" and index in self.blocks:
+                self.blocks[index].text += delta.text
+                return ChatStreamEvent(type="text", text=delta.text)
+            if delta.type == "input_json_delta" and index in self.tool_json:
+                self.tool_json[index].append(delta.partial_json)
+
+        elif event_type == "content_block_stop" and index in self.tool_json:
+            raw = "".join(self.tool_json.pop(index))
+            try:
+                self.blocks[index].input = json.loads(raw) if raw else {}
+            except json.JSONDecodeError:
+                self.blocks[index].input = {}
+            return ChatStreamEvent(
+                type="tool_use",
+                tool_name=self.blocks[index].name,
+                tool_input=self.blocks[index].input,
+            )
+
+        elif event_type == "message_delta":
+            self.stop_reason = getattr(event.delta, "stop_reason", None)
+            output_tokens = getattr(getattr(event, "usage", None), "output_tokens", None)
+            if isinstance(output_tokens, int):
+                self.usage["output_tokens"] = output_tokens
+
+        return None
+
+    def final(
+        self,
+        parse: Callable[[Any, Optional[TokenUsage]], Any],
+        call: str,
+    ) -> ChatStreamEvent:
+        """Parse the assembled message exactly like a non-streaming response."""
+        response = SimpleNamespace(
+            content=[self.blocks[index] for index in sorted(self.blocks)],
+            usage=SimpleNamespace(**self.usage),
+            stop_reason=self.stop_reason,
+        )
+        return ChatStreamEvent(
+            type="final", response=parse(response, _record_usage(call, response))
+        )
+
+
+# =============================================================================
+# Async Calls (AsyncAnthropic)
+# =============================================================================
+# Async endpoints await the model instead of parking a worker thread on
+# it for the whole call. Requests and parsing are shared with the sync
+# functions, so both paths send and return exactly the same things.
+
+async def _create_async(
+    client: AsyncAnthropic,
+    request: Dict[str, Any],
+    parse: Callable[[Any, Optional[TokenUsage]], Any],
+    call: str,
+) -> Any:
+    """Await a Messages API request and parse the response.
+
+    Raises:
+        AnthropicError: If the request fails
+    """
+    try:
+        response = await client.messages.create(**request)
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+    return parse(response, _record_usage(call, response))
+
+
+async def _stream_chat_async(
+    client: AsyncAnthropic,
+    request: Dict[str, Any],
+    parse: Callable[[Any, Optional[TokenUsage]], Any],
+    call: str,
+) -> AsyncIterator[ChatStreamEvent]:
+    """Run a Messages API request with stream=True and re-assemble the result.
+
+    The assembled message is handed to ``parse`` exactly like a
+    non-streaming response, so both paths produce the same response objects.
+
+    Raises:
+        AnthropicError: If the request or the stream fails
+    """
+    assembler = _StreamAssembler()
+    try:
+        stream = await client.messages.create(**request, stream=True)
+        async for event in stream:
+            forwarded = assembler.feed(event)
+            if forwarded is not None:
+                yield forwarded
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except AnthropicError:
+        raise
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+
+    yield assembler.final(parse, call)
+
+
 def generate_assist_suggestion(
     task: TaskDetail,
     *,
@@ -938,6 +1536,7 @@ class ChatResponse:
     message: str
     pending_action: Optional[TaskUpdateAction] = None
     email_draft_update: Optional[EmailDraftUpdate] = None
+    usage: Optional[TokenUsage] = None
 
 
 @dataclass(slots=True)
@@ -965,6 +1564,7 @@ class PortfolioChatResponse:
     """Response from portfolio_chat_with_tools."""
     message: str
     pending_actions: List["PortfolioTaskUpdateAction"] = None  # Can have multiple task updates
+    usage: Optional[TokenUsage] = None
     
     def __post_init__(self):
         if self.pending_actions is None:
@@ -999,8 +1599,99 @@ def chat_with_tools(
         ChatResponse with message and optional pending_action
     """
     client = client or build_anthropic_client()
-    config = config or resolve_config()
+    request = _task_chat_request(
+        task,
+        user_message,
+        history,
+        attachments=attachments,
+        workspace_context=workspace_context,
+        config=config or resolve_config(),
+    )
+    try:
+        response = client.messages.create(**request)
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+
+    return _parse_task_chat_response(
+        response, _record_usage("chat_with_tools", response)
+    )
+
+
+async def chat_with_tools_async(
+    task: TaskDetail,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    attachments: Optional[List[AttachmentDetail]] = None,
+    workspace_context: Optional[str] = None,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> ChatResponse:
+    """Async variant of chat_with_tools.
+
+    Attachments are downloaded and prepared on a worker thread; the model
+    call itself is awaited. Arguments are the same as for chat_with_tools.
+    """
+    client = client or build_async_anthropic_client()
+    request = await asyncio.to_thread(
+        _task_chat_request,
+        task,
+        user_message,
+        history,
+        attachments=attachments,
+        workspace_context=workspace_context,
+        config=config or resolve_config(),
+    )
+    return await _create_async(
+        client, request, _parse_task_chat_response, "chat_with_tools"
+    )
+
+
+async def stream_chat_with_tools_async(
+    task: TaskDetail,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    attachments: Optional[List[AttachmentDetail]] = None,
+    workspace_context: Optional[str] = None,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> AsyncIterator[ChatStreamEvent]:
+    """Streaming variant of chat_with_tools_async.
+
+    Yields text deltas and completed tool calls as they arrive, then a
+    "final" event whose response is the ChatResponse chat_with_tools
+    would return.
+    Arguments are the same as for chat_with_tools.
+    """
+    client = client or build_async_anthropic_client()
+    request = await asyncio.to_thread(
+        _task_chat_request,
+        task,
+        user_message,
+        history,
+        attachments=attachments,
+        workspace_context=workspace_context,
+        config=config or resolve_config(),
+    )
+    async for event in _stream_chat_async(
+        client, request, _parse_task_chat_response, "chat_with_tools"
+    ):
+        yield event
+
 
+def _task_chat_request(
+    task: TaskDetail,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]],
+    *,
+    attachments: Optional[List[AttachmentDetail]],
+    workspace_context: Optional[str],
+    config: AnthropicConfig,
+) -> Dict[str, Any]:
+    """Build the Messages API request for chat_with_tools."""
     # Build task context - include source for priority format guidance
     priority_format = "numbered (5-Critical, 4-Urgent, 3-Important, 2-Standard, 1-Low)" if task.source == "work" else "simple (Critical, Urgent, Important, Standard, Low)"
     task_context = f"""Current Task:
@@ -1031,25 +1722,23 @@ Reference this context in your response when relevant."""
     
     # Add attachments (images first, then PDFs as text)
     if attachments:
-        pdf_texts: List[str] = []
-        for att in attachments:
-            if is_vision_supported(att.mime_type):
+        prepared = prepare_attachments(attachments)
+        for item in prepared:
+            if item.image_data:
                 # Image: use Claude Vision
-                image_data = download_and_encode_image(att.download_url)
-                if image_data:
-                    context_content.append({
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": att.mime_type,
-                            "data": image_data,
-                        }
-                    })
-            elif is_pdf(att.mime_type):
-                # PDF: extract text content
-                pdf_text = download_and_extract_pdf_text(att.download_url)
-                if pdf_text:
-                    pdf_texts.append(f"[PDF Attachment: {att.name}]\n{pdf_text}")
+                context_content.append({
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": item.media_type,
+                        "data": item.image_data,
+                    }
+                })
+        pdf_texts = [
+            f"[PDF Attachment: {item.attachment.name}]\n{item.text}"
+            for item in prepared
+            if item.text
+        ]
 
         # Add PDF text content after images
         if pdf_texts:
@@ -1060,6 +1749,8 @@ Reference this context in your response when relevant."""
     
     # Add task context text
     context_content.append({"type": "text", "text": task_context})
+    # Task context is identical on every turn about this task
+    _mark_cache_breakpoint(context_content)
     
     # Task context as priming
     messages.append({
@@ -1085,20 +1776,18 @@ Reference this context in your response when relevant."""
         "content": [{"type": "text", "text": user_message}]
     })
 
-    try:
-        response = client.messages.create(
-            model=config.model,
-            max_tokens=config.max_output_tokens,
-            temperature=0.5,
-            system=CHAT_WITH_TOOLS_SYSTEM_PROMPT,
-            messages=messages,
-            tools=[TASK_UPDATE_TOOL, WEB_SEARCH_TOOL, EMAIL_DRAFT_UPDATE_TOOL],
-        )
-    except APIStatusError as exc:
-        raise AnthropicError(f"Anthropic API error: {exc}") from exc
-    except Exception as exc:
-        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+    return {
+        "model": config.model,
+        "max_tokens": config.max_output_tokens,
+        "temperature": 0.5,
+        "system": cached_system(CHAT_WITH_TOOLS_SYSTEM_PROMPT),
+        "messages": messages,
+        "tools": cached_tools([TASK_UPDATE_TOOL, WEB_SEARCH_TOOL, EMAIL_DRAFT_UPDATE_TOOL]),
+    }
+
 
+def _parse_task_chat_response(response: Any, usage: Optional[TokenUsage]) -> ChatResponse:
+    """Build a ChatResponse from a task chat completion."""
     # Extract text and tool use from response
     text_content = []
     pending_action = None
@@ -1152,7 +1841,12 @@ Reference this context in your response when relevant."""
             changes.append("body")
         message = f"I've updated the email {' and '.join(changes)}. {email_draft_update.reason}"
 
-    return ChatResponse(message=message, pending_action=pending_action, email_draft_update=email_draft_update)
+    return ChatResponse(
+        message=message,
+        pending_action=pending_action,
+        email_draft_update=email_draft_update,
+        usage=usage,
+    )
 
 
 def _describe_action(action: TaskUpdateAction) -> str:
@@ -1515,8 +2209,93 @@ def portfolio_chat_with_tools(
         PortfolioChatResponse with message and optional pending_actions list
     """
     client = client or build_anthropic_client()
-    config = config or resolve_config()
+    request = _portfolio_chat_request(
+        portfolio_context,
+        task_summaries,
+        user_message,
+        history,
+        perspective,
+        config=config or resolve_config(),
+    )
+    try:
+        response = client.messages.create(**request)
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+
+    return _parse_portfolio_chat_response(
+        response, _record_usage("portfolio_chat", response)
+    )
+
+
+async def portfolio_chat_with_tools_async(
+    portfolio_context: str,
+    task_summaries: List[Dict[str, Any]],
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    perspective: str = "holistic",
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> PortfolioChatResponse:
+    """Async variant of portfolio_chat_with_tools (same arguments)."""
+    client = client or build_async_anthropic_client()
+    request = _portfolio_chat_request(
+        portfolio_context,
+        task_summaries,
+        user_message,
+        history,
+        perspective,
+        config=config or resolve_config(),
+    )
+    return await _create_async(
+        client, request, _parse_portfolio_chat_response, "portfolio_chat"
+    )
+
+
+async def stream_portfolio_chat_with_tools_async(
+    portfolio_context: str,
+    task_summaries: List[Dict[str, Any]],
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    perspective: str = "holistic",
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> AsyncIterator[ChatStreamEvent]:
+    """Streaming variant of portfolio_chat_with_tools_async.
 
+    Yields text deltas and completed tool calls as they arrive, then a
+    "final" event whose response is the PortfolioChatResponse
+    portfolio_chat_with_tools would return.
+    Arguments are the same as for portfolio_chat_with_tools.
+    """
+    client = client or build_async_anthropic_client()
+    request = _portfolio_chat_request(
+        portfolio_context,
+        task_summaries,
+        user_message,
+        history,
+        perspective,
+        config=config or resolve_config(),
+    )
+    async for event in _stream_chat_async(
+        client, request, _parse_portfolio_chat_response, "portfolio_chat"
+    ):
+        yield event
+
+
+def _portfolio_chat_request(
+    portfolio_context: str,
+    task_summaries: List[Dict[str, Any]],
+    user_message: str,
+    history: Optional[List[Dict[str, str]]],
+    perspective: str,
+    *,
+    config: AnthropicConfig,
+) -> Dict[str, Any]:
+    """Build the Messages API request for portfolio_chat_with_tools."""
     # Build task list for context (include row_id for targeting)
     task_list_text = "\n".join([
         f"- [{t.get('row_id')}] {t.get('title', 'Untitled')[:50]} | {t.get('priority')} | Due: {t.get('due', 'N/A')[:10]} | #: {t.get('number', '-')}"
@@ -1555,20 +2334,20 @@ TASKS (with row_id for updates):
             "content": [{"type": "text", "text": f"[Portfolio: {len(task_summaries)} tasks]\n\n{user_message}"}]
         })
 
-    try:
-        response = client.messages.create(
-            model=config.model,
-            max_tokens=4000,  # Increased for multiple tool calls
-            temperature=0.5,
-            system=_build_portfolio_system_prompt(),
-            messages=messages,
-            tools=[PORTFOLIO_TASK_UPDATE_TOOL],
-        )
-    except APIStatusError as exc:
-        raise AnthropicError(f"Anthropic API error: {exc}") from exc
-    except Exception as exc:
-        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+    return {
+        "model": config.model,
+        "max_tokens": 4000,  # Increased for multiple tool calls
+        "temperature": 0.5,
+        "system": cached_system(_build_portfolio_system_prompt()),
+        "messages": messages,
+        "tools": cached_tools([PORTFOLIO_TASK_UPDATE_TOOL]),
+    }
+
 
+def _parse_portfolio_chat_response(
+    response: Any, usage: Optional[TokenUsage]
+) -> PortfolioChatResponse:
+    """Build a PortfolioChatResponse from a portfolio chat completion."""
     # Extract text and tool uses from response
     text_content = []
     pending_actions = []
@@ -1616,7 +2395,9 @@ TASKS (with row_id for updates):
         else:
             message = f"I have {len(pending_actions)} task updates ready. Review and confirm?"
 
-    return PortfolioChatResponse(message=message, pending_actions=pending_actions)
+    return PortfolioChatResponse(
+        message=message, pending_actions=pending_actions, usage=usage
+    )
 
 
 def _describe_portfolio_action(action: PortfolioTaskUpdateAction) -> str:
@@ -1744,6 +2525,7 @@ class EmailChatResponse:
     """Response from email chat, may include a pending action."""
     message: str
     pending_action: Optional[EmailAction] = None
+    usage: Optional[TokenUsage] = None
 
 
 def chat_with_email(
@@ -1767,15 +2549,77 @@ def chat_with_email(
         EmailChatResponse with message and optional pending_action
     """
     client = client or build_anthropic_client()
-    config = config or resolve_config()
+    request = _email_chat_request(
+        email_context, user_message, history, config=config or resolve_config()
+    )
+    try:
+        response = client.messages.create(**request)
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+
+    return _parse_email_chat_response(response, _record_usage("email_chat", response))
+
+
+async def chat_with_email_async(
+    email_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> EmailChatResponse:
+    """Async variant of chat_with_email (same arguments)."""
+    client = client or build_async_anthropic_client()
+    request = _email_chat_request(
+        email_context, user_message, history, config=config or resolve_config()
+    )
+    return await _create_async(client, request, _parse_email_chat_response, "email_chat")
+
+
+async def stream_chat_with_email_async(
+    email_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> AsyncIterator[ChatStreamEvent]:
+    """Streaming variant of chat_with_email_async.
+
+    Yields text deltas and completed tool calls as they arrive, then a
+    "final" event whose response is the EmailChatResponse
+    chat_with_email would return.
+    Arguments are the same as for chat_with_email.
+    """
+    client = client or build_async_anthropic_client()
+    request = _email_chat_request(
+        email_context, user_message, history, config=config or resolve_config()
+    )
+    async for event in _stream_chat_async(
+        client, request, _parse_email_chat_response, "email_chat"
+    ):
+        yield event
+
 
+def _email_chat_request(
+    email_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]],
+    *,
+    config: AnthropicConfig,
+) -> Dict[str, Any]:
+    """Build the Messages API request for chat_with_email."""
     # Build messages
     messages: List[Dict[str, Any]] = []
     
-    # Email context as priming
+    # Email context as priming (stable for the thread, so cacheable)
+    context_content: List[Dict[str, Any]] = [{"type": "text", "text": email_context}]
+    _mark_cache_breakpoint(context_content)
     messages.append({
         "role": "user",
-        "content": [{"type": "text", "text": email_context}]
+        "content": context_content
     })
     messages.append({
         "role": "assistant",
@@ -1796,20 +2640,20 @@ def chat_with_email(
         "content": [{"type": "text", "text": user_message}]
     })
 
-    try:
-        response = client.messages.create(
-            model=config.model,
-            max_tokens=config.max_output_tokens,
-            temperature=0.5,
-            system=EMAIL_CHAT_SYSTEM_PROMPT,
-            messages=messages,
-            tools=[EMAIL_ACTION_TOOL],
-        )
-    except APIStatusError as exc:
-        raise AnthropicError(f"Anthropic API error: {exc}") from exc
-    except Exception as exc:
-        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+    return {
+        "model": config.model,
+        "max_tokens": config.max_output_tokens,
+        "temperature": 0.5,
+        "system": cached_system(EMAIL_CHAT_SYSTEM_PROMPT),
+        "messages": messages,
+        "tools": cached_tools([EMAIL_ACTION_TOOL]),
+    }
+
 
+def _parse_email_chat_response(
+    response: Any, usage: Optional[TokenUsage]
+) -> EmailChatResponse:
+    """Build an EmailChatResponse from an email chat completion."""
     # Extract text and tool use from response
     text_content = []
     pending_action = None
@@ -1838,7 +2682,7 @@ def chat_with_email(
         action_desc = _describe_email_action(pending_action)
         message = f"I'll {action_desc}. Should I proceed?"
 
-    return EmailChatResponse(message=message, pending_action=pending_action)
+    return EmailChatResponse(message=message, pending_action=pending_action, usage=usage)
 
 
 def _describe_email_action(action: EmailAction) -> str:
@@ -2479,6 +3323,7 @@ class CalendarChatResponse:
     pending_calendar_action: Optional[CalendarAction] = None
     pending_task_creation: Optional[TaskCreation] = None
     pending_task_update: Optional[TaskUpdate] = None
+    usage: Optional[TokenUsage] = None
 
 
 def chat_with_calendar(
@@ -2502,15 +3347,81 @@ def chat_with_calendar(
         CalendarChatResponse with message and optional pending actions
     """
     client = client or build_anthropic_client()
-    config = config or resolve_config()
+    request = _calendar_chat_request(
+        calendar_context, user_message, history, config=config or resolve_config()
+    )
+    try:
+        response = client.messages.create(**request)
+    except APIStatusError as exc:
+        raise AnthropicError(f"Anthropic API error: {exc}") from exc
+    except Exception as exc:
+        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+
+    return _parse_calendar_chat_response(
+        response, _record_usage("calendar_chat", response)
+    )
+
+
+async def chat_with_calendar_async(
+    calendar_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> CalendarChatResponse:
+    """Async variant of chat_with_calendar (same arguments)."""
+    client = client or build_async_anthropic_client()
+    request = _calendar_chat_request(
+        calendar_context, user_message, history, config=config or resolve_config()
+    )
+    return await _create_async(
+        client, request, _parse_calendar_chat_response, "calendar_chat"
+    )
+
+
+async def stream_chat_with_calendar_async(
+    calendar_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]] = None,
+    *,
+    client: Optional[AsyncAnthropic] = None,
+    config: Optional[AnthropicConfig] = None,
+) -> AsyncIterator[ChatStreamEvent]:
+    """Streaming variant of chat_with_calendar_async.
 
+    Yields text deltas and completed tool calls as they arrive, then a
+    "final" event whose response is the CalendarChatResponse
+    chat_with_calendar would return.
+    Arguments are the same as for chat_with_calendar.
+    """
+    client = client or build_async_anthropic_client()
+    request = _calendar_chat_request(
+        calendar_context, user_message, history, config=config or resolve_config()
+    )
+    async for event in _stream_chat_async(
+        client, request, _parse_calendar_chat_response, "calendar_chat"
+    ):
+        yield event
+
+
+def _calendar_chat_request(
+    calendar_context: str,
+    user_message: str,
+    history: Optional[List[Dict[str, str]]],
+    *,
+    config: AnthropicConfig,
+) -> Dict[str, Any]:
+    """Build the Messages API request for chat_with_calendar."""
     # Build messages
     messages: List[Dict[str, Any]] = []
 
-    # Calendar context as priming
+    # Calendar context as priming (cacheable while the view is unchanged)
+    context_content: List[Dict[str, Any]] = [{"type": "text", "text": calendar_context}]
+    _mark_cache_breakpoint(context_content)
     messages.append({
         "role": "user",
-        "content": [{"type": "text", "text": calendar_context}]
+        "content": context_content
     })
     messages.append({
         "role": "assistant",
@@ -2538,20 +3449,20 @@ def chat_with_calendar(
         PORTFOLIO_TASK_UPDATE_TOOL,  # Full task update capability
     ]
 
-    try:
-        response = client.messages.create(
-            model=config.model,
-            max_tokens=config.max_output_tokens,
-            temperature=0.5,
-            system=CALENDAR_CHAT_SYSTEM_PROMPT,
-            messages=messages,
-            tools=tools,
-        )
-    except APIStatusError as exc:
-        raise AnthropicError(f"Anthropic API error: {exc}") from exc
-    except Exception as exc:
-        raise AnthropicError(f"Anthropic request failed: {exc}") from exc
+    return {
+        "model": config.model,
+        "max_tokens": config.max_output_tokens,
+        "temperature": 0.5,
+        "system": cached_system(CALENDAR_CHAT_SYSTEM_PROMPT),
+        "messages": messages,
+        "tools": cached_tools(tools),
+    }
 
+
+def _parse_calendar_chat_response(
+    response: Any, usage: Optional[TokenUsage]
+) -> CalendarChatResponse:
+    """Build a CalendarChatResponse from a calendar chat completion."""
     # Extract text and tool use from response
     text_content = []
     pending_calendar_action = None
@@ -2628,6 +3539,7 @@ def chat_with_calendar(
         pending_calendar_action=pending_calendar_action,
         pending_task_creation=pending_task_creation,
         pending_task_update=pending_task_update,
+        usage=usage,
     )
 
 
@@ -0,0 +1,263 @@
+"""Local blob cache for attachment content sent to the model.
+
+Chat turns about a task re-send its selected attachments every time. The
+signed Smartsheet URLs change between turns, but an attachment's ID and
+creation time do not, so downloads and derived content (resized JPEGs,
+extracted PDF text) are cached under that identity:
+
+    entries(attachment_key, variant) -> digest    e.g. ("123:2025-01-02:5120", "raw")
+    blobs/<digest[:2]>/<digest>                    content-addressed bytes
+
+Identical content is stored once (a small image that needs no resizing
+shares its blob between the "raw" and "image" variants). When the blobs
+exceed the size budget, the least recently used entries are evicted and
+unreferenced blobs deleted.
+
+Environment Variables:
+    DTA_ATTACHMENT_CACHE: Set to "0" to bypass the cache
+    DTA_ATTACHMENT_CACHE_DIR: Cache directory (default: attachment_cache)
+    DTA_ATTACHMENT_CACHE_MAX_MB: Total blob budget in megabytes (default: 256)
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from ..tasks import AttachmentDetail
+
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding the index and blobs."""
+    return Path(
+        os.getenv(
+            "DTA_ATTACHMENT_CACHE_DIR",
+            Path(__file__).resolve().parents[2] / "attachment_cache",
+        )
+    )
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("DTA_ATTACHMENT_CACHE", "1") != "0"
+
+
+def _max_cache_bytes() -> int:
+    """Return the total blob budget before LRU eviction."""
+    try:
+        return int(float(os.getenv("DTA_ATTACHMENT_CACHE_MAX_MB", "256")) * 1024 * 1024)
+    except ValueError:
+        return 256 * 1024 * 1024
+
+
+def attachment_cache_key(attachment: AttachmentDetail) -> str:
+    """Identify an attachment version independently of its signed URL."""
+    return f"{attachment.attachment_id}:{attachment.created_at}:{attachment.size_bytes}"
+
+
+class AttachmentCache:
+    """Content-addressed blob store with an SQLite index and LRU eviction."""
+
+    def __init__(self, root: Optional[Path] = None, *, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root else _cache_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else _max_cache_bytes()
+        self._lock = threading.Lock()
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    attachment_key TEXT NOT NULL,
+                    variant TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (attachment_key, variant)
+                );
+                CREATE INDEX IF NOT EXISTS idx_entries_lru ON entries (last_access);
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL
+                );
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.root / "index.sqlite3")
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def get(self, attachment_key: str, variant: str) -> Optional[bytes]:
+        """Return cached bytes for an attachment variant, or None on a miss."""
+        path = self.get_path(attachment_key, variant)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            # Evicted between lookup and read
+            return None
+
+    def get_path(self, attachment_key: str, variant: str) -> Optional[Path]:
+        """Return the blob file for an attachment variant, or None on a miss.
+
+        Lets large attachments (PDFs) be parsed from disk instead of being
+        read into memory.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT digest FROM entries WHERE attachment_key = ? AND variant = ?",
+                (attachment_key, variant),
+            ).fetchone()
+            if row is None:
+                return None
+            path = self._blob_path(row[0])
+            if not path.exists():
+                # Blob removed behind our back; forget the entry
+                conn.execute(
+                    "DELETE FROM entries WHERE attachment_key = ? AND variant = ?",
+                    (attachment_key, variant),
+                )
+                return None
+            conn.execute(
+                "UPDATE entries SET last_access = ? WHERE attachment_key = ? AND variant = ?",
+                (time.time(), attachment_key, variant),
+            )
+        return path
+
+    def put(self, attachment_key: str, variant: str, data: bytes) -> None:
+        """Store bytes for an attachment variant, evicting old entries if needed."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        with self._connect() as conn:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(path)
+            self._index(conn, attachment_key, variant, digest, len(data))
+
+    def put_file(self, attachment_key: str, variant: str, source: Path) -> Path:
+        """Move a file into the cache as an attachment variant.
+
+        The file is hashed in chunks, so it is never held in memory.
+        Returns the path of the cached blob, or the source itself when it
+        is larger than the whole cache.
+        """
+        source = Path(source)
+        size = source.stat().st_size
+        if size > self.max_bytes:
+            # Would be evicted immediately; leave it where it is
+            return source
+        hasher = hashlib.sha256()
+        with source.open("rb") as fh:
+            while chunk := fh.read(_HASH_CHUNK_BYTES):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        path = self._blob_path(digest)
+        with self._connect() as conn:
+            if path.exists():
+                source.unlink(missing_ok=True)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # The source may live on another filesystem (e.g. /tmp)
+                tmp = path.with_suffix(".tmp")
+                shutil.move(str(source), tmp)
+                tmp.replace(path)
+            self._index(conn, attachment_key, variant, digest, size)
+        return path
+
+    def _index(
+        self,
+        conn: sqlite3.Connection,
+        attachment_key: str,
+        variant: str,
+        digest: str,
+        size: int,
+    ) -> None:
+        conn.execute(
+            "INSERT OR IGNORE INTO blobs (digest, size) VALUES (?, ?)",
+            (digest, size),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(attachment_key, variant, digest, last_access) VALUES (?, ?, ?, ?)",
+            (attachment_key, variant, digest, time.time()),
+        )
+        self._evict(conn)
+
+    def total_bytes(self) -> int:
+        with self._connect() as conn:
+            return self._total_bytes(conn)
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used entries until blobs fit in max_bytes."""
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT attachment_key, variant FROM entries ORDER BY last_access"
+        ).fetchall()
+        for attachment_key, variant in rows:
+            conn.execute(
+                "DELETE FROM entries WHERE attachment_key = ? AND variant = ?",
+                (attachment_key, variant),
+            )
+            total -= self._delete_orphans(conn)
+            if total <= self.max_bytes:
+                break
+
+    def _delete_orphans(self, conn: sqlite3.Connection) -> int:
+        """Delete blobs no entry references. Returns the bytes freed."""
+        orphans = conn.execute(
+            "SELECT digest, size FROM blobs "
+            "WHERE digest NOT IN (SELECT digest FROM entries)"
+        ).fetchall()
+        for digest, _ in orphans:
+            try:
+                self._blob_path(digest).unlink()
+            except OSError:
+                pass
+        conn.executemany("DELETE FROM blobs WHERE digest = ?", [(d,) for d, _ in orphans])
+        return sum(size for _, size in orphans)
+
+
+_default_cache: Optional[AttachmentCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_attachment_cache() -> Optional[AttachmentCache]:
+    """Return the process-wide attachment cache, or None when disabled."""
+    global _default_cache
+    if not _cache_enabled():
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = AttachmentCache()
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning(f"[attachment_cache] Cache unavailable: {exc}")
+                return None
+        return _default_cache
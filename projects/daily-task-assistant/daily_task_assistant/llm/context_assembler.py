@@ -5,12 +5,11 @@ based on classified intent.
 """
 from __future__ import annotations
 
-import base64
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
-from urllib import request as urlrequest
 
 from ..tasks import AttachmentDetail, TaskDetail
+from .anthropic_client import is_vision_supported, prepare_attachments
 from .intent_classifier import ClassifiedIntent
 from .prompts import assemble_system_prompt, get_tools_for_intent
 
@@ -84,17 +83,17 @@ def assemble_context(
     
     # Add images first if visual intent with selected images
     if intent.include_images and selected_images:
-        for att in selected_images:
-            image_data = _download_and_encode_image(att.download_url)
-            if image_data:
-                context_parts.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": att.mime_type,
-                        "data": image_data,
-                    }
-                })
+        images = [att for att in selected_images if is_vision_supported(att.mime_type)]
+        # 3.5MB raw stays under Claude's 5MB limit after base64 (~33% overhead)
+        for item in prepare_attachments(images, max_image_bytes=3_500_000):
+            context_parts.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": item.media_type,
+                    "data": item.image_data,
+                }
+            })
     
     # Add task context
     context_parts.append({"type": "text", "text": task_context})
@@ -198,68 +197,6 @@ def _summarize_history(history: List[Dict[str, str]]) -> str:
     return " ".join(topics)
 
 
-def _download_and_encode_image(url: str, max_size_bytes: int = 3_500_000) -> Optional[str]:
-    """Download and base64 encode an image.
-    
-    Resizes if too large for Claude's limits.
-    Note: max_size_bytes is for RAW data. Base64 adds ~33% overhead,
-    so 3.5MB raw becomes ~4.7MB encoded (under 5MB limit).
-    """
-    try:
-        with urlrequest.urlopen(url, timeout=15) as response:
-            data = response.read()
-            
-            if len(data) > max_size_bytes:
-                data = _resize_image(data, max_size_bytes)
-                if data is None:
-                    return None
-            
-            return base64.standard_b64encode(data).decode('utf-8')
-    except Exception:
-        return None
-
-
-def _resize_image(image_data: bytes, max_size_bytes: int) -> Optional[bytes]:
-    """Resize image to fit within size limit."""
-    try:
-        from PIL import Image
-        import io
-        
-        img = Image.open(io.BytesIO(image_data))
-        
-        if img.mode in ('RGBA', 'P'):
-            img = img.convert('RGB')
-        
-        quality = 85
-        scale = 1.0
-        
-        for _ in range(10):
-            output = io.BytesIO()
-            
-            if scale < 1.0:
-                new_size = (int(img.width * scale), int(img.height * scale))
-                resized = img.resize(new_size, Image.Resampling.LANCZOS)
-            else:
-                resized = img
-            
-            resized.save(output, format='JPEG', quality=quality, optimize=True)
-            result = output.getvalue()
-            
-            if len(result) <= max_size_bytes:
-                return result
-            
-            if quality > 50:
-                quality -= 10
-            else:
-                scale *= 0.8
-        
-        return None
-    except ImportError:
-        return None
-    except Exception:
-        return None
-
-
 def _estimate_tokens(system_prompt: str, messages: List[Dict[str, Any]]) -> int:
     """Rough token estimation (4 chars per token average)."""
     total_chars = len(system_prompt)
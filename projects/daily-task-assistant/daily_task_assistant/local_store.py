@@ -0,0 +1,612 @@
+"""Embedded local storage for stores running in file mode.
+
+Stores use local storage when their DTA_*_FORCE_FILE switch is set (or when
+Firestore is unavailable). Records are JSON documents keyed by
+(account, document ID). The default SQLite backend keeps every record of a
+store in one file and copies the fields the stores filter on into indexed
+columns, so listing pending or active items and purging expired ones are
+index lookups rather than directory walks:
+
+    {store_dir}/store.sqlite3    documents(account, doc_id, data,
+                                           status, email_id, created_at, expires_at)
+                                 rollups(account, day, key, count)
+
+Stores that keep metric rollups (see metric_rollups) pass their counter keys
+function; every put then updates the per-day counters in the same
+transaction as the records.
+
+Records left by the one-file-per-record layout
+({store_dir}/{account}/{doc_id}.json) are imported the first time an account
+is read and the files renamed to {doc_id}.json.migrated. That layout is still
+available as the "json" backend, which renames migrated files back, so
+switching to it after a migration still finds the imported records.
+
+Environment Variables:
+    DTA_LOCAL_STORE: "sqlite" (default) or "json" (one file per record)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .metric_rollups import RollupDeltas, RollupKeys, count_records, merge_deltas, rollup_deltas
+
+
+logger = logging.getLogger(__name__)
+
+# Indexed columns; stores map each to one of their record fields
+INDEXED_FIELDS = ("status", "email_id", "created_at", "expires_at")
+
+_TIME_FIELDS = ("created_at", "expires_at")
+
+# Suffix added to legacy record files once they are imported into SQLite
+MIGRATED_SUFFIX = ".migrated"
+
+Document = Dict[str, Any]
+
+
+def _backend() -> str:
+    """Return the configured local backend ("sqlite" or "json")."""
+    backend = os.getenv("DTA_LOCAL_STORE", "sqlite").strip().lower()
+    return backend if backend in ("sqlite", "json") else "sqlite"
+
+
+def _timestamp(value: Union[datetime, str, None]) -> Optional[float]:
+    """Convert a datetime or ISO string to a UTC timestamp (naive = UTC)."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _safe_name(doc_id: str) -> str:
+    return doc_id.replace("/", "_").replace("\\", "_")
+
+
+class LocalStore(ABC):
+    """JSON document store partitioned by account.
+
+    Backends implement the abstract methods; put() and delete() build on them.
+
+    Args:
+        root: Store directory
+        fields: Record field backing each indexed column (default: same name)
+        rollup_keys: Record -> metric counter keys, for stores keeping rollups
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        fields: Optional[Dict[str, str]] = None,
+        rollup_keys: Optional[RollupKeys] = None,
+    ):
+        self.root = Path(root)
+        self.fields = {name: name for name in INDEXED_FIELDS}
+        self.fields.update(fields or {})
+        self.rollup_keys = rollup_keys
+        self._lock = threading.Lock()
+
+    def _index_values(self, data: Document) -> Dict[str, Any]:
+        values = {name: data.get(key) for name, key in self.fields.items()}
+        for name in _TIME_FIELDS:
+            values[name] = _timestamp(values[name])
+        return values
+
+    def _legacy_dir(self, account: str) -> Path:
+        return self.root / account if account else self.root
+
+    @abstractmethod
+    def get(self, account: str, doc_id: str) -> Optional[Document]:
+        """Return one document, or None if it does not exist."""
+
+    @abstractmethod
+    def put_many(self, account: str, docs: Dict[str, Document]) -> None:
+        """Write documents keyed by ID, replacing stored versions."""
+
+    @abstractmethod
+    def delete_many(self, account: str, doc_ids: Iterable[str]) -> int:
+        """Delete documents by ID. Returns the number deleted."""
+
+    @abstractmethod
+    def query(
+        self,
+        account: str,
+        *,
+        status: Union[str, Collection[str], None] = None,
+        email_id: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        expires_before: Optional[datetime] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Document]:
+        """Return the documents matching every given filter.
+
+        Args:
+            account: Account partition
+            status: Status value, or a collection of accepted values
+            email_id: Exact email ID
+            created_after: Created at or after this time
+            created_before: Created before this time
+            expires_before: Has an expiry earlier than this time
+            newest_first: Order by created_at descending
+            limit: Maximum documents to return
+        """
+
+    @abstractmethod
+    def delete_where(self, account: str, **filters: Any) -> int:
+        """Delete the documents matching query() filters. Returns the count."""
+
+    @abstractmethod
+    def read_rollups(self, account: str, since: str) -> Dict[str, int]:
+        """Sum the metric counters for days on or after ``since`` (YYYY-MM-DD).
+
+        Counters are rebuilt from the stored records on the first read for
+        an account that has none.
+        """
+
+    @abstractmethod
+    def rebuild_rollups(self, account: str) -> None:
+        """Recompute an account's metric counters from its records."""
+
+    def _rollup_changes(
+        self, previous: Dict[str, Document], docs: Dict[str, Document]
+    ) -> RollupDeltas:
+        deltas: RollupDeltas = {}
+        if self.rollup_keys is not None:
+            for doc_id, data in docs.items():
+                merge_deltas(deltas, rollup_deltas(self.rollup_keys, previous.get(doc_id), data))
+        return deltas
+
+    def put(self, account: str, doc_id: str, data: Document) -> None:
+        self.put_many(account, {doc_id: data})
+
+    def delete(self, account: str, doc_id: str) -> bool:
+        return self.delete_many(account, [doc_id]) > 0
+
+
+# =============================================================================
+# SQLite Backend
+# =============================================================================
+
+class SqliteLocalStore(LocalStore):
+    """All records of a store in one SQLite file with indexed filter columns."""
+
+    def __init__(
+        self,
+        root: Path,
+        fields: Optional[Dict[str, str]] = None,
+        rollup_keys: Optional[RollupKeys] = None,
+    ):
+        super().__init__(root, fields, rollup_keys)
+        self.path = self.root / "store.sqlite3"
+        self._imported: set = set()
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    account TEXT NOT NULL,
+                    doc_id TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    status TEXT,
+                    email_id TEXT,
+                    created_at REAL,
+                    expires_at REAL,
+                    PRIMARY KEY (account, doc_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_status
+                    ON documents (account, status);
+                CREATE INDEX IF NOT EXISTS idx_documents_email_id
+                    ON documents (account, email_id);
+                CREATE INDEX IF NOT EXISTS idx_documents_created_at
+                    ON documents (account, created_at);
+                CREATE INDEX IF NOT EXISTS idx_documents_expires_at
+                    ON documents (account, expires_at);
+                CREATE TABLE IF NOT EXISTS rollups (
+                    account TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (account, day, key)
+                );
+                CREATE TABLE IF NOT EXISTS rollup_accounts (
+                    account TEXT PRIMARY KEY
+                );
+                """
+            )
+
+    @contextmanager
+    def _connect(self, account: Optional[str] = None) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                if account is not None and account not in self._imported:
+                    self._import_legacy(conn, account)
+                    self._imported.add(account)
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _rows(self, account: str, docs: Dict[str, Document]) -> List[Tuple]:
+        rows = []
+        for doc_id, data in docs.items():
+            values = self._index_values(data)
+            rows.append((
+                account, doc_id, json.dumps(data),
+                values["status"], values["email_id"],
+                values["created_at"], values["expires_at"],
+            ))
+        return rows
+
+    def _import_legacy(self, conn: sqlite3.Connection, account: str) -> None:
+        """Copy one-file-per-record JSON documents for an account into the table.
+
+        Imported files are renamed rather than deleted, so the json backend
+        can still serve them.
+        """
+        legacy_dir = self._legacy_dir(account)
+        if not legacy_dir.is_dir():
+            return
+        docs, paths = {}, []
+        for path in legacy_dir.glob("*.json"):
+            try:
+                docs[path.stem] = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning(f"[local_store] Skipping unreadable record {path}: {exc}")
+                continue
+            paths.append(path)
+        if not docs:
+            return
+        # Records already in the table are newer than any leftover file
+        conn.executemany(
+            "INSERT OR IGNORE INTO documents "
+            "(account, doc_id, data, status, email_id, created_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._rows(account, docs),
+        )
+        conn.commit()
+        for path in paths:
+            try:
+                path.replace(path.with_name(path.name + MIGRATED_SUFFIX))
+            except OSError as exc:
+                logger.warning(f"[local_store] Could not mark {path} as migrated: {exc}")
+        logger.info(f"[local_store] Imported {len(docs)} records into {self.path}")
+
+    def get(self, account: str, doc_id: str) -> Optional[Document]:
+        with self._connect(account) as conn:
+            row = conn.execute(
+                "SELECT data FROM documents WHERE account = ? AND doc_id = ?",
+                (account, doc_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, account: str, docs: Dict[str, Document]) -> None:
+        if not docs:
+            return
+        with self._connect(account) as conn:
+            previous = self._stored(conn, account, docs) if self.rollup_keys else {}
+            conn.executemany(
+                "INSERT OR REPLACE INTO documents "
+                "(account, doc_id, data, status, email_id, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._rows(account, docs),
+            )
+            self._add_rollups(conn, account, self._rollup_changes(previous, docs))
+
+    @staticmethod
+    def _stored(
+        conn: sqlite3.Connection, account: str, doc_ids: Iterable[str]
+    ) -> Dict[str, Document]:
+        doc_ids = list(doc_ids)
+        stored = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT doc_id, data FROM documents WHERE account = ? "
+                f"AND doc_id IN ({', '.join('?' * len(chunk))})",
+                [account, *chunk],
+            ).fetchall()
+            stored.update((doc_id, json.loads(data)) for doc_id, data in rows)
+        return stored
+
+    @staticmethod
+    def _add_rollups(conn: sqlite3.Connection, account: str, deltas: RollupDeltas) -> None:
+        conn.executemany(
+            "INSERT INTO rollups (account, day, key, count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (account, day, key) DO UPDATE SET count = count + excluded.count",
+            [
+                (account, day, key, n)
+                for day, counts in deltas.items()
+                for key, n in counts.items()
+            ],
+        )
+
+    def delete_many(self, account: str, doc_ids: Iterable[str]) -> int:
+        params = [(account, doc_id) for doc_id in doc_ids]
+        if not params:
+            return 0
+        with self._connect(account) as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "DELETE FROM documents WHERE account = ? AND doc_id = ?", params
+            )
+            return conn.total_changes - before
+
+    @staticmethod
+    def _where(account: str, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        clauses, params = ["account = ?"], [account]
+        status = filters.get("status")
+        if isinstance(status, str):
+            clauses.append("status = ?")
+            params.append(status)
+        elif status is not None:
+            status = list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(status))})")
+            params.extend(status)
+        if filters.get("email_id") is not None:
+            clauses.append("email_id = ?")
+            params.append(filters["email_id"])
+        if filters.get("created_after") is not None:
+            clauses.append("created_at >= ?")
+            params.append(_timestamp(filters["created_after"]))
+        if filters.get("created_before") is not None:
+            clauses.append("created_at < ?")
+            params.append(_timestamp(filters["created_before"]))
+        if filters.get("expires_before") is not None:
+            clauses.append("expires_at < ?")
+            params.append(_timestamp(filters["expires_before"]))
+        return " AND ".join(clauses), params
+
+    def query(self, account: str, *, newest_first: bool = False,
+              limit: Optional[int] = None, **filters: Any) -> List[Document]:
+        where, params = self._where(account, filters)
+        sql = f"SELECT data FROM documents WHERE {where}"
+        if newest_first:
+            sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect(account) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def delete_where(self, account: str, **filters: Any) -> int:
+        where, params = self._where(account, filters)
+        with self._connect(account) as conn:
+            return conn.execute(f"DELETE FROM documents WHERE {where}", params).rowcount
+
+    def read_rollups(self, account: str, since: str) -> Dict[str, int]:
+        with self._connect(account) as conn:
+            built = conn.execute(
+                "SELECT 1 FROM rollup_accounts WHERE account = ?", (account,)
+            ).fetchone()
+            if not built:
+                self._rebuild_rollups(conn, account)
+            rows = conn.execute(
+                "SELECT key, SUM(count) FROM rollups "
+                "WHERE account = ? AND day >= ? GROUP BY key",
+                (account, since),
+            ).fetchall()
+        return {key: total for key, total in rows if total}
+
+    def rebuild_rollups(self, account: str) -> None:
+        with self._connect(account) as conn:
+            self._rebuild_rollups(conn, account)
+
+    def _rebuild_rollups(self, conn: sqlite3.Connection, account: str) -> None:
+        conn.execute("DELETE FROM rollups WHERE account = ?", (account,))
+        if self.rollup_keys is not None:
+            rows = conn.execute(
+                "SELECT data FROM documents WHERE account = ?", (account,)
+            ).fetchall()
+            counts = count_records(self.rollup_keys, (json.loads(row[0]) for row in rows))
+            self._add_rollups(conn, account, counts)
+        conn.execute("INSERT OR IGNORE INTO rollup_accounts (account) VALUES (?)", (account,))
+
+
+# =============================================================================
+# JSON Backend (one file per record)
+# =============================================================================
+
+class JsonLocalStore(LocalStore):
+    """One JSON file per record under {root}/{account}/; queries scan the directory."""
+
+    def __init__(
+        self,
+        root: Path,
+        fields: Optional[Dict[str, str]] = None,
+        rollup_keys: Optional[RollupKeys] = None,
+    ):
+        super().__init__(root, fields, rollup_keys)
+        self._restored: set = set()
+
+    def _account_dir(self, account: str) -> Path:
+        """Return an account's directory, first restoring files the SQLite backend migrated."""
+        directory = self._legacy_dir(account)
+        if account not in self._restored:
+            self._restored.add(account)
+            if directory.is_dir():
+                for path in directory.glob(f"*.json{MIGRATED_SUFFIX}"):
+                    original = path.with_name(path.name[: -len(MIGRATED_SUFFIX)])
+                    # A file written since the migration is newer than the import
+                    if not original.exists():
+                        try:
+                            path.replace(original)
+                        except OSError:
+                            continue
+        return directory
+
+    def _path(self, account: str, doc_id: str) -> Path:
+        return self._account_dir(account) / f"{_safe_name(doc_id)}.json"
+
+    def _scan(self, account: str) -> Iterator[Tuple[Path, Document]]:
+        directory = self._account_dir(account)
+        if not directory.exists():
+            return
+        for path in directory.glob("*.json"):
+            try:
+                yield path, json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+    def _matches(self, data: Document, filters: Dict[str, Any]) -> bool:
+        values = self._index_values(data)
+        status = filters.get("status")
+        if status is not None:
+            accepted = (status,) if isinstance(status, str) else status
+            if values["status"] not in accepted:
+                return False
+        if filters.get("email_id") is not None and values["email_id"] != filters["email_id"]:
+            return False
+        created = values["created_at"]
+        if filters.get("created_after") is not None:
+            if created is None or created < _timestamp(filters["created_after"]):
+                return False
+        if filters.get("created_before") is not None:
+            if created is None or created >= _timestamp(filters["created_before"]):
+                return False
+        if filters.get("expires_before") is not None:
+            expires = values["expires_at"]
+            if expires is None or expires >= _timestamp(filters["expires_before"]):
+                return False
+        return True
+
+    def get(self, account: str, doc_id: str) -> Optional[Document]:
+        path = self._path(account, doc_id)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put_many(self, account: str, docs: Dict[str, Document]) -> None:
+        if not docs:
+            return
+        self._account_dir(account).mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            previous = {}
+            if self.rollup_keys is not None:
+                for doc_id in docs:
+                    data = self.get(account, doc_id)
+                    if data is not None:
+                        previous[doc_id] = data
+            for doc_id, data in docs.items():
+                with open(self._path(account, doc_id), "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+            deltas = self._rollup_changes(previous, docs)
+            # Counters that were never built are built from the records on first read
+            rollups = self._load_rollups(account) if deltas else None
+            if rollups is not None:
+                self._save_rollups(account, merge_deltas(rollups, deltas))
+
+    def delete_many(self, account: str, doc_ids: Iterable[str]) -> int:
+        count = 0
+        for doc_id in doc_ids:
+            path = self._path(account, doc_id)
+            if path.exists():
+                path.unlink()
+                count += 1
+        return count
+
+    def query(self, account: str, *, newest_first: bool = False,
+              limit: Optional[int] = None, **filters: Any) -> List[Document]:
+        docs = [data for _, data in self._scan(account) if self._matches(data, filters)]
+        if newest_first:
+            docs.sort(key=lambda d: self._index_values(d)["created_at"] or 0.0, reverse=True)
+        return docs[:limit] if limit is not None else docs
+
+    def delete_where(self, account: str, **filters: Any) -> int:
+        count = 0
+        for path, data in self._scan(account):
+            if self._matches(data, filters):
+                path.unlink()
+                count += 1
+        return count
+
+    def _rollups_path(self, account: str) -> Path:
+        return self.root / "_rollups" / f"{_safe_name(account) or '_'}.json"
+
+    def _load_rollups(self, account: str) -> Optional[RollupDeltas]:
+        try:
+            return json.loads(self._rollups_path(account).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _save_rollups(self, account: str, rollups: RollupDeltas) -> None:
+        path = self._rollups_path(account)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rollups, f, indent=2)
+
+    def read_rollups(self, account: str, since: str) -> Dict[str, int]:
+        with self._lock:
+            rollups = self._load_rollups(account)
+            if rollups is None:
+                rollups = self._rebuild_rollups(account)
+        totals: Dict[str, int] = {}
+        for day, counts in rollups.items():
+            if day >= since:
+                for key, n in counts.items():
+                    totals[key] = totals.get(key, 0) + n
+        return {key: n for key, n in totals.items() if n}
+
+    def rebuild_rollups(self, account: str) -> None:
+        with self._lock:
+            self._rebuild_rollups(account)
+
+    def _rebuild_rollups(self, account: str) -> RollupDeltas:
+        rollups: RollupDeltas = {}
+        if self.rollup_keys is not None:
+            rollups = count_records(self.rollup_keys, (data for _, data in self._scan(account)))
+        self._save_rollups(account, rollups)
+        return rollups
+
+
+# =============================================================================
+# Store Registry
+# =============================================================================
+
+_stores: Dict[Tuple[str, Path], LocalStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_local_store(
+    root: Path,
+    *,
+    fields: Optional[Dict[str, str]] = None,
+    rollup_keys: Optional[RollupKeys] = None,
+) -> LocalStore:
+    """Return the process-wide local store for a store directory.
+
+    Args:
+        root: Store directory (e.g. the value of DTA_ATTENTION_DIR)
+        fields: Record field backing each indexed column, for records that
+            name them differently (e.g. {"created_at": "pinned_at"})
+        rollup_keys: Record -> metric counter keys, for stores whose stats
+            read per-day rollups (see metric_rollups)
+    """
+    backend = _backend()
+    key = (backend, Path(root).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            cls = SqliteLocalStore if backend == "sqlite" else JsonLocalStore
+            store = _stores[key] = cls(root, fields, rollup_keys)
+        return store
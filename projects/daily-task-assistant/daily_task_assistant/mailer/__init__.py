@@ -10,15 +10,30 @@ from .gmail import (
 from .inbox import (
     AttachmentInfo,
     EmailMessage,
+    HydrationResult,
     InboxSummary,
     GmailLabel,
+    LabelCatalog,
     count_messages,
+    get_history_id,
     get_inbox_summary,
     get_label_counts,
     get_message,
+    get_thread_messages,
+    get_thread_state,
     get_unread_messages,
+    hydrate_messages,
+    list_history,
     list_messages,
     search_messages,
+    # Async variants for async routes
+    get_inbox_summary_async,
+    get_label_counts_async,
+    get_message_async,
+    get_unread_messages_async,
+    hydrate_messages_async,
+    list_messages_async,
+    search_messages_async,
     # Email actions
     archive_message,
     delete_message,
@@ -29,6 +44,8 @@ from .inbox import (
     modify_message_labels,
     # Custom label operations
     list_labels,
+    get_label_catalog,
+    invalidate_label_catalog,
     get_label_by_name,
     apply_label,
     remove_label,
@@ -36,6 +53,18 @@ from .inbox import (
     remove_label_by_name,
 )
 
+from .history_sync import (
+    MessageCache,
+    SyncDelta,
+    ThreadSnapshot,
+    get_message_cache,
+    get_thread_cached,
+    hydrate_cached,
+    hydrate_cached_async,
+    save_thread_summary,
+    sync_history,
+)
+
 __all__ = [
     # Gmail sending
     "GmailAccountConfig",
@@ -45,15 +74,29 @@ __all__ = [
     # Inbox reading
     "AttachmentInfo",
     "EmailMessage",
+    "HydrationResult",
     "InboxSummary",
     "GmailLabel",
+    "LabelCatalog",
     "count_messages",
+    "get_history_id",
     "get_inbox_summary",
     "get_label_counts",
     "get_message",
+    "get_thread_messages",
+    "get_thread_state",
     "get_unread_messages",
+    "hydrate_messages",
+    "list_history",
     "list_messages",
     "search_messages",
+    "get_inbox_summary_async",
+    "get_label_counts_async",
+    "get_message_async",
+    "get_unread_messages_async",
+    "hydrate_messages_async",
+    "list_messages_async",
+    "search_messages_async",
     # Email actions
     "archive_message",
     "delete_message",
@@ -64,10 +107,22 @@ __all__ = [
     "modify_message_labels",
     # Custom label operations
     "list_labels",
+    "get_label_catalog",
+    "invalidate_label_catalog",
     "get_label_by_name",
     "apply_label",
     "remove_label",
     "apply_label_by_name",
     "remove_label_by_name",
+    # Incremental sync / message cache
+    "MessageCache",
+    "SyncDelta",
+    "ThreadSnapshot",
+    "get_message_cache",
+    "get_thread_cached",
+    "hydrate_cached",
+    "hydrate_cached_async",
+    "save_thread_summary",
+    "sync_history",
 ]
 
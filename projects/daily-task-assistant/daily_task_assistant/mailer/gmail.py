@@ -3,21 +3,28 @@ from __future__ import annotations
 
 import base64
 from dataclasses import dataclass
-import json
 import os
-from typing import Optional
-from urllib import error as urlerror
-from urllib import parse as urlparse
-from urllib import request as urlrequest
+from typing import Optional, Tuple
 from email.message import EmailMessage
 
+from ..google_oauth import get_cached_access_token, get_cached_access_token_async
+from ..http_transport import HTTPStatusError, TransportError, request_json
+
 
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 SEND_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
 
 
 class GmailError(RuntimeError):
-    """Raised when Gmail sending fails."""
+    """Raised when Gmail sending fails.
+
+    Attributes:
+        status_code: HTTP status of the failed Gmail API call, if any
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 @dataclass(slots=True)
@@ -114,54 +121,61 @@ def send_email(
     if thread_id:
         payload_data["threadId"] = thread_id
     
-    payload = json.dumps(payload_data).encode("utf-8")
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
-    req = urlrequest.Request(SEND_URL, data=payload, headers=headers, method="POST")
+    headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            response = json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:  # pragma: no cover - network path
-        detail = exc.read().decode("utf-8", errors="ignore")
+        response = request_json(
+            "POST", SEND_URL, headers=headers, json_body=payload_data, timeout=15
+        )
+    except HTTPStatusError as exc:  # pragma: no cover - network path
         raise GmailError(
-            f"Gmail send failed with status {exc.code}: {detail}"
+            f"Gmail send failed with status {exc.status_code}: {exc.detail}",
+            status_code=exc.status_code,
         ) from exc
-    except urlerror.URLError as exc:  # pragma: no cover - network path
+    except TransportError as exc:  # pragma: no cover - network path
         raise GmailError(f"Gmail network error: {exc}") from exc
 
     return response.get("id", "")
 
 
 def _fetch_access_token(account: GmailAccountConfig) -> str:
-    payload = urlparse.urlencode(
-        {
-            "client_id": account.client_id,
-            "client_secret": account.client_secret,
-            "refresh_token": account.refresh_token,
-            "grant_type": "refresh_token",
-        }
-    ).encode("utf-8")
-    req = urlrequest.Request(
-        TOKEN_URL,
-        data=payload,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        method="POST",
+    """Return a process-wide cached access token for the account."""
+    return get_cached_access_token(
+        account.client_id,
+        account.refresh_token,
+        lambda: _request_access_token(account),
+    )
+
+
+async def _fetch_access_token_async(account: GmailAccountConfig) -> str:
+    """Async variant of _fetch_access_token."""
+    return await get_cached_access_token_async(
+        account.client_id,
+        account.refresh_token,
+        lambda: _request_access_token(account),
     )
+
+
+def _request_access_token(account: GmailAccountConfig) -> Tuple[str, int]:
+    payload = {
+        "client_id": account.client_id,
+        "client_secret": account.client_secret,
+        "refresh_token": account.refresh_token,
+        "grant_type": "refresh_token",
+    }
     try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:  # pragma: no cover - network path
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail token request failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:  # pragma: no cover - network path
+        data = request_json("POST", TOKEN_URL, data=payload, timeout=15)
+    except HTTPStatusError as exc:  # pragma: no cover - network path
+        raise GmailError(
+            f"Gmail token request failed ({exc.status_code}): {exc.detail}",
+            status_code=exc.status_code,
+        ) from exc
+    except TransportError as exc:  # pragma: no cover - network path
         raise GmailError(f"Gmail token network error: {exc}") from exc
 
     token = data.get("access_token")
     if not token:
         raise GmailError("Gmail token response missing access_token.")
-    return str(token)
+    return str(token), int(data.get("expires_in") or 0)
 
 
 def _build_raw_message(
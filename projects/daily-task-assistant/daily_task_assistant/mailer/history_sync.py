@@ -0,0 +1,691 @@
+"""Incremental Gmail sync with a local message cache.
+
+Inbox views and analysis runs used to re-download every listed message on
+each call. This module keeps parsed EmailMessage records in a local SQLite
+cache and keeps it current with Gmail's history API:
+
+    1. sync_history() pulls message additions, deletions and label changes
+       since the stored historyId (one small users.history.list call) and
+       applies them to the cache.
+    2. hydrate_cached() serves listed message IDs from the cache and fetches
+       only the misses through hydrate_messages(); hydrate_cached_async()
+       does the same for async routes.
+    3. get_thread_cached() checks a thread's historyId with one minimal
+       threads.get call, serves its messages from the cache and keeps the
+       thread summary, so only new messages are fetched and summarized.
+
+If the stored historyId is too old (Gmail returns 404), the account's cache
+is dropped and a fresh historyId is recorded.
+
+Cache Structure (SQLite):
+    messages(mailbox, message_id, format_rank, data, history_id, last_access)
+    sync_state(mailbox, history_id, synced_at)
+    threads(mailbox, thread_id, history_id, message_ids, summary,
+            summary_message_ids, last_access)
+
+Environment Variables:
+    DTA_GMAIL_CACHE: Set to "0" to bypass the cache and always fetch live
+    DTA_GMAIL_CACHE_PATH: SQLite file path (default: gmail_cache/messages.sqlite3)
+    DTA_GMAIL_CACHE_MAX_MESSAGES: Max cached messages per mailbox (default: 5000)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Literal, Optional, Sequence
+
+from .gmail import GmailAccountConfig, GmailError
+from .inbox import (
+    AttachmentInfo,
+    EmailMessage,
+    HydrationResult,
+    get_history_id,
+    get_thread_messages,
+    get_thread_state,
+    hydrate_messages,
+    hydrate_messages_async,
+    list_history,
+)
+
+
+logger = logging.getLogger(__name__)
+
+MessageFormat = Literal["minimal", "metadata", "full"]
+
+# A cached entry can serve any request at or below its own format
+_FORMAT_RANK = {"minimal": 0, "metadata": 1, "full": 2}
+
+
+def _cache_path() -> Path:
+    """Return the SQLite file used for the message cache."""
+    return Path(
+        os.getenv(
+            "DTA_GMAIL_CACHE_PATH",
+            Path(__file__).resolve().parents[2] / "gmail_cache" / "messages.sqlite3",
+        )
+    )
+
+
+def _cache_enabled() -> bool:
+    return os.getenv("DTA_GMAIL_CACHE", "1") != "0"
+
+
+def _max_cached_messages() -> int:
+    """Return the per-mailbox cache size before LRU eviction."""
+    return int(os.getenv("DTA_GMAIL_CACHE_MAX_MESSAGES", "5000"))
+
+
+def _now() -> datetime:
+    """Return current UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True)
+class SyncDelta:
+    """Summary of one history sync."""
+
+    history_id: str
+    added: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    relabeled: List[str] = field(default_factory=list)
+    reset: bool = False  # True when the cache was dropped for a full resync
+
+
+@dataclass(slots=True)
+class ThreadSnapshot:
+    """A thread's messages plus the summary cached for it."""
+
+    thread_id: str
+    history_id: str
+    messages: List[EmailMessage]
+    summary: Optional[str] = None
+    summary_message_ids: List[str] = field(default_factory=list)  # Messages the summary covers
+    unchanged: bool = False  # True when historyId matched the cached thread
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+def _message_to_dict(msg: EmailMessage) -> Dict:
+    return {
+        "id": msg.id,
+        "thread_id": msg.thread_id,
+        "from_address": msg.from_address,
+        "from_name": msg.from_name,
+        "to_address": msg.to_address,
+        "subject": msg.subject,
+        "snippet": msg.snippet,
+        "date": msg.date.isoformat(),
+        "is_unread": msg.is_unread,
+        "labels": list(msg.labels),
+        "body": msg.body,
+        "body_html": msg.body_html,
+        "attachment_count": msg.attachment_count,
+        "attachments": [
+            {
+                "filename": a.filename,
+                "mime_type": a.mime_type,
+                "size": a.size,
+                "attachment_id": a.attachment_id,
+            }
+            for a in msg.attachments
+        ],
+        "cc_address": msg.cc_address,
+        "message_id_header": msg.message_id_header,
+        "references": msg.references,
+        "history_id": msg.history_id,
+    }
+
+
+def _message_from_dict(data: Dict) -> EmailMessage:
+    return EmailMessage(
+        id=data["id"],
+        thread_id=data["thread_id"],
+        from_address=data["from_address"],
+        from_name=data["from_name"],
+        to_address=data["to_address"],
+        subject=data["subject"],
+        snippet=data["snippet"],
+        date=datetime.fromisoformat(data["date"]),
+        is_unread=data["is_unread"],
+        labels=list(data.get("labels", [])),
+        body=data.get("body"),
+        body_html=data.get("body_html"),
+        attachment_count=data.get("attachment_count", 0),
+        attachments=[AttachmentInfo(**a) for a in data.get("attachments", [])],
+        cc_address=data.get("cc_address", ""),
+        message_id_header=data.get("message_id_header", ""),
+        references=data.get("references", ""),
+        history_id=data.get("history_id", ""),
+    )
+
+
+# =============================================================================
+# Message Cache
+# =============================================================================
+
+class MessageCache:
+    """SQLite-backed cache of parsed Gmail messages, keyed by mailbox."""
+
+    def __init__(self, path: Optional[Path] = None, *, max_messages: Optional[int] = None):
+        self.path = Path(path) if path else _cache_path()
+        self.max_messages = max_messages or _max_cached_messages()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    mailbox TEXT NOT NULL,
+                    message_id TEXT NOT NULL,
+                    format_rank INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    history_id TEXT,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (mailbox, message_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_messages_lru
+                    ON messages (mailbox, last_access);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    mailbox TEXT PRIMARY KEY,
+                    history_id TEXT NOT NULL,
+                    synced_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS threads (
+                    mailbox TEXT NOT NULL,
+                    thread_id TEXT NOT NULL,
+                    history_id TEXT NOT NULL,
+                    message_ids TEXT NOT NULL,
+                    summary TEXT,
+                    summary_message_ids TEXT NOT NULL DEFAULT '[]',
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (mailbox, thread_id)
+                );
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    # Sync state ---------------------------------------------------------
+
+    def get_history_id(self, mailbox: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT history_id FROM sync_state WHERE mailbox = ?", (mailbox,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_history_id(self, mailbox: str, history_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (mailbox, history_id, synced_at) "
+                "VALUES (?, ?, ?)",
+                (mailbox, history_id, _now().isoformat()),
+            )
+
+    # Messages -----------------------------------------------------------
+
+    def get_many(
+        self,
+        mailbox: str,
+        message_ids: Sequence[str],
+        *,
+        format: MessageFormat = "metadata",
+    ) -> Dict[str, EmailMessage]:
+        """Return cached messages that satisfy the requested format."""
+        if not message_ids:
+            return {}
+        rank = _FORMAT_RANK[format]
+        placeholders = ",".join("?" for _ in message_ids)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT message_id, data FROM messages "
+                f"WHERE mailbox = ? AND format_rank >= ? AND message_id IN ({placeholders})",
+                (mailbox, rank, *message_ids),
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    f"UPDATE messages SET last_access = ? "
+                    f"WHERE mailbox = ? AND message_id IN ({','.join('?' for _ in rows)})",
+                    (time.time(), mailbox, *[row[0] for row in rows]),
+                )
+        return {row[0]: _message_from_dict(json.loads(row[1])) for row in rows}
+
+    def put_many(
+        self,
+        mailbox: str,
+        messages: Sequence[EmailMessage],
+        *,
+        format: MessageFormat = "metadata",
+    ) -> None:
+        """Store messages, never downgrading a richer cached format."""
+        if not messages:
+            return
+        rank = _FORMAT_RANK[format]
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO messages "
+                "(mailbox, message_id, format_rank, data, history_id, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (mailbox, message_id) DO UPDATE SET "
+                "format_rank = excluded.format_rank, data = excluded.data, "
+                "history_id = excluded.history_id, last_access = excluded.last_access "
+                "WHERE excluded.format_rank >= messages.format_rank",
+                [
+                    (mailbox, m.id, rank, json.dumps(_message_to_dict(m)), m.history_id, now)
+                    for m in messages
+                ],
+            )
+            self._evict(conn, mailbox)
+
+    def update_labels(self, mailbox: str, message_id: str, labels: List[str]) -> bool:
+        """Apply a label change to a cached message. Returns False if not cached."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM messages WHERE mailbox = ? AND message_id = ?",
+                (mailbox, message_id),
+            ).fetchone()
+            if row is None:
+                return False
+            data = json.loads(row[0])
+            data["labels"] = list(labels)
+            data["is_unread"] = "UNREAD" in labels
+            conn.execute(
+                "UPDATE messages SET data = ? WHERE mailbox = ? AND message_id = ?",
+                (json.dumps(data), mailbox, message_id),
+            )
+        return True
+
+    def delete_many(self, mailbox: str, message_ids: Sequence[str]) -> None:
+        if not message_ids:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM messages WHERE mailbox = ? AND message_id = ?",
+                [(mailbox, message_id) for message_id in message_ids],
+            )
+
+    # Threads ------------------------------------------------------------
+
+    def get_thread(self, mailbox: str, thread_id: str) -> Optional[Dict]:
+        """Return the cached thread record (history_id, message_ids, summary)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT history_id, message_ids, summary, summary_message_ids "
+                "FROM threads WHERE mailbox = ? AND thread_id = ?",
+                (mailbox, thread_id),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE threads SET last_access = ? WHERE mailbox = ? AND thread_id = ?",
+                (time.time(), mailbox, thread_id),
+            )
+        return {
+            "history_id": row[0],
+            "message_ids": json.loads(row[1]),
+            "summary": row[2],
+            "summary_message_ids": json.loads(row[3]),
+        }
+
+    def put_thread(
+        self,
+        mailbox: str,
+        thread_id: str,
+        history_id: str,
+        message_ids: Sequence[str],
+    ) -> None:
+        """Record a thread's current state, keeping any cached summary."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO threads "
+                "(mailbox, thread_id, history_id, message_ids, last_access) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (mailbox, thread_id) DO UPDATE SET "
+                "history_id = excluded.history_id, message_ids = excluded.message_ids, "
+                "last_access = excluded.last_access",
+                (mailbox, thread_id, history_id, json.dumps(list(message_ids)), time.time()),
+            )
+            self._evict_threads(conn, mailbox)
+
+    def set_thread_summary(
+        self,
+        mailbox: str,
+        thread_id: str,
+        summary: str,
+        message_ids: Sequence[str],
+    ) -> None:
+        """Store a thread summary and the message IDs it covers."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE threads SET summary = ?, summary_message_ids = ? "
+                "WHERE mailbox = ? AND thread_id = ?",
+                (summary, json.dumps(list(message_ids)), mailbox, thread_id),
+            )
+
+    def clear(self, mailbox: str) -> None:
+        """Drop all cached messages, threads and sync state for a mailbox."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM messages WHERE mailbox = ?", (mailbox,))
+            conn.execute("DELETE FROM threads WHERE mailbox = ?", (mailbox,))
+            conn.execute("DELETE FROM sync_state WHERE mailbox = ?", (mailbox,))
+
+    def count(self, mailbox: str) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE mailbox = ?", (mailbox,)
+            ).fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, mailbox: str) -> None:
+        """Drop least-recently-used messages beyond max_messages."""
+        conn.execute(
+            "DELETE FROM messages WHERE mailbox = ? AND message_id IN ("
+            "  SELECT message_id FROM messages WHERE mailbox = ? "
+            "  ORDER BY last_access DESC LIMIT -1 OFFSET ?"
+            ")",
+            (mailbox, mailbox, self.max_messages),
+        )
+
+    def _evict_threads(self, conn: sqlite3.Connection, mailbox: str) -> None:
+        """Drop least-recently-used thread records beyond max_messages."""
+        conn.execute(
+            "DELETE FROM threads WHERE mailbox = ? AND thread_id IN ("
+            "  SELECT thread_id FROM threads WHERE mailbox = ? "
+            "  ORDER BY last_access DESC LIMIT -1 OFFSET ?"
+            ")",
+            (mailbox, mailbox, self.max_messages),
+        )
+
+
+_default_cache: Optional[MessageCache] = None
+_default_cache_lock = threading.Lock()
+_sync_locks: Dict[str, threading.Lock] = {}
+
+
+def get_message_cache() -> MessageCache:
+    """Return the process-wide message cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = MessageCache()
+        return _default_cache
+
+
+def _sync_lock(mailbox: str) -> threading.Lock:
+    with _default_cache_lock:
+        return _sync_locks.setdefault(mailbox, threading.Lock())
+
+
+def _mailbox_key(account: GmailAccountConfig) -> str:
+    return account.from_address.lower()
+
+
+# =============================================================================
+# Sync Engine
+# =============================================================================
+
+def sync_history(
+    account: GmailAccountConfig,
+    *,
+    cache: Optional[MessageCache] = None,
+) -> SyncDelta:
+    """Apply Gmail changes since the last sync to the local cache.
+
+    The first call for a mailbox only records the current historyId.
+
+    Args:
+        account: Gmail account configuration.
+        cache: Cache to update (defaults to the process-wide cache).
+
+    Returns:
+        SyncDelta describing the applied changes.
+    """
+    cache = cache or get_message_cache()
+    mailbox = _mailbox_key(account)
+
+    with _sync_lock(mailbox):
+        start_id = cache.get_history_id(mailbox)
+        if not start_id:
+            history_id = get_history_id(account)
+            cache.set_history_id(mailbox, history_id)
+            return SyncDelta(history_id=history_id, reset=True)
+
+        delta = SyncDelta(history_id=start_id)
+        page_token: Optional[str] = None
+        try:
+            while True:
+                records, page_token, latest = list_history(
+                    account, start_id, page_token=page_token
+                )
+                _apply_history(cache, mailbox, records, delta)
+                delta.history_id = latest
+                if not page_token:
+                    break
+        except GmailError as exc:
+            if exc.status_code != 404:
+                raise
+            logger.info(f"[history_sync] historyId {start_id} expired for {mailbox}, resetting cache")
+            cache.clear(mailbox)
+            history_id = get_history_id(account)
+            cache.set_history_id(mailbox, history_id)
+            return SyncDelta(history_id=history_id, reset=True)
+
+        cache.set_history_id(mailbox, delta.history_id)
+        return delta
+
+
+def _apply_history(
+    cache: MessageCache,
+    mailbox: str,
+    records: List[dict],
+    delta: SyncDelta,
+) -> None:
+    deleted: List[str] = []
+    for record in records:
+        for item in record.get("messagesAdded", []):
+            delta.added.append(item["message"]["id"])
+        for item in record.get("messagesDeleted", []):
+            deleted.append(item["message"]["id"])
+        for key in ("labelsAdded", "labelsRemoved"):
+            for item in record.get(key, []):
+                message = item["message"]
+                # history entries carry the message's current label set
+                if "labelIds" in message and cache.update_labels(
+                    mailbox, message["id"], message["labelIds"]
+                ):
+                    delta.relabeled.append(message["id"])
+    if deleted:
+        cache.delete_many(mailbox, deleted)
+        delta.deleted.extend(deleted)
+
+
+def hydrate_cached(
+    account: GmailAccountConfig,
+    message_ids: Sequence[str],
+    *,
+    format: MessageFormat = "metadata",
+    cache: Optional[MessageCache] = None,
+    sync: bool = True,
+) -> HydrationResult:
+    """Hydrate messages from the cache, fetching only the misses from Gmail.
+
+    Args:
+        account: Gmail account configuration.
+        message_ids: Message IDs in the desired output order.
+        format: Minimum format required ('full' entries also serve 'metadata').
+        cache: Cache to use (defaults to the process-wide cache).
+        sync: Apply the history delta before reading (default True).
+
+    Returns:
+        HydrationResult with messages in request order and per-ID failures.
+    """
+    if not _cache_enabled():
+        return hydrate_messages(account, message_ids, format=format)
+
+    cache = cache or get_message_cache()
+    mailbox = _mailbox_key(account)
+
+    if sync:
+        _sync_before_read(account, cache, mailbox)
+
+    cached = cache.get_many(mailbox, message_ids, format=format)
+    misses = [message_id for message_id in message_ids if message_id not in cached]
+
+    fetched = hydrate_messages(account, misses, format=format)
+    cache.put_many(mailbox, fetched.messages, format=format)
+    return _merge_hydrated(message_ids, cached, fetched)
+
+
+async def hydrate_cached_async(
+    account: GmailAccountConfig,
+    message_ids: Sequence[str],
+    *,
+    format: MessageFormat = "metadata",
+    cache: Optional[MessageCache] = None,
+    sync: bool = True,
+) -> HydrationResult:
+    """Async variant of hydrate_cached.
+
+    Cache reads/writes and the history sync run in a worker thread; the
+    misses are fetched on the event loop.
+    """
+    if not _cache_enabled():
+        return await hydrate_messages_async(account, message_ids, format=format)
+
+    cache = cache or get_message_cache()
+    mailbox = _mailbox_key(account)
+
+    if sync:
+        await asyncio.to_thread(_sync_before_read, account, cache, mailbox)
+
+    cached = await asyncio.to_thread(cache.get_many, mailbox, message_ids, format=format)
+    misses = [message_id for message_id in message_ids if message_id not in cached]
+
+    fetched = await hydrate_messages_async(account, misses, format=format)
+    await asyncio.to_thread(cache.put_many, mailbox, fetched.messages, format=format)
+    return _merge_hydrated(message_ids, cached, fetched)
+
+
+def _sync_before_read(account: GmailAccountConfig, cache: MessageCache, mailbox: str) -> None:
+    try:
+        sync_history(account, cache=cache)
+    except GmailError as exc:
+        # Without a delta the cache may be stale; fall back to live fetches
+        logger.warning(f"[history_sync] History sync failed for {mailbox}: {exc}")
+        cache.clear(mailbox)
+
+
+def _merge_hydrated(
+    message_ids: Sequence[str],
+    cached: Dict[str, EmailMessage],
+    fetched: HydrationResult,
+) -> HydrationResult:
+    by_id = dict(cached)
+    by_id.update({msg.id: msg for msg in fetched.messages})
+    return HydrationResult(
+        messages=[by_id[message_id] for message_id in message_ids if message_id in by_id],
+        failures=fetched.failures,
+    )
+
+
+# =============================================================================
+# Thread Cache
+# =============================================================================
+
+def get_thread_cached(
+    account: GmailAccountConfig,
+    thread_id: str,
+    *,
+    cache: Optional[MessageCache] = None,
+) -> ThreadSnapshot:
+    """Get a thread's full messages, downloading only messages not yet cached.
+
+    One minimal threads.get call returns the thread's historyId and message
+    IDs. Cached messages are reused (with their current labels); only new
+    ones are fetched with format=full. The thread's cached summary is
+    returned along with the message IDs it covers, so callers can reuse it
+    when the thread is unchanged or extend it with just the new messages.
+
+    Args:
+        account: Gmail account configuration.
+        thread_id: The thread ID to fetch.
+        cache: Cache to use (defaults to the process-wide cache).
+
+    Returns:
+        ThreadSnapshot with messages in the order Gmail returns them.
+
+    Raises:
+        GmailError: If the thread or any of its messages cannot be fetched.
+    """
+    if not _cache_enabled():
+        messages = get_thread_messages(account, thread_id, format="full")
+        return ThreadSnapshot(thread_id=thread_id, history_id="", messages=messages)
+
+    cache = cache or get_message_cache()
+    mailbox = _mailbox_key(account)
+
+    history_id, refs = get_thread_state(account, thread_id)
+    record = cache.get_thread(mailbox, thread_id)
+    message_ids = [ref["id"] for ref in refs]
+
+    hydrated = hydrate_cached(account, message_ids, format="full", cache=cache, sync=False)
+    if hydrated.failures:
+        message_id, error = next(iter(hydrated.failures.items()))
+        raise GmailError(f"Gmail thread get failed for message {message_id}: {error}")
+
+    # Label changes bump the historyId without adding messages; the minimal
+    # refs carry the current labels, so cached copies never go stale
+    labels = {ref["id"]: ref.get("labelIds", []) for ref in refs}
+    for msg in hydrated.messages:
+        msg.labels = list(labels.get(msg.id, msg.labels))
+        msg.is_unread = "UNREAD" in msg.labels
+
+    unchanged = bool(record) and record["history_id"] == history_id
+    if not unchanged:
+        cache.put_thread(mailbox, thread_id, history_id, message_ids)
+
+    return ThreadSnapshot(
+        thread_id=thread_id,
+        history_id=history_id,
+        messages=hydrated.messages,
+        summary=record["summary"] if record else None,
+        summary_message_ids=record["summary_message_ids"] if record else [],
+        unchanged=unchanged,
+    )
+
+
+def save_thread_summary(
+    account: GmailAccountConfig,
+    thread_id: str,
+    summary: str,
+    message_ids: Sequence[str],
+    *,
+    cache: Optional[MessageCache] = None,
+) -> None:
+    """Cache a thread summary generated from the given messages.
+
+    No-op when the cache is disabled or the thread was never cached.
+    """
+    if not _cache_enabled():
+        return
+    cache = cache or get_message_cache()
+    cache.set_thread_summary(_mailbox_key(account), thread_id, summary, message_ids)
@@ -1,21 +1,98 @@
 """Gmail inbox reading capabilities.
 
 This module provides functions to read and search emails from Gmail accounts
-using the existing OAuth credentials.
+using the existing OAuth credentials. The listing and hydration functions
+behind the inbox endpoints also have ``*_async`` variants for async routes.
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional, Literal, Tuple
-from urllib import request as urlrequest
-from urllib import error as urlerror
+from typing import Any, Dict, List, Optional, Literal, Sequence, Tuple
+from urllib import parse as urlparse
 
-from .gmail import GmailAccountConfig, GmailError, _fetch_access_token
+from ..google_oauth import invalidate_access_token
+from ..http_transport import HTTPStatusError, TransportError, request_json, request_json_async
+from .gmail import GmailAccountConfig, GmailError, _fetch_access_token, _fetch_access_token_async
 
 
 MESSAGES_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages"
+THREADS_URL = "https://gmail.googleapis.com/gmail/v1/users/me/threads"
+PROFILE_URL = "https://gmail.googleapis.com/gmail/v1/users/me/profile"
+HISTORY_URL = "https://gmail.googleapis.com/gmail/v1/users/me/history"
+LABELS_URL = "https://gmail.googleapis.com/gmail/v1/users/me/labels"
+
+
+def _gmail_request(
+    account: GmailAccountConfig,
+    method: str,
+    url: str,
+    *,
+    action: str,
+    body: Optional[dict] = None,
+    timeout: float = 15,
+) -> Dict[str, Any]:
+    """Make an authenticated Gmail API call over the shared HTTP pool.
+
+    Args:
+        account: Gmail account configuration.
+        method: HTTP method.
+        url: Full request URL including query string.
+        action: Short label used in error messages (e.g. "list", "get").
+        body: Optional JSON body.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        Decoded JSON response ({} for empty responses).
+    """
+    access_token = _fetch_access_token(account)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    try:
+        return request_json(method, url, headers=headers, json_body=body, timeout=timeout)
+    except TransportError as exc:
+        raise _gmail_error(account, action, exc) from exc
+
+
+async def _gmail_request_async(
+    account: GmailAccountConfig,
+    method: str,
+    url: str,
+    *,
+    action: str,
+    body: Optional[dict] = None,
+    timeout: float = 15,
+) -> Dict[str, Any]:
+    """Async variant of _gmail_request."""
+    access_token = await _fetch_access_token_async(account)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    try:
+        return await request_json_async(
+            method, url, headers=headers, json_body=body, timeout=timeout
+        )
+    except TransportError as exc:
+        raise _gmail_error(account, action, exc) from exc
+
+
+def _gmail_error(account: GmailAccountConfig, action: str, exc: TransportError) -> GmailError:
+    """Translate a transport failure into a GmailError."""
+    if isinstance(exc, HTTPStatusError):
+        if exc.status_code == 401:
+            invalidate_access_token(account.client_id, account.refresh_token)
+        return GmailError(
+            f"Gmail {action} failed ({exc.status_code}): {exc.detail}",
+            status_code=exc.status_code,
+        )
+    return GmailError(f"Gmail network error: {exc}")
+
+
+def _hydration_workers() -> int:
+    """Max concurrent get_message calls when hydrating a message list."""
+    return max(1, int(os.getenv("DTA_GMAIL_FETCH_WORKERS", "8")))
 
 
 @dataclass(slots=True)
@@ -51,6 +128,7 @@ class EmailMessage:
     cc_address: str = ""
     message_id_header: str = ""  # For In-Reply-To
     references: str = ""  # For References header
+    history_id: str = ""  # Gmail historyId of the last change to this message
     
     @property
     def is_important(self) -> bool:
@@ -88,6 +166,18 @@ class InboxSummary:
     next_page_token: Optional[str] = None  # For pagination
 
 
+@dataclass(slots=True)
+class HydrationResult:
+    """Result of fetching many messages by ID.
+
+    ``messages`` preserves the order of the requested IDs (minus failures).
+    ``failures`` maps each message ID that could not be fetched to its error.
+    """
+
+    messages: List[EmailMessage] = field(default_factory=list)
+    failures: Dict[str, str] = field(default_factory=dict)
+
+
 def list_messages(
     account: GmailAccountConfig,
     *,
@@ -112,35 +202,44 @@ def list_messages(
         messages: List of message dicts with 'id' and 'threadId'.
         next_page_token: Token for next page, or None if no more pages.
     """
-    access_token = _fetch_access_token(account)
+    url = _list_url(max_results, label_ids, query, include_spam_trash, page_token)
+    data = _gmail_request(account, "GET", url, action="list")
+    return data.get("messages", []), data.get("nextPageToken")
+
 
+async def list_messages_async(
+    account: GmailAccountConfig,
+    *,
+    max_results: int = 20,
+    label_ids: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    include_spam_trash: bool = False,
+    page_token: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """Async variant of list_messages."""
+    url = _list_url(max_results, label_ids, query, include_spam_trash, page_token)
+    data = await _gmail_request_async(account, "GET", url, action="list")
+    return data.get("messages", []), data.get("nextPageToken")
+
+
+def _list_url(
+    max_results: int,
+    label_ids: Optional[List[str]],
+    query: Optional[str],
+    include_spam_trash: bool,
+    page_token: Optional[str],
+) -> str:
     params = [f"maxResults={max_results}"]
     if label_ids:
         for label in label_ids:
             params.append(f"labelIds={label}")
     if query:
-        params.append(f"q={urlrequest.quote(query)}")
+        params.append(f"q={urlparse.quote(query)}")
     if include_spam_trash:
         params.append("includeSpamTrash=true")
     if page_token:
         params.append(f"pageToken={page_token}")
-
-    url = f"{MESSAGES_URL}?{'&'.join(params)}"
-    headers = {"Authorization": f"Bearer {access_token}"}
-
-    req = urlrequest.Request(url, headers=headers, method="GET")
-
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            messages = data.get("messages", [])
-            next_token = data.get("nextPageToken")
-            return messages, next_token
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail list failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+    return f"{MESSAGES_URL}?{'&'.join(params)}"
 
 
 def count_messages(
@@ -160,28 +259,15 @@ def count_messages(
     Returns:
         Estimated count of matching messages.
     """
-    access_token = _fetch_access_token(account)
-    
     # Request minimal results, we only need the count estimate
     params = [
         "maxResults=1",
-        f"q={urlrequest.quote(query)}",
+        f"q={urlparse.quote(query)}",
     ]
     
     url = f"{MESSAGES_URL}?{'&'.join(params)}"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    
-    req = urlrequest.Request(url, headers=headers, method="GET")
-    
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            return data.get("resultSizeEstimate", 0)
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail count failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+    data = _gmail_request(account, "GET", url, action="count")
+    return data.get("resultSizeEstimate", 0)
 
 
 def get_label_counts(
@@ -197,27 +283,28 @@ def get_label_counts(
     Returns:
         Dict with 'messagesTotal', 'messagesUnread', 'threadsTotal', 'threadsUnread'.
     """
-    access_token = _fetch_access_token(account)
-    
-    url = f"https://gmail.googleapis.com/gmail/v1/users/me/labels/{label_id}"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    
-    req = urlrequest.Request(url, headers=headers, method="GET")
-    
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            return {
-                "messagesTotal": data.get("messagesTotal", 0),
-                "messagesUnread": data.get("messagesUnread", 0),
-                "threadsTotal": data.get("threadsTotal", 0),
-                "threadsUnread": data.get("threadsUnread", 0),
-            }
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail label info failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+    url = f"{LABELS_URL}/{label_id}"
+    data = _gmail_request(account, "GET", url, action="label info")
+    return _label_counts(data)
+
+
+async def get_label_counts_async(
+    account: GmailAccountConfig,
+    label_id: str,
+) -> dict:
+    """Async variant of get_label_counts."""
+    url = f"{LABELS_URL}/{label_id}"
+    data = await _gmail_request_async(account, "GET", url, action="label info")
+    return _label_counts(data)
+
+
+def _label_counts(data: dict) -> dict:
+    return {
+        "messagesTotal": data.get("messagesTotal", 0),
+        "messagesUnread": data.get("messagesUnread", 0),
+        "threadsTotal": data.get("threadsTotal", 0),
+        "threadsUnread": data.get("threadsUnread", 0),
+    }
 
 
 def get_message(
@@ -238,30 +325,190 @@ def get_message(
         EmailMessage with parsed headers and metadata.
         When format='full', includes body, body_html, and attachments.
     """
-    access_token = _fetch_access_token(account)
-    
+    data = _gmail_request(account, "GET", _message_url(message_id, format), action="get")
+    return _parse_message(data, include_body=(format == "full"))
+
+
+async def get_message_async(
+    account: GmailAccountConfig,
+    message_id: str,
+    *,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+) -> EmailMessage:
+    """Async variant of get_message."""
+    data = await _gmail_request_async(
+        account, "GET", _message_url(message_id, format), action="get"
+    )
+    return _parse_message(data, include_body=(format == "full"))
+
+
+def _message_url(message_id: str, format: str) -> str:
     # Request specific headers we need (for metadata format)
     # For full format, all headers are included automatically
-    url = (
+    return (
         f"{MESSAGES_URL}/{message_id}?format={format}"
         f"&metadataHeaders=Subject&metadataHeaders=From"
         f"&metadataHeaders=To&metadataHeaders=Date"
         f"&metadataHeaders=Cc&metadataHeaders=Message-ID"
         f"&metadataHeaders=References"
     )
-    headers = {"Authorization": f"Bearer {access_token}"}
-    
-    req = urlrequest.Request(url, headers=headers, method="GET")
-    
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            return _parse_message(data, include_body=(format == "full"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail get failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+
+
+def get_thread_messages(
+    account: GmailAccountConfig,
+    thread_id: str,
+    *,
+    format: Literal["minimal", "metadata", "full"] = "full",
+) -> List[EmailMessage]:
+    """Get all messages in a thread, in the order Gmail returns them.
+
+    Args:
+        account: Gmail account configuration.
+        thread_id: The thread ID to fetch.
+        format: Response format - 'minimal', 'metadata', or 'full'.
+
+    Returns:
+        List of EmailMessage objects (with bodies when format='full').
+    """
+    url = f"{THREADS_URL}/{thread_id}?format={format}"
+    data = _gmail_request(account, "GET", url, action="thread get", timeout=30)
+    return [
+        _parse_message(msg_data, include_body=(format == "full"))
+        for msg_data in data.get("messages", [])
+    ]
+
+
+def get_thread_state(
+    account: GmailAccountConfig,
+    thread_id: str,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Get a thread's historyId and message refs without downloading bodies.
+
+    Args:
+        account: Gmail account configuration.
+        thread_id: The thread ID to inspect.
+
+    Returns:
+        Tuple of (thread historyId, list of {"id", "labelIds", ...} refs).
+    """
+    url = f"{THREADS_URL}/{thread_id}?format=minimal"
+    data = _gmail_request(account, "GET", url, action="thread get")
+    return data.get("historyId", ""), data.get("messages", [])
+
+
+def hydrate_messages(
+    account: GmailAccountConfig,
+    message_ids: Sequence[str],
+    *,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+    max_workers: Optional[int] = None,
+) -> HydrationResult:
+    """Fetch many messages concurrently over a bounded worker pool.
+
+    Each message is still a single ``get_message`` call, but up to
+    ``max_workers`` run at once, so a page of N messages costs roughly
+    N / max_workers round trips instead of N.
+
+    Args:
+        account: Gmail account configuration.
+        message_ids: Message IDs to fetch, in the desired output order.
+        format: Response format passed through to get_message.
+        max_workers: Pool size (defaults to DTA_GMAIL_FETCH_WORKERS, 8).
+
+    Returns:
+        HydrationResult with messages in request order and per-ID failures.
+    """
+    result = HydrationResult()
+    if not message_ids:
+        return result
+
+    def fetch(message_id: str) -> Tuple[str, Optional[EmailMessage], Optional[str]]:
+        try:
+            return message_id, get_message(account, message_id, format=format), None
+        except GmailError as exc:
+            return message_id, None, str(exc)
+
+    workers = min(max_workers or _hydration_workers(), len(message_ids))
+    if workers <= 1:
+        outcomes = [fetch(message_id) for message_id in message_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields results in submission order
+            outcomes = list(pool.map(fetch, message_ids))
+    return _hydration_result(outcomes)
+
+
+async def hydrate_messages_async(
+    account: GmailAccountConfig,
+    message_ids: Sequence[str],
+    *,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+    max_workers: Optional[int] = None,
+) -> HydrationResult:
+    """Async variant of hydrate_messages.
+
+    Up to ``max_workers`` get_message calls are in flight at once on the
+    event loop instead of a thread pool.
+    """
+    if not message_ids:
+        return HydrationResult()
+
+    limit = asyncio.Semaphore(max_workers or _hydration_workers())
+
+    async def fetch(message_id: str) -> Tuple[str, Optional[EmailMessage], Optional[str]]:
+        async with limit:
+            try:
+                return message_id, await get_message_async(account, message_id, format=format), None
+            except GmailError as exc:
+                return message_id, None, str(exc)
+
+    # gather() returns results in submission order
+    outcomes = await asyncio.gather(*(fetch(message_id) for message_id in message_ids))
+    return _hydration_result(outcomes)
+
+
+def _hydration_result(
+    outcomes: Sequence[Tuple[str, Optional[EmailMessage], Optional[str]]],
+) -> HydrationResult:
+    result = HydrationResult()
+    for message_id, msg, error in outcomes:
+        if msg is not None:
+            result.messages.append(msg)
+        else:
+            result.failures[message_id] = error or "unknown error"
+    return result
+
+
+def _hydrate(
+    account: GmailAccountConfig,
+    message_ids: List[str],
+    *,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+    use_cache: bool = False,
+) -> List[EmailMessage]:
+    """Hydrate listed IDs, optionally through the local history-synced cache."""
+    if use_cache:
+        # Lazy import: history_sync builds on this module
+        from .history_sync import hydrate_cached
+
+        return hydrate_cached(account, message_ids, format=format).messages
+    # Messages that fail to load are skipped
+    return hydrate_messages(account, message_ids, format=format).messages
+
+
+async def _hydrate_async(
+    account: GmailAccountConfig,
+    message_ids: List[str],
+    *,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+    use_cache: bool = False,
+) -> List[EmailMessage]:
+    """Async variant of _hydrate."""
+    if use_cache:
+        from .history_sync import hydrate_cached_async
+
+        return (await hydrate_cached_async(account, message_ids, format=format)).messages
+    return (await hydrate_messages_async(account, message_ids, format=format)).messages
 
 
 def get_unread_messages(
@@ -269,6 +516,7 @@ def get_unread_messages(
     *,
     max_results: int = 20,
     from_filter: Optional[str] = None,
+    use_cache: bool = False,
 ) -> List[EmailMessage]:
     """Get unread messages from inbox.
 
@@ -276,31 +524,46 @@ def get_unread_messages(
         account: Gmail account configuration.
         max_results: Maximum number of messages.
         from_filter: Optional filter for sender (e.g., "@company.com").
+        use_cache: Serve messages from the local history-synced cache.
 
     Returns:
         List of unread EmailMessage objects.
     """
-    query = "is:unread"
-    if from_filter:
-        query += f" from:{from_filter}"
-
     message_refs, _ = list_messages(
         account,
         max_results=max_results,
         label_ids=["INBOX"],
-        query=query,
+        query=_unread_query(from_filter),
     )
 
-    messages = []
-    for ref in message_refs:
-        try:
-            msg = get_message(account, ref["id"])
-            messages.append(msg)
-        except GmailError:
-            # Skip messages that fail to load
-            continue
+    return _hydrate(account, [ref["id"] for ref in message_refs], use_cache=use_cache)
 
-    return messages
+
+async def get_unread_messages_async(
+    account: GmailAccountConfig,
+    *,
+    max_results: int = 20,
+    from_filter: Optional[str] = None,
+    use_cache: bool = False,
+) -> List[EmailMessage]:
+    """Async variant of get_unread_messages."""
+    message_refs, _ = await list_messages_async(
+        account,
+        max_results=max_results,
+        label_ids=["INBOX"],
+        query=_unread_query(from_filter),
+    )
+
+    return await _hydrate_async(
+        account, [ref["id"] for ref in message_refs], use_cache=use_cache
+    )
+
+
+def _unread_query(from_filter: Optional[str]) -> str:
+    query = "is:unread"
+    if from_filter:
+        query += f" from:{from_filter}"
+    return query
 
 
 def get_inbox_summary(
@@ -309,6 +572,7 @@ def get_inbox_summary(
     vip_senders: Optional[List[str]] = None,
     max_recent: int = 10,
     page_token: Optional[str] = None,
+    use_cache: bool = False,
 ) -> InboxSummary:
     """Get a summary of the inbox state with pagination support.
 
@@ -317,30 +581,63 @@ def get_inbox_summary(
         vip_senders: List of important sender patterns (e.g., ["boss@", "@company.com"]).
         max_recent: Number of recent messages to include per page.
         page_token: Token for fetching next page of results.
+        use_cache: Serve messages from the local history-synced cache.
 
     Returns:
         InboxSummary with counts, recent/VIP messages, and next_page_token.
     """
-    vip_senders = vip_senders or []
-
     # Get exact counts from Gmail Labels API
     inbox_counts = get_label_counts(account, "INBOX")
     important_counts = get_label_counts(account, "IMPORTANT")
 
-    total_unread = inbox_counts["messagesUnread"]
-    unread_important = important_counts["messagesUnread"]
-
     # Get recent messages with full details (with pagination)
     recent_refs, next_page_token = list_messages(
         account, max_results=max_recent, label_ids=["INBOX"], page_token=page_token
     )
-    recent_messages = []
-    for ref in recent_refs:
-        try:
-            msg = get_message(account, ref["id"])
-            recent_messages.append(msg)
-        except GmailError:
-            continue
+    recent_messages = _hydrate(
+        account, [ref["id"] for ref in recent_refs], use_cache=use_cache
+    )
+
+    return _inbox_summary(
+        inbox_counts, important_counts, recent_messages, next_page_token, vip_senders
+    )
+
+
+async def get_inbox_summary_async(
+    account: GmailAccountConfig,
+    *,
+    vip_senders: Optional[List[str]] = None,
+    max_recent: int = 10,
+    page_token: Optional[str] = None,
+    use_cache: bool = False,
+) -> InboxSummary:
+    """Async variant of get_inbox_summary; the three listing calls run concurrently."""
+    inbox_counts, important_counts, (recent_refs, next_page_token) = await asyncio.gather(
+        get_label_counts_async(account, "INBOX"),
+        get_label_counts_async(account, "IMPORTANT"),
+        list_messages_async(
+            account, max_results=max_recent, label_ids=["INBOX"], page_token=page_token
+        ),
+    )
+    recent_messages = await _hydrate_async(
+        account, [ref["id"] for ref in recent_refs], use_cache=use_cache
+    )
+
+    return _inbox_summary(
+        inbox_counts, important_counts, recent_messages, next_page_token, vip_senders
+    )
+
+
+def _inbox_summary(
+    inbox_counts: dict,
+    important_counts: dict,
+    recent_messages: List[EmailMessage],
+    next_page_token: Optional[str],
+    vip_senders: Optional[List[str]],
+) -> InboxSummary:
+    vip_senders = vip_senders or []
+    total_unread = inbox_counts["messagesUnread"]
+    unread_important = important_counts["messagesUnread"]
 
     # Filter VIP messages
     vip_messages = []
@@ -372,6 +669,7 @@ def search_messages(
     *,
     max_results: int = 20,
     format: Literal["minimal", "metadata", "full"] = "metadata",
+    use_cache: bool = False,
 ) -> List[EmailMessage]:
     """Search messages using Gmail query syntax.
 
@@ -380,6 +678,7 @@ def search_messages(
         query: Gmail search query (e.g., "subject:urgent after:2025/01/01").
         max_results: Maximum results to return.
         format: Response format - 'metadata' (default) or 'full' for body content.
+        use_cache: Serve messages from the local history-synced cache.
 
     Returns:
         List of matching EmailMessage objects.
@@ -392,15 +691,82 @@ def search_messages(
     """
     message_refs, _ = list_messages(account, max_results=max_results, query=query)
 
-    messages = []
-    for ref in message_refs:
-        try:
-            msg = get_message(account, ref["id"], format=format)
-            messages.append(msg)
-        except GmailError:
-            continue
+    return _hydrate(
+        account, [ref["id"] for ref in message_refs], format=format, use_cache=use_cache
+    )
+
+
+async def search_messages_async(
+    account: GmailAccountConfig,
+    query: str,
+    *,
+    max_results: int = 20,
+    format: Literal["minimal", "metadata", "full"] = "metadata",
+    use_cache: bool = False,
+) -> List[EmailMessage]:
+    """Async variant of search_messages."""
+    message_refs, _ = await list_messages_async(account, max_results=max_results, query=query)
+
+    return await _hydrate_async(
+        account, [ref["id"] for ref in message_refs], format=format, use_cache=use_cache
+    )
+
+
+def get_history_id(account: GmailAccountConfig) -> str:
+    """Get the mailbox's current historyId from the Gmail profile.
+
+    Args:
+        account: Gmail account configuration.
+
+    Returns:
+        The current historyId, used as the starting point for list_history.
+    """
+    data = _gmail_request(account, "GET", PROFILE_URL, action="profile")
+    return str(data.get("historyId", ""))
+
+
+def list_history(
+    account: GmailAccountConfig,
+    start_history_id: str,
+    *,
+    page_token: Optional[str] = None,
+    max_results: int = 500,
+) -> Tuple[List[dict], Optional[str], str]:
+    """List mailbox changes since a historyId (users.history.list).
 
-    return messages
+    Only message additions, deletions and label changes are requested.
+
+    Args:
+        account: Gmail account configuration.
+        start_history_id: Return changes after this historyId.
+        page_token: Token for fetching the next page of results.
+        max_results: Maximum history records per page.
+
+    Returns:
+        Tuple of (history_records, next_page_token, latest_history_id).
+
+    Raises:
+        GmailError: On failure. A status_code of 404 means start_history_id is
+            too old and the caller must fall back to a full resync.
+    """
+    params = [
+        f"startHistoryId={start_history_id}",
+        f"maxResults={max_results}",
+        "historyTypes=messageAdded",
+        "historyTypes=messageDeleted",
+        "historyTypes=labelAdded",
+        "historyTypes=labelRemoved",
+    ]
+    if page_token:
+        params.append(f"pageToken={page_token}")
+
+    url = f"{HISTORY_URL}?{'&'.join(params)}"
+    data = _gmail_request(account, "GET", url, action="history")
+    return (
+        data.get("history", []),
+        data.get("nextPageToken"),
+        str(data.get("historyId", start_history_id)),
+    )
 
 
 def _parse_message(data: dict, include_body: bool = False) -> EmailMessage:
@@ -462,6 +828,7 @@ def _parse_message(data: dict, include_body: bool = False) -> EmailMessage:
         cc_address=get_header("Cc"),
         message_id_header=get_header("Message-ID"),
         references=get_header("References"),
+        history_id=str(data.get("historyId", "")),
     )
 
 
@@ -599,13 +966,7 @@ def modify_message_labels(
     Returns:
         Updated message data.
     """
-    access_token = _fetch_access_token(account)
-    
     url = f"{MESSAGES_URL}/{message_id}/modify"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-    }
     
     body = {}
     if add_labels:
@@ -613,21 +974,7 @@ def modify_message_labels(
     if remove_labels:
         body["removeLabelIds"] = remove_labels
     
-    req = urlrequest.Request(
-        url,
-        data=json.dumps(body).encode("utf-8"),
-        headers=headers,
-        method="POST",
-    )
-    
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail modify failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+    return _gmail_request(account, "POST", url, action="modify", body=body)
 
 
 def archive_message(account: GmailAccountConfig, message_id: str) -> dict:
@@ -657,21 +1004,8 @@ def delete_message(account: GmailAccountConfig, message_id: str) -> dict:
     Returns:
         Updated message data.
     """
-    access_token = _fetch_access_token(account)
-    
     url = f"{MESSAGES_URL}/{message_id}/trash"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    
-    req = urlrequest.Request(url, headers=headers, method="POST")
-    
-    try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail trash failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+    return _gmail_request(account, "POST", url, action="trash")
 
 
 def star_message(account: GmailAccountConfig, message_id: str, starred: bool = True) -> dict:
@@ -777,43 +1111,128 @@ class GmailLabel:
 def list_labels(account: GmailAccountConfig) -> List[GmailLabel]:
     """List all Gmail labels for the account.
     
+    Always calls the Gmail API; use get_label_catalog() for cached lookups.
+    
     Args:
         account: Gmail account configuration.
         
     Returns:
         List of GmailLabel objects including both system and user labels.
     """
-    access_token = _fetch_access_token(account)
-    
-    url = "https://gmail.googleapis.com/gmail/v1/users/me/labels"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    
-    req = urlrequest.Request(url, headers=headers, method="GET")
-    
+    data = _gmail_request(account, "GET", LABELS_URL, action="labels list")
+
+    labels = []
+    for label_data in data.get("labels", []):
+        labels.append(_parse_label(label_data))
+    return labels
+
+
+def _parse_label(label_data: dict) -> GmailLabel:
+    label_type = label_data.get("type", "user").lower()
+    color = None
+    if "color" in label_data:
+        color = label_data["color"].get("backgroundColor")
+
+    return GmailLabel(
+        id=label_data["id"],
+        name=label_data["name"],
+        label_type=label_type,
+        messages_total=label_data.get("messagesTotal", 0),
+        messages_unread=label_data.get("messagesUnread", 0),
+        color=color,
+    )
+
+
+def _label_cache_ttl_seconds() -> float:
+    """How long a label catalogue is served before re-listing labels."""
     try:
-        with urlrequest.urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            labels = []
-            for label_data in data.get("labels", []):
-                label_type = label_data.get("type", "user").lower()
-                color = None
-                if "color" in label_data:
-                    color = label_data["color"].get("backgroundColor")
-                
-                labels.append(GmailLabel(
-                    id=label_data["id"],
-                    name=label_data["name"],
-                    label_type=label_type,
-                    messages_total=label_data.get("messagesTotal", 0),
-                    messages_unread=label_data.get("messagesUnread", 0),
-                    color=color,
-                ))
-            return labels
-    except urlerror.HTTPError as exc:
-        detail = exc.read().decode("utf-8", errors="ignore")
-        raise GmailError(f"Gmail labels list failed ({exc.code}): {detail}") from exc
-    except urlerror.URLError as exc:
-        raise GmailError(f"Gmail network error: {exc}") from exc
+        return float(os.getenv("DTA_GMAIL_LABEL_TTL", "300"))
+    except ValueError:
+        return 300.0
+
+
+@dataclass(slots=True)
+class LabelCatalog:
+    """An account's labels indexed for O(1) lookup by ID and by name."""
+
+    labels: List[GmailLabel]
+    by_id: Dict[str, GmailLabel]
+    by_name: Dict[str, GmailLabel]  # Keyed by lower-cased label name
+    fetched_at: float  # time.monotonic() when the labels were listed
+
+    @classmethod
+    def build(cls, labels: List[GmailLabel]) -> "LabelCatalog":
+        return cls(
+            labels=labels,
+            by_id={label.id: label for label in labels},
+            by_name={label.name.lower(): label for label in labels},
+            fetched_at=time.monotonic(),
+        )
+
+    def find(self, label_name: str) -> Optional[GmailLabel]:
+        """Find a label by name (case-insensitive)."""
+        return self.by_name.get(label_name.lower())
+
+    def name_for(self, label_id: str) -> str:
+        """Resolve a label ID to its name (the ID itself if unknown)."""
+        label = self.by_id.get(label_id)
+        return label.name if label else label_id
+
+    def names_for(self, label_ids: Sequence[str]) -> List[str]:
+        """Resolve label IDs (e.g. EmailMessage.labels) to names."""
+        return [self.name_for(label_id) for label_id in label_ids]
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.fetched_at < _label_cache_ttl_seconds()
+
+
+_label_catalogs: Dict[str, LabelCatalog] = {}
+_label_catalog_lock = threading.Lock()
+
+
+def _label_catalog_key(account: GmailAccountConfig) -> str:
+    return f"{account.name}:{account.from_address.lower()}"
+
+
+def get_label_catalog(
+    account: GmailAccountConfig,
+    *,
+    refresh: bool = False,
+) -> LabelCatalog:
+    """Return the account's label catalogue, listing labels at most once per TTL.
+
+    The catalogue is shared by every endpoint in the process and expires
+    after DTA_GMAIL_LABEL_TTL seconds (default 300); invalidate_label_catalog
+    drops it immediately.
+
+    Args:
+        account: Gmail account configuration.
+        refresh: Ignore any cached catalogue and re-list labels.
+
+    Returns:
+        LabelCatalog for the account.
+    """
+    key = _label_catalog_key(account)
+    catalog = _label_catalogs.get(key)
+    if catalog and not refresh and catalog.is_fresh():
+        return catalog
+
+    with _label_catalog_lock:
+        # Another thread may have refreshed while we waited
+        current = _label_catalogs.get(key)
+        if current and current is not catalog and current.is_fresh():
+            return current
+        catalog = LabelCatalog.build(list_labels(account))
+        _label_catalogs[key] = catalog
+        return catalog
+
+
+def invalidate_label_catalog(account: Optional[GmailAccountConfig] = None) -> None:
+    """Drop the cached label catalogue for an account (or all accounts)."""
+    if account is None:
+        _label_catalogs.clear()
+    else:
+        _label_catalogs.pop(_label_catalog_key(account), None)
 
 
 def get_label_by_name(
@@ -822,6 +1241,9 @@ def get_label_by_name(
 ) -> Optional[GmailLabel]:
     """Find a label by name (case-insensitive).
     
+    Served from the label catalogue. A miss against a cached catalogue
+    re-lists labels once in case the label was created outside DATA.
+    
     Args:
         account: Gmail account configuration.
         label_name: The label name to find.
@@ -829,12 +1251,12 @@ def get_label_by_name(
     Returns:
         GmailLabel if found, None otherwise.
     """
-    labels = list_labels(account)
-    label_name_lower = label_name.lower()
-    for label in labels:
-        if label.name.lower() == label_name_lower:
-            return label
-    return None
+    cached = _label_catalogs.get(_label_catalog_key(account))
+    catalog = get_label_catalog(account)
+    label = catalog.find(label_name)
+    if label is None and catalog is cached:
+        label = get_label_catalog(account, refresh=True).find(label_name)
+    return label
 
 
 def apply_label(
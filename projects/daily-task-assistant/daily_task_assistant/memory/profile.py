@@ -532,8 +532,7 @@ def get_rejection_candidates(
     """
     from ..email.suggestion_store import (
         _force_file_fallback as _suggestion_force_file,
-        _suggestion_dir,
-        SuggestionRecord,
+        _local_store as _suggestion_local_store,
         _now,
     )
     from datetime import timedelta
@@ -577,22 +576,14 @@ def get_rejection_candidates(
             # Fall back to file-based storage
             pass
 
-    # File-based: read suggestions from both accounts (if Firestore wasn't used)
+    # Local storage: recent rejections from both accounts (if Firestore wasn't used)
     if not used_firestore:
+        store = _suggestion_local_store()
         for account in accounts:
-            store_dir = _suggestion_dir() / account
-            if store_dir.exists():
-                for file_path in store_dir.glob("*.json"):
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    record = SuggestionRecord.from_dict(data)
-
-                    # Only count recent rejections
-                    if record.status == "rejected" and record.created_at >= cutoff:
-                        # Use rationale as the pattern identifier
-                        pattern_key = record.rationale.lower()[:50]
-                        rejections[account][pattern_key] += 1
+            for data in store.query(account, status="rejected", created_after=cutoff):
+                # Use rationale as the pattern identifier
+                pattern_key = data.get("rationale", "").lower()[:50]
+                rejections[account][pattern_key] += 1
 
     # Build candidate list
     candidates = {
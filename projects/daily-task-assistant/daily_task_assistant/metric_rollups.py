@@ -0,0 +1,350 @@
+"""Per-day metric counters maintained alongside record writes.
+
+Trust and quality stats count the records created in a window by status,
+analysis method, action and so on. Instead of loading every record in the
+window, each store describes a record as a list of counter keys
+("status:approved", "method:haiku", "method_approved:haiku", ...). Whenever a
+record is written, the keys it loses are decremented and the keys it gains
+incremented on the counters for the day the record was created, so reading a
+30-day window touches 31 small counter documents however many records exist.
+
+Firestore Structure:
+    email_accounts/{account}/metric_rollups/{store}_{YYYY-MM-DD} -> {store, day, counts}
+    email_accounts/{account}/metric_rollups/{store}_state -> {rebuilt_at}
+
+In file mode the counters live next to the records (see LocalStore.read_rollups).
+
+Counters describe records as they were created and decided: purging expired
+records does not decrement them. The first read for an account without
+counters rebuilds them from the stored records, and so does the next read
+after a counter write fails.
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .firestore import BatchWriter, BatchWriteResult
+
+
+logger = logging.getLogger(__name__)
+
+Document = Dict[str, Any]
+
+# Record dict -> counter keys
+RollupKeys = Callable[[Document], List[str]]
+
+# Day ("YYYY-MM-DD") -> counter key -> delta
+RollupDeltas = Dict[str, Dict[str, int]]
+
+
+def record_day(data: Optional[Document]) -> Optional[str]:
+    """Return the UTC creation day of a record dict, or None if unknown."""
+    value = (data or {}).get("created_at")
+    if not value:
+        return None
+    try:
+        created = datetime.fromisoformat(value) if isinstance(value, str) else value
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return created.astimezone(timezone.utc).date().isoformat()
+
+
+def window_start(days: int) -> str:
+    """Return the first day included in a window of the last ``days`` days."""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).date().isoformat()
+
+
+def window_days(days: int) -> List[str]:
+    """Return every day in a window of the last ``days`` days, oldest first."""
+    today = datetime.now(timezone.utc).date()
+    return [(today - timedelta(days=offset)).isoformat() for offset in range(days, -1, -1)]
+
+
+def rollup_deltas(
+    keys: RollupKeys,
+    before: Optional[Document],
+    after: Optional[Document],
+) -> RollupDeltas:
+    """Return the counter changes for replacing ``before`` with ``after``.
+
+    Args:
+        keys: The store's record -> counter keys function
+        before: Stored version of the record (None when new)
+        after: Version being written (None when deleted)
+
+    Returns:
+        Non-zero deltas grouped by the records' creation day
+    """
+    deltas: RollupDeltas = {}
+    for data, sign in ((before, -1), (after, 1)):
+        day = record_day(data)
+        if day is None:
+            continue
+        counts = deltas.setdefault(day, {})
+        for key in keys(data):
+            counts[key] = counts.get(key, 0) + sign
+    return {
+        day: {key: n for key, n in counts.items() if n}
+        for day, counts in deltas.items()
+        if any(counts.values())
+    }
+
+
+def merge_deltas(total: RollupDeltas, deltas: RollupDeltas) -> RollupDeltas:
+    """Add ``deltas`` into ``total`` in place and return it."""
+    for day, counts in deltas.items():
+        day_total = total.setdefault(day, {})
+        for key, n in counts.items():
+            day_total[key] = day_total.get(key, 0) + n
+    return total
+
+
+def count_records(keys: RollupKeys, records: Iterable[Document]) -> RollupDeltas:
+    """Return absolute per-day counters for a set of records."""
+    total: RollupDeltas = {}
+    for data in records:
+        merge_deltas(total, rollup_deltas(keys, None, data))
+    return total
+
+
+# =============================================================================
+# Firestore
+# =============================================================================
+
+def _rollups_collection(db: Any, account: str) -> Any:
+    return db.collection("email_accounts").document(account).collection("metric_rollups")
+
+
+def _run_transaction(db: Any, fn: Callable[[Any], None]) -> None:
+    """Run ``fn(transaction)`` in a Firestore transaction, retrying on contention."""
+    from firebase_admin import firestore as fb_firestore
+
+    fb_firestore.transactional(fn)(db.transaction())
+
+
+def _increments(store: str, day: str, counts: Dict[str, int]) -> Document:
+    from firebase_admin import firestore as fb_firestore
+
+    return {
+        "store": store,
+        "day": day,
+        "counts": {key: fb_firestore.Increment(n) for key, n in counts.items()},
+    }
+
+
+def save_with_rollups(
+    db: Any,
+    doc_ref: Any,
+    data: Document,
+    *,
+    account: str,
+    store: str,
+    keys: RollupKeys,
+) -> None:
+    """Write one record and apply its counter changes in a single transaction.
+
+    Args:
+        db: Firestore client
+        doc_ref: Record document reference
+        data: Record dict to write
+        account: Email account
+        store: Rollup namespace (the record collection name)
+        keys: The store's record -> counter keys function
+    """
+    rollups = _rollups_collection(db, account)
+
+    def write(transaction: Any) -> None:
+        snapshot = doc_ref.get(transaction=transaction)
+        previous = snapshot.to_dict() if snapshot.exists else None
+        transaction.set(doc_ref, data)
+        for day, counts in rollup_deltas(keys, previous, data).items():
+            transaction.set(
+                rollups.document(f"{store}_{day}"),
+                _increments(store, day, counts),
+                merge=True,
+            )
+
+    _run_transaction(db, write)
+
+
+def queue_rollups(
+    writer: BatchWriter,
+    db: Any,
+    account: str,
+    store: str,
+    deltas: RollupDeltas,
+) -> None:
+    """Queue counter increments on a BatchWriter."""
+    rollups = _rollups_collection(db, account)
+    for day, counts in deltas.items():
+        if counts:
+            writer.set(
+                rollups.document(f"{store}_{day}"),
+                _increments(store, day, counts),
+                merge=True,
+            )
+
+
+def invalidate_rollups(db: Any, account: str, store: str) -> None:
+    """Drop a store's rebuilt marker so the next read rebuilds its counters."""
+    try:
+        _rollups_collection(db, account).document(f"{store}_state").delete()
+    except Exception as exc:
+        logger.error(f"[rollups] Could not invalidate {store} counters for {account}: {exc}")
+
+
+def commit_with_rollups(writer: BatchWriter, db: Any, account: str, store: str) -> BatchWriteResult:
+    """Commit a BatchWriter holding counter increments, invalidating them on failure.
+
+    BatchWriter already retries a failed batch one write at a time. An
+    increment that still fails is not retried again: its first attempt may
+    have been applied, so the counters are rebuilt on the next read instead.
+    """
+    result = writer.commit()
+    failed = [path for path in result.failures if "/metric_rollups/" in path]
+    if failed:
+        logger.warning(
+            f"[rollups] {len(failed)} {store} counter writes failed for {account}; "
+            "counters will be rebuilt on the next read"
+        )
+        invalidate_rollups(db, account, store)
+    return result
+
+
+def save_many_with_rollups(
+    db: Any,
+    collection_ref: Any,
+    docs: Dict[str, Document],
+    *,
+    account: str,
+    store: str,
+    keys: RollupKeys,
+) -> Set[str]:
+    """Write many records in batches and apply their counter changes.
+
+    Stored versions are fetched in one get_all() call. Counter increments are
+    committed after the records, for the records that were written.
+
+    Returns:
+        IDs of the records that could not be written
+    """
+    refs = {doc_id: collection_ref.document(doc_id) for doc_id in docs}
+    previous = {
+        snapshot.id: snapshot.to_dict()
+        for snapshot in db.get_all(list(refs.values()))
+        if snapshot.exists
+    }
+
+    writer = BatchWriter(db)
+    for doc_id, data in docs.items():
+        writer.set(refs[doc_id], data)
+    result = writer.commit()
+    failed = {path.rsplit("/", 1)[-1] for path in result.failures}
+
+    deltas: RollupDeltas = {}
+    for doc_id, data in docs.items():
+        if doc_id not in failed:
+            merge_deltas(deltas, rollup_deltas(keys, previous.get(doc_id), data))
+    queue_rollups(writer, db, account, store, deltas)
+    commit_with_rollups(writer, db, account, store)
+    return failed
+
+
+def read_rollups_firestore(
+    db: Any,
+    collection_ref: Any,
+    *,
+    account: str,
+    store: str,
+    keys: RollupKeys,
+    days: int,
+) -> Dict[str, int]:
+    """Sum the counters for the last ``days`` days.
+
+    Args:
+        db: Firestore client
+        collection_ref: Record collection, scanned if counters need rebuilding
+        account: Email account
+        store: Rollup namespace
+        keys: The store's record -> counter keys function
+        days: Window length
+
+    Returns:
+        Counter key -> count over the window
+    """
+    rollups = _rollups_collection(db, account)
+    state_id = f"{store}_state"
+    day_ids = {f"{store}_{day}": day for day in window_days(days)}
+    refs = [rollups.document(state_id)] + [rollups.document(doc_id) for doc_id in day_ids]
+
+    by_day: Dict[str, Dict[str, int]] = {}
+    built = False
+    for snapshot in db.get_all(refs):
+        if not snapshot.exists:
+            continue
+        if snapshot.id == state_id:
+            built = True
+        elif snapshot.id in day_ids:
+            by_day[day_ids[snapshot.id]] = snapshot.to_dict().get("counts", {})
+    if not built:
+        by_day = rebuild_rollups_firestore(
+            db, collection_ref, account=account, store=store, keys=keys
+        )
+
+    first_day = window_start(days)
+    total: Counter = Counter()
+    for day, counts in by_day.items():
+        if day >= first_day:
+            total.update(counts)
+    return dict(total)
+
+
+def rebuild_rollups_firestore(
+    db: Any,
+    collection_ref: Any,
+    *,
+    account: str,
+    store: str,
+    keys: RollupKeys,
+) -> RollupDeltas:
+    """Recompute a store's counters from its records and replace the stored ones.
+
+    Writes landing while the rebuild runs may be counted twice or not at
+    all; this backfills counters once and is not meant for routine use.
+    The rebuilt marker is only written once every counter write succeeded,
+    so a partial rebuild is redone on the next read.
+
+    Returns:
+        The rebuilt per-day counters
+    """
+    rollups = _rollups_collection(db, account)
+    by_day = count_records(keys, (doc.to_dict() for doc in collection_ref.stream()))
+
+    writer = BatchWriter(db)
+    for doc in rollups.where("store", "==", store).stream():
+        if doc.id not in (f"{store}_{day}" for day in by_day):
+            writer.delete(doc.reference)
+    for day, counts in by_day.items():
+        writer.set(
+            rollups.document(f"{store}_{day}"),
+            {"store": store, "day": day, "counts": counts},
+        )
+    result = writer.commit()
+    if result.failures:
+        logger.warning(
+            f"[rollups] Rebuilding {store} counters for {account} failed for "
+            f"{len(result.failures)} documents; will retry on the next read"
+        )
+        return by_day
+
+    writer.set(
+        rollups.document(f"{store}_state"),
+        {"rebuilt_at": datetime.now(timezone.utc).isoformat()},
+    )
+    writer.commit()
+    return by_day
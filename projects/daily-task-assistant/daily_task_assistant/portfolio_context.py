@@ -64,6 +64,8 @@ class PortfolioContext:
     domain_breakdown: Dict[str, int] = field(default_factory=dict)
     conflicts: List[str] = field(default_factory=list)
     task_summaries: List[Dict[str, Any]] = field(default_factory=list)
+    # Per-sheet fetch/parse timings (ms) from SmartsheetClient.source_timings
+    source_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     
     # Phase 2 hooks - David Profile integration
     user_profile: Optional[Dict[str, Any]] = None
@@ -109,7 +111,9 @@ def build_portfolio_context(
         open_tasks = [t for t in open_tasks if _is_church_task(t)]
     
     # Build aggregations
-    return _aggregate_portfolio(perspective, open_tasks)
+    portfolio = _aggregate_portfolio(perspective, open_tasks)
+    portfolio.source_timings = dict(client.source_timings)
+    return portfolio
 
 
 def _is_task_open(task: TaskDetail) -> bool:
@@ -15,14 +15,13 @@ Sheet Structure:
 """
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import List, Optional, Literal
-from urllib import request as urlrequest
-from urllib import error as urlerror
-from urllib import parse as urlparse
+from typing import List, Optional, Literal, Tuple
+
+from ..google_oauth import get_cached_access_token, invalidate_access_token
+from ..http_transport import HTTPStatusError, TransportError, request_json
 
 
 # Gmail_Filter_Index sheet ID
@@ -197,36 +196,36 @@ class FilterRulesManager:
         )
     
     def _get_access_token(self) -> str:
+        """Return a process-wide cached access token for these credentials."""
+        token = get_cached_access_token(
+            self._client_id,
+            self._refresh_token,
+            self._request_access_token,
+        )
+        self._access_token = token
+        return token
+
+    def _request_access_token(self) -> Tuple[str, int]:
         """Fetch a fresh access token using the refresh token."""
-        payload = urlparse.urlencode({
+        payload = {
             "client_id": self._client_id,
             "client_secret": self._client_secret,
             "refresh_token": self._refresh_token,
             "grant_type": "refresh_token",
-        }).encode("utf-8")
-        
-        req = urlrequest.Request(
-            TOKEN_URL,
-            data=payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            method="POST",
-        )
+        }
         
         try:
-            with urlrequest.urlopen(req, timeout=15) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-        except urlerror.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="ignore")
-            raise SheetsError(f"Token request failed ({exc.code}): {detail}") from exc
-        except urlerror.URLError as exc:
+            data = request_json("POST", TOKEN_URL, data=payload, timeout=15)
+        except HTTPStatusError as exc:
+            raise SheetsError(f"Token request failed ({exc.status_code}): {exc.detail}") from exc
+        except TransportError as exc:
             raise SheetsError(f"Network error: {exc}") from exc
         
         token = data.get("access_token")
         if not token:
             raise SheetsError("Token response missing access_token.")
         
-        self._access_token = token
-        return token
+        return str(token), int(data.get("expires_in") or 0)
     
     def _request(
         self,
@@ -238,21 +237,15 @@ class FilterRulesManager:
         token = self._get_access_token()
         
         url = f"{SHEETS_API_BASE}/{self._sheet_id}/{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-        
-        data = json.dumps(body).encode("utf-8") if body else None
-        req = urlrequest.Request(url, data=data, headers=headers, method=method)
+        headers = {"Authorization": f"Bearer {token}"}
         
         try:
-            with urlrequest.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
-        except urlerror.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="ignore")
-            raise SheetsError(f"Sheets API error ({exc.code}): {detail}") from exc
-        except urlerror.URLError as exc:
+            return request_json(method, url, headers=headers, json_body=body or None, timeout=30)
+        except HTTPStatusError as exc:
+            if exc.status_code == 401:
+                invalidate_access_token(self._client_id, self._refresh_token)
+            raise SheetsError(f"Sheets API error ({exc.status_code}): {exc.detail}") from exc
+        except TransportError as exc:
             raise SheetsError(f"Network error: {exc}") from exc
     
     def get_all_rules(self) -> List[FilterRule]:
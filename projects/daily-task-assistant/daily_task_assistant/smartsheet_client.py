@@ -1,15 +1,19 @@
 """Smartsheet connector scaffolding for the Daily Task Assistant."""
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
-from urllib import error as urlerror
-from urllib import parse as urlparse
-from urllib import request as urlrequest
 
 from .config import Settings
+from .http_transport import HTTPStatusError, TransportError, request_json, request_json_async
 from .tasks import AttachmentDetail, AttachmentInfo, TaskDetail, fetch_stubbed_tasks
 
 try:  # Optional dependency
@@ -26,7 +30,15 @@ class SchemaError(RuntimeError):
 
 
 class SmartsheetAPIError(RuntimeError):
-    """Raised when Smartsheet returns an error response."""
+    """Raised when Smartsheet returns an error response.
+
+    Attributes:
+        status_code: HTTP status of the failed request, if any
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 @dataclass(slots=True)
@@ -78,6 +90,172 @@ class MultiSheetConfig:
         return self.sheets.get("personal")
 
 
+@dataclass(slots=True)
+class SheetSnapshot:
+    """Parsed copy of one sheet, shared by every client in the process."""
+
+    sheet_id: str
+    source_key: str
+    version: Optional[int]
+    rows: Dict[str, Dict[str, Any]]  # row_id -> raw row, in sheet order
+    details: List[TaskDetail]
+    index: Dict[str, TaskDetail]  # row_id -> parsed task
+    errors: List[str]
+    fetched_at: datetime  # UTC time the rows were read (for rowsModifiedSince)
+    checked_at: float  # time.monotonic() of the last version check
+    parse_ms: float = 0.0  # Time spent turning rows into TaskDetail
+
+
+@dataclass(slots=True)
+class SourceFetch:
+    """Outcome of loading one source sheet in list_tasks."""
+
+    source_key: str
+    snapshot: Optional[SheetSnapshot] = None
+    error: Optional[str] = None
+    fetch_ms: float = 0.0  # Wall time to obtain the snapshot, parse excluded
+    parse_ms: float = 0.0  # Zero when an existing snapshot was reused
+
+    def timings(self) -> Dict[str, Any]:
+        return {
+            "fetchMs": round(self.fetch_ms, 1),
+            "parseMs": round(self.parse_ms, 1),
+            "ok": self.error is None,
+            "error": self.error,
+        }
+
+
+# Sheet snapshots keyed by (sheet_id, source_key)
+_snapshots: Dict[Tuple[str, str], SheetSnapshot] = {}
+_snapshot_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_snapshot_registry_lock = threading.Lock()
+# asyncio locks only work on the loop that created them, so keep one set per loop
+_async_snapshot_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], asyncio.Lock]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Source fetches that outlived their deadline; referenced so they can finish
+_straggler_fetches: Set["asyncio.Task[SourceFetch]"] = set()
+
+SHEET_INCLUDE = "objectValue,rowNumbers,childIds"
+# Rows per bulk PUT; Smartsheet caps request size, so stay well below it
+MAX_ROWS_PER_UPDATE = 200
+# Overlap delta windows so clock skew cannot drop a modification
+ROWS_MODIFIED_SKEW = timedelta(seconds=60)
+
+
+def _snapshots_enabled() -> bool:
+    """Set DTA_SMARTSHEET_SNAPSHOT=0 to download sheets on every call."""
+    return os.getenv("DTA_SMARTSHEET_SNAPSHOT", "1") != "0"
+
+
+def _version_ttl_seconds() -> float:
+    """Seconds a snapshot is served before its sheet version is re-checked."""
+    return float(os.getenv("DTA_SMARTSHEET_VERSION_TTL", "10"))
+
+
+def _source_timeout_seconds(default: float) -> float:
+    """Per-sheet deadline when several sheets are fetched concurrently."""
+    return float(os.getenv("DTA_SMARTSHEET_SOURCE_TIMEOUT", str(default)))
+
+
+def _attachment_lookup_workers() -> int:
+    """Max concurrent attachment detail requests."""
+    try:
+        return max(1, int(os.getenv("DTA_ATTACHMENT_WORKERS", "5")))
+    except ValueError:
+        return 5
+
+
+def _snapshot_lock(key: Tuple[str, str]) -> threading.Lock:
+    with _snapshot_registry_lock:
+        return _snapshot_locks.setdefault(key, threading.Lock())
+
+
+def _async_snapshot_lock(key: Tuple[str, str]) -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    with _snapshot_registry_lock:
+        locks = _async_snapshot_locks.setdefault(loop, {})
+        return locks.setdefault(key, asyncio.Lock())
+
+
+def _fresh_snapshot(key: Tuple[str, str]) -> Optional[SheetSnapshot]:
+    """Return the cached snapshot if its version was checked within the TTL."""
+    snapshot = _snapshots.get(key)
+    if snapshot and time.monotonic() - snapshot.checked_at < _version_ttl_seconds():
+        return snapshot
+    return None
+
+
+def _store_snapshot(key: Tuple[str, str], snapshot: SheetSnapshot) -> None:
+    with _snapshot_registry_lock:
+        _snapshots[key] = snapshot
+
+
+def _delta_params(snapshot: SheetSnapshot) -> Dict[str, Any]:
+    since = snapshot.fetched_at - ROWS_MODIFIED_SKEW
+    return {
+        "include": SHEET_INCLUDE,
+        "rowsModifiedSince": since.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def _merge_delta_rows(
+    snapshot: SheetSnapshot, payload: Dict[str, Any]
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Apply a rowsModifiedSince payload to the snapshot rows; None if a full fetch is needed."""
+    rows = dict(snapshot.rows)
+    last_row_number = max(
+        (row.get("rowNumber") or 0 for row in rows.values()), default=0
+    )
+    for row in sorted(payload.get("rows", []), key=lambda r: r.get("rowNumber") or 0):
+        row_id = str(row.get("id"))
+        previous = rows.get(row_id)
+        if previous is None:
+            # Only rows appended at the bottom keep the cached order valid
+            if (row.get("rowNumber") or 0) <= last_row_number:
+                return None
+            last_row_number = row.get("rowNumber") or last_row_number
+        elif previous.get("rowNumber") != row.get("rowNumber"):
+            return None
+        rows[row_id] = row
+
+    # Deleted rows never appear in a delta; detect them by count
+    if payload.get("totalRowCount") != len(rows):
+        return None
+    return rows
+
+
+def _source_fetch(
+    source_key: str,
+    snapshot: SheetSnapshot,
+    previous: Optional[SheetSnapshot],
+    started: float,
+) -> SourceFetch:
+    """Build a successful SourceFetch, splitting parse time out of the wall time."""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    parse_ms = snapshot.parse_ms if snapshot is not previous else 0.0
+    return SourceFetch(
+        source_key=source_key,
+        snapshot=snapshot,
+        fetch_ms=max(0.0, elapsed_ms - parse_ms),
+        parse_ms=parse_ms,
+    )
+
+
+def clear_sheet_snapshots() -> None:
+    """Drop all cached sheet snapshots."""
+    with _snapshot_registry_lock:
+        _snapshots.clear()
+
+
+def invalidate_sheet_snapshot(sheet_id: str) -> None:
+    """Force the next read of a sheet to re-check its version."""
+    with _snapshot_registry_lock:
+        for (cached_id, _), snapshot in _snapshots.items():
+            if cached_id == sheet_id:
+                snapshot.checked_at = float("-inf")
+
+
 PROJECT_ROOT = Path(__file__).resolve().parent
 DEFAULT_SCHEMA_PATH = PROJECT_ROOT.parent / "config" / "smartsheet.yml"
 
@@ -205,6 +383,7 @@ class SmartsheetClient:
         self.timeout_seconds = timeout_seconds
         self._last_fetch_used_live = False
         self._row_errors: List[str] = []
+        self._source_timings: Dict[str, Dict[str, Any]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -229,52 +408,255 @@ class SmartsheetClient:
         self._last_fetch_used_live = False
         self._row_errors = []
 
-        # Determine which sheets to fetch from
+        target_sources = self._target_sources(sources, include_work_in_all)
+        fetches = self._fetch_sources(self._live_sources(target_sources))
+        return self._assemble_tasks(target_sources, fetches, limit, fallback_to_stub)
+
+    async def list_tasks_async(
+        self,
+        *,
+        limit: Optional[int] = None,
+        fallback_to_stub: bool = True,
+        sources: Optional[List[str]] = None,
+        include_work_in_all: bool = False,
+    ) -> List[TaskDetail]:
+        """Async variant of list_tasks; sheets are fetched on the event loop."""
+        self._last_fetch_used_live = False
+        self._row_errors = []
+
+        target_sources = self._target_sources(sources, include_work_in_all)
+        fetches = await self._fetch_sources_async(self._live_sources(target_sources))
+        return self._assemble_tasks(target_sources, fetches, limit, fallback_to_stub)
+
+    def _target_sources(
+        self, sources: Optional[List[str]], include_work_in_all: bool
+    ) -> List[str]:
+        """Determine which sheets to fetch from."""
         if sources is not None:
-            target_sources = sources
-        elif include_work_in_all:
-            target_sources = self.multi_config.get_all_sources()
-        else:
-            target_sources = self.multi_config.get_sources_for_all_filter()
+            return sources
+        if include_work_in_all:
+            return self.multi_config.get_all_sources()
+        return self.multi_config.get_sources_for_all_filter()
+
+    def _live_sources(self, target_sources: List[str]) -> List[str]:
+        return [
+            key for key in target_sources
+            if key in self.multi_config.sheets and self.multi_config.sheets[key].ready_for_live
+        ]
+
+    def _assemble_tasks(
+        self,
+        target_sources: List[str],
+        fetches: Dict[str, SourceFetch],
+        limit: Optional[int],
+        fallback_to_stub: bool,
+    ) -> List[TaskDetail]:
+        self._source_timings = {key: fetch.timings() for key, fetch in fetches.items()}
 
         all_tasks: List[TaskDetail] = []
         all_errors: List[str] = []
         any_live = False
 
+        # Assemble in the requested source order regardless of completion order
         for source_key in target_sources:
             schema = self.multi_config.sheets.get(source_key)
             if not schema:
                 continue
 
-            if not schema.ready_for_live:
+            fetch = fetches.get(source_key)
+            if fetch is None or fetch.snapshot is None:
                 if fallback_to_stub and source_key == "personal":
                     all_tasks.extend(fetch_stubbed_tasks(limit=limit))
                 continue
 
-            try:
-                payload = self._request(
-                    "GET",
-                    f"/sheets/{schema.sheet_id}",
-                    params={"include": "objectValue,rowNumbers,childIds"},
+            any_live = True
+            snapshot = fetch.snapshot
+            details = snapshot.details if limit is None else snapshot.details[:limit]
+            all_tasks.extend(details)
+            all_errors.extend(snapshot.errors)
+
+        self._last_fetch_used_live = any_live
+        self._row_errors = all_errors
+        return all_tasks
+
+    def get_task(
+        self,
+        row_id: str,
+        *,
+        fallback_to_stub: bool = True,
+        sources: Optional[List[str]] = None,
+    ) -> Optional[TaskDetail]:
+        """Return a single task by row ID without downloading whole sheets.
+
+        Looks the row up in the cached sheet snapshots first. On a miss, or
+        when the snapshot is due for a version check, the row itself is
+        fetched with GET /sheets/{id}/rows/{rowId}.
+
+        Args:
+            row_id: The Smartsheet row ID.
+            fallback_to_stub: If True, search stubbed data when no sheet answers.
+            sources: Source keys to search (defaults to all sources).
+
+        Returns:
+            The TaskDetail, or None if every searched sheet answered 404.
+
+        Raises:
+            SmartsheetAPIError: A sheet that might hold the row failed (other
+                than with a 404) and there is no stale snapshot of the row.
+        """
+        self._last_fetch_used_live = False
+        self._row_errors = []
+        target_sources = sources if sources is not None else self.multi_config.get_all_sources()
+        live_schemas = [
+            (key, self.multi_config.sheets[key])
+            for key in target_sources
+            if key in self.multi_config.sheets and self.multi_config.sheets[key].ready_for_live
+        ]
+
+        # Fresh snapshots answer without any request
+        stale_hits: List[Tuple[str, SheetSchema]] = []
+        stale_rows: Dict[str, TaskDetail] = {}
+        for source_key, schema in live_schemas:
+            snapshot = _snapshots.get((schema.sheet_id, source_key)) if _snapshots_enabled() else None
+            if snapshot is None or row_id not in snapshot.index:
+                continue
+            if time.monotonic() - snapshot.checked_at < _version_ttl_seconds():
+                self._last_fetch_used_live = True
+                return snapshot.index[row_id]
+            stale_hits.append((source_key, schema))
+            stale_rows[source_key] = snapshot.index[row_id]
+
+        # Ask the sheet we last saw the row in first, then the others
+        ordered = stale_hits + [entry for entry in live_schemas if entry not in stale_hits]
+        any_answered = False
+        failures: List[Tuple[str, SmartsheetAPIError]] = []
+        if row_id.isdigit():
+            for source_key, schema in ordered:
+                try:
+                    row = self._request(
+                        "GET",
+                        f"/sheets/{schema.sheet_id}/rows/{row_id}",
+                        params={"include": SHEET_INCLUDE},
+                    )
+                except SmartsheetAPIError as exc:
+                    # A 404 is an answer (not in this sheet), not an outage
+                    if exc.status_code == 404:
+                        any_answered = True
+                    else:
+                        failures.append((source_key, exc))
+                    continue
+                any_answered = True
+                details, errors = self._rows_to_details(
+                    [row], limit=None, schema=schema, source_key=source_key
                 )
-                any_live = True
-            except SmartsheetAPIError:
-                if fallback_to_stub and source_key == "personal":
-                    all_tasks.extend(fetch_stubbed_tasks(limit=limit))
+                self._row_errors = errors
+                if details:
+                    self._last_fetch_used_live = True
+                    return details[0]
+
+        if failures:
+            # The row may be in a sheet that failed; "not found" would be wrong
+            for source_key, exc in failures:
+                if source_key in stale_rows:
+                    self._last_fetch_used_live = True
+                    return stale_rows[source_key]
+            raise failures[-1][1]
+
+        self._last_fetch_used_live = any_answered
+        if fallback_to_stub and not any_answered:
+            return next(
+                (task for task in fetch_stubbed_tasks() if task.row_id == row_id), None
+            )
+        return None
+
+    def _fetch_sources(self, source_keys: List[str]) -> Dict[str, SourceFetch]:
+        """Load several sheets concurrently, isolating failures per sheet.
+
+        Each sheet gets DTA_SMARTSHEET_SOURCE_TIMEOUT seconds (defaults to the
+        client's HTTP timeout plus a small margin); a sheet that errors or
+        runs late is reported as failed without affecting the others.
+        """
+        if not source_keys:
+            return {}
+        if len(source_keys) == 1:
+            key = source_keys[0]
+            return {key: self._fetch_source(key)}
+
+        timeout = _source_timeout_seconds(self.timeout_seconds + 5)
+        pool = ThreadPoolExecutor(max_workers=len(source_keys))
+        try:
+            futures = {key: pool.submit(self._fetch_source, key) for key in source_keys}
+            deadline = time.monotonic() + timeout
+            results: Dict[str, SourceFetch] = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
+                    results[key] = SourceFetch(
+                        source_key=key,
+                        error=f"timed out after {timeout:g}s",
+                        fetch_ms=timeout * 1000,
+                    )
+            return results
+        finally:
+            # Do not block on a straggler; its snapshot still lands in the cache
+            pool.shutdown(wait=False)
+
+    async def _fetch_sources_async(self, source_keys: List[str]) -> Dict[str, SourceFetch]:
+        """Async variant of _fetch_sources."""
+        if not source_keys:
+            return {}
+        if len(source_keys) == 1:
+            key = source_keys[0]
+            return {key: await self._fetch_source_async(key)}
+
+        timeout = _source_timeout_seconds(self.timeout_seconds + 5)
+        tasks = {
+            key: asyncio.ensure_future(self._fetch_source_async(key)) for key in source_keys
+        }
+        done, _ = await asyncio.wait(tasks.values(), timeout=timeout)
+        results: Dict[str, SourceFetch] = {}
+        for key, task in tasks.items():
+            if task in done:
+                results[key] = task.result()
                 continue
+            # Do not wait for a straggler; its snapshot still lands in the cache
+            _straggler_fetches.add(task)
+            task.add_done_callback(_straggler_fetches.discard)
+            results[key] = SourceFetch(
+                source_key=key,
+                error=f"timed out after {timeout:g}s",
+                fetch_ms=timeout * 1000,
+            )
+        return results
 
-            details, errors = self._rows_to_details(
-                payload.get("rows", []),
-                limit=limit,
-                schema=schema,
+    def _fetch_source(self, source_key: str) -> SourceFetch:
+        schema = self.multi_config.sheets[source_key]
+        previous = _snapshots.get((schema.sheet_id, source_key))
+        started = time.perf_counter()
+        try:
+            snapshot = self._load_snapshot(schema, source_key)
+        except SmartsheetAPIError as exc:
+            return SourceFetch(
                 source_key=source_key,
+                error=str(exc),
+                fetch_ms=(time.perf_counter() - started) * 1000,
             )
-            all_tasks.extend(details)
-            all_errors.extend(errors)
+        return _source_fetch(source_key, snapshot, previous, started)
 
-        self._last_fetch_used_live = any_live
-        self._row_errors = all_errors
-        return all_tasks
+    async def _fetch_source_async(self, source_key: str) -> SourceFetch:
+        schema = self.multi_config.sheets[source_key]
+        previous = _snapshots.get((schema.sheet_id, source_key))
+        started = time.perf_counter()
+        try:
+            snapshot = await self._load_snapshot_async(schema, source_key)
+        except SmartsheetAPIError as exc:
+            return SourceFetch(
+                source_key=source_key,
+                error=str(exc),
+                fetch_ms=(time.perf_counter() - started) * 1000,
+            )
+        return _source_fetch(source_key, snapshot, previous, started)
 
     def get_available_sources(self) -> List[str]:
         """Return list of available source keys."""
@@ -294,21 +676,10 @@ class SmartsheetClient:
             return {"urgent": 0, "due_soon": 0, "overdue": 0, "total": 0}
 
         try:
-            payload = self._request(
-                "GET",
-                f"/sheets/{work_schema.sheet_id}",
-                params={"include": "objectValue,rowNumbers,childIds"},
-            )
+            details = self._load_snapshot(work_schema, "work").details
         except SmartsheetAPIError:
             return {"urgent": 0, "due_soon": 0, "overdue": 0, "total": 0}
 
-        details, _ = self._rows_to_details(
-            payload.get("rows", []),
-            limit=None,
-            schema=work_schema,
-            source_key="work",
-        )
-
         # Filter out completed/cancelled tasks
         active_tasks = [
             t for t in details
@@ -386,6 +757,25 @@ class SmartsheetClient:
             raise ValueError("No updates provided")
 
         schema = self._get_schema_for_source(source)
+        cells = self._build_update_cells(updates, schema)
+
+        payload = [{"id": int(row_id), "cells": cells}]
+
+        try:
+            response = self._request(
+                "PUT",
+                f"/sheets/{schema.sheet_id}/rows",
+                body=payload,
+            )
+        except SmartsheetAPIError as exc:
+            raise SmartsheetAPIError(f"Failed to update row {row_id}: {exc}") from exc
+        invalidate_sheet_snapshot(schema.sheet_id)
+        return response
+
+    def _build_update_cells(
+        self, updates: Dict[str, Any], schema: SheetSchema
+    ) -> List[Dict[str, Any]]:
+        """Validate field updates and convert them to Smartsheet cell payloads."""
         cells = []
         for field_name, value in updates.items():
             column = schema.columns.get(field_name)
@@ -432,18 +822,7 @@ class SmartsheetClient:
                     "columnId": int(column.column_id),
                     "value": cell_value,
                 })
-
-        payload = [{"id": int(row_id), "cells": cells}]
-
-        try:
-            response = self._request(
-                "PUT",
-                f"/sheets/{schema.sheet_id}/rows",
-                body=payload,
-            )
-            return response
-        except SmartsheetAPIError as exc:
-            raise SmartsheetAPIError(f"Failed to update row {row_id}: {exc}") from exc
+        return cells
 
     def create_row(
         self, task_data: Dict[str, Any], *, source: str = "personal"
@@ -531,9 +910,10 @@ class SmartsheetClient:
                 f"/sheets/{schema.sheet_id}/rows",
                 body=payload,
             )
-            return response
         except SmartsheetAPIError as exc:
             raise SmartsheetAPIError(f"Failed to create row: {exc}") from exc
+        invalidate_sheet_snapshot(schema.sheet_id)
+        return response
 
     def mark_complete(self, row_id: str, *, source: str = "personal") -> Dict[str, Any]:
         """Mark a task as complete.
@@ -550,48 +930,111 @@ class SmartsheetClient:
         Returns:
             The API response containing the updated row data.
         """
-        # Fetch the row to check current status
+        return self.update_row(row_id, self.completion_updates(row_id, source=source), source=source)
+
+    def completion_updates(self, row_id: str, *, source: str = "personal") -> Dict[str, Any]:
+        """Return the field updates that mark a row complete.
+
+        Recurring tasks only get Done checked (status stays "Recurring") so
+        Smartsheet automation can reset them; other tasks also get
+        Status='Completed'. The recurring pattern is read from the cached sheet
+        snapshot when the row is in it, otherwise from a single row GET.
+        """
         schema = self._get_schema_for_source(source)
-        try:
-            row_data = self._request(
-                "GET",
-                f"/sheets/{schema.sheet_id}/rows/{row_id}",
-            )
-        except SmartsheetAPIError:
-            # If we can't fetch, fall back to standard completion
-            return self.update_row(row_id, {
-                "status": "Completed",
-                "done": True,
-            }, source=source)
-        
-        # Check if task is recurring by looking at the recurring_pattern column
-        # A task is recurring if it has ANY value in the recurring pattern field
-        has_recurring_pattern = False
-        recurring_col = schema.columns.get("recurring_pattern")
-        if recurring_col and "cells" in row_data:
-            for cell in row_data["cells"]:
-                if cell.get("columnId") == int(recurring_col.column_id):
-                    # Check for any non-empty value (could be displayValue, value, or objectValue)
-                    pattern_value = cell.get("displayValue") or cell.get("value")
-                    if not pattern_value and cell.get("objectValue"):
-                        # Multi-picklist stores values in objectValue.values array
-                        obj_val = cell.get("objectValue", {})
-                        values = obj_val.get("values", [])
-                        has_recurring_pattern = len(values) > 0
-                    else:
-                        has_recurring_pattern = bool(pattern_value)
-                    break
-        
+        snapshot = _snapshots.get((schema.sheet_id, source)) if _snapshots_enabled() else None
+        row_data = snapshot.rows.get(str(row_id)) if snapshot else None
+        if row_data is None:
+            try:
+                row_data = self._request(
+                    "GET",
+                    f"/sheets/{schema.sheet_id}/rows/{row_id}",
+                )
+            except SmartsheetAPIError:
+                # If we can't fetch, fall back to standard completion
+                return {"status": "Completed", "done": True}
+
         # For recurring tasks: only check Done box (don't change status)
         # This allows Smartsheet automation to reset the task for the next occurrence
-        if has_recurring_pattern:
-            return self.update_row(row_id, {"done": True}, source=source)
-        
+        if self._has_recurring_pattern(row_data, schema):
+            return {"done": True}
+
         # For regular tasks: set both status and done
-        return self.update_row(row_id, {
-            "status": "Completed",
-            "done": True,
-        }, source=source)
+        return {"status": "Completed", "done": True}
+
+    def _has_recurring_pattern(self, row_data: Dict[str, Any], schema: SheetSchema) -> bool:
+        """Check for ANY value in the row's recurring pattern column."""
+        recurring_col = schema.columns.get("recurring_pattern")
+        if not recurring_col or "cells" not in row_data:
+            return False
+        for cell in row_data["cells"]:
+            if cell.get("columnId") == int(recurring_col.column_id):
+                # Check for any non-empty value (could be displayValue, value, or objectValue)
+                pattern_value = cell.get("displayValue") or cell.get("value")
+                if not pattern_value and cell.get("objectValue"):
+                    # Multi-picklist stores values in objectValue.values array
+                    obj_val = cell.get("objectValue", {})
+                    return len(obj_val.get("values", [])) > 0
+                return bool(pattern_value)
+        return False
+
+    def update_rows(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]],
+        *,
+        source: str = "personal",
+    ) -> Dict[str, Optional[str]]:
+        """Update many rows of one sheet with as few requests as possible.
+
+        Updates for the same row are merged, then rows are sent in chunks of
+        MAX_ROWS_PER_UPDATE per PUT /sheets/{id}/rows with allowPartialSuccess,
+        so one bad row does not fail the rest.
+
+        Args:
+            updates: (row_id, field updates) pairs, as accepted by update_row.
+            source: Source key ("personal" or "work") to determine which sheet
+
+        Returns:
+            Dict mapping each row_id to None on success or an error message.
+        """
+        schema = self._get_schema_for_source(source)
+        outcomes: Dict[str, Optional[str]] = {}
+        merged: Dict[str, Dict[str, Any]] = {}
+        for row_id, fields in updates:
+            merged.setdefault(str(row_id), {}).update(fields)
+
+        rows: List[Dict[str, Any]] = []
+        for row_id, fields in merged.items():
+            try:
+                if not fields:
+                    raise ValueError("No updates provided")
+                rows.append({"id": int(row_id), "cells": self._build_update_cells(fields, schema)})
+            except ValueError as exc:
+                outcomes[row_id] = str(exc)
+
+        for start in range(0, len(rows), MAX_ROWS_PER_UPDATE):
+            chunk = rows[start:start + MAX_ROWS_PER_UPDATE]
+            try:
+                response = self._request(
+                    "PUT",
+                    f"/sheets/{schema.sheet_id}/rows",
+                    params={"allowPartialSuccess": "true"},
+                    body=chunk,
+                )
+            except SmartsheetAPIError as exc:
+                for row in chunk:
+                    outcomes[str(row["id"])] = f"Failed to update row {row['id']}: {exc}"
+                continue
+
+            failed: Dict[int, str] = {}
+            for item in response.get("failedItems") or []:
+                error = item.get("error") or {}
+                failed[item.get("index", -1)] = error.get("message") or str(error) or "update failed"
+            for index, row in enumerate(chunk):
+                outcomes[str(row["id"])] = failed.get(index)
+
+        if rows:
+            invalidate_sheet_snapshot(schema.sheet_id)
+        return outcomes
 
     def get_row_attachments(
         self, row_id: str, *, source: str = "personal"
@@ -674,14 +1117,37 @@ class SmartsheetClient:
             List of AttachmentDetail objects with download URLs
         """
         basic_attachments = self.get_row_attachments(row_id, source=source)
-        detailed: List[AttachmentDetail] = []
+        return self.get_attachment_details(
+            [att.attachment_id for att in basic_attachments], source=source
+        )
 
-        for att in basic_attachments:
-            detail = self.get_attachment_detail(att.attachment_id, source=source)
-            if detail:
-                detailed.append(detail)
+    def get_attachment_details(
+        self, attachment_ids: List[str], *, source: str = "personal"
+    ) -> List[AttachmentDetail]:
+        """Get details for several attachments concurrently.
+
+        Args:
+            attachment_ids: Smartsheet attachment IDs, in the desired order
+            source: Source key ("personal" or "work") to determine which sheet
 
-        return detailed
+        Returns:
+            AttachmentDetail objects in request order; IDs that are not
+            found are omitted
+        """
+        if len(attachment_ids) <= 1:
+            details = [
+                self.get_attachment_detail(attachment_id, source=source)
+                for attachment_id in attachment_ids
+            ]
+        else:
+            workers = min(len(attachment_ids), _attachment_lookup_workers())
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # map() yields results in submission order
+                details = list(pool.map(
+                    lambda attachment_id: self.get_attachment_detail(attachment_id, source=source),
+                    attachment_ids,
+                ))
+        return [detail for detail in details if detail]
 
     @property
     def last_fetch_used_live(self) -> bool:
@@ -691,6 +1157,173 @@ class SmartsheetClient:
     def row_errors(self) -> List[str]:
         return self._row_errors
 
+    @property
+    def source_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source fetch/parse timings from the last list_tasks call."""
+        return self._source_timings
+
+    # ------------------------------------------------------------------
+    # Sheet snapshots
+    # ------------------------------------------------------------------
+    def _load_snapshot(self, schema: SheetSchema, source_key: str) -> SheetSnapshot:
+        """Return a current snapshot of a sheet, downloading as little as possible.
+
+        A cached snapshot is served as-is for DTA_SMARTSHEET_VERSION_TTL
+        seconds. After that the sheet version is checked (a tiny request); if
+        it moved, only rows modified since the snapshot are fetched and merged.
+        Inserted, deleted or reordered rows fall back to a full download.
+        """
+        if not _snapshots_enabled():
+            return self._fetch_full_snapshot(schema, source_key)
+
+        key = (schema.sheet_id, source_key)
+        snapshot = _fresh_snapshot(key)
+        if snapshot:
+            return snapshot
+
+        with _snapshot_lock(key):
+            # Another request may have refreshed while we waited
+            snapshot = _fresh_snapshot(key)
+            if snapshot:
+                return snapshot
+
+            snapshot = _snapshots.get(key)
+            if snapshot is None or snapshot.version is None:
+                snapshot = self._fetch_full_snapshot(schema, source_key)
+            else:
+                version = self._request(
+                    "GET", f"/sheets/{schema.sheet_id}/version"
+                ).get("version")
+                if version == snapshot.version:
+                    snapshot.checked_at = time.monotonic()
+                    return snapshot
+                snapshot = (
+                    self._fetch_delta_snapshot(schema, source_key, snapshot)
+                    or self._fetch_full_snapshot(schema, source_key)
+                )
+
+            _store_snapshot(key, snapshot)
+            return snapshot
+
+    async def _load_snapshot_async(self, schema: SheetSchema, source_key: str) -> SheetSnapshot:
+        """Async variant of _load_snapshot.
+
+        Requests run on the event loop; parsing runs in a worker thread.
+        """
+        if not _snapshots_enabled():
+            return await self._fetch_full_snapshot_async(schema, source_key)
+
+        key = (schema.sheet_id, source_key)
+        snapshot = _fresh_snapshot(key)
+        if snapshot:
+            return snapshot
+
+        async with _async_snapshot_lock(key):
+            # Another request may have refreshed while we waited
+            snapshot = _fresh_snapshot(key)
+            if snapshot:
+                return snapshot
+
+            snapshot = _snapshots.get(key)
+            if snapshot is None or snapshot.version is None:
+                snapshot = await self._fetch_full_snapshot_async(schema, source_key)
+            else:
+                version = (
+                    await self._request_async("GET", f"/sheets/{schema.sheet_id}/version")
+                ).get("version")
+                if version == snapshot.version:
+                    snapshot.checked_at = time.monotonic()
+                    return snapshot
+                snapshot = (
+                    await self._fetch_delta_snapshot_async(schema, source_key, snapshot)
+                    or await self._fetch_full_snapshot_async(schema, source_key)
+                )
+
+            _store_snapshot(key, snapshot)
+            return snapshot
+
+    def _fetch_full_snapshot(self, schema: SheetSchema, source_key: str) -> SheetSnapshot:
+        fetched_at = datetime.now(timezone.utc)
+        payload = self._request(
+            "GET",
+            f"/sheets/{schema.sheet_id}",
+            params={"include": SHEET_INCLUDE},
+        )
+        rows = {str(row.get("id")): row for row in payload.get("rows", [])}
+        return self._build_snapshot(
+            schema, source_key, rows, payload.get("version"), fetched_at
+        )
+
+    async def _fetch_full_snapshot_async(
+        self, schema: SheetSchema, source_key: str
+    ) -> SheetSnapshot:
+        fetched_at = datetime.now(timezone.utc)
+        payload = await self._request_async(
+            "GET",
+            f"/sheets/{schema.sheet_id}",
+            params={"include": SHEET_INCLUDE},
+        )
+        rows = {str(row.get("id")): row for row in payload.get("rows", [])}
+        return await asyncio.to_thread(
+            self._build_snapshot, schema, source_key, rows, payload.get("version"), fetched_at
+        )
+
+    def _fetch_delta_snapshot(
+        self, schema: SheetSchema, source_key: str, snapshot: SheetSnapshot
+    ) -> Optional[SheetSnapshot]:
+        """Merge rows modified since the snapshot; None if a full fetch is needed."""
+        fetched_at = datetime.now(timezone.utc)
+        payload = self._request(
+            "GET", f"/sheets/{schema.sheet_id}", params=_delta_params(snapshot)
+        )
+        rows = _merge_delta_rows(snapshot, payload)
+        if rows is None:
+            return None
+        return self._build_snapshot(
+            schema, source_key, rows, payload.get("version"), fetched_at
+        )
+
+    async def _fetch_delta_snapshot_async(
+        self, schema: SheetSchema, source_key: str, snapshot: SheetSnapshot
+    ) -> Optional[SheetSnapshot]:
+        """Async variant of _fetch_delta_snapshot."""
+        fetched_at = datetime.now(timezone.utc)
+        payload = await self._request_async(
+            "GET", f"/sheets/{schema.sheet_id}", params=_delta_params(snapshot)
+        )
+        rows = _merge_delta_rows(snapshot, payload)
+        if rows is None:
+            return None
+        return await asyncio.to_thread(
+            self._build_snapshot, schema, source_key, rows, payload.get("version"), fetched_at
+        )
+
+    def _build_snapshot(
+        self,
+        schema: SheetSchema,
+        source_key: str,
+        rows: Dict[str, Dict[str, Any]],
+        version: Optional[int],
+        fetched_at: datetime,
+    ) -> SheetSnapshot:
+        started = time.perf_counter()
+        details, errors = self._rows_to_details(
+            rows.values(), limit=None, schema=schema, source_key=source_key
+        )
+        parse_ms = (time.perf_counter() - started) * 1000
+        return SheetSnapshot(
+            sheet_id=schema.sheet_id,
+            source_key=source_key,
+            version=version,
+            rows=rows,
+            details=details,
+            index={detail.row_id: detail for detail in details},
+            errors=errors,
+            fetched_at=fetched_at,
+            checked_at=time.monotonic(),
+            parse_ms=parse_ms,
+        )
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -860,31 +1493,50 @@ class SmartsheetClient:
         params: Optional[Dict[str, Any]] = None,
         body: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        url = f"{self.base_url}{path}"
-        if params:
-            query = urlparse.urlencode(params)
-            url = f"{url}?{query}"
+        try:
+            return request_json(
+                method,
+                f"{self.base_url}{path}",
+                headers=self._headers(),
+                params=params,
+                json_body=body,
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as exc:  # pragma: no cover - network path
+            raise _api_error(method, path, exc) from exc
 
-        data: Optional[bytes] = None
-        headers = {
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        try:
+            return await request_json_async(
+                method,
+                f"{self.base_url}{path}",
+                headers=self._headers(),
+                params=params,
+                json_body=body,
+                timeout=self.timeout_seconds,
+            )
+        except TransportError as exc:  # pragma: no cover - network path
+            raise _api_error(method, path, exc) from exc
+
+    def _headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.settings.smartsheet_token}",
             "Accept": "application/json",
         }
 
-        if body is not None:
-            data = json.dumps(body).encode("utf-8")
-            headers["Content-Type"] = "application/json"
 
-        req = urlrequest.Request(url, data=data, method=method, headers=headers)
-
-        try:
-            with urlrequest.urlopen(req, timeout=self.timeout_seconds) as resp:
-                raw = resp.read().decode("utf-8")
-                return json.loads(raw)
-        except urlerror.HTTPError as exc:  # pragma: no cover - network path
-            detail = exc.read().decode("utf-8", errors="ignore")
-            raise SmartsheetAPIError(
-                f"Smartsheet API {method} {path} failed with status {exc.code}: {detail}"
-            ) from exc
-        except urlerror.URLError as exc:  # pragma: no cover - network path
-            raise SmartsheetAPIError(f"Network error calling Smartsheet: {exc}") from exc
\ No newline at end of file
+def _api_error(method: str, path: str, exc: TransportError) -> SmartsheetAPIError:
+    """Translate a transport failure into a SmartsheetAPIError."""
+    if isinstance(exc, HTTPStatusError):
+        return SmartsheetAPIError(
+            f"Smartsheet API {method} {path} failed with status {exc.status_code}: {exc.detail}",
+            status_code=exc.status_code,
+        )
+    return SmartsheetAPIError(f"Network error calling Smartsheet: {exc}")
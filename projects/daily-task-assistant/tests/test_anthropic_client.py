@@ -0,0 +1,253 @@
+"""Tests for prompt caching, usage reporting and streaming in the Anthropic client."""
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from daily_task_assistant.llm.anthropic_client import (
+    CHAT_WITH_TOOLS_SYSTEM_PROMPT,
+    EMAIL_ACTION_TOOL,
+    TASK_UPDATE_TOOL,
+    AnthropicError,
+    TokenUsage,
+    build_async_anthropic_client,
+    chat_with_email,
+    chat_with_email_async,
+    chat_with_tools,
+    chat_with_tools_async,
+    close_async_anthropic_client,
+    stream_chat_with_tools_async,
+)
+from daily_task_assistant.tasks import TaskDetail
+
+
+def _sample_task() -> TaskDetail:
+    return TaskDetail(
+        row_id="1234",
+        title="Prepare onboarding email",
+        status="On Hold",
+        due=datetime(2025, 1, 15) + timedelta(days=2),
+        priority="Urgent",
+        project="Zendesk Ticket",
+        assigned_to="owner@example.com",
+        estimated_hours=1.5,
+        notes="Need to summarize decisions and email the vendor.",
+        next_step="Draft email with next steps",
+        automation_hint="Draft follow-up email",
+    )
+
+
+def _client(**usage) -> Mock:
+    client = Mock()
+    client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="Sure.")],
+        usage=SimpleNamespace(**usage) if usage else None,
+    )
+    return client
+
+
+def _prefix(kwargs: dict) -> str:
+    """Serialize everything that should be byte-identical across turns."""
+    return json.dumps(
+        [kwargs["tools"], kwargs["system"], kwargs["messages"][:2]]
+    )
+
+
+class TestPromptCaching:
+    def test_marks_tools_system_and_task_context(self):
+        client = _client()
+
+        chat_with_tools(_sample_task(), "hello", client=client)
+
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [{
+            "type": "text",
+            "text": CHAT_WITH_TOOLS_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert all("cache_control" not in tool for tool in kwargs["tools"][:-1])
+        context = kwargs["messages"][0]["content"]
+        assert context[-1]["cache_control"] == {"type": "ephemeral"}
+        # The latest user turn changes every call and must not be marked
+        assert "cache_control" not in kwargs["messages"][-1]["content"][-1]
+
+    def test_module_tool_definitions_are_not_mutated(self):
+        chat_with_tools(_sample_task(), "hello", client=_client())
+        chat_with_email("From: a@example.com", "hi", client=_client())
+
+        assert "cache_control" not in TASK_UPDATE_TOOL
+        assert "cache_control" not in EMAIL_ACTION_TOOL
+
+    def test_cached_prefix_is_identical_across_turns(self):
+        client = _client()
+        history = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "Hi"},
+        ]
+
+        chat_with_tools(_sample_task(), "hello", client=client)
+        chat_with_tools(_sample_task(), "next", history=history, client=client)
+
+        first, second = (call.kwargs for call in client.messages.create.call_args_list)
+        assert _prefix(first) == _prefix(second)
+
+    def test_disabled_sends_plain_prompts(self, monkeypatch):
+        monkeypatch.setenv("DTA_PROMPT_CACHE", "0")
+        client = _client()
+
+        chat_with_email("From: a@example.com", "hi", client=client)
+
+        kwargs = client.messages.create.call_args.kwargs
+        assert isinstance(kwargs["system"], str)
+        assert "cache_control" not in json.dumps(kwargs["tools"])
+        assert "cache_control" not in json.dumps(kwargs["messages"])
+
+
+class TestTokenUsage:
+    def test_reports_cache_counts(self):
+        client = _client(
+            input_tokens=12,
+            output_tokens=40,
+            cache_read_input_tokens=3000,
+            cache_creation_input_tokens=0,
+        )
+
+        response = chat_with_email("From: a@example.com", "hi", client=client)
+
+        assert response.usage.to_dict() == {
+            "inputTokens": 12,
+            "outputTokens": 40,
+            "cacheReadTokens": 3000,
+            "cacheWriteTokens": 0,
+        }
+
+    def test_missing_usage(self):
+        assert TokenUsage.from_response(SimpleNamespace(content=[])) is None
+        partial = TokenUsage.from_response(
+            SimpleNamespace(usage=SimpleNamespace(input_tokens=5, cache_read_input_tokens=None))
+        )
+        assert partial == TokenUsage(input_tokens=5)
+
+
+def _raw_stream():
+    """Raw Messages API stream events: two text deltas then a split tool call."""
+    ns = SimpleNamespace
+    return iter([
+        ns(type="message_start", message=ns(usage=ns(input_tokens=10, cache_read_input_tokens=900))),
+        ns(type="content_block_start", index=0, content_block=ns(type="text", text="")),
+        ns(type="content_block_delta", index=0, delta=ns(type="text_delta", text="Marking ")),
+        ns(type="content_block_delta", index=0, delta=ns(type="text_delta", text="it done.")),
+        ns(type="content_block_stop", index=0),
+        ns(type="content_block_start", index=1,
+           content_block=ns(type="tool_use", id="tu_1", name="update_task")),
+        ns(type="content_block_delta", index=1,
+           delta=ns(type="input_json_delta", partial_json='{"action": "mark_')),
+        ns(type="content_block_delta", index=1,
+           delta=ns(type="input_json_delta", partial_json='complete", "reason": "done"}')),
+        ns(type="content_block_stop", index=1),
+        ns(type="message_delta", delta=ns(stop_reason="tool_use"), usage=ns(output_tokens=25)),
+        ns(type="message_stop"),
+    ])
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+def _async_client(**create) -> Mock:
+    client = Mock()
+    client.messages.create = AsyncMock(**create)
+    return client
+
+
+class TestStreaming:
+    def test_forwards_deltas_and_assembles_tool_call(self):
+        client = _async_client(return_value=_aiter(list(_raw_stream())))
+
+        events = asyncio.run(
+            _collect(stream_chat_with_tools_async(_sample_task(), "done?", client=client))
+        )
+
+        assert client.messages.create.await_args.kwargs["stream"] is True
+        assert [e.text for e in events if e.type == "text"] == ["Marking ", "it done."]
+        tool = next(e for e in events if e.type == "tool_use")
+        assert tool.tool_name == "update_task"
+        assert tool.tool_input == {"action": "mark_complete", "reason": "done"}
+
+        final = events[-1]
+        assert final.type == "final"
+        assert final.response.message == "Marking it done."
+        assert final.response.pending_action.action == "mark_complete"
+        assert final.response.usage == TokenUsage(
+            input_tokens=10, output_tokens=25, cache_read_input_tokens=900
+        )
+
+    def test_stream_matches_request_of_sync_call(self):
+        sync_client = _client()
+        stream_client = _async_client(return_value=_aiter([]))
+
+        chat_with_tools(_sample_task(), "hello", client=sync_client)
+        asyncio.run(
+            _collect(stream_chat_with_tools_async(_sample_task(), "hello", client=stream_client))
+        )
+
+        stream_kwargs = dict(stream_client.messages.create.await_args.kwargs)
+        assert stream_kwargs.pop("stream") is True
+        assert stream_kwargs == sync_client.messages.create.call_args.kwargs
+
+    def test_stream_errors_are_wrapped(self):
+        client = _async_client(side_effect=RuntimeError("connection reset"))
+
+        with pytest.raises(AnthropicError):
+            asyncio.run(
+                _collect(stream_chat_with_tools_async(_sample_task(), "hi", client=client))
+            )
+
+
+class TestAsync:
+    def test_async_call_sends_same_request_and_parses(self):
+        sync_client = _client(input_tokens=7, output_tokens=3)
+        async_client = Mock()
+        async_client.messages.create = AsyncMock(
+            return_value=sync_client.messages.create.return_value
+        )
+
+        expected = chat_with_tools(_sample_task(), "hello", client=sync_client)
+        response = asyncio.run(
+            chat_with_tools_async(_sample_task(), "hello", client=async_client)
+        )
+
+        assert async_client.messages.create.await_args.kwargs == (
+            sync_client.messages.create.call_args.kwargs
+        )
+        assert response.message == expected.message == "Sure."
+        assert response.usage == expected.usage
+
+    def test_async_errors_are_wrapped(self):
+        client = Mock()
+        client.messages.create = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        with pytest.raises(AnthropicError):
+            asyncio.run(chat_with_email_async("From: a@example.com", "hi", client=client))
+
+    def test_async_client_is_shared_and_closed(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        created = Mock(close=AsyncMock())
+
+        with patch("daily_task_assistant.llm.anthropic_client.AsyncAnthropic", return_value=created) as mock_cls:
+            assert build_async_anthropic_client() is build_async_anthropic_client()
+            asyncio.run(close_async_anthropic_client())
+
+        mock_cls.assert_called_once_with(api_key="test-key")
+        created.close.assert_awaited_once()
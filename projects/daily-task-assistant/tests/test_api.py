@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 from pathlib import Path
@@ -91,6 +92,70 @@ def test_assist_stub_flow(tmp_path, monkeypatch):
     assert len(history) >= 1
 
 
+def test_task_chat_stream_emits_sse(tmp_path, monkeypatch):
+    from daily_task_assistant.llm import anthropic_client
+    from daily_task_assistant.llm.anthropic_client import (
+        ChatResponse,
+        ChatStreamEvent,
+        TaskUpdateAction,
+    )
+
+    monkeypatch.setenv("DTA_CONVERSATION_DIR", str(tmp_path / "conversations"))
+
+    async def fake_stream(**kwargs):
+        assert kwargs["user_message"] == "Mark it done"
+        yield ChatStreamEvent(type="text", text="On it.")
+        yield ChatStreamEvent(
+            type="tool_use", tool_name="update_task", tool_input={"action": "mark_complete"}
+        )
+        yield ChatStreamEvent(type="final", response=ChatResponse(
+            message="On it.",
+            pending_action=TaskUpdateAction(action="mark_complete", reason="Done"),
+        ))
+
+    monkeypatch.setattr(anthropic_client, "stream_chat_with_tools_async", fake_stream)
+
+    resp = client.post(
+        "/assist/1001/chat/stream",
+        json={"message": "Mark it done", "source": "stub"},
+        headers=USER_HEADERS,
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    frames = [frame for frame in resp.text.split("\n\n") if frame]
+    events = [frame.split("\n")[0].removeprefix("event: ") for frame in frames]
+    assert events == ["delta", "tool", "done"]
+    done = json.loads(frames[-1].split("data: ", 1)[1])
+    assert done["response"] == "On it."
+    assert done["pendingAction"]["action"] == "mark_complete"
+    assert [m["content"] for m in done["history"]][-2:] == ["Mark it done", "On it."]
+
+
+def test_task_chat_awaits_async_client(tmp_path, monkeypatch):
+    from daily_task_assistant.llm import anthropic_client
+    from daily_task_assistant.llm.anthropic_client import ChatResponse
+
+    monkeypatch.setenv("DTA_CONVERSATION_DIR", str(tmp_path / "conversations"))
+
+    async def fake_chat(**kwargs):
+        return ChatResponse(message=f"Re: {kwargs['user_message']}")
+
+    def sync_chat(**kwargs):
+        raise AssertionError("chat endpoint should not block on the sync client")
+
+    monkeypatch.setattr(anthropic_client, "chat_with_tools_async", fake_chat)
+    monkeypatch.setattr(anthropic_client, "chat_with_tools", sync_chat)
+
+    resp = client.post(
+        "/assist/1001/chat",
+        json={"message": "Status?", "source": "stub"},
+        headers=USER_HEADERS,
+    )
+    assert resp.status_code == 200
+    assert resp.json()["response"] == "Re: Status?"
+
+
 def test_activity_endpoint(tmp_path, monkeypatch):
     log_file = tmp_path / "api-log.jsonl"
     log_file.write_text('{"task_id": "1"}\n', encoding="utf-8")
@@ -215,3 +280,45 @@ class TestTaskUpdateEndpoint:
         body = resp.json()
         assert body["preview"]["changes"]["comment"] == "Test comment"
 
+
+def test_bulk_update_is_batched_per_sheet(tmp_path, monkeypatch):
+    """/assist/global/bulk-update sends one update_rows call per sheet."""
+    monkeypatch.setenv("DTA_CONVERSATION_FORCE_FILE", "1")
+    monkeypatch.setenv("DTA_CONVERSATION_DIR", str(tmp_path / "conversations"))
+    from daily_task_assistant.smartsheet_client import SmartsheetClient
+
+    calls = []
+
+    def fake_update_rows(self, updates, *, source="personal"):
+        calls.append((source, list(updates)))
+        return {row_id: ("Row is locked" if row_id == "3" else None) for row_id, _ in updates}
+
+    monkeypatch.setattr(SmartsheetClient, "update_rows", fake_update_rows)
+    monkeypatch.setattr(SmartsheetClient, "list_tasks", lambda self, **kw: [])
+    monkeypatch.setattr(
+        SmartsheetClient,
+        "completion_updates",
+        lambda self, row_id, source="personal": {"done": True},
+    )
+
+    resp = client.post(
+        "/assist/global/bulk-update",
+        json={
+            "updates": [
+                {"rowId": "1", "action": "update_due_date", "dueDate": "2025-12-05"},
+                {"rowId": "2", "action": "mark_complete"},
+                {"rowId": "3", "source": "work", "action": "update_number", "number": 2},
+            ],
+            "perspective": "holistic",
+        },
+        headers=USER_HEADERS,
+    )
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert sorted(source for source, _ in calls) == ["personal", "work"]
+    personal = dict(next(u for s, u in calls if s == "personal"))
+    assert personal == {"1": {"due_date": "2025-12-05"}, "2": {"done": True}}
+    assert body["successCount"] == 2
+    assert [r["success"] for r in body["results"]] == [True, True, False]
+    assert body["results"][2]["error"] == "Row is locked"
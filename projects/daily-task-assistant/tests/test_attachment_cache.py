@@ -0,0 +1,351 @@
+"""Tests for the attachment blob cache, attachment preprocessing and PDF extraction."""
+from __future__ import annotations
+
+import base64
+import io
+import tempfile
+import time
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+import pytest
+
+from daily_task_assistant.llm import anthropic_client
+from daily_task_assistant.llm.anthropic_client import prepare_attachments
+from daily_task_assistant.llm.attachment_cache import (
+    AttachmentCache,
+    attachment_cache_key,
+)
+from daily_task_assistant.tasks import AttachmentDetail
+
+
+MODULE = "daily_task_assistant.llm.anthropic_client"
+IMAGE_BYTES = 4_500_000
+PDF_CHARS = 10000
+
+
+def _attachment(attachment_id="att-1", mime_type="image/png", url="https://signed/1"):
+    return AttachmentDetail(
+        attachment_id=attachment_id,
+        name=f"{attachment_id}.bin",
+        mime_type=mime_type,
+        size_bytes=100,
+        created_at="2025-01-02T03:04:05Z",
+        attachment_type="FILE",
+        download_url=url,
+    )
+
+
+def _response(data: bytes):
+    return io.BytesIO(data)  # urlopen() results are used as context managers
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = AttachmentCache(tmp_path / "attachments")
+    monkeypatch.setattr(anthropic_client, "get_attachment_cache", lambda: cache)
+    return cache
+
+
+class TestAttachmentCache:
+    def test_round_trip_and_dedup(self, tmp_path):
+        cache = AttachmentCache(tmp_path)
+
+        cache.put("a:1", "raw", b"same bytes")
+        cache.put("a:1", "image:100", b"same bytes")
+
+        assert cache.get("a:1", "image:100") == b"same bytes"
+        assert cache.get("a:1", "pdf_text:10") is None
+        assert cache.total_bytes() == len(b"same bytes")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = AttachmentCache(tmp_path, max_bytes=25)
+        cache.put("a", "raw", b"a" * 10)
+        cache.put("b", "raw", b"b" * 10)
+        cache.get("a", "raw")  # "b" is now least recently used
+
+        cache.put("c", "raw", b"c" * 10)
+
+        assert cache.get("b", "raw") is None
+        assert cache.get("a", "raw") == b"a" * 10
+        assert cache.total_bytes() == 20
+        assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 2
+
+    def test_key_ignores_signed_url(self):
+        first = _attachment(url="https://signed/1?sig=a")
+        second = _attachment(url="https://signed/1?sig=b")
+
+        assert attachment_cache_key(first) == attachment_cache_key(second)
+
+
+class TestCachedAttachments:
+    def test_image_is_downloaded_once_across_turns(self, cache):
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"png")) as mock_open:
+            first = anthropic_client._cached_image_bytes(
+                _attachment(url="https://signed/turn-1"), IMAGE_BYTES
+            )
+            second = anthropic_client._cached_image_bytes(
+                _attachment(url="https://signed/turn-2"), IMAGE_BYTES
+            )
+
+        assert first == second == b"png"
+        assert mock_open.call_count == 1
+
+    def test_resized_image_is_cached(self, cache):
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"x" * 50)), \
+             patch(f"{MODULE}._resize_image", return_value=b"small") as mock_resize:
+            anthropic_client._cached_image_bytes(_attachment(), 10)
+            result = anthropic_client._cached_image_bytes(_attachment(), 10)
+
+        assert result == b"small"
+        assert mock_resize.call_count == 1
+
+    def test_pdf_text_and_unreadable_pdfs_are_cached(self, cache):
+        readable = _attachment("pdf-1", "application/pdf")
+        scanned = _attachment("pdf-2", "application/pdf")
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"%PDF")), \
+             patch(f"{MODULE}._parse_pdf_text", side_effect=["Page text", ""]) as mock_extract:
+            assert anthropic_client._cached_pdf_text(readable, PDF_CHARS) == "Page text"
+            assert anthropic_client._cached_pdf_text(scanned, PDF_CHARS) is None
+            assert anthropic_client._cached_pdf_text(readable, PDF_CHARS) == "Page text"
+            assert anthropic_client._cached_pdf_text(scanned, PDF_CHARS) is None
+
+        assert mock_extract.call_count == 2
+
+    def test_failed_pdf_extraction_is_not_cached(self, cache):
+        pdf = _attachment("pdf-1", "application/pdf")
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"%PDF")), \
+             patch(f"{MODULE}._parse_pdf_text", side_effect=[ImportError("pdfplumber"), "Page text"]):
+            assert anthropic_client._cached_pdf_text(pdf, PDF_CHARS) is None
+            assert anthropic_client._cached_pdf_text(pdf, PDF_CHARS) == "Page text"
+
+    def test_failed_download_is_not_cached(self, cache):
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=OSError("expired")):
+            assert anthropic_client._cached_image_bytes(_attachment(), IMAGE_BYTES) is None
+
+        assert cache.get(attachment_cache_key(_attachment()), "raw") is None
+
+    def test_disabled_cache_downloads_every_time(self, monkeypatch):
+        monkeypatch.setenv("DTA_ATTACHMENT_CACHE", "0")
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"png")) as mock_open:
+            anthropic_client._cached_image_bytes(_attachment(), IMAGE_BYTES)
+            anthropic_client._cached_image_bytes(_attachment(), IMAGE_BYTES)
+
+        assert mock_open.call_count == 2
+
+
+def _png(size: int = 64) -> bytes:
+    """A noisy PNG that does not compress below a few KB."""
+    from PIL import Image
+    import os as _os
+
+    img = Image.frombytes("RGB", (size, size), _os.urandom(size * size * 3))
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+class TestPrepareAttachments:
+    @pytest.fixture(autouse=True)
+    def inline_cpu(self, monkeypatch):
+        monkeypatch.setenv("DTA_ATTACHMENT_PROCESS_WORKERS", "0")
+
+    def test_downloads_run_concurrently_in_selection_order(self, cache):
+        def slow_open(url, timeout):
+            time.sleep(0.2)
+            return _response(url.encode())
+
+        attachments = [_attachment(f"img-{i}", url=f"https://signed/{i}") for i in range(5)]
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=slow_open):
+            started = time.perf_counter()
+            prepared = prepare_attachments(attachments)
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.6
+        assert [base64.standard_b64decode(p.image_data) for p in prepared] == [
+            f"https://signed/{i}".encode() for i in range(5)
+        ]
+
+    def test_token_budget_drops_images_and_truncates_pdfs(self, cache):
+        pdf = _attachment("pdf-1", "application/pdf")
+        images = [_attachment("img-1"), _attachment("img-2")]
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"data")), \
+             patch(f"{MODULE}._parse_pdf_text", return_value="x" * 8000):
+            prepared = prepare_attachments(images + [pdf], max_total_tokens=2000)
+
+        assert [p.attachment.attachment_id for p in prepared] == ["img-1", "pdf-1"]
+        assert prepared[1].text.endswith("[... PDF content truncated ...]")
+        assert sum(p.tokens for p in prepared) <= 2000
+
+    def test_byte_budget_truncates_pdfs_on_encoded_length(self, cache):
+        pdf = _attachment("pdf-1", "application/pdf")
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"data")), \
+             patch(f"{MODULE}._parse_pdf_text", return_value="\u00e9" * 2000):
+            [prepared] = prepare_attachments([pdf], max_total_bytes=1000)
+
+        assert prepared.text.endswith("[... PDF content truncated ...]")
+        assert prepared.size <= 1000
+
+    def test_byte_budget_drops_images(self, cache):
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(b"d" * 300)):
+            prepared = prepare_attachments(
+                [_attachment("img-1"), _attachment("img-2")], max_total_bytes=500
+            )
+
+        assert [p.attachment.attachment_id for p in prepared] == ["img-1"]
+
+    def test_resize_runs_in_process_pool(self, cache, monkeypatch):
+        monkeypatch.setenv("DTA_ATTACHMENT_PROCESS_WORKERS", "1")
+        png = _png()
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: _response(png)):
+            [prepared] = prepare_attachments([_attachment()], max_image_bytes=len(png) // 2)
+
+        # Resized output is JPEG, so the media type follows it
+        assert prepared.media_type == "image/jpeg"
+        assert len(base64.standard_b64decode(prepared.image_data)) <= len(png) // 2
+
+    def test_job_errors_keep_the_process_pool(self, monkeypatch):
+        monkeypatch.setenv("DTA_ATTACHMENT_PROCESS_WORKERS", "1")
+        pool = Mock()
+        pool.submit.return_value.result.side_effect = ValueError("No /Root object!")
+        monkeypatch.setattr(anthropic_client, "_process_pool", pool)
+        fn = Mock()
+
+        with pytest.raises(ValueError):
+            anthropic_client._run_in_process_pool(fn, "broken.pdf")
+
+        fn.assert_not_called()
+        assert anthropic_client._process_pool is pool
+        pool.shutdown.assert_not_called()
+
+    def test_broken_process_pool_falls_back_in_thread(self, monkeypatch):
+        monkeypatch.setenv("DTA_ATTACHMENT_PROCESS_WORKERS", "1")
+        pool = Mock()
+        pool.submit.return_value.result.side_effect = BrokenProcessPool("worker died")
+        monkeypatch.setattr(anthropic_client, "_process_pool", pool)
+
+        assert anthropic_client._run_in_process_pool(len, "abc") == 3
+        assert anthropic_client._process_pool is None
+        pool.shutdown.assert_called_once_with(wait=False)
+
+
+def _pdf(pages: list[str | None]) -> bytes:
+    """A minimal PDF; each entry is a page of text, or None for a scanned page."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b""]
+    font = len(objects) + 1
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    image = len(objects) + 1
+    objects.append(
+        b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+        b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"
+    )
+    kids = []
+    for text in pages:
+        if text is None:
+            content, resources = b"q 100 0 0 100 0 0 cm /Im1 Do Q", f"/XObject << /Im1 {image} 0 R >>"
+        else:
+            content, resources = f"BT /F1 12 Tf 20 700 Td ({text}) Tj ET".encode(), f"/Font << /F1 {font} 0 R >>"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << {resources} >> /Contents {len(objects)} 0 R >>".encode()
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+@pytest.fixture
+def page_spy():
+    """Record which pages pdfplumber lays out."""
+    from pdfplumber.page import Page
+
+    original = Page.extract_text
+    parsed = []
+
+    def spy(page, *args, **kwargs):
+        parsed.append(page.page_number)
+        return original(page, *args, **kwargs)
+
+    with patch.object(Page, "extract_text", spy):
+        yield parsed
+
+
+class TestPdfExtraction:
+    def test_stops_parsing_once_budget_is_met(self, page_spy):
+        pdf = _pdf([f"Page {i} " + "x" * 80 for i in range(50)])
+
+        text = anthropic_client._parse_pdf_text(pdf, max_chars=200)
+
+        assert text.startswith("Page 0")
+        assert text.endswith("[... PDF content truncated ...]")
+        assert page_spy == [1, 2, 3]
+
+    def test_skips_image_only_pages_without_layout(self, page_spy):
+        pdf = _pdf([None, None, "Signed agreement"])
+
+        assert anthropic_client._parse_pdf_text(pdf, max_chars=1000) == "Signed agreement"
+        assert page_spy == [3]
+
+    def test_scanned_pdf_has_no_text(self, page_spy):
+        assert anthropic_client._parse_pdf_text(_pdf([None] * 5), max_chars=1000) == ""
+        assert page_spy == []
+
+    def test_download_is_streamed_into_cache_and_parsed_from_disk(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        pdf = _pdf(["Invoice total 42"])
+        reads = []
+
+        class Chunked(io.BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        with patch(f"{MODULE}.urlrequest.urlopen", side_effect=lambda *a, **k: Chunked(pdf)):
+            text = anthropic_client._cached_pdf_text(
+                _attachment("pdf-1", "application/pdf"), PDF_CHARS
+            )
+
+        assert text == "Invoice total 42"
+        assert all(size > 0 for size in reads)  # never read() the whole body
+        path = cache.get_path(attachment_cache_key(_attachment("pdf-1")), "raw")
+        assert path.read_bytes() == pdf
+        # The temporary download was moved into the cache
+        assert not list(tmp_path.glob("dta-attachment-*"))
+
+    def test_put_file_moves_and_dedups(self, tmp_path):
+        cache = AttachmentCache(tmp_path / "cache")
+        first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        first.write_bytes(b"%PDF same")
+        second.write_bytes(b"%PDF same")
+
+        path_a = cache.put_file("a", "raw", first)
+        path_b = cache.put_file("b", "raw", second)
+
+        assert path_a == path_b
+        assert not first.exists() and not second.exists()
+        assert cache.total_bytes() == len(b"%PDF same")
+
+    def test_oversized_file_is_not_cached(self, tmp_path):
+        cache = AttachmentCache(tmp_path / "cache", max_bytes=4)
+        source = tmp_path / "big.pdf"
+        source.write_bytes(b"%PDF too large")
+
+        assert cache.put_file("a", "raw", source) == source
+        assert cache.get_path("a", "raw") is None
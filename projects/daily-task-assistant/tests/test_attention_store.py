@@ -0,0 +1,105 @@
+"""Tests for single-pass attention state loading."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from daily_task_assistant.email import attention_store
+from daily_task_assistant.email.attention_store import (
+    AttentionRecord,
+    get_attention,
+    load_attention_state,
+    save_attentions,
+)
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def _record(email_id, days_old=0, **overrides):
+    record = AttentionRecord(
+        email_id=email_id,
+        email_account="church",
+        user_id="test@test.com",
+        subject=f"Subject {email_id}",
+        from_address="a@example.com",
+        date=NOW - timedelta(days=days_old),
+        snippet="",
+    )
+    for key, value in overrides.items():
+        setattr(record, key, value)
+    return record
+
+
+def _records():
+    return [
+        _record("older", days_old=2),
+        _record("newer"),
+        _record("expired", expires_at=NOW - timedelta(days=1)),
+        _record("expired-dismissed", status="dismissed", expires_at=NOW - timedelta(days=1)),
+        _record("due", days_old=1, status="snoozed", snoozed_until=NOW - timedelta(hours=1)),
+        _record("sleeping", status="snoozed", snoozed_until=NOW + timedelta(days=1)),
+        _record("dismissed", status="dismissed"),
+        _record("tasked", status="task_created"),
+    ]
+
+
+def _assert_partitions(state):
+    assert [r.email_id for r in state.active] == ["newer", "due", "older"]
+    assert state.dismissed_ids == {"dismissed"}
+    assert [r.email_id for r in state.snoozed_due] == ["due"]
+    assert sorted(r.email_id for r in state.expired) == ["expired", "expired-dismissed"]
+
+
+class TestLoadAttentionState:
+    def test_file_mode_partitions_and_applies_mutations(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DTA_ATTENTION_FORCE_FILE", "1")
+        monkeypatch.setenv("DTA_ATTENTION_DIR", str(tmp_path))
+        save_attentions("church", _records())
+
+        _assert_partitions(load_attention_state("church"))
+
+        assert get_attention("church", "expired") is None
+        due = get_attention("church", "due")
+        assert due.status == "active" and due.snoozed_until is None
+        assert get_attention("church", "sleeping").status == "snoozed"
+
+    def test_firestore_reads_once_and_commits_one_batch(self, monkeypatch):
+        monkeypatch.delenv("DTA_ATTENTION_FORCE_FILE", raising=False)
+        db = Mock()
+        collection = db.collection.return_value.document.return_value.collection.return_value
+        collection.stream.return_value = [
+            SimpleNamespace(to_dict=record.to_dict) for record in _records()
+        ]
+        collection.document.side_effect = lambda doc_id: SimpleNamespace(path=f"attention/{doc_id}")
+
+        with patch.object(attention_store, "get_firestore_client", return_value=db):
+            state = load_attention_state("church")
+
+        _assert_partitions(state)
+        collection.stream.assert_called_once()
+        collection.where.assert_not_called()
+        batch = db.batch.return_value
+        assert sorted(call.args[0].path for call in batch.delete.call_args_list) == [
+            "attention/expired", "attention/expired-dismissed",
+        ]
+        written, rollup = batch.set.call_args_list
+        assert written.args[0].path == "attention/due"
+        assert written.args[1]["status"] == "active"
+        # The reactivation moves the due record's counter from snoozed to active
+        counts = {key: inc.value for key, inc in rollup.args[1]["counts"].items()}
+        assert counts == {"status:snoozed": -1, "status:active": 1}
+        batch.commit.assert_called_once()
+
+    def test_nothing_to_write(self, monkeypatch):
+        monkeypatch.delenv("DTA_ATTENTION_FORCE_FILE", raising=False)
+        db = Mock()
+        collection = db.collection.return_value.document.return_value.collection.return_value
+        collection.stream.return_value = [SimpleNamespace(to_dict=_record("a").to_dict)]
+
+        with patch.object(attention_store, "get_firestore_client", return_value=db):
+            state = load_attention_state("church")
+
+        assert [r.email_id for r in state.active] == ["a"]
+        db.batch.assert_not_called()
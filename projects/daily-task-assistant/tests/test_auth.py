@@ -0,0 +1,130 @@
+"""Tests for cached Google ID token verification."""
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from daily_task_assistant.api import auth
+from daily_task_assistant.api.auth import (
+    AuthError,
+    _CachingCertRequest,
+    clear_auth_caches,
+    get_current_user,
+    verify_token,
+)
+
+
+VERIFY = "daily_task_assistant.api.auth.id_token.verify_oauth2_token"
+
+
+@pytest.fixture(autouse=True)
+def _configured(monkeypatch):
+    monkeypatch.delenv("DTA_DEV_AUTH_BYPASS", raising=False)
+    monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "client-a")
+    monkeypatch.setenv("DTA_ALLOWED_EMAILS", "me@example.com")
+    auth._audiences.cache_clear()
+    auth._allowed_emails.cache_clear()
+    clear_auth_caches()
+    yield
+    auth._audiences.cache_clear()
+    auth._allowed_emails.cache_clear()
+    clear_auth_caches()
+
+
+def _claims(exp_in: float = 3600, email: str = "me@example.com") -> dict:
+    return {"email": email, "exp": int(time.time() + exp_in)}
+
+
+def test_verified_token_is_reused():
+    with patch(VERIFY, return_value=_claims()) as mock_verify:
+        assert get_current_user("Bearer tok-1", None) == "me@example.com"
+        assert get_current_user("Bearer tok-1", None) == "me@example.com"
+
+    assert mock_verify.call_count == 1
+
+
+def test_cache_is_keyed_by_token():
+    with patch(VERIFY, return_value=_claims()) as mock_verify:
+        verify_token("tok-1")
+        verify_token("tok-2")
+
+    assert mock_verify.call_count == 2
+    assert all(len(key) == 64 for key in auth._verified_tokens)
+
+
+def test_expired_token_is_verified_again():
+    with patch(VERIFY, side_effect=[_claims(exp_in=-1), ValueError("Token expired")]):
+        verify_token("tok-1")
+        with pytest.raises(AuthError):
+            verify_token("tok-1")
+
+
+def test_invalid_tokens_are_not_cached():
+    with patch(VERIFY, side_effect=[ValueError("bad signature"), _claims()]) as mock_verify:
+        with pytest.raises(AuthError):
+            verify_token("tok-1")
+        assert verify_token("tok-1")["email"] == "me@example.com"
+
+    assert mock_verify.call_count == 2
+
+
+def test_allowlist_is_checked_on_cache_hits(monkeypatch):
+    with patch(VERIFY, return_value=_claims(email="other@example.com")):
+        for _ in range(2):
+            with pytest.raises(AuthError) as exc_info:
+                get_current_user("Bearer tok-1", None)
+            assert exc_info.value.status_code == 403
+
+
+def test_cache_size_is_bounded(monkeypatch):
+    monkeypatch.setenv("DTA_AUTH_TOKEN_CACHE_SIZE", "2")
+    with patch(VERIFY, return_value=_claims()) as mock_verify:
+        for token in ("a", "b", "c", "a"):
+            verify_token(token)
+
+    # "a" was evicted when "c" arrived
+    assert mock_verify.call_count == 4
+    assert len(auth._verified_tokens) == 2
+
+
+def _cert_response(cache_control: str = "public, max-age=19000", status: int = 200):
+    return SimpleNamespace(status=status, headers={"cache-control": cache_control}, data=b"{}")
+
+
+class TestCachingCertRequest:
+    def test_reuses_response_within_max_age(self):
+        transport = Mock(return_value=_cert_response())
+        request = _CachingCertRequest(transport)
+
+        first = request("https://www.googleapis.com/oauth2/v1/certs")
+        second = request("https://www.googleapis.com/oauth2/v1/certs")
+
+        assert first is second
+        assert transport.call_count == 1
+
+    def test_refetches_after_max_age(self):
+        transport = Mock(return_value=_cert_response())
+        request = _CachingCertRequest(transport)
+
+        request("https://certs")
+        with patch("daily_task_assistant.api.auth.time.monotonic", return_value=time.monotonic() + 20000):
+            request("https://certs")
+
+        assert transport.call_count == 2
+
+    @pytest.mark.parametrize("response", [
+        _cert_response("no-store"),
+        _cert_response(""),
+        _cert_response(status=500),
+    ])
+    def test_uncacheable_responses_are_not_reused(self, response):
+        transport = Mock(return_value=response)
+        request = _CachingCertRequest(transport)
+
+        request("https://certs")
+        request("https://certs")
+
+        assert transport.call_count == 2
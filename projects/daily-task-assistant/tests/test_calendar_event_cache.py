@@ -0,0 +1,262 @@
+"""Tests for incremental Calendar sync and the cached event store."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from daily_task_assistant.calendar.event_cache import (
+    EventCache,
+    list_events_cached,
+    list_events_cached_async,
+    sync_calendar,
+)
+from daily_task_assistant.calendar.google_calendar import (
+    CalendarAccountConfig,
+    SyncTokenExpiredError,
+)
+from daily_task_assistant.calendar.types import EventListResponse, EventSyncPage
+
+
+MODULE = "daily_task_assistant.calendar.event_cache"
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest.fixture
+def account():
+    return CalendarAccountConfig(
+        name="personal",
+        client_id="cid",
+        client_secret="secret",
+        refresh_token="rt",
+        user_email="Me@Example.com",
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EventCache(tmp_path / "events.sqlite3")
+
+
+def _item(event_id: str, start: datetime, hours: int = 1, summary: str = "") -> dict:
+    end = start + timedelta(hours=hours)
+    return {
+        "id": event_id,
+        "summary": summary or f"Event {event_id}",
+        "status": "confirmed",
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": end.isoformat()},
+    }
+
+
+def _page(items=(), cancelled=(), token="sync-1", next_page=None) -> EventSyncPage:
+    return EventSyncPage(
+        items=list(items),
+        cancelled_ids=list(cancelled),
+        next_page_token=next_page,
+        next_sync_token=None if next_page else token,
+    )
+
+
+class TestSyncCalendar:
+    def test_first_sync_is_full_and_stores_token(self, account, cache):
+        items = [_item("e1", NOW + timedelta(days=1))]
+        with patch(f"{MODULE}.sync_events", return_value=_page(items)) as mock_sync:
+            state = sync_calendar(account, "primary", cache=cache)
+
+        assert state.sync_token == "sync-1"
+        kwargs = mock_sync.call_args.kwargs
+        assert "sync_token" not in kwargs
+        assert kwargs["time_min"] < NOW < kwargs["time_max"]
+
+    def test_recent_sync_skips_delta(self, account, cache):
+        with patch(f"{MODULE}.sync_events", return_value=_page()) as mock_sync:
+            sync_calendar(account, "primary", cache=cache)
+            sync_calendar(account, "primary", cache=cache)
+
+        assert mock_sync.call_count == 1
+
+    def test_delta_applies_changes_and_cancellations(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_CALENDAR_SYNC_INTERVAL", "0")
+        start = NOW + timedelta(days=1)
+        full = _page([_item("e1", start), _item("e2", start + timedelta(hours=2))])
+        delta = _page(
+            [_item("e1", start, summary="Renamed")], cancelled=["e2"], token="sync-2"
+        )
+
+        with patch(f"{MODULE}.sync_events", side_effect=[full, delta]) as mock_sync:
+            sync_calendar(account, "primary", cache=cache)
+            state = sync_calendar(account, "primary", cache=cache)
+
+        assert mock_sync.call_args.kwargs["sync_token"] == "sync-1"
+        assert state.sync_token == "sync-2"
+        events = cache.query("me@example.com", "primary", NOW.timestamp(),
+                             state.window_end, 10)
+        assert [(e["id"], e["summary"]) for e in events] == [("e1", "Renamed")]
+
+    def test_expired_token_triggers_full_resync(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_CALENDAR_SYNC_INTERVAL", "0")
+        start = NOW + timedelta(days=1)
+        responses = [
+            _page([_item("old", start)]),
+            SyncTokenExpiredError("Calendar API request failed (410): Gone"),
+            _page([_item("new", start)], token="sync-fresh"),
+        ]
+
+        with patch(f"{MODULE}.sync_events", side_effect=responses):
+            sync_calendar(account, "primary", cache=cache)
+            state = sync_calendar(account, "primary", cache=cache)
+
+        assert state.sync_token == "sync-fresh"
+        events = cache.query("me@example.com", "primary", NOW.timestamp(),
+                             state.window_end, 10)
+        assert [e["id"] for e in events] == ["new"]
+
+    def test_full_sync_follows_pages(self, account, cache):
+        start = NOW + timedelta(days=1)
+        pages = [
+            _page([_item("e1", start)], next_page="p2"),
+            _page([_item("e2", start + timedelta(hours=1))]),
+        ]
+        with patch(f"{MODULE}.sync_events", side_effect=pages) as mock_sync:
+            state = sync_calendar(account, "primary", cache=cache)
+
+        assert mock_sync.call_args.kwargs["page_token"] == "p2"
+        assert len(cache.query("me@example.com", "primary", 0, state.window_end, 10)) == 2
+
+
+class TestListEventsCached:
+    def test_serves_window_locally_in_start_order(self, account, cache):
+        items = [
+            _item("later", NOW + timedelta(days=3)),
+            _item("soon", NOW + timedelta(days=1)),
+            _item("outside", NOW + timedelta(days=20)),
+        ]
+        with patch(f"{MODULE}.sync_events", return_value=_page(items)), \
+             patch(f"{MODULE}.list_events") as mock_live:
+            response = list_events_cached(
+                account,
+                time_min=NOW,
+                time_max=NOW + timedelta(days=7),
+                source_domain="work",
+                cache=cache,
+            )
+
+        mock_live.assert_not_called()
+        assert [e.id for e in response.events] == ["soon", "later"]
+        assert all(e.source_domain == "work" for e in response.events)
+
+    def test_respects_max_results(self, account, cache):
+        items = [_item(f"e{i}", NOW + timedelta(days=i + 1)) for i in range(5)]
+        with patch(f"{MODULE}.sync_events", return_value=_page(items)):
+            response = list_events_cached(account, time_min=NOW, max_results=2, cache=cache)
+
+        assert [e.id for e in response.events] == ["e0", "e1"]
+        assert response.next_page_token == "cache:2"
+
+    def test_pages_through_cached_window(self, account, cache):
+        items = [_item(f"e{i}", NOW + timedelta(days=i + 1)) for i in range(5)]
+        seen, token = [], None
+        with patch(f"{MODULE}.sync_events", return_value=_page(items)), \
+             patch(f"{MODULE}.list_events") as mock_live:
+            while True:
+                response = list_events_cached(
+                    account, time_min=NOW, max_results=2, page_token=token, cache=cache
+                )
+                seen += [e.id for e in response.events]
+                token = response.next_page_token
+                if token is None:
+                    break
+
+        mock_live.assert_not_called()
+        assert seen == ["e0", "e1", "e2", "e3", "e4"]
+
+    def test_google_page_token_lists_live(self, account, cache):
+        live = EventListResponse(events=[], next_page_token="g-3")
+        with patch(f"{MODULE}.sync_events") as mock_sync, \
+             patch(f"{MODULE}.list_events", return_value=live) as mock_live:
+            response = list_events_cached(account, page_token="g-2", cache=cache)
+
+        assert response is live
+        assert mock_live.call_args.kwargs["page_token"] == "g-2"
+        mock_sync.assert_not_called()
+
+    def test_range_before_window_falls_back_to_live(self, account, cache):
+        live = EventListResponse(events=[])
+        with patch(f"{MODULE}.sync_events", return_value=_page()), \
+             patch(f"{MODULE}.list_events", return_value=live) as mock_live:
+            response = list_events_cached(
+                account,
+                time_min=NOW - timedelta(days=365),
+                time_max=NOW,
+                cache=cache,
+            )
+
+        assert response is live
+        mock_live.assert_called_once()
+
+    def test_disabled_cache_lists_live(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_CALENDAR_CACHE", "0")
+        live = EventListResponse(events=[])
+        with patch(f"{MODULE}.sync_events") as mock_sync, \
+             patch(f"{MODULE}.list_events", return_value=live):
+            assert list_events_cached(account, cache=cache) is live
+
+        mock_sync.assert_not_called()
+
+
+class TestListEventsCachedAsync:
+    def test_serves_window_from_cache(self, account, cache):
+        items = [_item("soon", NOW + timedelta(days=1))]
+        with patch(f"{MODULE}.sync_events", return_value=_page(items)), \
+             patch(f"{MODULE}.list_events_async", new_callable=AsyncMock) as mock_live:
+            response = asyncio.run(list_events_cached_async(
+                account, time_min=NOW, time_max=NOW + timedelta(days=7), cache=cache
+            ))
+
+        mock_live.assert_not_called()
+        assert [e.id for e in response.events] == ["soon"]
+
+    def test_stale_cache_token_lists_live_from_offset(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_CALENDAR_CACHE", "0")
+        events = [_item(f"e{i}", NOW + timedelta(days=i + 1)) for i in range(4)]
+        from daily_task_assistant.calendar.google_calendar import _parse_event
+
+        live = EventListResponse(
+            events=[_parse_event(item, "primary", account.user_email, "personal") for item in events],
+            next_page_token="g-2",
+        )
+        with patch(f"{MODULE}.list_events_async", new_callable=AsyncMock,
+                   return_value=live) as mock_live:
+            response = asyncio.run(list_events_cached_async(
+                account, max_results=2, page_token="cache:2", cache=cache
+            ))
+
+        assert mock_live.call_args.kwargs["max_results"] == 4
+        assert mock_live.call_args.kwargs["page_token"] is None
+        assert [e.id for e in response.events] == ["e2", "e3"]
+        assert response.next_page_token == "g-2"
+
+
+class TestSyncTokenExpiry:
+    def test_410_status_raises_sync_token_expired(self, account):
+        from daily_task_assistant.calendar.google_calendar import CalendarError, sync_events
+
+        gone = CalendarError("Sync token is no longer valid", status_code=410)
+        with patch("daily_task_assistant.calendar.google_calendar._make_request",
+                   side_effect=gone):
+            with pytest.raises(SyncTokenExpiredError):
+                sync_events(account, sync_token="stale")
+
+    def test_other_errors_pass_through(self, account):
+        from daily_task_assistant.calendar.google_calendar import CalendarError, sync_events
+
+        error = CalendarError("Calendar API request failed (410): Gone")
+        with patch("daily_task_assistant.calendar.google_calendar._make_request",
+                   side_effect=error):
+            with pytest.raises(CalendarError) as raised:
+                sync_events(account, sync_token="stale")
+
+        assert not isinstance(raised.value, SyncTokenExpiredError)
@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import json
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -100,7 +100,7 @@ class TestInboxEndpoint:
     
     @pytest.mark.skip(reason="API mocking needs work - lazy imports not properly intercepted")
     @patch("daily_task_assistant.mailer.load_account_from_env")
-    @patch("daily_task_assistant.mailer.get_inbox_summary")
+    @patch("daily_task_assistant.mailer.get_inbox_summary_async", new_callable=AsyncMock)
     def test_inbox_summary_success(
         self, mock_get_summary, mock_load_account, client, auth_headers, sample_inbox_summary
     ):
@@ -133,7 +133,7 @@ class TestUnreadEndpoint:
     """Tests for GET /inbox/{account}/unread endpoint."""
     
     @patch("daily_task_assistant.mailer.load_account_from_env")
-    @patch("daily_task_assistant.mailer.get_unread_messages")
+    @patch("daily_task_assistant.mailer.get_unread_messages_async", new_callable=AsyncMock)
     def test_unread_messages_success(
         self,
         mock_get_unread,
@@ -159,7 +159,7 @@ class TestSearchEndpoint:
     
     @pytest.mark.skip(reason="API mocking needs work - lazy imports not properly intercepted")
     @patch("daily_task_assistant.mailer.load_account_from_env")
-    @patch("daily_task_assistant.mailer.search_messages")
+    @patch("daily_task_assistant.mailer.search_messages_async", new_callable=AsyncMock)
     def test_search_messages_success(
         self,
         mock_search,
@@ -298,6 +298,74 @@ class TestAnalyzeEndpoint:
         assert "attention_items" in data
 
 
+class TestThreadContextEndpoint:
+    """Tests for GET /email/{account}/thread/{thread_id} summary caching."""
+
+    @staticmethod
+    def _thread(count: int):
+        from daily_task_assistant.mailer import ThreadSnapshot
+
+        messages = [
+            EmailMessage(
+                id=f"m{i}",
+                thread_id="t1",
+                from_address="sender@example.com",
+                from_name=f"Sender {i}",
+                to_address="david.a.royes@gmail.com",
+                subject="Budget",
+                snippet=f"message {i}",
+                date=datetime(2025, 12, 1, 9, i, tzinfo=timezone.utc),
+                is_unread=False,
+            )
+            for i in range(count)
+        ]
+        return ThreadSnapshot(thread_id="t1", history_id="300", messages=messages)
+
+    @patch("daily_task_assistant.mailer.save_thread_summary")
+    @patch("daily_task_assistant.mailer.get_thread_cached")
+    @patch("daily_task_assistant.mailer.load_account_from_env")
+    def test_cached_summary_is_reused(
+        self, mock_load_account, mock_thread, mock_save, client, auth_headers
+    ):
+        snapshot = self._thread(8)
+        snapshot.summary = "Cached summary"
+        snapshot.summary_message_ids = [f"m{i}" for i in range(7)]
+        mock_thread.return_value = snapshot
+
+        with patch("daily_task_assistant.llm.anthropic_client.build_anthropic_client") as mock_client:
+            response = client.get("/email/personal/thread/t1", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["summary"] == "Cached summary"
+        mock_client.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch("daily_task_assistant.mailer.save_thread_summary")
+    @patch("daily_task_assistant.mailer.get_thread_cached")
+    @patch("daily_task_assistant.mailer.load_account_from_env")
+    def test_grown_thread_summarizes_only_new_messages(
+        self, mock_load_account, mock_thread, mock_save, client, auth_headers
+    ):
+        snapshot = self._thread(10)
+        snapshot.summary = "Cached summary"
+        snapshot.summary_message_ids = [f"m{i}" for i in range(7)]
+        mock_thread.return_value = snapshot
+
+        with patch("daily_task_assistant.llm.anthropic_client.build_anthropic_client") as mock_client:
+            llm = mock_client.return_value
+            llm.messages.create.return_value = MagicMock(content=[MagicMock(text="Updated")])
+            response = client.get("/email/personal/thread/t1", headers=auth_headers)
+
+        assert response.json()["summary"] == "Updated"
+        prompt = llm.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "Cached summary" in prompt
+        assert "message 7" in prompt and "message 8" in prompt
+        assert "message 6" not in prompt and "message 9" not in prompt
+        mock_save.assert_called_once_with(
+            mock_load_account.return_value, "t1", "Updated", [f"m{i}" for i in range(9)]
+        )
+
+
 class TestAuthRequirement:
     """Tests that endpoints require authentication."""
     
@@ -0,0 +1,133 @@
+"""Tests for the batched Firestore write layer."""
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from daily_task_assistant.firestore import BatchWriter, delete_documents
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, doc_ref, data, merge=False):
+        self.ops.append(("set", doc_ref.path, data))
+
+    def delete(self, doc_ref):
+        self.ops.append(("delete", doc_ref.path, None))
+
+    def commit(self):
+        self.db.commit_batch(self)
+
+
+class FakeDb:
+    """Records committed batches; fails any batch touching a doc in ``poison``."""
+
+    def __init__(self, poison=(), delay=0.0):
+        self.poison = set(poison)
+        self.delay = delay
+        self.committed = []
+        self.lock = threading.Lock()
+
+    def batch(self):
+        return FakeBatch(self)
+
+    def commit_batch(self, batch):
+        time.sleep(self.delay)
+        if any(path in self.poison for _, path, _ in batch.ops):
+            raise RuntimeError("invalid argument")
+        with self.lock:
+            self.committed.append(batch.ops)
+
+    def ref(self, path):
+        ref = Mock(path=path)
+        if path in self.poison:
+            ref.set.side_effect = RuntimeError("invalid argument")
+        return ref
+
+
+def test_chunks_at_batch_size():
+    db = FakeDb()
+    writer = BatchWriter(db, batch_size=2, max_workers=1)
+    for i in range(5):
+        writer.set(db.ref(f"c/{i}"), {"n": i})
+
+    result = writer.commit()
+
+    assert result.ok and result.written == 5
+    assert [len(ops) for ops in db.committed] == [2, 2, 1]
+    assert len(writer) == 0
+
+
+def test_batch_size_is_capped_at_firestore_limit():
+    db = FakeDb()
+    writer = BatchWriter(db, batch_size=10_000, max_workers=1)
+    for i in range(501):
+        writer.delete(db.ref(f"c/{i}"))
+
+    writer.commit()
+
+    assert [len(ops) for ops in db.committed] == [500, 1]
+
+
+def test_batches_commit_in_parallel():
+    db = FakeDb(delay=0.2)
+    writer = BatchWriter(db, batch_size=1, max_workers=4)
+    for i in range(4):
+        writer.set(db.ref(f"c/{i}"), {})
+
+    started = time.perf_counter()
+    result = writer.commit()
+
+    assert result.written == 4
+    assert time.perf_counter() - started < 0.6
+
+
+def test_failed_batch_is_retried_per_document():
+    db = FakeDb(poison={"c/1"})
+    refs = [db.ref(f"c/{i}") for i in range(3)]
+    writer = BatchWriter(db, max_workers=1)
+    for ref in refs:
+        writer.set(ref, {"x": 1}, merge=True)
+
+    result = writer.commit()
+
+    assert not result.ok
+    assert result.written == 2
+    assert list(result.failures) == ["c/1"]
+    refs[0].set.assert_called_once_with({"x": 1}, merge=True)
+    refs[2].set.assert_called_once_with({"x": 1}, merge=True)
+
+
+def test_delete_documents_accepts_snapshots_and_refs():
+    db = FakeDb()
+    snapshot = SimpleNamespace(reference=db.ref("c/a"))
+    ref = SimpleNamespace(path="c/b")
+
+    result = delete_documents(db, [snapshot, ref])
+
+    assert result.written == 2
+    assert db.committed == [[("delete", "c/a", None), ("delete", "c/b", None)]]
+
+
+def test_purge_uses_batched_deletes(tmp_path, monkeypatch):
+    from daily_task_assistant.email import attention_store
+
+    monkeypatch.delenv("DTA_ATTENTION_FORCE_FILE", raising=False)
+    db = FakeDb()
+    expired = [SimpleNamespace(reference=db.ref(f"attention/{i}")) for i in range(3)]
+    collection = Mock()
+    collection.where.return_value.stream.return_value = iter(expired)
+    client = Mock(batch=db.batch)
+    client.collection.return_value.document.return_value.collection.return_value = collection
+
+    with patch.object(attention_store, "get_firestore_client", return_value=client):
+        assert attention_store._purge_expired_firestore("personal") == 3
+
+    assert len(db.committed) == 1
+    for doc in expired:
+        doc.reference.delete.assert_not_called()
@@ -0,0 +1,251 @@
+"""Tests for incremental Gmail sync and the local message cache."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from daily_task_assistant.mailer.gmail import GmailAccountConfig, GmailError
+from daily_task_assistant.mailer.history_sync import (
+    MessageCache,
+    get_thread_cached,
+    hydrate_cached,
+    save_thread_summary,
+    sync_history,
+)
+from daily_task_assistant.mailer.inbox import AttachmentInfo, EmailMessage
+
+
+MODULE = "daily_task_assistant.mailer.history_sync"
+
+
+@pytest.fixture
+def account():
+    return GmailAccountConfig(
+        name="test",
+        client_id="cid",
+        client_secret="secret",
+        refresh_token="rt",
+        from_address="Test@Example.com",
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MessageCache(tmp_path / "messages.sqlite3")
+
+
+def _message(msg_id: str, *, labels=None, body=None) -> EmailMessage:
+    labels = labels if labels is not None else ["INBOX", "UNREAD"]
+    return EmailMessage(
+        id=msg_id,
+        thread_id=f"t-{msg_id}",
+        from_address="sender@example.com",
+        from_name="Sender",
+        to_address="test@example.com",
+        subject=f"Subject {msg_id}",
+        snippet="snippet",
+        date=datetime(2025, 12, 1, 9, 30, tzinfo=timezone.utc),
+        is_unread="UNREAD" in labels,
+        labels=list(labels),
+        body=body,
+        attachments=[AttachmentInfo("a.pdf", "application/pdf", 10, "att-1")],
+        attachment_count=1,
+        history_id="100",
+    )
+
+
+class TestMessageCache:
+    def test_round_trip_preserves_fields(self, cache):
+        original = _message("m1", body="hello")
+        cache.put_many("box", [original], format="full")
+
+        restored = cache.get_many("box", ["m1"], format="full")["m1"]
+
+        assert restored == original
+
+    def test_metadata_entry_does_not_serve_full(self, cache):
+        cache.put_many("box", [_message("m1")], format="metadata")
+
+        assert cache.get_many("box", ["m1"], format="full") == {}
+        assert "m1" in cache.get_many("box", ["m1"], format="metadata")
+
+    def test_put_never_downgrades_format(self, cache):
+        cache.put_many("box", [_message("m1", body="full body")], format="full")
+        cache.put_many("box", [_message("m1")], format="metadata")
+
+        assert cache.get_many("box", ["m1"], format="full")["m1"].body == "full body"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = MessageCache(tmp_path / "lru.sqlite3", max_messages=2)
+        cache.put_many("box", [_message("m1")])
+        cache.put_many("box", [_message("m2")])
+        cache.get_many("box", ["m1"])
+        cache.put_many("box", [_message("m3")])
+
+        assert set(cache.get_many("box", ["m1", "m2", "m3"])) == {"m1", "m3"}
+
+
+class TestSyncHistory:
+    def test_first_sync_records_history_id(self, account, cache):
+        with patch(f"{MODULE}.get_history_id", return_value="500"), \
+             patch(f"{MODULE}.list_history") as mock_list:
+            delta = sync_history(account, cache=cache)
+
+        assert delta.reset is True
+        assert cache.get_history_id("test@example.com") == "500"
+        mock_list.assert_not_called()
+
+    def test_applies_label_changes_and_deletions(self, account, cache):
+        mailbox = "test@example.com"
+        cache.set_history_id(mailbox, "100")
+        cache.put_many(mailbox, [_message("m1"), _message("m2")])
+        records = [
+            {"labelsRemoved": [{"message": {"id": "m1", "labelIds": ["INBOX"]}, "labelIds": ["UNREAD"]}]},
+            {"messagesDeleted": [{"message": {"id": "m2"}}]},
+            {"messagesAdded": [{"message": {"id": "m3"}}]},
+        ]
+
+        with patch(f"{MODULE}.list_history", return_value=(records, None, "150")):
+            delta = sync_history(account, cache=cache)
+
+        cached = cache.get_many(mailbox, ["m1", "m2"])
+        assert cached["m1"].is_unread is False
+        assert cached["m1"].labels == ["INBOX"]
+        assert "m2" not in cached
+        assert delta.added == ["m3"]
+        assert delta.deleted == ["m2"]
+        assert cache.get_history_id(mailbox) == "150"
+
+    def test_follows_history_pages(self, account, cache):
+        cache.set_history_id("test@example.com", "100")
+        pages = [([], "page-2", "120"), ([], None, "130")]
+
+        with patch(f"{MODULE}.list_history", side_effect=pages) as mock_list:
+            delta = sync_history(account, cache=cache)
+
+        assert mock_list.call_count == 2
+        assert mock_list.call_args.kwargs["page_token"] == "page-2"
+        assert delta.history_id == "130"
+
+    def test_expired_history_id_resets_cache(self, account, cache):
+        mailbox = "test@example.com"
+        cache.set_history_id(mailbox, "1")
+        cache.put_many(mailbox, [_message("m1")])
+
+        with patch(
+            f"{MODULE}.list_history",
+            side_effect=GmailError("Requested entity was not found.", status_code=404),
+        ), patch(f"{MODULE}.get_history_id", return_value="900"):
+            delta = sync_history(account, cache=cache)
+
+        assert delta.reset is True
+        assert cache.count(mailbox) == 0
+        assert cache.get_history_id(mailbox) == "900"
+
+    def test_other_errors_propagate(self, account, cache):
+        cache.set_history_id("test@example.com", "1")
+
+        with patch(
+            f"{MODULE}.list_history",
+            side_effect=GmailError("Gmail history list failed (500): boom", status_code=500),
+        ):
+            with pytest.raises(GmailError):
+                sync_history(account, cache=cache)
+
+
+class TestHydrateCached:
+    def test_fetches_only_misses_and_preserves_order(self, account, cache):
+        mailbox = "test@example.com"
+        cache.set_history_id(mailbox, "100")
+        cache.put_many(mailbox, [_message("m2")], format="full")
+
+        def fake_get(acct, msg_id, format="metadata"):
+            return _message(msg_id)
+
+        with patch(f"{MODULE}.list_history", return_value=([], None, "100")), \
+             patch("daily_task_assistant.mailer.inbox.get_message", side_effect=fake_get) as mock_get:
+            result = hydrate_cached(account, ["m1", "m2", "m3"], format="full", cache=cache)
+
+        assert [m.id for m in result.messages] == ["m1", "m2", "m3"]
+        fetched = sorted(call.args[1] for call in mock_get.call_args_list)
+        assert fetched == ["m1", "m3"]
+        assert cache.count(mailbox) == 3
+
+    def test_failures_are_reported_not_cached(self, account, cache):
+        cache.set_history_id("test@example.com", "100")
+
+        with patch(f"{MODULE}.list_history", return_value=([], None, "100")), \
+             patch(
+                 "daily_task_assistant.mailer.inbox.get_message",
+                 side_effect=GmailError("Gmail get message failed (404): gone"),
+             ):
+            result = hydrate_cached(account, ["m1"], cache=cache)
+
+        assert result.messages == []
+        assert "m1" in result.failures
+        assert cache.count("test@example.com") == 0
+
+    def test_disabled_cache_fetches_live(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_GMAIL_CACHE", "0")
+        cache.put_many("test@example.com", [_message("m1")])
+
+        with patch(
+            "daily_task_assistant.mailer.inbox.get_message",
+            return_value=_message("m1"),
+        ) as mock_get:
+            result = hydrate_cached(account, ["m1"], cache=cache)
+
+        assert [m.id for m in result.messages] == ["m1"]
+        mock_get.assert_called_once()
+
+
+class TestGetThreadCached:
+    @staticmethod
+    def _refs(*ids, labels=("INBOX",)):
+        return [{"id": msg_id, "labelIds": list(labels)} for msg_id in ids]
+
+    def _get(self, account, cache, history_id, refs):
+        with patch(f"{MODULE}.get_thread_state", return_value=(history_id, refs)), \
+             patch(
+                 "daily_task_assistant.mailer.inbox.get_message",
+                 side_effect=lambda acct, msg_id, format="metadata": _message(msg_id, body="hi"),
+             ) as mock_get:
+            snapshot = get_thread_cached(account, "t1", cache=cache)
+        return snapshot, sorted(call.args[1] for call in mock_get.call_args_list)
+
+    def test_unchanged_thread_is_served_from_cache(self, account, cache):
+        first, fetched = self._get(account, cache, "200", self._refs("m1", "m2"))
+        save_thread_summary(account, "t1", "summary", ["m1"], cache=cache)
+        second, refetched = self._get(account, cache, "200", self._refs("m1", "m2"))
+
+        assert fetched == ["m1", "m2"] and refetched == []
+        assert not first.unchanged and second.unchanged
+        assert [m.body for m in second.messages] == ["hi", "hi"]
+        assert (second.summary, second.summary_message_ids) == ("summary", ["m1"])
+
+    def test_changed_thread_fetches_only_new_messages(self, account, cache):
+        self._get(account, cache, "200", self._refs("m1", "m2"))
+        save_thread_summary(account, "t1", "summary", ["m1"], cache=cache)
+
+        snapshot, fetched = self._get(
+            account, cache, "250", self._refs("m1", "m2", "m3", labels=("INBOX", "UNREAD"))
+        )
+
+        assert fetched == ["m3"]
+        assert not snapshot.unchanged
+        assert [m.id for m in snapshot.messages] == ["m1", "m2", "m3"]
+        # Labels come from the fresh minimal refs, not the cached copies
+        assert all(m.is_unread for m in snapshot.messages)
+        # The old summary is returned so the caller can extend it
+        assert snapshot.summary_message_ids == ["m1"]
+
+    def test_disabled_cache_fetches_thread_live(self, account, cache, monkeypatch):
+        monkeypatch.setenv("DTA_GMAIL_CACHE", "0")
+
+        with patch(f"{MODULE}.get_thread_messages", return_value=[_message("m1")]) as mock_thread:
+            snapshot = get_thread_cached(account, "t1", cache=cache)
+
+        mock_thread.assert_called_once_with(account, "t1", format="full")
+        assert snapshot.summary is None
@@ -0,0 +1,133 @@
+"""Tests for the shared Google OAuth access-token cache."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from daily_task_assistant.google_oauth import (
+    clear_token_cache,
+    get_cached_access_token,
+    get_cached_access_token_async,
+    invalidate_access_token,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def test_token_is_reused_until_expiry():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return f"token-{len(calls)}", 3600
+
+    assert get_cached_access_token("client", "refresh", fetch) == "token-1"
+    assert get_cached_access_token("client", "refresh", fetch) == "token-1"
+    assert len(calls) == 1
+
+
+def test_token_refreshes_inside_margin(monkeypatch):
+    monkeypatch.setenv("DTA_OAUTH_REFRESH_MARGIN", "120")
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        # Expires within the refresh margin, so never considered fresh
+        return f"token-{len(calls)}", 60
+
+    get_cached_access_token("client", "refresh", fetch)
+    assert get_cached_access_token("client", "refresh", fetch) == "token-2"
+
+
+def test_tokens_are_keyed_by_credentials():
+    get_cached_access_token("client", "refresh-a", lambda: ("a", 3600))
+    get_cached_access_token("client", "refresh-b", lambda: ("b", 3600))
+
+    assert get_cached_access_token("client", "refresh-a", lambda: ("x", 3600)) == "a"
+    assert get_cached_access_token("client", "refresh-b", lambda: ("x", 3600)) == "b"
+
+
+def test_invalidate_forces_refresh():
+    get_cached_access_token("client", "refresh", lambda: ("old", 3600))
+    invalidate_access_token("client", "refresh")
+
+    assert get_cached_access_token("client", "refresh", lambda: ("new", 3600)) == "new"
+
+
+def test_concurrent_callers_share_one_refresh():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return "shared", 3600
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(get_cached_access_token("client", "refresh", fetch))
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["shared"] * 8
+    assert len(calls) == 1
+
+
+def test_fetch_errors_propagate_and_are_not_cached():
+    def failing():
+        raise RuntimeError("token endpoint down")
+
+    with pytest.raises(RuntimeError):
+        get_cached_access_token("client", "refresh", failing)
+
+    assert get_cached_access_token("client", "refresh", lambda: ("ok", 3600)) == "ok"
+
+
+def test_gmail_fetch_access_token_uses_cache():
+    from daily_task_assistant.mailer.gmail import GmailAccountConfig, _fetch_access_token
+
+    account = GmailAccountConfig(
+        name="test",
+        client_id="cid",
+        client_secret="secret",
+        refresh_token="rt",
+        from_address="test@example.com",
+    )
+    with patch(
+        "daily_task_assistant.mailer.gmail._request_access_token",
+        return_value=("gmail-token", 3600),
+    ) as mock_request:
+        assert _fetch_access_token(account) == "gmail-token"
+        assert _fetch_access_token(account) == "gmail-token"
+
+    mock_request.assert_called_once_with(account)
+
+
+def test_async_lookup_shares_the_cache():
+    calls = []
+
+    def fetch():
+        calls.append(threading.current_thread())
+        return "token", 3600
+
+    async def lookup():
+        return [await get_cached_access_token_async("client", "refresh", fetch) for _ in range(2)]
+
+    assert asyncio.run(lookup()) == ["token", "token"]
+    assert get_cached_access_token("client", "refresh", lambda: ("x", 3600)) == "token"
+    # The one refresh ran off the event loop's thread
+    assert calls != [threading.current_thread()] and len(calls) == 1
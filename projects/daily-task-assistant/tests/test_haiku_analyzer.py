@@ -21,6 +21,7 @@ from daily_task_assistant.email.haiku_analyzer import (
     sanitize_content,
     prepare_email_for_haiku,
     analyze_email_with_haiku,
+    analyze_emails_with_haiku_batch,
     _parse_haiku_response,
     _build_analysis_result,
     _create_fallback_result,
@@ -28,10 +29,12 @@ from daily_task_assistant.email.haiku_analyzer import (
     HaikuAttentionResult,
     HaikuActionResult,
     HaikuRuleResult,
+    HaikuBatchEmail,
     PrivacySanitizeResult,
     SENSITIVE_DOMAINS,
     CONTENT_MASK_PATTERNS,
 )
+from daily_task_assistant.llm.anthropic_client import AnthropicError
 from daily_task_assistant.email.haiku_usage import (
     HaikuSettings,
     HaikuUsage,
@@ -40,6 +43,8 @@ from daily_task_assistant.email.haiku_usage import (
     get_usage,
     save_usage,
     increment_usage,
+    reserve_usage,
+    release_usage,
     can_use_haiku,
     get_usage_summary,
     DEFAULT_DAILY_LIMIT,
@@ -530,6 +535,33 @@ class TestHaikuUsageStorage:
         assert usage.daily_count == 2
         assert usage.weekly_count == 2
 
+    def test_reserve_usage_grants_up_to_remaining(self, temp_storage):
+        """Should count a whole batch at once, capped by the limits."""
+        save_settings(HaikuSettings(daily_limit=10, weekly_limit=100))
+        save_usage(HaikuUsage(daily_count=7, weekly_count=7))
+
+        assert reserve_usage(5) == 3
+        assert get_usage().daily_count == 10
+        assert reserve_usage(1) == 0
+
+    def test_reserve_usage_disabled(self, temp_storage):
+        """Should grant nothing when Haiku is disabled."""
+        save_settings(HaikuSettings(enabled=False))
+
+        assert reserve_usage(5) == 0
+        assert get_usage().daily_count == 0
+
+    def test_release_usage_returns_unused_calls(self, temp_storage):
+        """Should give back reserved calls without going negative."""
+        reserve_usage(4)
+        release_usage(3)
+        assert get_usage().daily_count == 1
+
+        release_usage(5)
+        usage = get_usage()
+        assert usage.daily_count == 0
+        assert usage.weekly_count == 0
+
     def test_can_use_haiku(self, temp_storage):
         """Should check combined settings and usage (GLOBAL - no user_id)."""
         # Should be able to use with defaults
@@ -677,3 +709,124 @@ class TestHaikuAnalysisIntegration:
         # The account number should be masked
         assert "123456789012" not in prompt
         assert "[ACCT-XXXX]" in prompt
+
+
+class TestHaikuBatchAnalysis:
+    """Tests for multi-email Haiku requests."""
+
+    @staticmethod
+    def _email(email_id: str, **overrides) -> HaikuBatchEmail:
+        fields = dict(
+            email_id=email_id,
+            sender_email=f"{email_id}@example.com",
+            sender_name="Sender",
+            subject=f"Subject {email_id}",
+            snippet="Can you take a look?",
+            date="2025-01-15",
+        )
+        fields.update(overrides)
+        return HaikuBatchEmail(**fields)
+
+    @staticmethod
+    def _response(entries) -> Mock:
+        text = entries if isinstance(entries, str) else json.dumps(entries)
+        return Mock(content=[Mock(type="text", text=text)])
+
+    @staticmethod
+    def _entry(email_id: str, needs_attention: bool = True) -> dict:
+        return {
+            "email_id": email_id,
+            "attention": {"needs_attention": needs_attention, "urgency": "medium"},
+            "action": {"recommended": "keep"},
+            "rule": {"should_suggest": False},
+            "confidence": 0.8,
+        }
+
+    def test_single_request_for_whole_batch(self):
+        """Should send every email in one prompt and map entries by ID."""
+        client = Mock()
+        client.messages.create.return_value = self._response(
+            [self._entry("b"), self._entry("a", needs_attention=False)]
+        )
+
+        results = analyze_emails_with_haiku_batch(
+            [self._email("a"), self._email("b")], client=client
+        )
+
+        client.messages.create.assert_called_once()
+        prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "[email_id: a]" in prompt and "[email_id: b]" in prompt
+        assert prompt.count("DAVID'S ROLES AND RESPONSIBILITIES") == 1
+        assert results["a"].attention.needs_attention is False
+        assert results["b"].attention.needs_attention is True
+        assert results["b"].analysis_method == "haiku"
+
+    def test_retries_only_missing_or_invalid_entries(self):
+        """Should re-request just the emails without a valid entry."""
+        client = Mock()
+        client.messages.create.side_effect = [
+            self._response([
+                self._entry("a"),
+                {"email_id": "b", "attention": "oops"},
+                self._entry("unknown"),
+            ]),
+            self._response([self._entry("b"), self._entry("c")]),
+        ]
+
+        results = analyze_emails_with_haiku_batch(
+            [self._email("a"), self._email("b"), self._email("c")], client=client
+        )
+
+        retry_prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "[email_id: a]" not in retry_prompt
+        assert "[email_id: b]" in retry_prompt and "[email_id: c]" in retry_prompt
+        assert set(results) == {"a", "b", "c"}
+
+    def test_malformed_sections_do_not_drop_the_batch(self):
+        """A null action or string rule should not discard the other entries."""
+        client = Mock()
+        broken = dict(self._entry("b"), action=None, rule="none")
+        client.messages.create.return_value = self._response([self._entry("a"), broken])
+
+        results = analyze_emails_with_haiku_batch(
+            [self._email("a"), self._email("b")], client=client
+        )
+
+        client.messages.create.assert_called_once()
+        assert set(results) == {"a", "b"}
+        assert results["b"].action.action == "keep"
+        assert results["b"].rule.should_suggest is False
+
+    def test_unparseable_response_retries_then_gives_up(self):
+        """Emails that never get a valid entry should be left out."""
+        client = Mock()
+        client.messages.create.side_effect = [
+            self._response("not json"),
+            self._response({"email_id": "a"}),
+        ]
+
+        results = analyze_emails_with_haiku_batch([self._email("a")], client=client)
+
+        assert client.messages.create.call_count == 2
+        assert results == {}
+
+    def test_first_request_failure_raises(self):
+        """API errors on the first request should surface like single analysis."""
+        client = Mock()
+        client.messages.create.side_effect = RuntimeError("boom")
+
+        with pytest.raises(AnthropicError):
+            analyze_emails_with_haiku_batch([self._email("a")], client=client)
+
+    def test_masks_sensitive_content(self):
+        """Batch prompts should go through the same content masking."""
+        client = Mock()
+        client.messages.create.return_value = self._response([self._entry("a")])
+
+        analyze_emails_with_haiku_batch(
+            [self._email("a", snippet="Please pay to account 123456789012")],
+            client=client,
+        )
+
+        prompt = client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "123456789012" not in prompt
@@ -242,6 +242,35 @@ class TestAnalyzeEmailWithHaikuSafe:
 class TestDetectAttentionWithHaiku:
     """Tests for the main Haiku-enhanced attention detection."""
 
+    @pytest.fixture(autouse=True)
+    def quota(self, monkeypatch):
+        """Grant every reservation without touching usage storage.
+
+        Batching is disabled so each email goes through the (mocked)
+        single-email path; batch tests opt back in.
+        """
+        monkeypatch.setenv("DTA_HAIKU_BATCH_SIZE", "1")
+        with patch(
+            "daily_task_assistant.email.analyzer.reserve_haiku_usage",
+            side_effect=lambda count: count,
+        ) as mock_reserve, patch(
+            "daily_task_assistant.email.analyzer.release_haiku_usage",
+        ) as mock_release:
+            yield mock_reserve, mock_release
+
+    def _detect(self, messages, email_account="personal"):
+        return detect_attention_with_haiku(
+            messages=messages,
+            email_account=email_account,
+            user_id="user@test.com",
+            church_roles=DEFAULT_CHURCH_ROLES,
+            personal_contexts=DEFAULT_PERSONAL_CONTEXTS,
+            vip_senders=DEFAULT_VIP_SENDERS,
+            church_attention_patterns=DEFAULT_CHURCH_PATTERNS,
+            personal_attention_patterns=DEFAULT_PERSONAL_PATTERNS,
+            not_actionable_patterns=DEFAULT_NOT_ACTIONABLE,
+        )
+
     @patch("daily_task_assistant.email.analyzer.can_use_haiku")
     @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
     def test_vip_senders_bypass_haiku(self, mock_haiku_safe, mock_can_use):
@@ -539,6 +568,157 @@ class TestDetectAttentionWithHaiku:
         assert "skip1" not in results  # Not actionable was skipped
 
 
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
+    def test_batch_reserves_quota_once(self, mock_haiku_safe, _mock_can_use, quota):
+        """Should reserve the whole batch up front instead of per-email checks."""
+        mock_reserve, mock_release = quota
+        mock_haiku_safe.return_value = make_haiku_result(needs_attention=False)
+        emails = [make_email(email_id=f"e{i}") for i in range(5)]
+
+        _, results = self._detect(emails)
+
+        mock_reserve.assert_called_once_with(5)
+        mock_release.assert_not_called()
+        assert set(results) == {f"e{i}" for i in range(5)}
+        assert all(
+            call.kwargs["count_usage"] is False
+            for call in mock_haiku_safe.call_args_list
+        )
+
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
+    def test_partial_grant_falls_back_for_the_rest(
+        self, mock_haiku_safe, _mock_can_use, quota
+    ):
+        """Emails beyond the granted quota should use profile/regex."""
+        mock_reserve, _ = quota
+        mock_reserve.side_effect = lambda count: 1
+        mock_haiku_safe.return_value = make_haiku_result(needs_attention=False)
+        emails = [
+            make_email(email_id="first"),
+            make_email(
+                email_id="second",
+                subject="Can you review this?",
+                snippet="Please review this document when you have a chance.",
+            ),
+        ]
+
+        items, results = self._detect(emails)
+
+        assert mock_haiku_safe.call_count == 1
+        assert list(results) == ["first"]
+        assert [(i.email.id, i.analysis_method) for i in items] == [
+            ("second", "regex")
+        ]
+
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
+    def test_failed_calls_release_quota(self, mock_haiku_safe, _mock_can_use, quota):
+        """Errors and privacy skips should hand their reserved calls back."""
+        _, mock_release = quota
+        mock_haiku_safe.side_effect = [
+            None,
+            make_haiku_result(analysis_method="skipped", skipped_reason="blocked"),
+            make_haiku_result(needs_attention=False),
+        ]
+        emails = [make_email(email_id=f"e{i}") for i in range(3)]
+
+        with patch.dict("os.environ", {"DTA_HAIKU_MAX_CONCURRENCY": "1"}):
+            _, results = self._detect(emails)
+
+        mock_release.assert_called_once_with(2)
+        assert list(results) == ["e2"]
+
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
+    def test_concurrent_results_keep_inbox_order(
+        self, mock_haiku_safe, _mock_can_use
+    ):
+        """Items should follow message order even when calls finish out of order."""
+        import threading
+        import time
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_analysis(email, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Earlier emails finish last
+            time.sleep(0.02 * (5 - int(email.id[1:])))
+            with lock:
+                active -= 1
+            return make_haiku_result(needs_attention=True, reason=email.id)
+
+        mock_haiku_safe.side_effect = slow_analysis
+        emails = [make_email(email_id=f"e{i}") for i in range(5)]
+        emails.insert(2, make_email(
+            email_id="vip", from_name="Pastor Smith", subject="Meeting update",
+        ))
+
+        with patch.dict("os.environ", {"DTA_HAIKU_MAX_CONCURRENCY": "3"}):
+            items, _ = self._detect(emails, email_account="church")
+
+        assert [i.email.id for i in items] == ["e0", "e1", "vip", "e2", "e3", "e4"]
+        assert 1 < peak <= 3
+
+
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_email_with_haiku_safe")
+    @patch("daily_task_assistant.email.analyzer.analyze_emails_with_haiku_batch")
+    def test_batches_candidates_and_falls_back_per_email(
+        self, mock_batch, mock_single, _mock_can_use, quota, monkeypatch
+    ):
+        """Candidates share requests; emails missing from the batch fall back."""
+        _, mock_release = quota
+        monkeypatch.setenv("DTA_HAIKU_BATCH_SIZE", "2")
+        mock_batch.side_effect = lambda batch, **kwargs: {
+            email.email_id: make_haiku_result(reason=email.email_id)
+            for email in batch if email.email_id != "e1"
+        }
+        mock_single.return_value = make_haiku_result(reason="single")
+        emails = [make_email(email_id=f"e{i}") for i in range(5)]
+
+        items, results = self._detect(emails)
+
+        assert [len(call.args[0]) for call in mock_batch.call_args_list] == [2, 2]
+        mock_single.assert_called_once()
+        assert mock_single.call_args.kwargs["email"].id == "e4"
+        assert set(results) == {"e0", "e2", "e3", "e4"}
+        assert [i.email.id for i in items if i.analysis_method == "haiku"] == [
+            "e0", "e2", "e3", "e4"
+        ]
+        mock_release.assert_called_once_with(1)
+
+    @patch("daily_task_assistant.email.analyzer.can_use_haiku", return_value=True)
+    @patch("daily_task_assistant.email.analyzer.analyze_emails_with_haiku_batch")
+    @patch("daily_task_assistant.email.analyzer.is_sender_blocked")
+    def test_batch_keeps_privacy_checks(
+        self, mock_blocked, mock_batch, _mock_can_use, monkeypatch
+    ):
+        """Blocked senders should never be packed into a batch."""
+        monkeypatch.setenv("DTA_HAIKU_BATCH_SIZE", "10")
+        mock_blocked.side_effect = lambda address: address == "secret@bank.com"
+        mock_batch.side_effect = lambda batch, **kwargs: {
+            email.email_id: make_haiku_result() for email in batch
+        }
+        emails = [
+            make_email(email_id="ok1"),
+            make_email(email_id="blocked", from_address="secret@bank.com"),
+            make_email(email_id="ok2"),
+        ]
+
+        _, results = self._detect(emails)
+
+        sent = [email.email_id for email in mock_batch.call_args.args[0]]
+        assert sent == ["ok1", "ok2"]
+        assert "blocked" not in results
+
+
 # =============================================================================
 # Test Action Suggestions with Haiku (Sprint 3)
 # =============================================================================
@@ -0,0 +1,206 @@
+"""Tests for the shared HTTP transport."""
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from daily_task_assistant import http_transport
+from daily_task_assistant.http_transport import (
+    HTTPStatusError,
+    TransportError,
+    request,
+    request_json,
+    request_json_async,
+)
+
+
+@pytest.fixture
+def install_handler(monkeypatch):
+    """Swap the shared client for one backed by an in-process handler."""
+
+    monkeypatch.setenv("DTA_HTTP_BACKOFF", "0")
+
+    def _install(handler):
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_transport, "_client", client)
+        return client
+
+    yield _install
+    http_transport.close_http_client()
+
+
+def test_request_json_decodes_body(install_handler):
+    install_handler(lambda req: httpx.Response(200, json={"ok": True}))
+
+    assert request_json("GET", "https://api.example.com/x") == {"ok": True}
+
+
+def test_request_json_empty_body_returns_empty_dict(install_handler):
+    install_handler(lambda req: httpx.Response(204))
+
+    assert request_json("DELETE", "https://api.example.com/x") == {}
+
+
+def test_sends_json_body_and_params(install_handler):
+    seen = {}
+
+    def handler(req: httpx.Request) -> httpx.Response:
+        seen["url"] = str(req.url)
+        seen["body"] = req.content
+        seen["content_type"] = req.headers.get("content-type")
+        return httpx.Response(200, json={})
+
+    install_handler(handler)
+    request_json(
+        "PUT",
+        "https://api.example.com/rows",
+        params={"include": "a,b"},
+        json_body=[{"id": 1}],
+    )
+
+    assert "include=a%2Cb" in seen["url"]
+    assert json.loads(seen["body"]) == [{"id": 1}]
+    assert seen["content_type"] == "application/json"
+
+
+def test_retries_429_then_succeeds(install_handler):
+    calls = []
+
+    def handler(req):
+        calls.append(req.method)
+        if len(calls) < 3:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"done": True})
+
+    install_handler(handler)
+
+    assert request_json("POST", "https://api.example.com/x", retries=2) == {"done": True}
+    assert len(calls) == 3
+
+
+def test_does_not_retry_5xx_for_post(install_handler):
+    calls = []
+
+    def handler(req):
+        calls.append(1)
+        return httpx.Response(503, text="unavailable")
+
+    install_handler(handler)
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        request("POST", "https://api.example.com/send", retries=3)
+    assert excinfo.value.status_code == 503
+    assert len(calls) == 1
+
+
+def test_retries_5xx_for_get_until_exhausted(install_handler):
+    calls = []
+
+    def handler(req):
+        calls.append(1)
+        return httpx.Response(500, text="boom")
+
+    install_handler(handler)
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        request("GET", "https://api.example.com/x", retries=2)
+    assert excinfo.value.detail == "boom"
+    assert len(calls) == 3
+
+
+def test_client_error_is_not_retried(install_handler):
+    calls = []
+
+    def handler(req):
+        calls.append(1)
+        return httpx.Response(404, text="missing")
+
+    install_handler(handler)
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        request("GET", "https://api.example.com/x", retries=3)
+    assert excinfo.value.status_code == 404
+    assert len(calls) == 1
+
+
+def test_network_error_raises_transport_error(install_handler):
+    def handler(req):
+        raise httpx.ConnectError("connection refused", request=req)
+
+    install_handler(handler)
+
+    with pytest.raises(TransportError) as excinfo:
+        request("GET", "https://api.example.com/x", retries=1)
+    assert not isinstance(excinfo.value, HTTPStatusError)
+
+
+def test_shared_client_is_reused(monkeypatch):
+    http_transport.close_http_client()
+    monkeypatch.setenv("DTA_HTTP2", "0")
+    try:
+        first = http_transport.get_http_client()
+        assert http_transport.get_http_client() is first
+    finally:
+        http_transport.close_http_client()
+
+
+def _run_with_async_handler(monkeypatch, handler, coro_fn):
+    """Run coro_fn() on a fresh loop whose async client uses ``handler``."""
+    monkeypatch.setenv("DTA_HTTP_BACKOFF", "0")
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        http_transport._async_clients[loop] = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        try:
+            return await coro_fn()
+        finally:
+            await http_transport.close_async_http_client()
+
+    return asyncio.run(main())
+
+
+def test_async_request_retries_and_decodes(monkeypatch):
+    calls = []
+
+    def handler(req):
+        calls.append(req.method)
+        if len(calls) < 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"done": True})
+
+    result = _run_with_async_handler(
+        monkeypatch, handler, lambda: request_json_async("GET", "https://api.example.com/x")
+    )
+
+    assert result == {"done": True}
+    assert calls == ["GET", "GET"]
+
+
+def test_async_request_raises_status_error(monkeypatch):
+    def handler(req):
+        return httpx.Response(404, text="missing")
+
+    with pytest.raises(HTTPStatusError) as excinfo:
+        _run_with_async_handler(
+            monkeypatch, handler, lambda: request_json_async("GET", "https://api.example.com/x")
+        )
+    assert excinfo.value.status_code == 404
+
+
+def test_async_client_is_shared_per_loop(monkeypatch):
+    monkeypatch.setenv("DTA_HTTP2", "0")
+
+    async def main():
+        first = http_transport.get_async_http_client()
+        try:
+            assert http_transport.get_async_http_client() is first
+        finally:
+            await http_transport.close_async_http_client()
+        return first
+
+    assert asyncio.run(main()) is not asyncio.run(main())
@@ -5,9 +5,9 @@ by mocking the Gmail API responses.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -17,10 +17,18 @@ from daily_task_assistant.mailer.inbox import (
     _parse_email_address,
     _parse_email_date,
     _parse_message,
+    apply_label_by_name,
     get_inbox_summary,
+    get_label_by_name,
+    get_label_catalog,
+    invalidate_label_catalog,
     get_message,
+    get_inbox_summary_async,
     get_unread_messages,
+    hydrate_messages,
+    hydrate_messages_async,
     list_messages,
+    list_messages_async,
     search_messages,
 )
 from daily_task_assistant.mailer.gmail import GmailAccountConfig, GmailError
@@ -208,17 +216,12 @@ class TestListMessages:
     """Tests for list_messages function."""
     
     @patch("daily_task_assistant.mailer.inbox._fetch_access_token")
-    @patch("daily_task_assistant.mailer.inbox.urlrequest.urlopen")
+    @patch("daily_task_assistant.mailer.inbox.request_json")
     def test_list_messages_basic(
-        self, mock_urlopen, mock_fetch_token, mock_account, sample_message_list
+        self, mock_request, mock_fetch_token, mock_account, sample_message_list
     ):
         mock_fetch_token.return_value = "mock-access-token"
-        
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(sample_message_list).encode()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        mock_request.return_value = sample_message_list
         
         messages, next_token = list_messages(mock_account, max_results=10)
 
@@ -227,62 +230,58 @@ class TestListMessages:
         assert next_token is None  # No more pages in sample data
     
     @patch("daily_task_assistant.mailer.inbox._fetch_access_token")
-    @patch("daily_task_assistant.mailer.inbox.urlrequest.urlopen")
+    @patch("daily_task_assistant.mailer.inbox.request_json")
     def test_list_messages_with_query(
-        self, mock_urlopen, mock_fetch_token, mock_account
+        self, mock_request, mock_fetch_token, mock_account
     ):
         mock_fetch_token.return_value = "mock-access-token"
-        
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({"messages": []}).encode()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        mock_request.return_value = {"messages": []}
         
         messages, next_token = list_messages(mock_account, query="is:unread from:boss@company.com")
 
         # Verify URL contains the query
-        call_args = mock_urlopen.call_args
-        url = call_args[0][0].full_url
+        url = mock_request.call_args[0][1]
         assert "q=" in url
         assert "is%3Aunread" in url  # URL encoded
     
     @patch("daily_task_assistant.mailer.inbox._fetch_access_token")
-    @patch("daily_task_assistant.mailer.inbox.urlrequest.urlopen")
+    @patch("daily_task_assistant.mailer.inbox.request_json")
     def test_list_messages_with_labels(
-        self, mock_urlopen, mock_fetch_token, mock_account
+        self, mock_request, mock_fetch_token, mock_account
     ):
         mock_fetch_token.return_value = "mock-access-token"
-        
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({"messages": []}).encode()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        mock_request.return_value = {"messages": []}
         
         messages, next_token = list_messages(mock_account, label_ids=["INBOX", "UNREAD"])
 
-        call_args = mock_urlopen.call_args
-        url = call_args[0][0].full_url
+        url = mock_request.call_args[0][1]
         assert "labelIds=INBOX" in url
         assert "labelIds=UNREAD" in url
 
+    @patch("daily_task_assistant.mailer.inbox._fetch_access_token")
+    @patch("daily_task_assistant.mailer.inbox.request_json")
+    def test_list_messages_http_error_raises_gmail_error(
+        self, mock_request, mock_fetch_token, mock_account
+    ):
+        from daily_task_assistant.http_transport import HTTPStatusError
+
+        mock_fetch_token.return_value = "mock-access-token"
+        mock_request.side_effect = HTTPStatusError(403, "forbidden")
+
+        with pytest.raises(GmailError, match="Gmail list failed \\(403\\)"):
+            list_messages(mock_account)
+
 
 class TestGetMessage:
     """Tests for get_message function."""
     
     @patch("daily_task_assistant.mailer.inbox._fetch_access_token")
-    @patch("daily_task_assistant.mailer.inbox.urlrequest.urlopen")
+    @patch("daily_task_assistant.mailer.inbox.request_json")
     def test_get_message_returns_email_message(
-        self, mock_urlopen, mock_fetch_token, mock_account, sample_message_data
+        self, mock_request, mock_fetch_token, mock_account, sample_message_data
     ):
         mock_fetch_token.return_value = "mock-access-token"
-        
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps(sample_message_data).encode()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        mock_request.return_value = sample_message_data
         
         result = get_message(mock_account, "msg123")
         
@@ -422,3 +421,193 @@ class TestGetUnreadMessages:
         assert "is:unread" in call_kwargs["query"]
         assert "from:@company.com" in call_kwargs["query"]
 
+
+
+def _make_message(message_id: str) -> EmailMessage:
+    return EmailMessage(
+        id=message_id,
+        thread_id=message_id,
+        from_address="test@example.com",
+        from_name="Test",
+        to_address="me@example.com",
+        subject=f"Subject {message_id}",
+        snippet="Test",
+        date=datetime.now(timezone.utc),
+        is_unread=False,
+        labels=[],
+    )
+
+
+class TestHydrateMessages:
+    """Tests for hydrate_messages function."""
+
+    @patch("daily_task_assistant.mailer.inbox.get_message")
+    def test_preserves_request_order(self, mock_get, mock_account):
+        import time
+
+        def fake_get(account, message_id, format="metadata"):
+            # Earlier IDs finish last to exercise ordering
+            time.sleep(0.01 * (5 - int(message_id)))
+            return _make_message(message_id)
+
+        mock_get.side_effect = fake_get
+
+        result = hydrate_messages(mock_account, ["1", "2", "3", "4"], max_workers=4)
+
+        assert [m.id for m in result.messages] == ["1", "2", "3", "4"]
+        assert result.failures == {}
+
+    @patch("daily_task_assistant.mailer.inbox.get_message")
+    def test_reports_per_message_failures(self, mock_get, mock_account):
+        def fake_get(account, message_id, format="metadata"):
+            if message_id == "bad":
+                raise GmailError("Gmail get failed (404): not found")
+            return _make_message(message_id)
+
+        mock_get.side_effect = fake_get
+
+        result = hydrate_messages(mock_account, ["a", "bad", "c"])
+
+        assert [m.id for m in result.messages] == ["a", "c"]
+        assert list(result.failures) == ["bad"]
+        assert "404" in result.failures["bad"]
+
+    @patch("daily_task_assistant.mailer.inbox.get_message")
+    def test_passes_format_through(self, mock_get, mock_account):
+        mock_get.return_value = _make_message("1")
+
+        hydrate_messages(mock_account, ["1"], format="full")
+
+        mock_get.assert_called_once_with(mock_account, "1", format="full")
+
+    @patch("daily_task_assistant.mailer.inbox.get_message")
+    def test_empty_ids_makes_no_calls(self, mock_get, mock_account):
+        result = hydrate_messages(mock_account, [])
+
+        assert result.messages == []
+        mock_get.assert_not_called()
+
+
+class TestAsyncVariants:
+    """Tests for the *_async listing and hydration functions."""
+
+    @patch("daily_task_assistant.mailer.inbox._fetch_access_token_async", new_callable=AsyncMock)
+    @patch("daily_task_assistant.mailer.inbox.request_json_async", new_callable=AsyncMock)
+    def test_list_messages_async_builds_same_url(
+        self, mock_request, mock_fetch_token, mock_account, sample_message_list
+    ):
+        mock_fetch_token.return_value = "mock-access-token"
+        mock_request.return_value = sample_message_list
+
+        messages, next_token = asyncio.run(
+            list_messages_async(mock_account, label_ids=["INBOX"], query="is:unread")
+        )
+
+        assert [m["id"] for m in messages] == ["msg1", "msg2", "msg3"]
+        url = mock_request.call_args[0][1]
+        assert "labelIds=INBOX" in url and "is%3Aunread" in url
+
+    @patch("daily_task_assistant.mailer.inbox._fetch_access_token_async", new_callable=AsyncMock)
+    @patch("daily_task_assistant.mailer.inbox.request_json_async", new_callable=AsyncMock)
+    def test_list_messages_async_http_error_raises_gmail_error(
+        self, mock_request, mock_fetch_token, mock_account
+    ):
+        from daily_task_assistant.http_transport import HTTPStatusError
+
+        mock_fetch_token.return_value = "mock-access-token"
+        mock_request.side_effect = HTTPStatusError(403, "forbidden")
+
+        with pytest.raises(GmailError, match="Gmail list failed \\(403\\)"):
+            asyncio.run(list_messages_async(mock_account))
+
+    @patch("daily_task_assistant.mailer.inbox.get_message_async", new_callable=AsyncMock)
+    def test_hydrate_async_preserves_order_and_failures(self, mock_get, mock_account):
+        async def fake_get(account, message_id, format="metadata"):
+            # Earlier IDs finish last to exercise ordering
+            await asyncio.sleep(0.01 * (5 - int(message_id)))
+            if message_id == "3":
+                raise GmailError("Gmail get failed (404): not found")
+            return _make_message(message_id)
+
+        mock_get.side_effect = fake_get
+
+        result = asyncio.run(
+            hydrate_messages_async(mock_account, ["1", "2", "3", "4"], max_workers=4)
+        )
+
+        assert [m.id for m in result.messages] == ["1", "2", "4"]
+        assert list(result.failures) == ["3"]
+
+    @patch("daily_task_assistant.mailer.inbox.get_label_counts_async", new_callable=AsyncMock)
+    @patch("daily_task_assistant.mailer.inbox.hydrate_messages_async", new_callable=AsyncMock)
+    @patch("daily_task_assistant.mailer.inbox.list_messages_async", new_callable=AsyncMock)
+    def test_inbox_summary_async(self, mock_list, mock_hydrate, mock_counts, mock_account):
+        from daily_task_assistant.mailer.inbox import HydrationResult
+
+        mock_counts.side_effect = [
+            {"messagesUnread": 5},
+            {"messagesUnread": 2},
+        ]
+        mock_list.return_value = ([{"id": "1"}], "next")
+        mock_hydrate.return_value = HydrationResult(messages=[_make_message("1")])
+
+        summary = asyncio.run(get_inbox_summary_async(mock_account, max_recent=1))
+
+        assert summary.total_unread == 5
+        assert summary.unread_important == 2
+        assert [m.id for m in summary.recent_messages] == ["1"]
+        assert summary.next_page_token == "next"
+
+
+class TestLabelCatalog:
+    """Tests for the cached label catalogue."""
+
+    LABELS = {
+        "labels": [
+            {"id": "INBOX", "name": "INBOX", "type": "system"},
+            {"id": "Label_1", "name": "Receipts", "type": "user"},
+        ]
+    }
+
+    @pytest.fixture(autouse=True)
+    def clean_catalog(self):
+        invalidate_label_catalog()
+        yield
+        invalidate_label_catalog()
+
+    @pytest.fixture
+    def mock_request(self):
+        with patch("daily_task_assistant.mailer.inbox._fetch_access_token", return_value="tok"), \
+             patch("daily_task_assistant.mailer.inbox.request_json") as mock_request:
+            mock_request.return_value = self.LABELS
+            yield mock_request
+
+    def test_lookups_share_one_listing(self, mock_request, mock_account):
+        catalog = get_label_catalog(mock_account)
+
+        assert catalog.names_for(["Label_1", "INBOX", "Label_9"]) == [
+            "Receipts", "INBOX", "Label_9",
+        ]
+        assert get_label_by_name(mock_account, "receipts").id == "Label_1"
+        apply_label_by_name(mock_account, "msg1", "RECEIPTS")
+
+        label_lists = [c for c in mock_request.call_args_list if c.args[1].endswith("/labels")]
+        assert len(label_lists) == 1
+
+    def test_expired_catalog_is_relisted(self, mock_request, mock_account, monkeypatch):
+        monkeypatch.setenv("DTA_GMAIL_LABEL_TTL", "0")
+
+        get_label_catalog(mock_account)
+        get_label_catalog(mock_account)
+
+        assert mock_request.call_count == 2
+
+    def test_miss_on_cached_catalog_relists_once(self, mock_request, mock_account):
+        get_label_catalog(mock_account)
+        mock_request.return_value = {
+            "labels": self.LABELS["labels"] + [{"id": "Label_2", "name": "Travel", "type": "user"}]
+        }
+
+        assert get_label_by_name(mock_account, "Travel").id == "Label_2"
+        assert get_label_by_name(mock_account, "Missing") is None
+        assert mock_request.call_count == 3
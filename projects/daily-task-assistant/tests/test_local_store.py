@@ -0,0 +1,189 @@
+"""Tests for the embedded local store behind the file-mode stores."""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from daily_task_assistant.local_store import (
+    JsonLocalStore,
+    LocalStore,
+    SqliteLocalStore,
+    get_local_store,
+)
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def _doc(doc_id, status="pending", email_id=None, age_days=0, expires_in_days=None):
+    created = NOW - timedelta(days=age_days)
+    expires = NOW + timedelta(days=expires_in_days) if expires_in_days is not None else None
+    return {
+        "id": doc_id,
+        "status": status,
+        "email_id": email_id or f"msg-{doc_id}",
+        "created_at": created.isoformat(),
+        "expires_at": expires.isoformat() if expires else None,
+    }
+
+
+@pytest.fixture(params=[SqliteLocalStore, JsonLocalStore])
+def store(request, tmp_path):
+    return request.param(tmp_path / "store")
+
+
+def _ids(docs):
+    return sorted(d["id"] for d in docs)
+
+
+class TestLocalStore:
+    def test_round_trip_and_delete(self, store):
+        store.put("church", "a", _doc("a"))
+
+        assert store.get("church", "a")["id"] == "a"
+        assert store.get("personal", "a") is None
+        assert store.delete("church", "a") is True
+        assert store.delete("church", "a") is False
+        assert store.get("church", "a") is None
+
+    def test_query_filters(self, store):
+        store.put_many("church", {
+            "new": _doc("new", email_id="m1"),
+            "old": _doc("old", email_id="m1", age_days=40),
+            "done": _doc("done", status="approved"),
+            "gone": _doc("gone", status="expired", expires_in_days=-1),
+        })
+        store.put("personal", "other", _doc("other"))
+
+        assert _ids(store.query("church", status="pending")) == ["new", "old"]
+        assert _ids(store.query("church", status=("approved", "expired"))) == ["done", "gone"]
+        assert _ids(store.query("church", email_id="m1", status="pending")) == ["new", "old"]
+        cutoff = NOW - timedelta(days=30)
+        assert _ids(store.query("church", created_after=cutoff)) == ["done", "gone", "new"]
+        assert _ids(store.query("church", created_before=cutoff)) == ["old"]
+        assert _ids(store.query("church", expires_before=NOW)) == ["gone"]
+
+    def test_newest_first_with_limit(self, store):
+        store.put_many("", {f"c{i}": _doc(f"c{i}", age_days=i) for i in range(5)})
+
+        assert [d["id"] for d in store.query("", newest_first=True, limit=2)] == ["c0", "c1"]
+
+    def test_delete_where(self, store):
+        store.put_many("church", {
+            "live": _doc("live", expires_in_days=1),
+            "dead": _doc("dead", expires_in_days=-1),
+            "forever": _doc("forever"),
+        })
+
+        assert store.delete_where("church", expires_before=NOW) == 1
+        assert _ids(store.query("church")) == ["forever", "live"]
+
+    def test_backends_implement_the_interface(self, tmp_path):
+        class Partial(LocalStore):
+            def get(self, account, doc_id):
+                return None
+
+        with pytest.raises(TypeError):
+            Partial(tmp_path)
+
+    def test_field_mapping(self, tmp_path):
+        store = SqliteLocalStore(tmp_path, fields={"created_at": "pinned_at"})
+        store.put("church", "a", {"pinned_at": (NOW - timedelta(days=3)).isoformat()})
+
+        assert store.query("church", created_after=NOW - timedelta(days=5))
+        assert not store.query("church", created_after=NOW - timedelta(days=1))
+
+
+class TestSqliteBackend:
+    def test_legacy_json_records_are_imported_once(self, tmp_path):
+        legacy = tmp_path / "church"
+        legacy.mkdir()
+        (legacy / "a.json").write_text(json.dumps(_doc("a")), encoding="utf-8")
+        (legacy / "b.json").write_text(json.dumps(_doc("b", status="approved")))
+        (legacy / "broken.json").write_text("{not json")
+
+        store = SqliteLocalStore(tmp_path)
+
+        assert _ids(store.query("church", status="pending")) == ["a"]
+        assert store.get("church", "b")["status"] == "approved"
+        # Imported files are kept under a new name; unreadable ones are left as is
+        assert sorted(p.name for p in legacy.iterdir()) == [
+            "a.json.migrated", "b.json.migrated", "broken.json",
+        ]
+
+    def test_json_fallback_after_migration(self, tmp_path, monkeypatch):
+        legacy = tmp_path / "church"
+        legacy.mkdir()
+        (legacy / "a.json").write_text(json.dumps(_doc("a")), encoding="utf-8")
+        (legacy / "b.json").write_text(json.dumps(_doc("b", status="approved")))
+        assert get_local_store(tmp_path).get("church", "a") is not None
+
+        monkeypatch.setenv("DTA_LOCAL_STORE", "json")
+        store = get_local_store(tmp_path)
+
+        assert store.get("church", "b")["status"] == "approved"
+        assert _ids(store.query("church", status="pending")) == ["a"]
+        assert sorted(p.name for p in legacy.iterdir()) == ["a.json", "b.json"]
+
+    def test_filters_use_indexes(self, tmp_path):
+        store = SqliteLocalStore(tmp_path)
+        with sqlite3.connect(store.path) as conn:
+            for column in ("status", "email_id", "created_at", "expires_at"):
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT data FROM documents "
+                    f"WHERE account = ? AND {column} = ?",
+                    ("church", "x"),
+                ).fetchall()
+                assert f"idx_documents_{column}" in " ".join(str(row) for row in plan)
+
+    def test_backend_switch(self, tmp_path, monkeypatch):
+        assert isinstance(get_local_store(tmp_path / "a"), SqliteLocalStore)
+        monkeypatch.setenv("DTA_LOCAL_STORE", "json")
+        assert isinstance(get_local_store(tmp_path / "a"), JsonLocalStore)
+
+
+class TestAttentionStoreOnLocalStore:
+    @pytest.fixture(autouse=True)
+    def file_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DTA_ATTENTION_FORCE_FILE", "1")
+        monkeypatch.setenv("DTA_ATTENTION_DIR", str(tmp_path / "attention"))
+
+    def _record(self, email_id, **overrides):
+        from daily_task_assistant.email.attention_store import AttentionRecord
+
+        record = AttentionRecord(
+            email_id=email_id,
+            email_account="church",
+            user_id="test@test.com",
+            subject=f"Subject {email_id}",
+            from_address="a@example.com",
+            date=NOW,
+            snippet="",
+        )
+        for key, value in overrides.items():
+            setattr(record, key, value)
+        return record
+
+    def test_active_listing_purges_and_reactivates(self):
+        from daily_task_assistant.email.attention_store import (
+            get_attention,
+            get_dismissed_email_ids,
+            list_active_attention,
+            save_attentions,
+        )
+
+        save_attentions("church", [
+            self._record("active"),
+            self._record("expired", expires_at=NOW - timedelta(days=1)),
+            self._record("woke", status="snoozed", snoozed_until=NOW - timedelta(hours=1)),
+            self._record("sleeping", status="snoozed", snoozed_until=NOW + timedelta(days=1)),
+            self._record("dismissed", status="dismissed"),
+        ])
+
+        assert sorted(r.email_id for r in list_active_attention("church")) == ["active", "woke"]
+        assert get_attention("church", "expired") is None
+        assert get_attention("church", "woke").status == "active"
+        assert get_dismissed_email_ids("church") == {"dismissed"}
@@ -0,0 +1,272 @@
+"""Tests for per-day metric rollups behind the stats endpoints."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from daily_task_assistant import metric_rollups
+from daily_task_assistant.local_store import JsonLocalStore, SqliteLocalStore
+from daily_task_assistant.metric_rollups import (
+    read_rollups_firestore,
+    rebuild_rollups_firestore,
+    rollup_deltas,
+    save_many_with_rollups,
+    save_with_rollups,
+    window_start,
+)
+
+
+NOW = datetime.now(timezone.utc)
+TODAY = NOW.date().isoformat()
+
+
+def _keys(data):
+    return ["total", f"status:{data['status']}"]
+
+
+def _doc(status="pending", age_days=0):
+    return {"status": status, "created_at": (NOW - timedelta(days=age_days)).isoformat()}
+
+
+class TestRollupDeltas:
+    def test_new_record(self):
+        assert rollup_deltas(_keys, None, _doc()) == {TODAY: {"total": 1, "status:pending": 1}}
+
+    def test_decision_moves_status_only(self):
+        deltas = rollup_deltas(_keys, _doc(), _doc("approved"))
+
+        assert deltas == {TODAY: {"status:pending": -1, "status:approved": 1}}
+
+    def test_unchanged_record(self):
+        assert rollup_deltas(_keys, _doc(), _doc()) == {}
+
+
+@pytest.fixture(params=[SqliteLocalStore, JsonLocalStore])
+def store_cls(request):
+    return request.param
+
+
+class TestLocalRollups:
+    def test_puts_maintain_counters(self, store_cls, tmp_path):
+        store = store_cls(tmp_path, rollup_keys=_keys)
+        store.read_rollups("church", window_start(30))
+        store.put_many("church", {"a": _doc(), "b": _doc(), "old": _doc(age_days=40)})
+        store.put("church", "a", _doc("approved"))
+
+        counts = store.read_rollups("church", window_start(30))
+
+        assert counts == {"total": 2, "status:pending": 1, "status:approved": 1}
+
+    def test_deletes_keep_counts(self, store_cls, tmp_path):
+        store = store_cls(tmp_path, rollup_keys=_keys)
+        store.read_rollups("church", window_start(30))
+        store.put("church", "a", _doc("rejected"))
+        store.delete("church", "a")
+
+        assert store.read_rollups("church", window_start(30)) == {"total": 1, "status:rejected": 1}
+
+    def test_first_read_rebuilds_from_records(self, store_cls, tmp_path):
+        store_cls(tmp_path).put_many("church", {"a": _doc(), "b": _doc("approved")})
+
+        store = store_cls(tmp_path, rollup_keys=_keys)
+
+        assert store.read_rollups("church", window_start(30)) == {
+            "total": 2, "status:pending": 1, "status:approved": 1,
+        }
+        assert store.read_rollups("personal", window_start(30)) == {}
+
+
+class TestStoreStats:
+    @pytest.fixture(autouse=True)
+    def file_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DTA_SUGGESTION_FORCE_FILE", "1")
+        monkeypatch.setenv("DTA_SUGGESTION_DIR", str(tmp_path / "suggestions"))
+        monkeypatch.setenv("DTA_ATTENTION_FORCE_FILE", "1")
+        monkeypatch.setenv("DTA_ATTENTION_DIR", str(tmp_path / "attention"))
+
+    def test_approval_stats_read_counters_not_records(self):
+        from daily_task_assistant.email import suggestion_store
+        from daily_task_assistant.email.suggestion_store import (
+            create_suggestion,
+            get_approval_stats,
+            record_suggestion_decision,
+        )
+
+        ids = [
+            create_suggestion(
+                "church", f"msg-{i}", "test@test.com", action="archive",
+                rationale="", confidence=0.9, analysis_method=method,
+            ).suggestion_id
+            for i, method in enumerate(["regex", "regex", "haiku"])
+        ]
+        record_suggestion_decision("church", ids[0], approved=True)
+        record_suggestion_decision("church", ids[2], approved=False)
+
+        store = suggestion_store._local_store()
+        with patch.object(store, "query", side_effect=AssertionError("scanned records")):
+            stats = get_approval_stats("church")
+
+        assert (stats["total"], stats["approved"], stats["rejected"], stats["pending"]) == (3, 1, 1, 1)
+        assert stats["by_action"] == {"archive": {"approved": 1, "rejected": 1}}
+        assert stats["by_method"] == {
+            "regex": {"approved": 1, "rejected": 0},
+            "haiku": {"approved": 0, "rejected": 1},
+        }
+        assert stats["approval_rate"] == 0.5
+
+    def test_attention_quality_metrics_follow_actions(self):
+        from daily_task_assistant.email.attention_store import (
+            AttentionRecord,
+            get_quality_metrics,
+            mark_email_replied,
+            save_attentions,
+        )
+
+        save_attentions("church", [
+            AttentionRecord(
+                email_id=email_id, email_account="church", user_id="test@test.com",
+                subject="", from_address="a@example.com", date=NOW, snippet="",
+                analysis_method="haiku",
+            )
+            for email_id in ("a", "b")
+        ])
+        mark_email_replied("church", "a")
+
+        metrics = get_quality_metrics("church")
+
+        assert metrics["total"] == 2
+        assert metrics["by_method"]["haiku"] == 2
+        assert metrics["by_action"]["email_replied"] == 1
+        assert metrics["acceptance_rate"] == 0.5
+
+
+class TestFirestoreRollups:
+    def test_save_applies_counters_in_the_same_transaction(self):
+        db, transaction = Mock(), Mock()
+        doc_ref = Mock()
+        doc_ref.get.return_value = SimpleNamespace(exists=True, to_dict=lambda: _doc())
+        rollups = db.collection.return_value.document.return_value.collection.return_value
+        rollups.document.side_effect = lambda doc_id: SimpleNamespace(id=doc_id)
+
+        with patch.object(metric_rollups, "_run_transaction", lambda db, fn: fn(transaction)):
+            save_with_rollups(db, doc_ref, _doc("approved"), account="church",
+                              store="suggestions", keys=_keys)
+
+        doc_ref.get.assert_called_once_with(transaction=transaction)
+        record_write, counter_write = transaction.set.call_args_list
+        assert record_write.args == (doc_ref, _doc("approved"))
+        assert counter_write.args[0].id == f"suggestions_{TODAY}"
+        counts = {key: inc.value for key, inc in counter_write.args[1]["counts"].items()}
+        assert counts == {"status:pending": -1, "status:approved": 1}
+        assert counter_write.kwargs == {"merge": True}
+
+    def test_window_reads_one_document_per_day(self):
+        db, collection_ref = Mock(), Mock()
+        rollups = db.collection.return_value.document.return_value.collection.return_value
+        rollups.document.side_effect = lambda doc_id: SimpleNamespace(id=doc_id)
+
+        def snapshot(doc_id, counts=None):
+            return SimpleNamespace(id=doc_id, exists=True, to_dict=lambda: {"counts": counts})
+
+        db.get_all.return_value = [
+            snapshot("attention_state"),
+            snapshot(f"attention_{TODAY}", {"total": 2}),
+            snapshot(f"attention_{window_start(7)}", {"total": 1}),
+        ]
+
+        counts = read_rollups_firestore(db, collection_ref, account="church",
+                                        store="attention", keys=_keys, days=7)
+
+        assert counts == {"total": 3}
+        [refs] = db.get_all.call_args.args
+        assert len(refs) == 1 + 8
+        collection_ref.stream.assert_not_called()
+
+    def test_missing_counters_are_rebuilt(self):
+        db, collection_ref = Mock(), Mock()
+        rollups = db.collection.return_value.document.return_value.collection.return_value
+        rollups.document.side_effect = lambda doc_id: SimpleNamespace(id=doc_id, path=doc_id)
+        rollups.where.return_value.stream.return_value = []
+        db.get_all.return_value = []
+        collection_ref.stream.return_value = [
+            SimpleNamespace(to_dict=lambda: _doc()),
+            SimpleNamespace(to_dict=lambda: _doc("approved", age_days=60)),
+        ]
+
+        counts = read_rollups_firestore(db, collection_ref, account="church",
+                                        store="suggestions", keys=_keys, days=30)
+
+        assert counts == {"total": 1, "status:pending": 1}
+        written = [call.args[0].id for call in db.batch.return_value.set.call_args_list]
+        assert f"suggestions_{TODAY}" in written and "suggestions_state" in written
+
+
+class FailingCountersDb:
+    """Firestore stand-in whose writes to metric_rollups documents fail."""
+
+    def __init__(self):
+        self.refs = {}
+        self.committed = []
+        self.rollups = Mock()
+        self.rollups.document.side_effect = lambda doc_id: self.ref(
+            f"email_accounts/church/metric_rollups/{doc_id}"
+        )
+        self.rollups.where.return_value.stream.return_value = []
+
+    def ref(self, path):
+        if path not in self.refs:
+            self.refs[path] = Mock(path=path, id=path.rsplit("/", 1)[-1])
+            if "/metric_rollups/" in path:
+                self.refs[path].set.side_effect = RuntimeError("deadline exceeded")
+        return self.refs[path]
+
+    def collection(self, name):
+        return Mock(**{"document.return_value.collection.return_value": self.rollups})
+
+    def get_all(self, refs):
+        return []
+
+    def batch(self):
+        ops = []
+        batch = Mock()
+        batch.set.side_effect = lambda ref, data, merge=False: ops.append(ref.path)
+        batch.delete.side_effect = lambda ref: ops.append(ref.path)
+
+        def commit():
+            if any("/metric_rollups/" in path for path in ops):
+                raise RuntimeError("deadline exceeded")
+            self.committed.extend(ops)
+
+        batch.commit.side_effect = commit
+        return batch
+
+
+class TestFirestoreCounterFailures:
+    STATE = "email_accounts/church/metric_rollups/suggestions_state"
+
+    def test_failed_increments_invalidate_the_counters(self):
+        db = FailingCountersDb()
+        collection_ref = Mock()
+        collection_ref.document.side_effect = lambda doc_id: db.ref(f"suggestions/{doc_id}")
+
+        failed = save_many_with_rollups(db, collection_ref, {"a": _doc(), "b": _doc()},
+                                        account="church", store="suggestions", keys=_keys)
+
+        assert failed == set()
+        assert db.committed == ["suggestions/a", "suggestions/b"]
+        db.refs[self.STATE].delete.assert_called_once()
+
+    def test_rebuild_skips_the_marker_when_counters_fail(self):
+        db = FailingCountersDb()
+        collection_ref = Mock()
+        collection_ref.stream.return_value = [SimpleNamespace(to_dict=lambda: _doc())]
+
+        by_day = rebuild_rollups_firestore(db, collection_ref, account="church",
+                                           store="suggestions", keys=_keys)
+
+        assert by_day == {TODAY: {"total": 1, "status:pending": 1}}
+        assert self.STATE not in db.refs
+        assert db.committed == []
@@ -25,9 +25,11 @@ from daily_task_assistant.email.rule_store import (
     list_pending_rules,
     decide_rule_suggestion,
     create_rule_suggestion,
+    create_rule_suggestions,
     get_rule_approval_stats,
     purge_expired_rules,
     has_pending_rule_for_pattern,
+    pending_rule_patterns,
     _rule_dir,
     _now,
 )
@@ -506,6 +508,52 @@ class TestDuplicateDetection:
         )
 
 
+class TestBulkOperations:
+    """Tests for set-based dedup and bulk creation."""
+
+    def test_pending_rule_patterns(self, temp_rule_dir, sample_rule):
+        """Should return pending (field, value) pairs, excluding decided rules."""
+        create_rule_suggestion(
+            account="church",
+            user_id="test@test.com",
+            suggestion_type="new_label",
+            suggested_rule=sample_rule,
+            reason="Test",
+        )
+        decided = create_rule_suggestion(
+            account="church",
+            user_id="test@test.com",
+            suggestion_type="new_label",
+            suggested_rule={**sample_rule, "value": "@old.com"},
+            reason="Test",
+        )
+        decide_rule_suggestion("church", decided.rule_id, approved=False)
+
+        assert pending_rule_patterns("church") == {("from", "@newsletter.example.com")}
+
+    def test_create_rule_suggestions(self, temp_rule_dir, sample_rule):
+        """Should persist every record in one call, preserving order."""
+        records = create_rule_suggestions("church", [
+            {
+                "user_id": "test@test.com",
+                "suggestion_type": "new_label",
+                "suggested_rule": {**sample_rule, "value": f"@sender{i}.com"},
+                "reason": f"Reason {i}",
+            }
+            for i in range(3)
+        ])
+
+        assert [r.reason for r in records] == ["Reason 0", "Reason 1", "Reason 2"]
+        assert all(r.email_account == "church" and r.examples == [] for r in records)
+        assert len(list_pending_rules("church")) == 3
+        assert get_rule_suggestion("church", records[1].rule_id).reason == "Reason 1"
+
+    def test_create_rule_suggestions_empty(self, temp_rule_dir):
+        """Should not touch storage when there is nothing to save."""
+        assert create_rule_suggestions("church", []) == []
+        assert not (temp_rule_dir / "church").exists()
+
+
 # =============================================================================
 # Purge Tests
 # =============================================================================
@@ -1,11 +1,13 @@
-"""Tests for SmartsheetClient write operations."""
+"""Tests for SmartsheetClient reads, writes and sheet snapshots."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from daily_task_assistant.smartsheet_client import (
     SmartsheetClient,
     SmartsheetAPIError,
+    clear_sheet_snapshots,
 )
 from daily_task_assistant.config import Settings
 
@@ -16,6 +18,13 @@ def mock_settings():
     return Settings(smartsheet_token="test_token_123", environment="test")
 
 
+@pytest.fixture(autouse=True)
+def _clean_snapshots():
+    clear_sheet_snapshots()
+    yield
+    clear_sheet_snapshots()
+
+
 @pytest.fixture
 def mock_client(mock_settings):
     """Create a SmartsheetClient with mocked HTTP requests."""
@@ -155,3 +164,423 @@ class TestPostComment:
         with pytest.raises(SmartsheetAPIError, match="Failed to post comment"):
             mock_client.post_comment("123", "Test")
 
+
+
+def _sheet_row(client, row_id, title, row_number, *, status="Scheduled", source="personal"):
+    """Build a raw Smartsheet row using the configured column IDs."""
+    columns = client.multi_config.sheets[source].columns
+    values = {
+        "task": title,
+        "status": status,
+        "due_date": "2025-12-01",
+        "priority": "Standard",
+        "project": "Sm. Projects & Tasks",
+    }
+    return {
+        "id": row_id,
+        "rowNumber": row_number,
+        "cells": [
+            {"columnId": int(columns[field].column_id), "value": value}
+            for field, value in values.items()
+        ],
+    }
+
+
+def _sheet(rows, version, total=None):
+    return {"version": version, "rows": rows, "totalRowCount": total or len(rows)}
+
+
+class TestSheetSnapshots:
+    """Tests for the process-wide sheet snapshot cache."""
+
+    def test_second_read_within_ttl_makes_no_request(self, mock_client):
+        rows = [_sheet_row(mock_client, 1, "Task A", 1)]
+        mock_client._mock_request.return_value = _sheet(rows, version=5)
+
+        first = mock_client.list_tasks(sources=["personal"])
+        second = mock_client.list_tasks(sources=["personal"])
+
+        assert [t.title for t in first] == [t.title for t in second] == ["Task A"]
+        mock_client._mock_request.assert_called_once()
+
+    def test_snapshot_is_shared_across_clients(self, mock_client, mock_settings):
+        rows = [_sheet_row(mock_client, 1, "Task A", 1)]
+        mock_client._mock_request.return_value = _sheet(rows, version=5)
+        mock_client.list_tasks(sources=["personal"])
+
+        other = SmartsheetClient(mock_settings)
+        assert [t.title for t in other.list_tasks(sources=["personal"])] == ["Task A"]
+        assert other.last_fetch_used_live
+        mock_client._mock_request.assert_called_once()
+
+    def test_unchanged_version_serves_snapshot(self, mock_client, monkeypatch):
+        monkeypatch.setenv("DTA_SMARTSHEET_VERSION_TTL", "0")
+        rows = [_sheet_row(mock_client, 1, "Task A", 1)]
+        mock_client._mock_request.side_effect = [_sheet(rows, version=5), {"version": 5}]
+
+        mock_client.list_tasks(sources=["personal"])
+        tasks = mock_client.list_tasks(sources=["personal"])
+
+        assert [t.title for t in tasks] == ["Task A"]
+        assert mock_client._mock_request.call_args[0][1].endswith("/version")
+
+    def test_changed_version_merges_modified_rows(self, mock_client, monkeypatch):
+        monkeypatch.setenv("DTA_SMARTSHEET_VERSION_TTL", "0")
+        rows = [
+            _sheet_row(mock_client, 1, "Task A", 1),
+            _sheet_row(mock_client, 2, "Task B", 2),
+        ]
+        delta = [
+            _sheet_row(mock_client, 2, "Task B edited", 2),
+            _sheet_row(mock_client, 3, "Task C", 3),
+        ]
+        mock_client._mock_request.side_effect = [
+            _sheet(rows, version=5),
+            {"version": 7},
+            _sheet(delta, version=7, total=3),
+        ]
+
+        mock_client.list_tasks(sources=["personal"])
+        tasks = mock_client.list_tasks(sources=["personal"])
+
+        assert [t.title for t in tasks] == ["Task A", "Task B edited", "Task C"]
+        delta_params = mock_client._mock_request.call_args[1]["params"]
+        assert "rowsModifiedSince" in delta_params
+
+    def test_deleted_rows_force_full_fetch(self, mock_client, monkeypatch):
+        monkeypatch.setenv("DTA_SMARTSHEET_VERSION_TTL", "0")
+        row_a = _sheet_row(mock_client, 1, "Task A", 1)
+        row_b = _sheet_row(mock_client, 2, "Task B", 2)
+        mock_client._mock_request.side_effect = [
+            _sheet([row_a, row_b], version=5),
+            {"version": 6},
+            _sheet([], version=6, total=1),  # delta: nothing modified, one row gone
+            _sheet([row_b | {"rowNumber": 1}], version=6),
+        ]
+
+        mock_client.list_tasks(sources=["personal"])
+        tasks = mock_client.list_tasks(sources=["personal"])
+
+        assert [t.title for t in tasks] == ["Task B"]
+        assert "rowsModifiedSince" not in mock_client._mock_request.call_args[1]["params"]
+
+    def test_update_row_invalidates_snapshot(self, mock_client):
+        rows = [_sheet_row(mock_client, 1, "Task A", 1)]
+        mock_client._mock_request.side_effect = [
+            _sheet(rows, version=5),
+            {"result": [{"id": 1}]},  # PUT
+            {"version": 5},
+        ]
+
+        mock_client.list_tasks(sources=["personal"])
+        mock_client.update_row("1", {"priority": "Urgent"})
+        mock_client.list_tasks(sources=["personal"])
+
+        # The read after our write re-checked the version despite the TTL
+        assert mock_client._mock_request.call_count == 3
+
+    def test_limit_applies_per_sheet(self, mock_client):
+        rows = [_sheet_row(mock_client, i, f"Task {i}", i) for i in range(1, 4)]
+        mock_client._mock_request.return_value = _sheet(rows, version=1)
+
+        assert len(mock_client.list_tasks(sources=["personal"], limit=2)) == 2
+        assert len(mock_client.list_tasks(sources=["personal"])) == 3
+
+
+class TestGetTask:
+    """Tests for single-task lookup by row ID."""
+
+    def test_fresh_snapshot_answers_without_request(self, mock_client):
+        rows = [_sheet_row(mock_client, 11, "Task A", 1)]
+        mock_client._mock_request.return_value = _sheet(rows, version=1)
+        mock_client.list_tasks(sources=["personal"])
+        mock_client._mock_request.reset_mock()
+
+        task = mock_client.get_task("11")
+
+        assert task.title == "Task A"
+        assert mock_client.last_fetch_used_live
+        mock_client._mock_request.assert_not_called()
+
+    def test_miss_fetches_single_row(self, mock_client):
+        mock_client._mock_request.return_value = _sheet_row(mock_client, 22, "Task B", 4)
+
+        task = mock_client.get_task("22", sources=["personal"])
+
+        assert task.title == "Task B"
+        mock_client._mock_request.assert_called_once()
+        assert mock_client._mock_request.call_args[0][1].endswith("/rows/22")
+
+    def test_searches_next_sheet_after_404(self, mock_client):
+        mock_client._mock_request.side_effect = [
+            SmartsheetAPIError("Not Found", status_code=404),
+            _sheet_row(mock_client, 33, "Work task", 2, source="work"),
+        ]
+
+        task = mock_client.get_task("33", sources=["personal", "work"])
+
+        assert task.source == "work"
+        assert task.title == "Work task"
+
+    def test_not_found_anywhere_returns_none(self, mock_client):
+        mock_client._mock_request.side_effect = SmartsheetAPIError(
+            "Smartsheet API GET /rows failed with status 404: Not Found", status_code=404
+        )
+
+        assert mock_client.get_task("1001") is None
+        assert mock_client.last_fetch_used_live
+
+    def test_outage_is_raised(self, mock_client):
+        mock_client._mock_request.side_effect = SmartsheetAPIError("Network error")
+
+        with pytest.raises(SmartsheetAPIError):
+            mock_client.get_task("1001")
+
+    def test_failing_sheet_is_not_reported_as_not_found(self, mock_client):
+        mock_client._mock_request.side_effect = [
+            SmartsheetAPIError("Internal Server Error", status_code=500),
+            SmartsheetAPIError("Not Found", status_code=404),
+        ]
+
+        with pytest.raises(SmartsheetAPIError) as exc_info:
+            mock_client.get_task("33", sources=["personal", "work"])
+
+        assert exc_info.value.status_code == 500
+
+    def test_failing_sheet_serves_stale_snapshot_row(self, mock_client, monkeypatch):
+        mock_client._mock_request.return_value = _sheet(
+            [_sheet_row(mock_client, 11, "Task A", 1)], version=1
+        )
+        mock_client.list_tasks(sources=["personal"])
+        monkeypatch.setenv("DTA_SMARTSHEET_VERSION_TTL", "0")
+        mock_client._mock_request.side_effect = [
+            SmartsheetAPIError("Internal Server Error", status_code=500),
+            SmartsheetAPIError("Not Found", status_code=404),
+        ]
+
+        task = mock_client.get_task("11", sources=["personal", "work"])
+
+        assert task.title == "Task A"
+
+
+class TestParallelSources:
+    """Tests for concurrent multi-sheet fetches in list_tasks."""
+
+    def _route(self, client, handlers):
+        """Dispatch _request calls by sheet ID to per-source handlers."""
+        ids = {s.sheet_id: key for key, s in client.multi_config.sheets.items()}
+
+        def _request(method, path, **kwargs):
+            sheet_id = path.split("/")[2]
+            return handlers[ids[sheet_id]]()
+
+        client._mock_request.side_effect = _request
+
+    def test_sheets_are_fetched_concurrently(self, mock_client):
+        import time
+
+        def slow(source, title):
+            def handler():
+                time.sleep(0.2)
+                return _sheet([_sheet_row(mock_client, 1, title, 1, source=source)], 1)
+            return handler
+
+        self._route(mock_client, {
+            "personal": slow("personal", "Home"),
+            "work": slow("work", "Office"),
+        })
+
+        started = time.perf_counter()
+        tasks = mock_client.list_tasks(sources=["personal", "work"])
+        elapsed = time.perf_counter() - started
+
+        assert [t.title for t in tasks] == ["Home", "Office"]
+        assert elapsed < 0.35
+        assert set(mock_client.source_timings) == {"personal", "work"}
+        assert mock_client.source_timings["work"]["ok"] is True
+
+    def test_failed_sheet_is_isolated(self, mock_client):
+        def broken():
+            raise SmartsheetAPIError("work sheet unavailable")
+
+        self._route(mock_client, {
+            "personal": lambda: _sheet([_sheet_row(mock_client, 1, "Home", 1)], 1),
+            "work": broken,
+        })
+
+        tasks = mock_client.list_tasks(sources=["personal", "work"])
+
+        assert [t.title for t in tasks] == ["Home"]
+        assert mock_client.last_fetch_used_live
+        assert mock_client.source_timings["work"]["ok"] is False
+        assert "unavailable" in mock_client.source_timings["work"]["error"]
+
+    def test_slow_sheet_times_out_and_personal_falls_back_to_stub(self, mock_client, monkeypatch):
+        import time
+
+        monkeypatch.setenv("DTA_SMARTSHEET_SOURCE_TIMEOUT", "0.1")
+
+        def hang():
+            time.sleep(0.5)
+            # Fail so the straggler leaves no snapshot behind for later tests
+            raise SmartsheetAPIError("too late")
+
+        self._route(mock_client, {
+            "personal": hang,
+            "work": lambda: _sheet([_sheet_row(mock_client, 1, "Office", 1, source="work")], 1),
+        })
+
+        tasks = mock_client.list_tasks(sources=["personal", "work"])
+
+        assert "Office" in [t.title for t in tasks]
+        assert any(t.source == "personal" for t in tasks)  # stub rows
+        assert "timed out" in mock_client.source_timings["personal"]["error"]
+
+
+class TestListTasksAsync:
+    """Tests for list_tasks_async, which fetches sheets on the event loop."""
+
+    def _route(self, client, handlers):
+        """Dispatch _request_async calls by sheet ID to per-source coroutines."""
+        ids = {s.sheet_id: key for key, s in client.multi_config.sheets.items()}
+
+        async def _request(method, path, **kwargs):
+            return await handlers[ids[path.split("/")[2]]]()
+
+        return patch.object(SmartsheetClient, "_request_async", new=AsyncMock(side_effect=_request))
+
+    def test_sheets_are_fetched_concurrently_and_snapshotted(self, mock_client):
+        import time
+
+        def slow(source, title):
+            async def handler():
+                await asyncio.sleep(0.2)
+                return _sheet([_sheet_row(mock_client, 1, title, 1, source=source)], 1)
+            return handler
+
+        with self._route(mock_client, {
+            "personal": slow("personal", "Home"),
+            "work": slow("work", "Office"),
+        }) as mock_request:
+            started = time.perf_counter()
+            tasks = asyncio.run(mock_client.list_tasks_async(sources=["personal", "work"]))
+            elapsed = time.perf_counter() - started
+            # Served from the shared snapshots within the version TTL
+            again = asyncio.run(mock_client.list_tasks_async(sources=["personal", "work"]))
+
+        assert [t.title for t in tasks] == ["Home", "Office"]
+        assert [t.title for t in again] == ["Home", "Office"]
+        assert elapsed < 0.35
+        assert mock_request.await_count == 2
+        assert mock_client.last_fetch_used_live
+        # The sync path reuses the snapshots the async path stored
+        assert [t.title for t in mock_client.list_tasks(sources=["personal"])] == ["Home"]
+        mock_client._mock_request.assert_not_called()
+
+    def test_slow_sheet_times_out_and_failed_sheet_is_isolated(self, mock_client, monkeypatch):
+        monkeypatch.setenv("DTA_SMARTSHEET_SOURCE_TIMEOUT", "0.1")
+
+        async def hang():
+            await asyncio.sleep(0.5)
+            raise SmartsheetAPIError("too late")
+
+        async def office():
+            return _sheet([_sheet_row(mock_client, 1, "Office", 1, source="work")], 1)
+
+        with self._route(mock_client, {"personal": hang, "work": office}):
+            tasks = asyncio.run(mock_client.list_tasks_async(sources=["personal", "work"]))
+
+        assert "Office" in [t.title for t in tasks]
+        assert any(t.source == "personal" for t in tasks)  # stub rows
+        assert "timed out" in mock_client.source_timings["personal"]["error"]
+        assert mock_client.source_timings["work"]["ok"] is True
+
+
+class TestBulkUpdates:
+    """Tests for batched row updates."""
+
+    def test_updates_are_sent_in_one_request(self, mock_client):
+        mock_client._mock_request.return_value = {"result": [{"id": 1}, {"id": 2}]}
+
+        outcomes = mock_client.update_rows([
+            ("1", {"priority": "Urgent"}),
+            ("2", {"due_date": "2025-12-05"}),
+            ("1", {"number": 3}),
+        ])
+
+        assert outcomes == {"1": None, "2": None}
+        mock_client._mock_request.assert_called_once()
+        call = mock_client._mock_request.call_args
+        assert call[1]["params"] == {"allowPartialSuccess": "true"}
+        rows = call[1]["body"]
+        assert [row["id"] for row in rows] == [1, 2]
+        # Updates to the same row are merged into one row entry
+        assert len(rows[0]["cells"]) == 2
+
+    def test_partial_failures_map_back_to_rows(self, mock_client):
+        mock_client._mock_request.return_value = {
+            "result": [{"id": 1}],
+            "failedItems": [{"index": 1, "rowId": 2, "error": {"message": "Row is locked"}}],
+        }
+
+        outcomes = mock_client.update_rows([
+            ("1", {"priority": "Urgent"}),
+            ("2", {"priority": "Urgent"}),
+        ])
+
+        assert outcomes == {"1": None, "2": "Row is locked"}
+
+    def test_invalid_row_does_not_block_others(self, mock_client):
+        mock_client._mock_request.return_value = {"result": [{"id": 2}]}
+
+        outcomes = mock_client.update_rows([
+            ("1", {"status": "NotAStatus"}),
+            ("2", {"priority": "Urgent"}),
+        ])
+
+        assert "Invalid value" in outcomes["1"]
+        assert outcomes["2"] is None
+        assert [row["id"] for row in mock_client._mock_request.call_args[1]["body"]] == [2]
+
+    def test_request_failure_fails_every_row_in_chunk(self, mock_client):
+        mock_client._mock_request.side_effect = SmartsheetAPIError("boom")
+
+        outcomes = mock_client.update_rows([("1", {"priority": "Urgent"})])
+
+        assert "boom" in outcomes["1"]
+
+    def test_completion_updates_use_snapshot_not_row_get(self, mock_client):
+        recurring_col = mock_client.schema.columns["recurring_pattern"].column_id
+        recurring = _sheet_row(mock_client, 1, "Water plants", 1, status="Recurring")
+        recurring["cells"].append({"columnId": int(recurring_col), "value": "Weekly"})
+        regular = _sheet_row(mock_client, 2, "File taxes", 2)
+        mock_client._mock_request.return_value = _sheet([recurring, regular], version=1)
+        mock_client.list_tasks(sources=["personal"])
+        mock_client._mock_request.reset_mock()
+
+        assert mock_client.completion_updates("1") == {"done": True}
+        assert mock_client.completion_updates("2") == {"status": "Completed", "done": True}
+        mock_client._mock_request.assert_not_called()
+
+
+class TestAttachmentDetails:
+    """Tests for concurrent attachment detail lookups."""
+
+    def test_lookups_run_concurrently_and_keep_order(self, mock_client):
+        import time
+
+        def _request(method, path, **kwargs):
+            attachment_id = path.rsplit("/", 1)[1]
+            time.sleep(0.2)
+            if attachment_id == "missing":
+                raise SmartsheetAPIError("404")
+            return {"id": attachment_id, "name": f"{attachment_id}.pdf", "url": "https://signed"}
+
+        mock_client._mock_request.side_effect = _request
+
+        started = time.perf_counter()
+        details = mock_client.get_attachment_details(["a", "missing", "b", "c"])
+        elapsed = time.perf_counter() - started
+
+        assert [d.attachment_id for d in details] == ["a", "b", "c"]
+        assert elapsed < 0.5
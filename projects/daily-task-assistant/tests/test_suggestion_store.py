@@ -0,0 +1,60 @@
+"""Tests for Suggestion Store bulk dedup and creation."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from daily_task_assistant.email.suggestion_store import (
+    create_suggestion,
+    create_suggestions,
+    get_suggestion,
+    pending_email_ids,
+    record_suggestion_decision,
+    save_suggestion,
+    _now,
+)
+
+
+@pytest.fixture
+def suggestion_dir(tmp_path, monkeypatch):
+    store = tmp_path / "suggestion_store"
+    monkeypatch.setenv("DTA_SUGGESTION_FORCE_FILE", "1")
+    monkeypatch.setenv("DTA_SUGGESTION_DIR", str(store))
+    return store
+
+
+def _fields(email_id: str) -> dict:
+    return {
+        "email_id": email_id,
+        "user_id": "test@test.com",
+        "action": "archive",
+        "rationale": "Newsletter",
+        "email_subject": f"Subject {email_id}",
+    }
+
+
+def test_pending_email_ids_excludes_decided_and_expired(suggestion_dir):
+    create_suggestion(account="personal", **_fields("pending"))
+    decided = create_suggestion(account="personal", **_fields("decided"))
+    record_suggestion_decision("personal", decided.suggestion_id, approved=True)
+    expired = create_suggestion(account="personal", **_fields("expired"))
+    expired.expires_at = _now() - timedelta(days=1)
+    save_suggestion("personal", expired)
+
+    assert pending_email_ids("personal") == {"pending"}
+    assert pending_email_ids("church") == set()
+
+
+def test_create_suggestions_persists_all_in_order(suggestion_dir):
+    records = create_suggestions("personal", [_fields(f"m{i}") for i in range(4)])
+
+    assert [r.email_id for r in records] == ["m0", "m1", "m2", "m3"]
+    assert len({r.suggestion_id for r in records}) == 4
+    assert get_suggestion("personal", records[2].suggestion_id).email_subject == "Subject m2"
+    assert pending_email_ids("personal") == {"m0", "m1", "m2", "m3"}
+
+
+def test_create_suggestions_empty(suggestion_dir):
+    assert create_suggestions("personal", []) == []
+    assert not suggestion_dir.exists()